@@ -12,6 +12,7 @@ import requests
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.http_client import async_client, OCR_TIMEOUT
 from edenai_apis.utils.http import HTTPMethod
+from edenai_apis.utils.http_sessions import provider_session
 from .document import DocumentState, FileParameter, QueryBuilder, UploadDocumentParams
 from .models import Document, Organization, Workspace, Collection
 
@@ -130,7 +131,7 @@ class Client:
         Returns:
             dict: The response of the request in json format. If status_code is 204, return { 'status_code': 204 }
         """
-        response: requests.Response = requests.request(
+        response: requests.Response = provider_session("affinda").request(
             method=method.value,
             url=url,
             data=data,
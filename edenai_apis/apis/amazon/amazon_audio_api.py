@@ -4,10 +4,9 @@ import urllib
 import uuid
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import aioboto3
-import aiofiles
 import requests
 from botocore.exceptions import ClientError
 
@@ -32,7 +31,14 @@ from edenai_apis.features.audio.tts import TtsDataClass
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.file_handling import FileHandler
 from edenai_apis.utils.ssml import is_ssml
+from edenai_apis.utils.staging_registry import staging_registry
+from edenai_apis.utils.staging_upload import (
+    aupload_file_to_s3_bucket,
+    upload_file_to_s3_bucket,
+)
 from edenai_apis.utils.tts import get_tts_config
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -168,6 +174,8 @@ class AmazonAudioApi(AudioInterface):
             original_response={}, standardized_response=standardized_response
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -267,6 +275,7 @@ class AmazonAudioApi(AudioInterface):
             original_response={}, standardized_response=standardized_response
         )
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
@@ -366,14 +375,17 @@ class AmazonAudioApi(AudioInterface):
         :param audio_path:  String that contains the audio file path
         :return:            String that contains the filename on the server
         """
-        # Store file in an Amazon server
-        # filename = str(int(time())) + "_" + str(file_name)
-        filename = str(uuid.uuid4())
-        self.storage_clients["speech"].meta.client.upload_file(
-            file_path, self.api_settings["bucket"], filename
-        )
+        # Store file in an Amazon server, once per content
+        bucket = self.api_settings["bucket"]
 
-        return filename
+        def upload() -> str:
+            filename = str(uuid.uuid4())
+            upload_file_to_s3_bucket(
+                self.storage_clients["speech"].meta.client, file_path, bucket, filename
+            )
+            return filename
+
+        return staging_registry.stage(f"s3:{bucket}", file_path, upload)
 
     def _create_vocabulary(self, language: str, list_vocabs: list):
         list_vocabs = ["-".join(vocab.strip().split()) for vocab in list_vocabs]
@@ -399,13 +411,16 @@ class AmazonAudioApi(AudioInterface):
         initiate_vocab: bool = False,
         format: str = "wav",
         provider_params: Optional[dict] = None,
+        media_uri: Optional[str] = None,
     ):
         provider_params = provider_params or {}
         if speakers < 2:
             speakers = 2
         params = {
             "TranscriptionJobName": filename,
-            "Media": {"MediaFileUri": self.api_settings["storage_url"] + filename},
+            "Media": {
+                "MediaFileUri": media_uri or self.api_settings["storage_url"] + filename
+            },
             "LanguageCode": language,
             "Settings": {
                 "ShowSpeakerLabels": True,
@@ -439,28 +454,29 @@ class AmazonAudioApi(AudioInterface):
         handle_amazon_call(self.clients["speech"].delete_vocabulary, **payload)
 
     # Async Speech to text helpers
-    async def _aupload_audio_file_to_amazon_server(self, file_path: str) -> str:
+    async def _aupload_audio_file_to_amazon_server(
+        self, file: Union[str, bytes]
+    ) -> str:
         """
-        Async version: Upload audio file to Amazon S3 server
-        :param file_path: String that contains the audio file path
+        Async version: Upload audio file to Amazon S3 server, once per content
+        :param file: String that contains the audio file path, or the file content
         :return: String that contains the filename on the server
         """
-        filename = str(uuid.uuid4())
-
-        async with aiofiles.open(file_path, "rb") as f:
-            file_content = await f.read()
-
-        session = aioboto3.Session()
-        async with session.resource(
-            "s3",
-            region_name=self.api_settings["region_name"],
-            aws_access_key_id=self.api_settings["aws_access_key_id"],
-            aws_secret_access_key=self.api_settings["aws_secret_access_key"],
-        ) as s3:
-            bucket = await s3.Bucket(self.api_settings["bucket"])
-            await bucket.put_object(Key=filename, Body=file_content)
-
-        return filename
+        bucket = self.api_settings["bucket"]
+
+        async def upload() -> str:
+            filename = str(uuid.uuid4())
+            session = aioboto3.Session()
+            async with session.client(
+                "s3",
+                region_name=self.api_settings["region_name"],
+                aws_access_key_id=self.api_settings["aws_access_key_id"],
+                aws_secret_access_key=self.api_settings["aws_secret_access_key"],
+            ) as s3_client:
+                await aupload_file_to_s3_bucket(s3_client, file, bucket, filename)
+            return filename
+
+        return await staging_registry.astage(f"s3:{bucket}", file, upload)
 
     async def _acreate_vocabulary(self, language: str, list_vocabs: list) -> str:
         """
@@ -578,9 +594,12 @@ class AmazonAudioApi(AudioInterface):
         provider_params = provider_params or {}
         export_format, channels, frame_rate = audio_attributes
 
-        filename = self._upload_audio_file_to_amazon_server(
+        media_key = self._upload_audio_file_to_amazon_server(
             file, Path(file).stem + "." + export_format
         )
+        # the staged file can be shared by several jobs, job names must be unique
+        filename = str(uuid.uuid4())
+        media_uri = self.api_settings["storage_url"] + media_key
         if vocabulary:
             if language is None:
                 raise ProviderException(
@@ -597,6 +616,7 @@ class AmazonAudioApi(AudioInterface):
                 True,
                 format=export_format,
                 provider_params=provider_params,
+                media_uri=media_uri,
             )
             return AsyncLaunchJobResponseType(
                 provider_job_id=f"{filename}EdenAI{vocab_name}"
@@ -609,6 +629,7 @@ class AmazonAudioApi(AudioInterface):
             speakers,
             format=export_format,
             provider_params=provider_params,
+            media_uri=media_uri,
         )
         return AsyncLaunchJobResponseType(provider_job_id=filename)
 
@@ -646,6 +667,7 @@ class AmazonAudioApi(AudioInterface):
                     settings["LanguageCode"],
                     settings["Settings"]["MaxSpeakerLabels"],
                     settings["Settings"]["VocabularyName"] if can_use_vocab else None,
+                    media_uri=settings["Media"]["MediaFileUri"],
                 )
                 settings["checked"] = True  # confirm vocabulary creation
                 extention_index = job_id.rfind(".")
@@ -736,26 +758,6 @@ class AmazonAudioApi(AudioInterface):
             provider_job_id=provider_job_id
         )
 
-    async def _aupload_audio_bytes_to_amazon_server(self, file_content: bytes) -> str:
-        """
-        Async version: Upload audio bytes to Amazon S3 server
-        :param file_content: Bytes content of the audio file
-        :return: String that contains the filename on the server
-        """
-        filename = str(uuid.uuid4())
-
-        session = aioboto3.Session()
-        async with session.resource(
-            "s3",
-            region_name=self.api_settings["region_name"],
-            aws_access_key_id=self.api_settings["aws_access_key_id"],
-            aws_secret_access_key=self.api_settings["aws_secret_access_key"],
-        ) as s3:
-            bucket = await s3.Bucket(self.api_settings["bucket"])
-            await bucket.put_object(Key=filename, Body=file_content)
-
-        return filename
-
     async def audio__aspeech_to_text_async__launch_job(
         self,
         file: str,
@@ -783,17 +785,19 @@ class AmazonAudioApi(AudioInterface):
                 # (Amazon Transcribe only accepts S3 URIs)
                 file_handler = FileHandler()
                 file_wrapper = await file_handler.download_file(file_url)
-                file_content = await file_wrapper.get_bytes()
-                job_name = await self._aupload_audio_bytes_to_amazon_server(file_content)
-                media_uri = self.api_settings["storage_url"] + job_name
+                media_key = await self._aupload_audio_file_to_amazon_server(
+                    file_wrapper.file_path or await file_wrapper.get_bytes()
+                )
             elif file:
                 # Local file: upload to S3
-                job_name = await self._aupload_audio_file_to_amazon_server(file)
-                media_uri = self.api_settings["storage_url"] + job_name
+                media_key = await self._aupload_audio_file_to_amazon_server(file)
             else:
                 raise ProviderException(
                     "Either file or file_url must be provided", code=400
                 )
+            # the staged file can be shared by several jobs, job names must be unique
+            job_name = str(uuid.uuid4())
+            media_uri = self.api_settings["storage_url"] + media_key
 
             if vocabulary:
                 if language is None:
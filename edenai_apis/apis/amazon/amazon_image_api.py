@@ -1,17 +1,30 @@
 import asyncio
 import json
 import base64
+import re
 from io import BytesIO
 
 import aiofiles
 import aioboto3
 
-from typing import Literal, Optional, Sequence
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from edenai_apis.llmengine.utils.moderation import async_moderate, moderate
 from edenai_apis.apis.amazon.helpers import (
     ahandle_amazon_call,
     handle_amazon_call,
     get_confidence_if_true,
+    is_throttling_error,
+    rekognition_image,
 )
 from edenai_apis.features.image.embeddings.embeddings_dataclass import (
     EmbeddingsDataClass,
@@ -73,6 +86,14 @@ from edenai_apis.features.image.object_detection.object_detection_dataclass impo
     ObjectDetectionDataClass,
     ObjectItem,
 )
+from edenai_apis.utils.bulk_operations import (
+    DEFAULT_MAX_CONCURRENCY,
+    BulkItem,
+    BulkProgress,
+    DatasetEntry,
+    iter_bulk,
+    load_dataset,
+)
 from edenai_apis.utils.conversion import standardized_confidence_score
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.file_handling import FileHandler
@@ -84,6 +105,38 @@ from edenai_apis.utils.upload_s3 import (
 )
 
 
+def _external_image_id(label: str) -> str:
+    """ExternalImageId allowed by Rekognition: [a-zA-Z0-9_.-:]+, 255 characters"""
+    return re.sub(r"[^a-zA-Z0-9_.\-:]", "_", label)[:255] or "_"
+
+
+def _add_face_response(response: Dict) -> ResponseType[FaceRecognitionAddFaceDataClass]:
+    face_ids = [face["Face"]["FaceId"] for face in response["FaceRecords"]]
+    if len(face_ids) == 0:
+        raise ProviderException("No face detected in the image")
+
+    return ResponseType(
+        original_response=response,
+        standardized_response=FaceRecognitionAddFaceDataClass(face_ids=face_ids),
+    )
+
+
+def _recognize_response(
+    response: Dict,
+) -> ResponseType[FaceRecognitionRecognizeDataClass]:
+    faces = [
+        FaceRecognitionRecognizedFaceDataClass(
+            confidence=face["Similarity"] / 100, face_id=face["Face"]["FaceId"]
+        )
+        for face in response["FaceMatches"]
+    ]
+
+    return ResponseType(
+        original_response=response,
+        standardized_response=FaceRecognitionRecognizeDataClass(items=faces),
+    )
+
+
 class AmazonImageApi(ImageInterface):
     def image__object_detection(
         self, file: str, model: str = None, file_url: str = "", **kwargs
@@ -693,15 +746,7 @@ class AmazonImageApi(ImageInterface):
             file_content = file_.read()
         payload = {"CollectionId": collection_id, "Image": {"Bytes": file_content}}
         response = handle_amazon_call(self.clients["image"].index_faces, **payload)
-
-        face_ids = [face["Face"]["FaceId"] for face in response["FaceRecords"]]
-        if len(face_ids) == 0:
-            raise ProviderException("No face detected in the image")
-
-        return ResponseType(
-            original_response=response,
-            standardized_response=FaceRecognitionAddFaceDataClass(face_ids=face_ids),
-        )
+        return _add_face_response(response)
 
     def image__face_recognition__delete_face(
         self, collection_id, face_id, **kwargs
@@ -730,17 +775,97 @@ class AmazonImageApi(ImageInterface):
         response = handle_amazon_call(
             self.clients["image"].search_faces_by_image, **payload
         )
+        return _recognize_response(response)
+
+    def bulk_add_faces(
+        self,
+        collection_id: str,
+        dataset: Union[str, Iterable[Union[DatasetEntry, Tuple[str, str]]]],
+        max_faces: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> Iterator[BulkItem]:
+        """
+        Index the faces of every image of `dataset` into a collection, yield the
+        `add_face` response of each image as it completes.
+
+        The label of an image is stored as the ExternalImageId of its faces (eg: the
+        employee id of a badge photo). Throttled calls are retried with a backoff.
+
+        Args:
+            dataset: folder of `<label>/<image>` or of `<label>.<ext>` images, CSV
+                manifest of `file,label` (paths, urls or s3:// objects), or pairs of
+                (file, label)
+            max_faces: faces indexed per image, the largest ones first
+            max_concurrency: concurrent calls, at most the connection pool of the
+                boto3 client (10)
+            progress: called with the progress after each image
+        """
+        client = self.clients["image"]
+
+        def add_face(
+            entry: DatasetEntry,
+        ) -> ResponseType[FaceRecognitionAddFaceDataClass]:
+            payload = {
+                "CollectionId": collection_id,
+                "Image": rekognition_image(entry),
+                "ExternalImageId": _external_image_id(entry.label),
+            }
+            if max_faces:
+                payload["MaxFaces"] = max_faces
+            return _add_face_response(handle_amazon_call(client.index_faces, **payload))
+
+        return iter_bulk(
+            load_dataset(dataset),
+            add_face,
+            max_concurrency=max_concurrency,
+            is_retryable=is_throttling_error,
+            progress=progress,
+        )
 
-        faces = [
-            FaceRecognitionRecognizedFaceDataClass(
-                confidence=face["Similarity"] / 100, face_id=face["Face"]["FaceId"]
+    def bulk_recognize_faces(
+        self,
+        collection_id: str,
+        dataset: Union[str, Iterable[Union[DatasetEntry, Tuple[str, str]]]],
+        threshold: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> Iterator[BulkItem]:
+        """
+        Search the faces of a collection matching the largest face of every image of
+        `dataset`, yield the `recognize` response of each image as it completes.
+
+        The label of an image is not sent, it can be compared with the
+        ExternalImageId of the matches (eg: nightly re-verification of badge photos).
+
+        Args:
+            dataset: same as `bulk_add_faces`
+            threshold: minimum similarity of a match, from 0 to 100
+        """
+        client = self.clients["image"]
+        # checked once, not for each image as `recognize` does
+        collection = handle_amazon_call(
+            client.describe_collection, CollectionId=collection_id
+        )
+        if not collection.get("FaceCount"):
+            raise ProviderException("Face Collection is empty.")
+
+        def recognize(
+            entry: DatasetEntry,
+        ) -> ResponseType[FaceRecognitionRecognizeDataClass]:
+            payload = {"CollectionId": collection_id, "Image": rekognition_image(entry)}
+            if threshold is not None:
+                payload["FaceMatchThreshold"] = threshold
+            return _recognize_response(
+                handle_amazon_call(client.search_faces_by_image, **payload)
             )
-            for face in response["FaceMatches"]
-        ]
 
-        return ResponseType(
-            original_response=response,
-            standardized_response=FaceRecognitionRecognizeDataClass(items=faces),
+        return iter_bulk(
+            load_dataset(dataset),
+            recognize,
+            max_concurrency=max_concurrency,
+            is_retryable=is_throttling_error,
+            progress=progress,
         )
 
     def image__face_compare(
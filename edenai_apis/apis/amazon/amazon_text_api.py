@@ -1,9 +1,19 @@
-from typing import List, Literal, Optional, Sequence, Union, Dict, Any
+from typing import Callable, List, Literal, Optional, Sequence, Union, Dict, Any
 import json
 import aioboto3
 
-from edenai_apis.apis.amazon.helpers import handle_amazon_call, ahandle_amazon_call
-from edenai_apis.features.text import ChatDataClass, GenerationDataClass
+from edenai_apis.apis.amazon.helpers import (
+    ahandle_amazon_call,
+    comprehend_batch_results,
+    handle_amazon_call,
+)
+from edenai_apis.features.text import (
+    BatchKeywordExtractionDataClass,
+    BatchNamedEntityRecognitionDataClass,
+    BatchSentimentAnalysisDataClass,
+    ChatDataClass,
+    GenerationDataClass,
+)
 from edenai_apis.features.text.anonymization.anonymization_dataclass import (
     AnonymizationDataClass,
     AnonymizationEntity,
@@ -31,11 +41,102 @@ from edenai_apis.features.text.syntax_analysis.syntax_analysis_dataclass import
     SyntaxAnalysisDataClass,
 )
 from edenai_apis.features.text.text_interface import TextInterface
+from edenai_apis.utils.batch_documents import (
+    BatchDocumentsResult,
+    DocumentLimits,
+    abatch_documents,
+    batch_documents,
+)
 from edenai_apis.utils.types import ResponseType
 from .config import tags
 
 
+# batch_detect_* calls take up to 25 documents of at most 5000 bytes each
+BATCH_DOCUMENT_LIMITS = DocumentLimits(max_documents=25, max_document_bytes=5000)
+
+
+def _sentiment(response: Dict) -> SentimentAnalysisDataClass:
+    best_sentiment = {
+        "general_sentiment": None,
+        "general_sentiment_rate": 0,
+        "items": [],
+    }
+
+    for key in response["SentimentScore"]:
+        if key == "Mixed":
+            continue
+
+        if best_sentiment["general_sentiment_rate"] <= response["SentimentScore"][key]:
+            best_sentiment["general_sentiment"] = key
+            best_sentiment["general_sentiment_rate"] = response["SentimentScore"][key]
+
+    return SentimentAnalysisDataClass(
+        general_sentiment=best_sentiment["general_sentiment"],
+        general_sentiment_rate=best_sentiment["general_sentiment_rate"],
+        items=[],
+    )
+
+
+def _keywords(response: Dict) -> KeywordExtractionDataClass:
+    items: Sequence[InfosKeywordExtractionDataClass] = []
+    for key_phrase in response["KeyPhrases"]:
+        items.append(
+            InfosKeywordExtractionDataClass(
+                keyword=key_phrase["Text"], importance=key_phrase["Score"]
+            )
+        )
+    return KeywordExtractionDataClass(items=items)
+
+
+def _entities(response: Dict) -> NamedEntityRecognitionDataClass:
+    items: Sequence[InfosNamedEntityRecognitionDataClass] = []
+    for ent in response["Entities"]:
+        items.append(
+            InfosNamedEntityRecognitionDataClass(
+                entity=ent["Text"],
+                importance=ent["Score"],
+                category=ent["Type"],
+            )
+        )
+    return NamedEntityRecognitionDataClass(items=items)
+
+
 class AmazonTextApi(TextInterface):
+    def _batch_detect(
+        self, operation: str, language: str, texts: List[str], standardize: Callable
+    ) -> BatchDocumentsResult:
+        def analyze_chunk(chunk: List[str]):
+            response = handle_amazon_call(
+                getattr(self.clients["text"], operation),
+                TextList=chunk,
+                LanguageCode=language,
+            )
+            return comprehend_batch_results(response, len(chunk), standardize), response
+
+        return batch_documents(texts, analyze_chunk, BATCH_DOCUMENT_LIMITS)
+
+    async def _abatch_detect(
+        self, operation: str, language: str, texts: List[str], standardize: Callable
+    ) -> BatchDocumentsResult:
+        session = aioboto3.Session()
+        async with session.client(
+            "comprehend",
+            region_name=self.api_settings["region_name"],
+            aws_access_key_id=self.api_settings["aws_access_key_id"],
+            aws_secret_access_key=self.api_settings["aws_secret_access_key"],
+        ) as comprehend_client:
+
+            async def analyze_chunk(chunk: List[str]):
+                response = await ahandle_amazon_call(
+                    getattr(comprehend_client, operation),
+                    TextList=chunk,
+                    LanguageCode=language,
+                )
+                results = comprehend_batch_results(response, len(chunk), standardize)
+                return results, response
+
+            return await abatch_documents(texts, analyze_chunk, BATCH_DOCUMENT_LIMITS)
+
     def text__sentiment_analysis(
         self, language: str, text: str, model: Optional[str] = None, **kwargs
     ) -> ResponseType[SentimentAnalysisDataClass]:
@@ -43,35 +144,30 @@ class AmazonTextApi(TextInterface):
         payload = {"Text": text, "LanguageCode": language}
         response = handle_amazon_call(self.clients["text"].detect_sentiment, **payload)
 
-        # Analysing response
-
-        best_sentiment = {
-            "general_sentiment": None,
-            "general_sentiment_rate": 0,
-            "items": [],
-        }
+        return ResponseType[SentimentAnalysisDataClass](
+            original_response=response, standardized_response=_sentiment(response)
+        )
 
-        for key in response["SentimentScore"]:
-            if key == "Mixed":
-                continue
-
-            if (
-                best_sentiment["general_sentiment_rate"]
-                <= response["SentimentScore"][key]
-            ):
-                best_sentiment["general_sentiment"] = key
-                best_sentiment["general_sentiment_rate"] = response["SentimentScore"][
-                    key
-                ]
-
-        standarize = SentimentAnalysisDataClass(
-            general_sentiment=best_sentiment["general_sentiment"],
-            general_sentiment_rate=best_sentiment["general_sentiment_rate"],
-            items=[],
+    def text__batch_sentiment_analysis(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        result = self._batch_detect(
+            "batch_detect_sentiment", language, texts, _sentiment
+        )
+        return ResponseType[BatchSentimentAnalysisDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchSentimentAnalysisDataClass(items=result.items),
         )
 
-        return ResponseType[SentimentAnalysisDataClass](
-            original_response=response, standardized_response=standarize
+    async def text__abatch_sentiment_analysis(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        result = await self._abatch_detect(
+            "batch_detect_sentiment", language, texts, _sentiment
+        )
+        return ResponseType[BatchSentimentAnalysisDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchSentimentAnalysisDataClass(items=result.items),
         )
 
     def text__keyword_extraction(
@@ -83,19 +179,30 @@ class AmazonTextApi(TextInterface):
             self.clients["text"].detect_key_phrases, **payload
         )
 
-        # Analysing response
-        items: Sequence[InfosKeywordExtractionDataClass] = []
-        for key_phrase in response["KeyPhrases"]:
-            items.append(
-                InfosKeywordExtractionDataClass(
-                    keyword=key_phrase["Text"], importance=key_phrase["Score"]
-                )
-            )
+        return ResponseType[KeywordExtractionDataClass](
+            original_response=response, standardized_response=_keywords(response)
+        )
 
-        standardized_response = KeywordExtractionDataClass(items=items)
+    def text__batch_keyword_extraction(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchKeywordExtractionDataClass]:
+        result = self._batch_detect(
+            "batch_detect_key_phrases", language, texts, _keywords
+        )
+        return ResponseType[BatchKeywordExtractionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchKeywordExtractionDataClass(items=result.items),
+        )
 
-        return ResponseType[KeywordExtractionDataClass](
-            original_response=response, standardized_response=standardized_response
+    async def text__abatch_keyword_extraction(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchKeywordExtractionDataClass]:
+        result = await self._abatch_detect(
+            "batch_detect_key_phrases", language, texts, _keywords
+        )
+        return ResponseType[BatchKeywordExtractionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchKeywordExtractionDataClass(items=result.items),
         )
 
     def text__named_entity_recognition(
@@ -105,20 +212,8 @@ class AmazonTextApi(TextInterface):
         payload = {"Text": text, "LanguageCode": language}
         response = handle_amazon_call(self.clients["text"].detect_entities, **payload)
 
-        items: Sequence[InfosNamedEntityRecognitionDataClass] = []
-        for ent in response["Entities"]:
-            items.append(
-                InfosNamedEntityRecognitionDataClass(
-                    entity=ent["Text"],
-                    importance=ent["Score"],
-                    category=ent["Type"],
-                )
-            )
-
-        standardized = NamedEntityRecognitionDataClass(items=items)
-
         return ResponseType[NamedEntityRecognitionDataClass](
-            original_response=response, standardized_response=standardized
+            original_response=response, standardized_response=_entities(response)
         )
 
     async def text__anamed_entity_recognition(
@@ -137,20 +232,32 @@ class AmazonTextApi(TextInterface):
                 comprehend_client.detect_entities, **payload
             )
 
-        items: Sequence[InfosNamedEntityRecognitionDataClass] = []
-        for ent in response["Entities"]:
-            items.append(
-                InfosNamedEntityRecognitionDataClass(
-                    entity=ent["Text"],
-                    importance=ent["Score"],
-                    category=ent["Type"],
-                )
-            )
+        return ResponseType[NamedEntityRecognitionDataClass](
+            original_response=response, standardized_response=_entities(response)
+        )
 
-        standardized = NamedEntityRecognitionDataClass(items=items)
+    def text__batch_named_entity_recognition(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        result = self._batch_detect("batch_detect_entities", language, texts, _entities)
+        return ResponseType[BatchNamedEntityRecognitionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchNamedEntityRecognitionDataClass(
+                items=result.items
+            ),
+        )
 
-        return ResponseType[NamedEntityRecognitionDataClass](
-            original_response=response, standardized_response=standardized
+    async def text__abatch_named_entity_recognition(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        result = await self._abatch_detect(
+            "batch_detect_entities", language, texts, _entities
+        )
+        return ResponseType[BatchNamedEntityRecognitionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchNamedEntityRecognitionDataClass(
+                items=result.items
+            ),
         )
 
     def text__syntax_analysis(
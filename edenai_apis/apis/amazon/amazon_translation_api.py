@@ -1,40 +1,108 @@
-from typing import Sequence, Optional
+from typing import Dict, List, Sequence, Optional
 
 import aioboto3
 
-from edenai_apis.apis.amazon.helpers import ahandle_amazon_call, handle_amazon_call
+from edenai_apis.apis.amazon.helpers import (
+    ahandle_amazon_call,
+    comprehend_batch_results,
+    handle_amazon_call,
+)
 from edenai_apis.features.translation.automatic_translation.automatic_translation_dataclass import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.batch_language_detection import (
+    BatchLanguageDetectionDataClass,
+)
+from edenai_apis.features.translation.batch_translation import (
+    BatchTranslationDataClass,
+)
 from edenai_apis.features.translation.language_detection.language_detection_dataclass import (
     InfosLanguageDetectionDataClass,
     LanguageDetectionDataClass,
 )
 from edenai_apis.features.translation.translation_interface import TranslationInterface
+from edenai_apis.utils.batch_documents import (
+    DocumentLimits,
+    abatch_documents,
+    batch_documents,
+)
+from edenai_apis.utils.batch_translation import (
+    BatchLimits,
+    abatch_translate,
+    batch_translate,
+)
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
+# TranslateText takes a single text (up to 10 000 bytes), segments are sent one by one
+BATCH_LIMITS = BatchLimits(max_segments=1, max_characters=10_000)
+BATCH_CONCURRENCY = 8
+
+
+# BatchDetectDominantLanguage takes up to 25 documents of at most 5000 bytes each
+BATCH_DOCUMENT_LIMITS = DocumentLimits(max_documents=25, max_document_bytes=5000)
+
+
+def _languages(response: Dict) -> LanguageDetectionDataClass:
+    items: Sequence[InfosLanguageDetectionDataClass] = []
+    for lang in response["Languages"]:
+        items.append(
+            InfosLanguageDetectionDataClass(
+                language=lang["LanguageCode"],
+                display_name=get_language_name_from_code(isocode=lang["LanguageCode"]),
+                confidence=lang["Score"],
+            )
+        )
+    return LanguageDetectionDataClass(items=items)
+
 
 class AmazonTranslationApi(TranslationInterface):
     def translation__language_detection(
         self, text: str, model: Optional[str] = None, **kwargs
     ) -> ResponseType[LanguageDetectionDataClass]:
         response = self.clients["text"].detect_dominant_language(Text=text)
-        items: Sequence[InfosLanguageDetectionDataClass] = []
-        for lang in response["Languages"]:
-            items.append(
-                InfosLanguageDetectionDataClass(
-                    language=lang["LanguageCode"],
-                    display_name=get_language_name_from_code(
-                        isocode=lang["LanguageCode"]
-                    ),
-                    confidence=lang["Score"],
-                )
-            )
-
         return ResponseType[LanguageDetectionDataClass](
             original_response=response,
-            standardized_response=LanguageDetectionDataClass(items=items),
+            standardized_response=_languages(response),
+        )
+
+    def translation__batch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        def analyze_chunk(chunk: List[str]):
+            response = handle_amazon_call(
+                self.clients["text"].batch_detect_dominant_language, TextList=chunk
+            )
+            return comprehend_batch_results(response, len(chunk), _languages), response
+
+        result = batch_documents(texts, analyze_chunk, BATCH_DOCUMENT_LIMITS)
+        return ResponseType[BatchLanguageDetectionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchLanguageDetectionDataClass(items=result.items),
+        )
+
+    async def translation__abatch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        session = aioboto3.Session()
+        async with session.client(
+            "comprehend",
+            region_name=self.api_settings["region_name"],
+            aws_access_key_id=self.api_settings["aws_access_key_id"],
+            aws_secret_access_key=self.api_settings["aws_secret_access_key"],
+        ) as comprehend_client:
+
+            async def analyze_chunk(chunk: List[str]):
+                response = await ahandle_amazon_call(
+                    comprehend_client.batch_detect_dominant_language, TextList=chunk
+                )
+                results = comprehend_batch_results(response, len(chunk), _languages)
+                return results, response
+
+            result = await abatch_documents(texts, analyze_chunk, BATCH_DOCUMENT_LIMITS)
+        return ResponseType[BatchLanguageDetectionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchLanguageDetectionDataClass(items=result.items),
         )
 
     def translation__automatic_translation(
@@ -93,3 +161,75 @@ class AmazonTranslationApi(TranslationInterface):
         return ResponseType[AutomaticTranslationDataClass](
             original_response=response, standardized_response=standardized
         )
+
+    def translation__batch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        def translate_pack(pack: List[str]):
+            response = handle_amazon_call(
+                self.clients["translate"].translate_text,
+                Text=pack[0],
+                SourceLanguageCode=source_language,
+                TargetLanguageCode=target_language,
+            )
+            return [response["TranslatedText"]], response
+
+        result = batch_translate(
+            self.provider_name,
+            model,
+            source_language,
+            target_language,
+            texts,
+            translate_pack,
+            BATCH_LIMITS,
+            max_concurrency=BATCH_CONCURRENCY,
+        )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
+    async def translation__abatch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        session = aioboto3.Session()
+        async with session.client(
+            "translate",
+            region_name=self.api_settings["region_name"],
+            aws_access_key_id=self.api_settings["aws_access_key_id"],
+            aws_secret_access_key=self.api_settings["aws_secret_access_key"],
+        ) as translate_client:
+
+            async def translate_pack(pack: List[str]):
+                response = await ahandle_amazon_call(
+                    translate_client.translate_text,
+                    Text=pack[0],
+                    SourceLanguageCode=source_language,
+                    TargetLanguageCode=target_language,
+                )
+                return [response["TranslatedText"]], response
+
+            result = await abatch_translate(
+                self.provider_name,
+                model,
+                source_language,
+                target_language,
+                texts,
+                translate_pack,
+                BATCH_LIMITS,
+                max_concurrency=BATCH_CONCURRENCY,
+            )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
@@ -39,6 +39,7 @@ from edenai_apis.utils.types import (
 )
 from .helpers import (
     amazon_get_video_data,
+    amazon_video_job_pages,
     handle_amazon_call,
     amazon_video_person_tracking_parser,
     amazon_video_labels_parser,
@@ -48,6 +49,7 @@ from .helpers import (
 )
 from .config import clients
 from edenai_apis.utils.file_handling import FileHandler
+from edenai_apis.utils.pagination import PageAssembler
 from edenai_apis.utils.upload_s3 import (
     USER_PROCESS,
     upload_file_bytes_to_s3,
@@ -175,33 +177,19 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_label_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            labels = []
-            for response in responses:
-                labels.extend(amazon_video_labels_parser(response))
+            # each page is parsed as soon as it is fetched
+            pages = amazon_video_job_pages(
+                self.clients["video"].get_label_detection,
+                provider_job_id,
+                first_page=response,
+            )
+            assembler = PageAssembler(amazon_video_labels_parser).consume(pages)
 
             return AsyncResponseType(
-                original_response=responses,
-                standardized_response=LabelDetectionAsyncDataClass(labels=labels),
+                original_response=assembler.original_response,
+                standardized_response=LabelDetectionAsyncDataClass(
+                    labels=assembler.items
+                ),
                 provider_job_id=provider_job_id,
             )
         return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
@@ -221,33 +209,19 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_text_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            texts = []
-            for response in responses:
-                texts.extend(amazon_video_text_parser(response))
+            # each page is parsed as soon as it is fetched
+            pages = amazon_video_job_pages(
+                self.clients["video"].get_text_detection,
+                provider_job_id,
+                first_page=response,
+            )
+            assembler = PageAssembler(amazon_video_text_parser).consume(pages)
 
             return AsyncResponseType(
-                original_response=responses,
-                standardized_response=TextDetectionAsyncDataClass(texts=texts),
+                original_response=assembler.original_response,
+                standardized_response=TextDetectionAsyncDataClass(
+                    texts=assembler.items
+                ),
                 provider_job_id=provider_job_id,
             )
         return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
@@ -267,33 +241,19 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_face_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            faces = []
-            for response in responses:
-                faces.extend(amazon_video_face_parser(response))
+            # each page is parsed as soon as it is fetched
+            pages = amazon_video_job_pages(
+                self.clients["video"].get_face_detection,
+                provider_job_id,
+                first_page=response,
+            )
+            assembler = PageAssembler(amazon_video_face_parser).consume(pages)
 
             return AsyncResponseType(
-                original_response=responses,
-                standardized_response=FaceDetectionAsyncDataClass(faces=faces),
+                original_response=assembler.original_response,
+                standardized_response=FaceDetectionAsyncDataClass(
+                    faces=assembler.items
+                ),
                 provider_job_id=provider_job_id,
             )
         return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
@@ -313,33 +273,21 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_person_tracking, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            persons = []
-            for response in responses:
-                persons.extend(amazon_video_person_tracking_parser(response))
+            # each page is parsed as soon as it is fetched
+            pages = amazon_video_job_pages(
+                self.clients["video"].get_person_tracking,
+                provider_job_id,
+                first_page=response,
+            )
+            assembler = PageAssembler(amazon_video_person_tracking_parser).consume(
+                pages
+            )
 
             return AsyncResponseType(
-                original_response=responses,
-                standardized_response=PersonTrackingAsyncDataClass(persons=persons),
+                original_response=assembler.original_response,
+                standardized_response=PersonTrackingAsyncDataClass(
+                    persons=assembler.items
+                ),
                 provider_job_id=provider_job_id,
             )
         return AsyncPendingResponseType(provider_job_id=response["JobStatus"])
@@ -359,34 +307,18 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_content_moderation, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
-            moderated_content = []
-            for response in responses:
-                moderated_content.extend(amazon_video_explicit_parser(response))
+            # each page is parsed as soon as it is fetched
+            pages = amazon_video_job_pages(
+                self.clients["video"].get_content_moderation,
+                provider_job_id,
+                first_page=response,
+            )
+            assembler = PageAssembler(amazon_video_explicit_parser).consume(pages)
 
             return AsyncResponseType(
-                original_response=responses,
+                original_response=assembler.original_response,
                 standardized_response=ExplicitContentDetectionAsyncDataClass(
-                    moderation=moderated_content
+                    moderation=assembler.items
                 ),
                 provider_job_id=provider_job_id,
             )
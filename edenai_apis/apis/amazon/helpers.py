@@ -1,7 +1,17 @@
 import urllib
 from pathlib import Path
 from time import time
-from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Sequence
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Sequence,
+    Union,
+)
 
 import requests
 from botocore.exceptions import ClientError, ParamValidationError
@@ -93,13 +103,18 @@ from edenai_apis.features.video.text_detection_async.text_detection_async_datacl
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.bounding_box import BoundingBox as BBox
+from edenai_apis.utils.bulk_operations import DatasetEntry, is_retryable_error
 from edenai_apis.utils.conversion import convert_string_to_number
 from edenai_apis.utils.exception import (
     AsyncJobException,
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http_sessions import provider_session
+from edenai_apis.utils.pagination import iter_pages
 from edenai_apis.utils.ssml import convert_audio_attr_in_prosody_tag
+from edenai_apis.utils.staging_registry import staging_registry
+from edenai_apis.utils.staging_upload import upload_file_to_s3_bucket
 from edenai_apis.utils.types import (
     ResponseType,
 )
@@ -194,14 +209,18 @@ def _upload_video_file_to_amazon_server(file: str, file_name: str, api_settings:
     :param video:       String that contains the video file path
     :return:            String that contains the filename on the server
     """
-    # Store file in an Amazon server
-    file_extension = file.split(".")[-1]
-    filename = str(int(time())) + file_name.stem + "_video_." + file_extension
-    storage_clients(api_settings)["video"].meta.client.upload_file(
-        file, api_settings["bucket_video"], filename
-    )
+    # Store file in an Amazon server, once per content
+    bucket = api_settings["bucket_video"]
 
-    return filename
+    def upload() -> str:
+        file_extension = file.split(".")[-1]
+        filename = str(int(time())) + file_name.stem + "_video_." + file_extension
+        upload_file_to_s3_bucket(
+            storage_clients(api_settings)["video"].meta.client, file, bucket, filename
+        )
+        return filename
+
+    return staging_registry.stage(f"s3:{bucket}", file, upload)
 
 
 def amazon_get_video_data(file: str):
@@ -236,6 +255,35 @@ def amazon_video_original_response(
     return response
 
 
+def amazon_video_job_pages(
+    get_method: Callable, provider_job_id: str, first_page: Optional[dict] = None
+) -> Iterator[dict]:
+    """Lazily fetch the result pages of a finished Rekognition video job
+
+    Args:
+        get_method (Callable): rekognition `get_*` method of the job
+        provider_job_id (str): job id
+        first_page (dict): first page, already fetched to check the job status
+
+    Returns:
+        Iterator[dict]: the pages, fetched one at a time
+    """
+
+    def fetch_page(pagination_token: Optional[str]) -> dict:
+        payload = {"JobId": provider_job_id}
+        if pagination_token:
+            payload["NextToken"] = pagination_token
+        response = handle_amazon_call(get_method, **payload)
+        if response["JobStatus"] == "FAILED":
+            error: str = response.get(
+                "StatusMessage", "Amazon returned a job status: FAILED"
+            )
+            raise ProviderException(error)
+        return response
+
+    return iter_pages(fetch_page, first_page=first_page)
+
+
 def amazon_custom_document_parsing_formatter(
     pages: List[dict],
 ) -> ResponseType[CustomDocumentParsingAsyncDataClass]:
@@ -845,6 +893,39 @@ def amazon_data_extraction_formatter(
     return DataExtractionDataClass(fields=items)
 
 
+# throttling errors of AWS APIs, most are returned with a 400 status code
+THROTTLING_ERRORS = (
+    "ThrottlingException",
+    "ProvisionedThroughputExceededException",
+    "LimitExceededException",
+    "TooManyRequestsException",
+)
+
+
+def is_throttling_error(exc: Exception) -> bool:
+    """Whether a call failed with an error worth retrying after a backoff"""
+    return is_retryable_error(exc) or (
+        isinstance(exc, ProviderException)
+        and any(error in str(exc) for error in THROTTLING_ERRORS)
+    )
+
+
+def rekognition_image(entry: DatasetEntry) -> Dict:
+    """`Image` parameter of Rekognition for a file, an url or an s3:// object"""
+    if entry.file.startswith("s3://"):
+        bucket, _, key = entry.file[len("s3://") :].partition("/")
+        return {"S3Object": {"Bucket": bucket, "Name": key}}
+    if entry.is_url:
+        response = provider_session("amazon").get(entry.file, timeout=60)
+        if response.status_code >= 400:
+            raise ProviderException(
+                f"Could not download {entry.file}", code=response.status_code
+            )
+        return {"Bytes": response.content}
+    with open(entry.file, "rb") as file_:
+        return {"Bytes": file_.read()}
+
+
 def handle_amazon_call(func: Callable, **kwargs):
     job_id_strings_errors = [
         "InvalidJobIdException",
@@ -897,6 +978,22 @@ async def ahandle_amazon_call(func: Callable, **kwargs):
     return response
 
 
+def comprehend_batch_results(
+    response: Dict, count: int, standardize: Callable[[Dict], T]
+) -> List[Union[T, ProviderException]]:
+    """Standardized result, or error, of each document of a `batch_detect_*` call"""
+    results: List[Union[T, ProviderException]] = [
+        ProviderException("Provider returned no result for this document")
+    ] * count
+    for result in response.get("ResultList") or []:
+        results[result["Index"]] = standardize(result)
+    for error in response.get("ErrorList") or []:
+        results[error["Index"]] = ProviderException(
+            error.get("ErrorMessage") or error.get("ErrorCode"), code=400
+        )
+    return results
+
+
 def amazon_video_person_tracking_parser(response):
     # gather all persons with the same index :
     persons_index = {index["Person"]["Index"] for index in response["Persons"]}
@@ -3,7 +3,7 @@ import json
 from io import BytesIO
 from pathlib import Path
 from time import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import httpx
 import requests
@@ -12,7 +12,7 @@ from edenai_apis.features import AudioInterface, ProviderInterface
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
 )
-from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.features.audio.tts import StreamTts, TtsDataClass
 from edenai_apis.utils.http_client import (
     async_client,
     AUDIO_TIMEOUT,
@@ -26,7 +26,10 @@ from edenai_apis.features.audio import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.tts import get_tts_config
+from edenai_apis.utils.http_sessions import provider_session
+from edenai_apis.utils.tts import TtsAudioStream, ahttp_audio_chunks, get_tts_config
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from edenai_apis.utils.types import (
     AsyncLaunchJobResponseType,
     AsyncResponseType,
@@ -50,6 +53,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         )
         self.api_key = self.api_settings["deepgram_key"]
         self.url = "https://api.deepgram.com/v1/listen"
+        self.session = provider_session(self.provider_name)
 
     def audio__speech_to_text_async__launch_job(
         self,
@@ -105,7 +109,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
             if isinstance(value, bool):
                 data_config[key] = str(value).lower()
 
-        response = requests.post(
+        response = self.session.post(
             self.url, headers=headers, json=data, params=data_config
         )
         original_response = response.json()
@@ -293,7 +297,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         }
 
         payload = {"text": text}
-        response = requests.post(
+        response = self.session.post(
             base_url,
             headers=headers,
             json=payload,
@@ -378,6 +382,8 @@ class DeepgramApi(ProviderInterface, AudioInterface):
             ),
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -388,8 +394,9 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         speaking_pitch: Optional[int] = None,
         speaking_volume: Optional[int] = None,
         provider_params: Optional[dict] = None,
+        stream: bool = False,
         **kwargs,
-    ) -> ResponseType[TtsDataClass]:
+    ) -> Union[ResponseType[TtsDataClass], StreamTts]:
         """Convert text to speech using Deepgram Aura API (async version).
 
         Args:
@@ -406,6 +413,8 @@ class DeepgramApi(ProviderInterface, AudioInterface):
                 - sample_rate: Audio sample rate in Hz
                 - encoding: Audio encoding (linear16, mulaw, alaw)
                 - container: Audio container format
+            stream: Yield audio chunks as they are synthesized instead of waiting
+                   for the whole audio (returns a StreamTts)
         """
         provider_params = provider_params or {}
         config = get_tts_config("deepgram")
@@ -438,6 +447,19 @@ class DeepgramApi(ProviderInterface, AudioInterface):
 
         payload = {"text": text}
 
+        if stream:
+            chunks = ahttp_audio_chunks(
+                "POST",
+                base_url,
+                AUDIO_TIMEOUT,
+                headers=headers,
+                json=payload,
+                params=params,
+            )
+            return StreamTts(
+                stream=TtsAudioStream(chunks, file_extension, provider="deepgram")
+            )
+
         try:
             async with async_client(AUDIO_TIMEOUT) as client:
                 response = await client.post(
@@ -511,6 +533,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         # Fall back to config default
         return config["default_voice"].lower()
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
@@ -572,7 +595,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         payload = {"text": text}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 base_url, headers=headers, json=payload, params=params
             )
             response.raise_for_status()
@@ -6,24 +6,32 @@ import mimetypes
 import os
 from io import BytesIO
 from time import sleep
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import aiofiles
-import requests
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.utils.http_client import async_client, DEFAULT_TIMEOUT
 from edenai_apis.features.translation.automatic_translation import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.batch_translation import (
+    BatchTranslationDataClass,
+)
 from edenai_apis.features.translation.document_translation.document_translation_dataclass import (
     DocumentTranslationDataClass,
 )
 from edenai_apis.features.translation.translation_interface import TranslationInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.batch_translation import (
+    BatchLimits,
+    abatch_translate,
+    batch_translate,
+)
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.file_handling import FileHandler
+from edenai_apis.utils.http_sessions import provider_session
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import (
     aupload_file_bytes_to_s3,
@@ -31,6 +39,10 @@ from edenai_apis.utils.upload_s3 import (
     USER_PROCESS,
 )
 
+# at most 50 texts per request. The request body is capped at 128 KiB: 30k
+# characters stay under it even when every character takes 4 bytes in UTF-8
+BATCH_LIMITS = BatchLimits(max_segments=50, max_characters=30_000)
+
 
 class DeeplApi(ProviderInterface, TranslationInterface):
     provider_name = "deepl"
@@ -44,6 +56,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
         self.header = {
             "authorization": f"DeepL-Auth-Key {self.api_key}",
         }
+        self.session = provider_session(self.provider_name)
 
     def translation__automatic_translation(
         self,
@@ -61,7 +74,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             "target_lang": target_language,
         }
 
-        response = requests.request("POST", url, headers=self.header, data=data)
+        response = self.session.request("POST", url, headers=self.header, data=data)
 
         if response.status_code >= 500:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -130,6 +143,99 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             standardized_response=standardized_response,
         )
 
+    def _translations(self, response) -> Dict:
+        """Translations of a /translate response (requests or httpx)"""
+        if response.status_code >= 500:
+            raise ProviderException(message=response.text, code=response.status_code)
+
+        try:
+            original_response = response.json()
+        except json.JSONDecodeError as exc:
+            raise ProviderException(
+                message=response.text, code=response.status_code
+            ) from exc
+
+        if response.status_code != 200:
+            raise ProviderException(
+                message=original_response["message"], code=response.status_code
+            )
+        return original_response
+
+    def translation__batch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        url = f"{self.url}translate"
+
+        def translate_pack(pack: List[str]):
+            data = {
+                "text": pack,
+                "source_lang": source_language,
+                "target_lang": target_language,
+            }
+            response = self.session.request("POST", url, headers=self.header, data=data)
+            original_response = self._translations(response)
+            return [
+                translation["text"] for translation in original_response["translations"]
+            ], original_response
+
+        result = batch_translate(
+            self.provider_name,
+            model,
+            source_language,
+            target_language,
+            texts,
+            translate_pack,
+            BATCH_LIMITS,
+        )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
+    async def translation__abatch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        url = f"{self.url}translate"
+
+        async with async_client(DEFAULT_TIMEOUT) as client:
+
+            async def translate_pack(pack: List[str]):
+                data = {
+                    "text": pack,
+                    "source_lang": source_language,
+                    "target_lang": target_language,
+                }
+                response = await client.post(url, headers=self.header, data=data)
+                original_response = self._translations(response)
+                return [
+                    translation["text"]
+                    for translation in original_response["translations"]
+                ], original_response
+
+            result = await abatch_translate(
+                self.provider_name,
+                model,
+                source_language,
+                target_language,
+                texts,
+                translate_pack,
+                BATCH_LIMITS,
+            )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
     def translation__document_translation(
         self,
         file: str,
@@ -150,7 +256,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             data = {"target_lang": target_language, "source_lang": source_language}
 
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.url}document", headers=self.header, data=data, files=files
                 )
             except:
@@ -176,12 +282,12 @@ class DeeplApi(ProviderInterface, TranslationInterface):
 
         doc_key = {"document_key": document_key}
 
-        response_status = requests.post(
+        response_status = self.session.post(
             f"{self.url}document/{document_id}", headers=self.header, data=doc_key
         ).json()
         try:
             while response_status["status"] != "done":
-                response_status = requests.post(
+                response_status = self.session.post(
                     f"{self.url}document/{document_id}",
                     headers=self.header,
                     data=doc_key,
@@ -192,7 +298,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
         except KeyError as exc:
             raise ProviderException("Internal server error", 500) from exc
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.url}document/{document_id}/result",
             headers=self.header,
             data=doc_key,
@@ -1,6 +1,6 @@
 import base64
 from io import BytesIO
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 import httpx
 import requests
@@ -10,12 +10,15 @@ from edenai_apis.utils.http_client import async_client, AUDIO_TIMEOUT
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
 )
-from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.features.audio.tts import StreamTts, TtsDataClass
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.tts import get_tts_config
+from edenai_apis.utils.http_sessions import provider_session
+from edenai_apis.utils.tts import TtsAudioStream, ahttp_audio_chunks, get_tts_config
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import (
     USER_PROCESS,
@@ -41,6 +44,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             "Content-Type": "application/json",
             "xi-api-key": self.api_key,
         }
+        self.session = provider_session(self.provider_name)
 
     def __get_model_from_voice(voice_id: str):
         if "Multilingual" in voice_id:
@@ -63,7 +67,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
         headers = {
             "Authorization": f"Bearer {api_key}",
         }
-        response = requests.post(
+        response = provider_session("openai").post(
             "https://api.openai.com/v1/moderations",
             headers=headers,
             json={"input": text},
@@ -106,7 +110,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             "model_id": model,
             "voice_settings": {"stability": 0.5, "similarity_boost": 0.5},
         }
-        response = requests.post(url, json=data, headers=self.headers)
+        response = self.session.post(url, json=data, headers=self.headers)
 
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
@@ -169,6 +173,8 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             ),
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -179,8 +185,9 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
         speaking_pitch: Optional[int] = None,
         speaking_volume: Optional[int] = None,
         provider_params: Optional[dict] = None,
+        stream: bool = False,
         **kwargs,
-    ) -> ResponseType[TtsDataClass]:
+    ) -> Union[ResponseType[TtsDataClass], StreamTts]:
         """Convert text to speech using ElevenLabs API (async version).
 
         Args:
@@ -196,6 +203,8 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             provider_params: Additional ElevenLabs API parameters. Top-level params
                 (language_code, seed, previous_text, next_text, etc.) are sent as
                 body params; all others override voice_settings.
+            stream: Yield audio chunks as they are synthesized instead of waiting
+                   for the whole audio (returns a StreamTts)
         """
         provider_params = provider_params or {}
         config = get_tts_config("elevenlabs")
@@ -266,6 +275,14 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             **top_level_params,
         }
 
+        if stream:
+            chunks = ahttp_audio_chunks(
+                "POST", f"{url}/stream", AUDIO_TIMEOUT, json=data, headers=self.headers
+            )
+            return StreamTts(
+                stream=TtsAudioStream(chunks, file_extension, provider="elevenlabs")
+            )
+
         try:
             async with async_client(AUDIO_TIMEOUT) as client:
                 response = await client.post(url, json=data, headers=self.headers)
@@ -289,6 +306,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
         except httpx.RequestError as exc:
             raise ProviderException(message=f"Request failed: {exc}", code=500) from exc
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
@@ -387,7 +405,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
         }
 
         try:
-            response = requests.post(url, json=data, headers=self.headers)
+            response = self.session.post(url, json=data, headers=self.headers)
             response.raise_for_status()
         except requests.exceptions.Timeout as exc:
             raise ProviderException(message="Request timed out", code=408) from exc
@@ -1,14 +1,21 @@
 import os
-from typing import Dict
+from typing import Any, Callable, Dict
 
-from google.cloud import aiplatform, storage
+from google.cloud import storage
 from google.cloud import translate_v3 as translate
-from google.cloud import videointelligence, vision
+from google.cloud import texttospeech, videointelligence, vision
+from google.cloud.speech_v2 import SpeechClient
 from edenai_apis.loaders.utils import check_empty_values
 from google.cloud.language import LanguageServiceClient
 from google.oauth2 import service_account
 
 from edenai_apis.apis.google.google_audio_api import GoogleAudioApi
+from edenai_apis.apis.google.google_clients import (
+    GoogleClients,
+    credentials_key,
+    get_client,
+    init_aiplatform,
+)
 from edenai_apis.apis.google.google_image_api import GoogleImageApi
 from edenai_apis.apis.google.google_llm_api import GoogleLLMApi
 from edenai_apis.apis.google.google_ocr_api import GoogleOcrApi
@@ -46,34 +53,45 @@ class GoogleApi(
         self.webhook_token = self.webhook_settings["webhook_token"]
         self.project_id = self.api_settings["project_id"]
 
-        clients_init_payload = {}
-        self.clients = {
-            "llm_client": LLMEngine(
+        # clients are shared by the instances using the same credentials
+        self.credentials_key = credentials_key(self.api_settings, self.location)
+        self.clients_payload: Dict = {}
+        factories = {
+            "llm_client": lambda: LLMEngine(
                 provider_name="gemini",
                 provider_config={
                     "api_key": self.api_settings.get("genai_api_key"),
                 },
             ),
+            # default credentials when none are configured, as before
+            "tts": lambda: texttospeech.TextToSpeechClient(**self.clients_payload),
+            "speech": lambda: SpeechClient(**self.clients_payload),
         }
         if self.location:
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.location
-            self.__set_remaining_clients(clients_init_payload)
+            factories.update(self.__remaining_clients_factories())
         else:
             if not check_empty_values(self.api_settings, ["genai_api_key"]):
-                credentials = service_account.Credentials.from_service_account_info(
-                    self.api_settings
+                self.clients_payload["credentials"] = get_client(
+                    self.credentials_key,
+                    "credentials",
+                    lambda: service_account.Credentials.from_service_account_info(
+                        self.api_settings
+                    ),
                 )
-                clients_init_payload["credentials"] = credentials
-                self.__set_remaining_clients(clients_init_payload)
+                factories.update(self.__remaining_clients_factories())
+        self.clients = GoogleClients(self.credentials_key, factories)
 
-        aiplatform.init(project=self.project_id, **clients_init_payload)
+        init_aiplatform(
+            self.credentials_key, project=self.project_id, **self.clients_payload
+        )
 
-    def __set_remaining_clients(self, payload: Dict):
-        self.clients = {
-            **self.clients,
-            "image": vision.ImageAnnotatorClient(**payload),
-            "text": LanguageServiceClient(**payload),
-            "storage": storage.Client(**payload),
-            "video": videointelligence.VideoIntelligenceServiceClient(**payload),
-            "translate": translate.TranslationServiceClient(**payload),
+    def __remaining_clients_factories(self) -> Dict[str, Callable[[], Any]]:
+        payload = self.clients_payload
+        return {
+            "image": lambda: vision.ImageAnnotatorClient(**payload),
+            "text": lambda: LanguageServiceClient(**payload),
+            "storage": lambda: storage.Client(**payload),
+            "video": lambda: videointelligence.VideoIntelligenceServiceClient(**payload),
+            "translate": lambda: translate.TranslationServiceClient(**payload),
         }
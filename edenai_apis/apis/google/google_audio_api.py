@@ -2,15 +2,14 @@ import base64
 from io import BytesIO
 from pathlib import Path
 from time import time
-from typing import List, Optional
+from typing import List, Optional, Union
 
-import aiofiles
-import googleapiclient.discovery
 from gcloud.aio.storage import Storage as AsyncStorage
 from google.cloud import storage, texttospeech
-from google.cloud.speech_v2 import SpeechAsyncClient, SpeechClient
+from google.cloud.speech_v2 import SpeechAsyncClient
 from google.cloud.speech_v2.types import cloud_speech
 
+from edenai_apis.apis.google.google_clients import default_credentials, discovery_service
 from edenai_apis.apis.google.google_helpers import (
     generate_tts_params,
     get_right_audio_support_and_sampling_rate,
@@ -27,10 +26,14 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
 )
-from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.features.audio.tts import StreamTts, TtsDataClass
 from edenai_apis.utils.exception import LanguageException, ProviderException
 from edenai_apis.utils.ssml import is_ssml
-from edenai_apis.utils.tts import get_tts_config
+from edenai_apis.utils.staging_registry import staging_registry
+from edenai_apis.utils.staging_upload import aupload_file_to_gcs, upload_file_to_gcs
+from edenai_apis.utils.tts import TtsAudioStream, get_tts_config
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -61,7 +64,7 @@ class GoogleAudioApi(AudioInterface):
     ) -> ResponseType[TextToSpeechDataClass]:
         voice_type = 1
 
-        client = texttospeech.TextToSpeechClient()
+        client = self.clients["tts"]
 
         if is_ssml(text):
             input_text = texttospeech.SynthesisInput(ssml=text)
@@ -178,6 +181,8 @@ class GoogleAudioApi(AudioInterface):
             standardized_response=standardized_response,
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -188,8 +193,9 @@ class GoogleAudioApi(AudioInterface):
         speaking_pitch: Optional[int] = None,
         speaking_volume: Optional[int] = None,
         provider_params: Optional[dict] = None,
+        stream: bool = False,
         **kwargs,
-    ) -> ResponseType[TtsDataClass]:
+    ) -> Union[ResponseType[TtsDataClass], StreamTts]:
         """Convert text to speech using Google Cloud TTS API (async version).
 
         Args:
@@ -207,6 +213,8 @@ class GoogleAudioApi(AudioInterface):
                 - language_code: Language code for Gemini TTS (default: "en-US")
                 - prompt: Natural language style instructions for Gemini TTS
                           (e.g., "Say this in a cheerful tone")
+            stream: Return a StreamTts instead of waiting for the S3 upload.
+                   Google returns the whole audio at once, so it is a single chunk
         """
         provider_params = provider_params or {}
         config = get_tts_config("google")
@@ -329,6 +337,19 @@ class GoogleAudioApi(AudioInterface):
             }
         }
 
+        if stream:
+
+            async def audio_chunks():
+                async with texttospeech.TextToSpeechAsyncClient() as client:
+                    response = await ahandle_google_call(
+                        client.synthesize_speech, **payload
+                    )
+                yield response.audio_content
+
+            return StreamTts(
+                stream=TtsAudioStream(audio_chunks(), ext, provider="google")
+            )
+
         async with texttospeech.TextToSpeechAsyncClient() as client:
             response = await ahandle_google_call(client.synthesize_speech, **payload)
 
@@ -343,6 +364,7 @@ class GoogleAudioApi(AudioInterface):
             standardized_response=standardized_response,
         )
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
@@ -494,7 +516,7 @@ class GoogleAudioApi(AudioInterface):
             }
         }
 
-        client = texttospeech.TextToSpeechClient()
+        client = self.clients["tts"]
         response = handle_google_call(client.synthesize_speech, **payload)
 
         audio_content = BytesIO(response.audio_content)
@@ -526,17 +548,22 @@ class GoogleAudioApi(AudioInterface):
         if not language:
             raise LanguageException("Language not provided")
 
-        audio_name = str(int(time())) + Path(file).stem + "." + export_format
-        # Upload file to google cloud
+        # Upload file to google cloud, once per content
         storage_client: storage.Client = self.clients["storage"]
         bucket_name = "audios-speech2text"
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(audio_name)
-        blob.upload_from_filename(file)
 
-        gcs_uri = f"gs://{bucket_name}/{audio_name}"
+        def upload() -> str:
+            audio_name = str(int(time())) + Path(file).stem + "." + export_format
+            bucket = storage_client.get_bucket(bucket_name)
+            blob = bucket.blob(audio_name)
+            upload_file_to_gcs(blob, file)
+            return f"gs://{bucket_name}/{audio_name}"
+
+        gcs_uri = staging_registry.stage(
+            f"gcs:{bucket_name}:.{export_format}", file, upload
+        )
         # Launch file transcription
-        client = SpeechClient()
+        client = self.clients["speech"]
 
         try:
             features = cloud_speech.RecognitionFeatures(**provider_params)
@@ -569,7 +596,7 @@ class GoogleAudioApi(AudioInterface):
     def audio__speech_to_text_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
-        service = googleapiclient.discovery.build("speech", "v1")
+        service = discovery_service("speech", "v1", default_credentials())
         service_request_ = service.operations().get(name=provider_job_id)
         original_response = handle_google_call(service_request_.execute)
 
@@ -625,27 +652,34 @@ class GoogleAudioApi(AudioInterface):
             bucket_name = "audios-speech2text"
 
             if file_url and not file:
-                # Download file from URL and get bytes directly
                 file_wrapper = await file_handler.download_file(file_url)
-                file_content = await file_wrapper.get_bytes()
+                file_path = file_wrapper.file_path
                 file_ext = file_wrapper.file_info.file_extension or "wav"
                 audio_name = str(int(time())) + "_audio." + file_ext
             elif file:
-                async with aiofiles.open(file, "rb") as f:
-                    file_content = await f.read()
+                file_path = file
                 audio_name = str(int(time())) + Path(file).stem + "." + export_format
             else:
                 raise ProviderException(
                     "Either file or file_url must be provided", code=400
                 )
 
-            # Upload to GCS using async storage client
-            async with AsyncStorage() as async_storage:
-                await async_storage.upload(
-                    bucket_name, audio_name, file_content
-                )
-
-            gcs_uri = f"gs://{bucket_name}/{audio_name}"
+            content = file_path or await file_wrapper.get_bytes()
+
+            async def upload() -> str:
+                if file_path:
+                    # Stream from disk with concurrent chunked upload
+                    blob = self.clients["storage"].bucket(bucket_name).blob(audio_name)
+                    await aupload_file_to_gcs(blob, file_path)
+                else:
+                    # Small downloads are kept in memory
+                    async with AsyncStorage() as async_storage:
+                        await async_storage.upload(bucket_name, audio_name, content)
+                return f"gs://{bucket_name}/{audio_name}"
+
+            gcs_uri = await staging_registry.astage(
+                f"gcs:{bucket_name}:{Path(audio_name).suffix}", content, upload
+            )
 
             # Launch file transcription using async client
             try:
@@ -0,0 +1,145 @@
+"""
+Process-wide cache of the Google clients.
+
+Building a Google client is costly (credentials parsing, gRPC channel, discovery
+document), and GoogleApi is instantiated for every call. Clients are therefore shared by
+every instance using the same credentials:
+    - gRPC clients (thread-safe) are created once per credentials, on first use, so that
+      an instance only opens the channels it needs,
+    - discovery-based services (googleapiclient, used by the polling of async jobs) are
+      built from the static discovery documents shipped with the library, once per
+      thread and credentials as their http transport isn't thread-safe,
+    - `aiplatform.init` is only called again when the credentials change.
+
+The number of cached clients is bounded, least recently used ones are dropped first.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+import google.auth
+import googleapiclient.discovery
+from google.cloud import aiplatform
+
+MAX_CACHED_CLIENTS = int(os.environ.get("EDENAI_GOOGLE_CLIENTS_CACHE_SIZE", 256))
+CLOUD_PLATFORM_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
+_clients: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+_lock = threading.RLock()
+_local = threading.local()
+_default_credentials: Dict[Tuple[str, ...], Any] = {}
+_aiplatform_key: Optional[str] = None
+
+
+def credentials_key(api_settings: Dict[str, Any], location: Optional[str] = None) -> str:
+    """Identifier of the credentials of a GoogleApi instance"""
+    if location:
+        try:
+            modified = os.stat(location).st_mtime_ns
+        except OSError:
+            modified = 0
+        identity = f"file:{location}:{modified}"
+    else:
+        identity = json.dumps(api_settings, sort_keys=True, default=str)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def get_client(key: str, name: str, factory: Callable[[], Any]) -> Any:
+    """Client `name` of the credentials `key`, created with `factory` on first use"""
+    with _lock:
+        client = _clients.get((key, name))
+        if client is None:
+            client = factory()
+            _clients[(key, name)] = client
+            while len(_clients) > MAX_CACHED_CLIENTS:
+                _clients.popitem(last=False)
+        else:
+            _clients.move_to_end((key, name))
+        return client
+
+
+def default_credentials(scopes: Sequence[str] = CLOUD_PLATFORM_SCOPES) -> Any:
+    """Application default credentials, loaded once per process (refreshed when needed)"""
+    with _lock:
+        credentials = _default_credentials.get(tuple(scopes))
+        if credentials is None:
+            credentials, _ = google.auth.default(scopes=list(scopes))
+            _default_credentials[tuple(scopes)] = credentials
+        return credentials
+
+
+def discovery_service(
+    service_name: str,
+    version: str,
+    credentials: Any = None,
+    api_endpoint: Optional[str] = None,
+) -> Any:
+    """
+    googleapiclient service built from its static discovery document, cached per thread,
+    credentials and endpoint
+    """
+    services = getattr(_local, "services", None)
+    if services is None:
+        services = _local.services = {}
+    key = (service_name, version, id(credentials), api_endpoint)
+    cached = services.get(key)
+    # the credentials are kept with the service so that their id isn't reused
+    if cached is not None and cached[0] is credentials:
+        return cached[1]
+    service = googleapiclient.discovery.build(
+        serviceName=service_name,
+        version=version,
+        credentials=credentials,
+        client_options={"api_endpoint": api_endpoint} if api_endpoint else None,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+    services[key] = (credentials, service)
+    return service
+
+
+def init_aiplatform(key: str, project: str, **payload: Any) -> None:
+    """`aiplatform.init`, only when the credentials changed since the last call"""
+    global _aiplatform_key
+    with _lock:
+        if _aiplatform_key == key:
+            return
+        aiplatform.init(project=project, **payload)
+        _aiplatform_key = key
+
+
+def clear() -> None:
+    global _aiplatform_key
+    with _lock:
+        _clients.clear()
+        _default_credentials.clear()
+        _aiplatform_key = None
+    _local.__dict__.clear()
+
+
+class GoogleClients(Mapping):
+    """
+    Clients of a GoogleApi instance, created on first access and shared by the instances
+    using the same credentials
+
+    Args:
+        key (str): identifier of the credentials, see `credentials_key`
+        factories (dict): function creating each client, by name
+    """
+
+    def __init__(self, key: str, factories: Dict[str, Callable[[], Any]]) -> None:
+        self.key = key
+        self._factories = factories
+
+    def __getitem__(self, name: str) -> Any:
+        return get_client(self.key, name, self._factories[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
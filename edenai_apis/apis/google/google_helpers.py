@@ -1,18 +1,18 @@
 import enum
 import json
 import re
-from typing import List, Sequence
+from typing import Awaitable, Callable, List, Sequence
 from typing import Tuple
 from http import HTTPStatus
 import requests
 
 import google
 import google.auth
-import googleapiclient.discovery
 from google.cloud.documentai_v1beta3 import Document
 from google.api_core.exceptions import GoogleAPIError
 from google.oauth2 import service_account
 
+from edenai_apis.apis.google.google_clients import default_credentials, discovery_service
 from edenai_apis.features.ocr.ocr_async.ocr_async_dataclass import (
     BoundingBox,
     Line,
@@ -31,6 +31,12 @@ from edenai_apis.features.ocr.ocr_tables_async.ocr_tables_async_dataclass import
 from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass import (
     SentimentEnum,
 )
+from edenai_apis.utils.batch_documents import (
+    BatchDocumentsResult,
+    DocumentLimits,
+    abatch_documents,
+    batch_documents,
+)
 from edenai_apis.utils.conversion import convert_pitch_from_percentage_to_semitones
 from edenai_apis.utils.exception import (
     AsyncJobException,
@@ -38,7 +44,7 @@ from edenai_apis.utils.exception import (
     ProviderException,
 )
 from edenai_apis.utils.conversion import convert_string_to_number
-from edenai_apis.utils.types import AsyncResponseType
+from edenai_apis.utils.types import AsyncResponseType, ResponseType
 from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import (
     FinancialParserDataClass,
     FinancialMerchantInformation,
@@ -155,20 +161,49 @@ async def ahandle_google_call(function_to_call, **kwargs):
     return response
 
 
+
+# Natural Language and Translation detect_language take a single document per request
+BATCH_DOCUMENT_LIMITS = DocumentLimits(max_documents=1, max_document_bytes=1_000_000)
+BATCH_CONCURRENCY = 8
+
+
+def batch_one_by_one(
+    analyze: Callable[[str], ResponseType], texts: List[str]
+) -> BatchDocumentsResult:
+    """Batch of documents sent concurrently, one `analyze` call per document"""
+
+    def analyze_chunk(chunk: List[str]):
+        response = analyze(chunk[0])
+        return [response.standardized_response], response.original_response
+
+    return batch_documents(
+        texts, analyze_chunk, BATCH_DOCUMENT_LIMITS, max_concurrency=BATCH_CONCURRENCY
+    )
+
+
+async def abatch_one_by_one(
+    analyze: Callable[[str], Awaitable[ResponseType]], texts: List[str]
+) -> BatchDocumentsResult:
+    """Async version of `batch_one_by_one`, `analyze` is a coroutine function"""
+
+    async def analyze_chunk(chunk: List[str]):
+        response = await analyze(chunk[0])
+        return [response.standardized_response], response.original_response
+
+    return await abatch_documents(
+        texts, analyze_chunk, BATCH_DOCUMENT_LIMITS, max_concurrency=BATCH_CONCURRENCY
+    )
+
 def score_to_rate(score):
     return abs(score)
 
 
 def google_video_get_job(provider_job_id: str):
-    scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-    credentials, _ = google.auth.default(scopes=scopes)
-    service = googleapiclient.discovery.build(
-        serviceName="videointelligence",
-        version="v1",
-        credentials=credentials,
-        client_options={
-            "api_endpoint": "https://videointelligence.googleapis.com/",
-        },
+    service = discovery_service(
+        "videointelligence",
+        "v1",
+        default_credentials(),
+        api_endpoint="https://videointelligence.googleapis.com/",
     )
     payload_request = {"name": provider_job_id}
     request = handle_google_call(
@@ -1,13 +1,12 @@
 import asyncio
 import base64
-from io import BytesIO
 import json
 from typing import Sequence, Optional
 import aiofiles
 import numpy as np
 import mimetypes
 import requests
-from PIL import Image as Img, UnidentifiedImageError
+from PIL import UnidentifiedImageError
 from google.cloud import vision
 from google.cloud.vision_v1.types.image_annotator import AnnotateImageResponse
 from google.protobuf.json_format import MessageToDict
@@ -60,6 +59,7 @@ from edenai_apis.features.image.question_answer import QuestionAnswerDataClass
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.file_handling import FileHandler
 from edenai_apis.utils.http_client import async_client, IMAGE_TIMEOUT
+from edenai_apis.utils.media_probe import aget_image_size, get_image_size
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.features.image.embeddings import (
     EmbeddingsDataClass,
@@ -276,7 +276,7 @@ class GoogleImageApi(ImageInterface):
         with open(file, "rb") as file_:
             file_content = file_.read()
         try:
-            img_size = Img.open(BytesIO(file_content)).size
+            img_size = get_image_size(file_content)
         except UnidentifiedImageError:
             raise ProviderException(message="Can not identify image file", code=400)
         image = vision.Image(content=file_content)
@@ -439,7 +439,7 @@ class GoogleImageApi(ImageInterface):
 
             result = []
             try:
-                img_size = Img.open(BytesIO(file_content)).size
+                img_size = await aget_image_size(file_content)
             except UnidentifiedImageError:
                 raise ProviderException(message="Can not identify image file", code=400)
             width, height = img_size
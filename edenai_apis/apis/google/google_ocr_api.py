@@ -7,10 +7,8 @@ from io import BytesIO
 from typing import Sequence
 
 import aiofiles
-import google.auth
-import googleapiclient.discovery
 import httpx
-from PIL import Image as Img, UnidentifiedImageError
+from PIL import UnidentifiedImageError
 from google.api_core.client_options import ClientOptions
 from google.cloud import documentai_v1beta3 as documentai
 from google.cloud import vision
@@ -20,6 +18,7 @@ from google.cloud.vision_v1.types.image_annotator import (
 )
 from google.protobuf.json_format import MessageToDict
 
+from edenai_apis.apis.google.google_clients import default_credentials, discovery_service
 from edenai_apis.apis.google.google_helpers import (
     google_ocr_tables_standardize_response,
     handle_done_response_ocr_async,
@@ -63,7 +62,9 @@ from edenai_apis.utils.exception import (
     ProviderException,
 )
 from edenai_apis.utils.file_handling import FileHandler
+from edenai_apis.utils.media_probe import aget_image_size, get_image_size
 from edenai_apis.utils.pdfs import get_pdf_width_height
+from edenai_apis.utils.staging_upload import upload_file_to_gcs
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -87,8 +88,7 @@ class GoogleOcrApi(OcrInterface):
         mimetype = mimetypes.guess_type(file)[0] or "unrecognized"
         if mimetype.startswith("image"):
             try:
-                with Img.open(file) as img:
-                    width, height = img.size
+                width, height = get_image_size(file)
             except UnidentifiedImageError as exc:
                 raise ProviderException(
                     "Image could not be identified. Supported types are: image/* and application/pdf"
@@ -159,10 +159,7 @@ class GoogleOcrApi(OcrInterface):
 
             if mimetype.startswith("image"):
                 try:
-                    def _get_image_size(content):
-                        with Img.open(BytesIO(content)) as img:
-                            return img.size
-                    width, height = await asyncio.to_thread(_get_image_size, file_content)
+                    width, height = await aget_image_size(file_content)
                 except UnidentifiedImageError as exc:
                     raise ProviderException(
                         "Image could not be identified. Supported types are: image/* and application/pdf"
@@ -510,7 +507,7 @@ class GoogleOcrApi(OcrInterface):
             bucket_client = self.clients["storage"]
             ocr_tables_bucket = bucket_client.get_bucket("async-ocr-tables")
             new_blob = ocr_tables_bucket.blob(file_name)
-            new_blob.upload_from_filename(file_content_path)
+            upload_file_to_gcs(new_blob, file_content_path)
 
             doc_ai = documentai.DocumentProcessorServiceClient(
                 client_options={"api_endpoint": "eu-documentai.googleapis.com"}
@@ -546,18 +543,15 @@ class GoogleOcrApi(OcrInterface):
     def ocr__ocr_tables_async__get_job_result(
         self, job_id: str
     ) -> ResponseType[OcrTablesAsyncDataClass]:
-        scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        credentials, _ = google.auth.default(scopes=scopes)
-
         documentai_projectid = self.api_settings["documentai"]["project_id"]
 
         name = f"projects/{documentai_projectid}/locations/eu/operations/{job_id}"
 
-        service = googleapiclient.discovery.build(
-            serviceName="documentai",
-            version="v1beta3",
-            credentials=credentials,
-            client_options={"api_endpoint": "https://eu-documentai.googleapis.com"},
+        service = discovery_service(
+            "documentai",
+            "v1beta3",
+            default_credentials(),
+            api_endpoint="https://eu-documentai.googleapis.com",
         )
 
         request = service.projects().locations().operations().get(name=name)
@@ -822,7 +816,7 @@ class GoogleOcrApi(OcrInterface):
 
             ocr_async_bucket = self.clients["storage"].get_bucket("ocr-async")
             new_blob = ocr_async_bucket.blob(filename)
-            new_blob.upload_from_filename(file_path)
+            upload_file_to_gcs(new_blob, file_path)
 
             feature = vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)
 
@@ -853,16 +847,13 @@ class GoogleOcrApi(OcrInterface):
     def ocr__ocr_async__get_job_result(
         self, job_id: str
     ) -> ResponseType[OcrAsyncDataClass]:
-        scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        credentials, _ = google.auth.default(scopes=scopes)
-
         name = f"projects/{self.project_id}/operations/{job_id}"
 
-        service = googleapiclient.discovery.build(
-            serviceName="vision",
-            version="v1",
-            credentials=credentials,
-            client_options={"api_endpoint": "https://vision.googleapis.com"},
+        service = discovery_service(
+            "vision",
+            "v1",
+            default_credentials(),
+            api_endpoint="https://vision.googleapis.com",
         )
 
         request = service.projects().operations().get(name=name)
@@ -4,6 +4,8 @@ from typing import Dict, List, Literal, Optional, Sequence, Union
 
 import requests
 from edenai_apis.apis.google.google_helpers import (
+    abatch_one_by_one,
+    batch_one_by_one,
     get_access_token,
     get_tag_name,
     handle_google_call,
@@ -13,6 +15,8 @@ from edenai_apis.apis.google.google_helpers import (
     palm_request,
 )
 from edenai_apis.features.text import (
+    BatchNamedEntityRecognitionDataClass,
+    BatchSentimentAnalysisDataClass,
     ChatDataClass,
     CodeGenerationDataClass,
     GenerationDataClass,
@@ -144,6 +148,32 @@ class GoogleTextApi(TextInterface):
             original_response=response, standardized_response=standardized_response
         )
 
+    def text__batch_named_entity_recognition(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        result = batch_one_by_one(
+            lambda text: self.text__named_entity_recognition(language, text), texts
+        )
+        return ResponseType[BatchNamedEntityRecognitionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchNamedEntityRecognitionDataClass(
+                items=result.items
+            ),
+        )
+
+    async def text__abatch_named_entity_recognition(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        result = await abatch_one_by_one(
+            lambda text: self.text__anamed_entity_recognition(language, text), texts
+        )
+        return ResponseType[BatchNamedEntityRecognitionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchNamedEntityRecognitionDataClass(
+                items=result.items
+            ),
+        )
+
     def text__sentiment_analysis(
         self, language: str, text: str, model: Optional[str] = None, **kwargs
     ) -> ResponseType[SentimentAnalysisDataClass]:
@@ -190,6 +220,17 @@ class GoogleTextApi(TextInterface):
             original_response=response, standardized_response=standarize
         )
 
+    def text__batch_sentiment_analysis(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        result = batch_one_by_one(
+            lambda text: self.text__sentiment_analysis(language, text), texts
+        )
+        return ResponseType[BatchSentimentAnalysisDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchSentimentAnalysisDataClass(items=result.items),
+        )
+
     def text__syntax_analysis(
         self, language: str, text: str, **kwargs
     ) -> ResponseType[SyntaxAnalysisDataClass]:
@@ -1,7 +1,7 @@
 import base64
 import mimetypes
 from io import BytesIO
-from typing import Sequence, Optional
+from typing import List, Sequence, Optional
 
 import aiofiles
 from google.cloud import translate_v3
@@ -9,11 +9,18 @@ from google.protobuf.json_format import MessageToDict
 
 from edenai_apis.apis.google.google_helpers import (
     ahandle_google_call,
+    batch_one_by_one,
     handle_google_call,
 )
 from edenai_apis.features.translation.automatic_translation import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.batch_language_detection import (
+    BatchLanguageDetectionDataClass,
+)
+from edenai_apis.features.translation.batch_translation import (
+    BatchTranslationDataClass,
+)
 from edenai_apis.features.translation.document_translation import (
     DocumentTranslationDataClass,
 )
@@ -22,6 +29,11 @@ from edenai_apis.features.translation.language_detection import (
     LanguageDetectionDataClass,
 )
 from edenai_apis.features.translation.translation_interface import TranslationInterface
+from edenai_apis.utils.batch_translation import (
+    BatchLimits,
+    abatch_translate,
+    batch_translate,
+)
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.file_handling import FileHandler
 from edenai_apis.utils.languages import get_language_name_from_code
@@ -32,6 +44,9 @@ from edenai_apis.utils.upload_s3 import (
     USER_PROCESS,
 )
 
+# 1024 texts and 30 000 code points per request
+BATCH_LIMITS = BatchLimits(max_segments=1024, max_characters=30_000)
+
 
 class GoogleTranslationApi(TranslationInterface):
     def translation__automatic_translation(
@@ -98,6 +113,84 @@ class GoogleTranslationApi(TranslationInterface):
             original_response=MessageToDict(response._pb), standardized_response=std
         )
 
+    def translation__batch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        client = self.clients["translate"]
+        parent = f"projects/{self.project_id}/locations/global"
+
+        def translate_pack(pack: List[str]):
+            response = handle_google_call(
+                client.translate_text,
+                parent=parent,
+                contents=pack,
+                mime_type="text/plain",
+                source_language_code=source_language,
+                target_language_code=target_language,
+            )
+            return [
+                translation.translated_text for translation in response.translations
+            ], MessageToDict(response._pb)
+
+        result = batch_translate(
+            self.provider_name,
+            model,
+            source_language,
+            target_language,
+            texts,
+            translate_pack,
+            BATCH_LIMITS,
+        )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
+    async def translation__abatch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        parent = f"projects/{self.project_id}/locations/global"
+
+        async with translate_v3.TranslationServiceAsyncClient() as client:
+
+            async def translate_pack(pack: List[str]):
+                response = await ahandle_google_call(
+                    client.translate_text,
+                    parent=parent,
+                    contents=pack,
+                    mime_type="text/plain",
+                    source_language_code=source_language,
+                    target_language_code=target_language,
+                )
+                return [
+                    translation.translated_text
+                    for translation in response.translations
+                ], MessageToDict(response._pb)
+
+            result = await abatch_translate(
+                self.provider_name,
+                model,
+                source_language,
+                target_language,
+                texts,
+                translate_pack,
+                BATCH_LIMITS,
+            )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
     def translation__language_detection(
         self, text: str, model: Optional[str] = None, **kwargs
     ) -> ResponseType[LanguageDetectionDataClass]:
@@ -127,6 +220,15 @@ class GoogleTranslationApi(TranslationInterface):
             standardized_response=LanguageDetectionDataClass(items=items),
         )
 
+    def translation__batch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        result = batch_one_by_one(self.translation__language_detection, texts)
+        return ResponseType[BatchLanguageDetectionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchLanguageDetectionDataClass(items=result.items),
+        )
+
     def translation__document_translation(
         self,
         file: str,
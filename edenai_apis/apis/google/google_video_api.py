@@ -1,6 +1,8 @@
 import base64
+import hashlib
 import json
 import mimetypes
+import os
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
@@ -89,10 +91,16 @@ from edenai_apis.utils.types import (
 )
 from edenai_apis.utils.file_handling import FileHandler
 from edenai_apis.utils.http_client import async_client, ASYNC_JOBS_TIMEOUT
+from edenai_apis.utils.staging_registry import staging_registry
+from edenai_apis.utils.staging_upload import upload_file_to_gcs
 from edenai_apis.utils.upload_s3 import (
     USER_PROCESS,
     upload_file_bytes_to_s3,
 )
+from edenai_apis.utils.video_keyframes import Keyframe, extract_keyframes, video_proxy
+
+# `video_sampling` values: whole video, keyframes or low resolution copy
+VIDEO_SAMPLINGS = (None, "keyframes", "proxy")
 
 
 class GoogleVideoApi(VideoInterface):
@@ -103,17 +111,19 @@ class GoogleVideoApi(VideoInterface):
         # Launch async job for label detection
         storage_client = self.clients["storage"]
         bucket_name = "audios-speech2text"
-        file_extension = file.split(".")[-1]
-        file_name = str(int(time())) + Path(file).stem + "_video_." + file_extension
 
-        # Upload video to GCS
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(file_name)
+        def upload() -> str:
+            file_extension = file.split(".")[-1]
+            file_name = str(int(time())) + Path(file).stem + "_video_." + file_extension
+
+            # Upload video to GCS
+            bucket = storage_client.get_bucket(bucket_name)
+            blob = bucket.blob(file_name)
 
-        blob.upload_from_filename(file)
-        gcs_uri = f"gs://{bucket_name}/{file_name}"
+            upload_file_to_gcs(blob, file)
+            return f"gs://{bucket_name}/{file_name}"
 
-        return gcs_uri
+        return staging_registry.stage(f"gcs:{bucket_name}", file, upload)
 
     def _is_older_than_3_hours(self, create_time: str) -> bool:
         created_at = parse(create_time)
@@ -137,6 +147,61 @@ class GoogleVideoApi(VideoInterface):
         return response_json
 
     def _upload_and_process_file(self, file: str, api_key: str) -> Dict[str, Any]:
+        """Upload a file to Gemini, reusing the file already uploaded for the same content"""
+        # key the destination on the api key (hashed) as files belong to a project
+        destination = "gemini:" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        uploaded = {}
+
+        def upload() -> str:
+            uploaded.update(self._upload_file(file, api_key))
+            return uploaded["name"]
+
+        name = staging_registry.stage(
+            destination,
+            file,
+            upload,
+            on_expire=lambda staged: self.delete_file(
+                staged.location, api_key, force=True
+            ),
+        )
+        if uploaded:
+            return uploaded
+
+        try:
+            file_data = self._check_file_status(
+                f"https://generativelanguage.googleapis.com/v1beta/{name}", api_key
+            )
+        except ProviderException:
+            file_data = None
+        if (
+            not file_data
+            or file_data.get("state") == "FAILED"
+            or self._is_older_than_3_hours(file_data["createTime"])
+        ):
+            # deleted or expired on Gemini side, upload it again
+            staging_registry.invalidate(name)
+            return self._upload_and_process_file(file, api_key)
+        return file_data
+
+    def _upload_video(
+        self, file: str, api_key: str, video_sampling: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Upload a video to Gemini, or its low resolution copy for `proxy` sampling"""
+        if video_sampling not in VIDEO_SAMPLINGS:
+            raise ProviderException(
+                f"Invalid video_sampling '{video_sampling}', "
+                f"expected one of: {', '.join(filter(None, VIDEO_SAMPLINGS))}",
+                code=400,
+            )
+        if video_sampling != "proxy":
+            return self._upload_and_process_file(file, api_key)
+        proxy = video_proxy(file)
+        try:
+            return self._upload_and_process_file(proxy, api_key)
+        finally:
+            os.remove(proxy)
+
+    def _upload_file(self, file: str, api_key: str) -> Dict[str, Any]:
         upload_url = f"https://generativelanguage.googleapis.com/upload/v1beta/files?key={api_key}"
 
         with open(file, "rb") as video_file:
@@ -154,7 +219,10 @@ class GoogleVideoApi(VideoInterface):
 
         return file_data
 
-    def delete_file(self, file: str, api_key: str):
+    def delete_file(self, file: str, api_key: str, force: bool = False):
+        # files shared through the staging registry are deleted once they expire
+        if not force and staging_registry.holds(file):
+            return
         delete_url = (
             f"https://generativelanguage.googleapis.com/v1beta/{file}?key={api_key}"
         )
@@ -267,7 +335,16 @@ class GoogleVideoApi(VideoInterface):
     def video__explicit_content_detection_async__launch_job(
         self, file: str, file_url: str = "", **kwargs
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
+        if kwargs.get("video_sampling") in ("proxy", "keyframes"):
+            # moderation is done frame by frame, a low resolution copy without audio
+            # keeps the timestamps of the original
+            proxy = video_proxy(file, audio=False)
+            try:
+                gcs_uri = self.google_upload_video(file=proxy)
+            finally:
+                os.remove(proxy)
+        else:
+            gcs_uri = self.google_upload_video(file=file)
         # Configure the request for each feature
         operation = self.clients["video"].annotate_video(
             request={
@@ -769,40 +846,58 @@ class GoogleVideoApi(VideoInterface):
         return bytes_value / (1024 * 1024)
 
     def request_question_answer(
-        self, model, api_key, text, temperature, file_data, max_tokens=None
+        self,
+        model,
+        api_key,
+        text,
+        temperature,
+        file_data=None,
+        max_tokens=None,
+        keyframes: Optional[List[Keyframe]] = None,
     ):
         base_url = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
         url = base_url.format(model=model, api_key=api_key)
         generation_config = {"candidateCount": 1, "temperature": temperature}
         if max_tokens is not None:
             generation_config["maxOutputTokens"] = max_tokens
-        payload = {
-            "contents": [
+        parts: List[Dict[str, Any]] = [{"text": text}]
+        if file_data is not None:
+            parts.append(
+                {
+                    "file_data": {
+                        "mime_type": file_data["mimeType"],
+                        "file_uri": file_data["uri"],
+                    }
+                }
+            )
+        # keyframes are sent inline, with their position in the video
+        for keyframe in keyframes or []:
+            parts.append({"text": f"Frame at {keyframe.timestamp:.1f}s:"})
+            parts.append(
                 {
-                    "parts": [
-                        {"text": text},
-                        {
-                            "file_data": {
-                                "mime_type": file_data["mimeType"],
-                                "file_uri": file_data["uri"],
-                            }
-                        },
-                    ]
+                    "inline_data": {
+                        "mime_type": "image/jpeg",
+                        "data": base64.b64encode(keyframe.content).decode(),
+                    }
                 }
-            ],
+            )
+        payload = {
+            "contents": [{"parts": parts}],
             "generationConfig": generation_config,
         }
         response = requests.post(url, json=payload)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
-            self.delete_file(file=file_data["name"], api_key=api_key)
+            if file_data is not None:
+                self.delete_file(file=file_data["name"], api_key=api_key)
             raise ProviderException(
                 "An error occurred while parsing the response."
             ) from exc
 
         if response.status_code != 200:
-            self.delete_file(file=file_data["name"], api_key=api_key)
+            if file_data is not None:
+                self.delete_file(file=file_data["name"], api_key=api_key)
             raise ProviderException(
                 message=original_response["error"]["message"],
                 code=response.status_code,
@@ -832,9 +927,29 @@ class GoogleVideoApi(VideoInterface):
         **kwargs,
     ) -> QuestionAnswerDataClass:
         api_key = self.api_settings.get("genai_api_key")
-        file_data = self._upload_and_process_file(file, api_key)
+        # optional local sampling: only keyframes or a low resolution copy are sent
+        video_sampling = kwargs.get("video_sampling")
+        if video_sampling == "keyframes":
+            original_response, standardized_output = self.request_question_answer(
+                model=model,
+                api_key=api_key,
+                text=text,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                keyframes=extract_keyframes(file),
+            )
+            return ResponseType[QuestionAnswerDataClass](
+                original_response=original_response,
+                standardized_response=QuestionAnswerDataClass(
+                    answer=standardized_output.answer,
+                    finish_reason=standardized_output.finish_reason,
+                ),
+            )
+
+        file_data = self._upload_video(file, api_key, video_sampling)
         file_size_mb = self._bytes_to_mega(int(file_data.get("sizeBytes", 0)))
         if file_size_mb >= 100:
+            staging_registry.invalidate(file_data["name"])
             self.delete_file(file=file_data["name"], api_key=api_key)
             raise ProviderException(
                 message="The video file is too large (over 100 MB). Please use the asynchronous video question answering api instead.",
@@ -873,7 +988,11 @@ class GoogleVideoApi(VideoInterface):
     ) -> AsyncLaunchJobResponseType:
         data_job_id = {}
         api_key = self.api_settings.get("genai_api_key")
-        file_data = self._upload_and_process_file(file, api_key)
+        # keyframes can't be kept until the job result is requested
+        video_sampling = kwargs.get("video_sampling")
+        if video_sampling == "keyframes":
+            video_sampling = "proxy"
+        file_data = self._upload_video(file, api_key, video_sampling)
         process_file_id = file_data["name"].split("/")[1]
 
         inputs = {
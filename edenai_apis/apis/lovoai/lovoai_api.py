@@ -31,6 +31,8 @@ from edenai_apis.utils.types import (
     AsyncPendingResponseType,
 )
 from edenai_apis.utils.tts import normalize_speed_for_lovoai, get_tts_config
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from .config import voice_ids
 
 
@@ -293,6 +295,8 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             provider_job_id=provider_job_id,
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -387,6 +391,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
         except httpx.RequestError as exc:
             raise ProviderException(message=f"Request failed: {exc}", code=500) from exc
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
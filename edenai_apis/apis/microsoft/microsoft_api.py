@@ -15,6 +15,7 @@ from edenai_apis.apis.microsoft.microsoft_llm_api import MicrosoftLLMApi
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.http_sessions import provider_session
 from edenai_apis.llmengine import LLMEngine
 
 
@@ -39,6 +40,7 @@ class MicrosoftApi(
         )
         self.headers = get_microsoft_headers()
         self.url = get_microsoft_urls()
+        self.session = provider_session(self.provider_name)
         self.user = user
         self.azure_ai_credentials = self.api_settings.get("generative", {})
         self.llm_client = LLMEngine(
@@ -29,6 +29,8 @@ from edenai_apis.utils.exception import (
 )
 from edenai_apis.utils.ssml import is_ssml
 from edenai_apis.utils.tts import get_tts_config
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -168,6 +170,8 @@ class MicrosoftAudioApi(AudioInterface):
             original_response={}, standardized_response=standardized_response
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -259,6 +263,7 @@ class MicrosoftAudioApi(AudioInterface):
             original_response={}, standardized_response=standardized_response
         )
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
@@ -3,7 +3,11 @@ import datetime
 from collections import defaultdict
 from copy import deepcopy
 from math import floor
-from typing import Dict, List, Sequence, Optional, Any
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import httpx
+import requests
 
 from edenai_apis.features.image.face_detection.face_detection_dataclass import (
     FaceAccessories,
@@ -66,12 +70,21 @@ from edenai_apis.features.text import (
 from edenai_apis.features.text.moderation.category import CategoryType
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.batch_documents import (
+    BatchDocumentsResult,
+    DocumentLimits,
+    abatch_documents,
+    batch_documents,
+)
 from edenai_apis.utils.conversion import (
     combine_date_with_time,
     convert_string_to_number,
     convert_time_to_string,
     standardized_confidence_score,
 )
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http_client import DEFAULT_TIMEOUT, async_client
+from edenai_apis.utils.http_sessions import provider_session
 from edenai_apis.utils.parsing import extract, extract_amount
 from edenai_apis.utils.ssml import convert_audio_attr_in_prosody_tag
 from statistics import mean
@@ -131,6 +144,106 @@ def get_microsoft_urls() -> Dict:
     }
 
 
+
+def _text_analytics_payload(
+    kind: str, texts: List[str], language: Optional[str]
+) -> Dict:
+    documents = []
+    for index, text in enumerate(texts):
+        document = {"id": str(index), "text": text}
+        if language:
+            document["language"] = language
+        documents.append(document)
+    return {
+        "kind": kind,
+        "parameters": {"modelVersion": "latest"},
+        "analysisInput": {"documents": documents},
+    }
+
+
+def _text_analytics_error(error: Dict) -> Optional[str]:
+    return (error.get("innererror") or {}).get("message") or error.get("message")
+
+
+def _text_analytics_results(
+    response: Union[requests.Response, httpx.Response],
+    count: int,
+    standardize: Callable[[Dict], Any],
+) -> Tuple[List[Any], Dict]:
+    """Standardized result, or error, of each document of a Text Analytics response"""
+    try:
+        data = response.json()
+    except ValueError:
+        data = {}
+    if response.status_code >= 400:
+        message = _text_analytics_error(data.get("error") or {})
+        raise ProviderException(
+            message or HTTPStatus(response.status_code).phrase,
+            code=response.status_code,
+        )
+    results: List[Any] = [
+        ProviderException("Provider returned no result for this document")
+    ] * count
+    analysis = data.get("results") or {}
+    for document in analysis.get("documents") or []:
+        results[int(document["id"])] = standardize(document)
+    for error in analysis.get("errors") or []:
+        results[int(error["id"])] = ProviderException(
+            _text_analytics_error(error.get("error") or {}), code=400
+        )
+    return results, data
+
+
+def analyze_text_documents(
+    url: str,
+    headers: Dict,
+    kind: str,
+    texts: List[str],
+    standardize: Callable[[Dict], Any],
+    limits: DocumentLimits,
+    language: Optional[str] = None,
+) -> BatchDocumentsResult:
+    """Analyze documents with Text Analytics, by chunks of `limits.max_documents`"""
+
+    def analyze_chunk(chunk: List[str]):
+        try:
+            response = provider_session("microsoft").post(
+                url,
+                headers=headers,
+                json=_text_analytics_payload(kind, chunk, language),
+            )
+        except requests.RequestException as exc:
+            raise ProviderException(str(exc), code=500) from exc
+        return _text_analytics_results(response, len(chunk), standardize)
+
+    return batch_documents(texts, analyze_chunk, limits)
+
+
+async def aanalyze_text_documents(
+    url: str,
+    headers: Dict,
+    kind: str,
+    texts: List[str],
+    standardize: Callable[[Dict], Any],
+    limits: DocumentLimits,
+    language: Optional[str] = None,
+) -> BatchDocumentsResult:
+    """Async version of `analyze_text_documents`"""
+    async with async_client(DEFAULT_TIMEOUT) as client:
+
+        async def analyze_chunk(chunk: List[str]):
+            try:
+                response = await client.post(
+                    url,
+                    headers=headers,
+                    json=_text_analytics_payload(kind, chunk, language),
+                )
+            except httpx.HTTPError as exc:
+                raise ProviderException(str(exc), code=500) from exc
+            return _text_analytics_results(response, len(chunk), standardize)
+
+        return await abatch_documents(texts, analyze_chunk, limits)
+
 def microsoft_text_moderation_personal_infos(data):
     classification: Sequence[TextModerationItem] = []
     text_moderation: ModerationDataClass
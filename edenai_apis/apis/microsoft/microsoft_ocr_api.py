@@ -2,7 +2,6 @@ import json
 from collections import defaultdict
 from typing import Sequence
 
-from io import BytesIO
 import aiofiles
 import httpx
 import requests
@@ -13,7 +12,6 @@ from azure.ai.formrecognizer.aio import (
 )
 from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import AzureError
-from PIL import Image as Img
 
 from edenai_apis.apis.microsoft.microsoft_helpers import (
     microsoft_financial_parser_formatter,
@@ -60,6 +58,7 @@ from edenai_apis.utils.exception import (
     ProviderException,
 )
 from edenai_apis.utils.file_handling import FileHandler
+from edenai_apis.utils.media_probe import aget_image_size, get_image_size
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -92,8 +91,7 @@ class MicrosoftOcrApi(OcrInterface):
 
         # Get width and hight
 
-        with Img.open(file) as img:
-            width, height = img.size
+        width, height = get_image_size(file)
         boxes: Sequence[Bounding_box] = []
         # Get region of text
         for region in response["regions"]:
@@ -163,21 +161,18 @@ class MicrosoftOcrApi(OcrInterface):
                     response["error"]["message"], request.status_code
                 )
 
-            def _get_image_size(content):
-                with Img.open(BytesIO(content)) as img:
-                    return img.size
-
             boxes: Sequence[Bounding_box] = []
             final_text = ""
 
             regions = response.get("regions", [])
             if regions:
-                # Download image only if needed for bounding box normalization
+                # the size is probed on the content already sent, a file_url is only
+                # fetched when no file was given, through the shared download cache
                 if file_content is None:
                     file_wrapper = await file_handler.download_file(file_url)
-                    file_content = await file_wrapper.get_bytes()
+                    file_content = file_wrapper.get_memoryview()
 
-                width, height = _get_image_size(file_content)
+                width, height = await aget_image_size(file_content)
 
                 for region in regions:
                     for line in region["lines"]:
@@ -1,13 +1,17 @@
+import asyncio
 import sys
-from collections import defaultdict
 from http import HTTPStatus
 from time import sleep
 from typing import Any, Dict, List, Literal, Optional, Sequence, Union
 
+import httpx
 import requests
 
 from edenai_apis.features.text import (
     AnonymizationDataClass,
+    BatchKeywordExtractionDataClass,
+    BatchNamedEntityRecognitionDataClass,
+    BatchSentimentAnalysisDataClass,
     ChatDataClass,
     InfosKeywordExtractionDataClass,
     InfosNamedEntityRecognitionDataClass,
@@ -27,11 +31,137 @@ from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass i
 )
 from edenai_apis.features.text.spell_check import SpellCheckDataClass, SpellCheckItem
 from edenai_apis.features.text.text_interface import TextInterface
+from edenai_apis.utils.batch_documents import DocumentLimits
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import async_client as shared_async_client
 from edenai_apis.utils.http_client import DEFAULT_TIMEOUT, async_client
 from edenai_apis.utils.types import ResponseType
 
-from .microsoft_helpers import microsoft_text_moderation_personal_infos
+from .microsoft_helpers import (
+    aanalyze_text_documents,
+    analyze_text_documents,
+    microsoft_text_moderation_personal_infos,
+)
+
+
+# documents per request of the synchronous Text Analytics API, 5120 characters each
+BATCH_SENTIMENT_LIMITS = DocumentLimits(max_documents=10, max_document_characters=5120)
+BATCH_ENTITIES_LIMITS = DocumentLimits(max_documents=5, max_document_characters=5120)
+BATCH_KEY_PHRASES_LIMITS = DocumentLimits(
+    max_documents=10, max_document_characters=5120
+)
+
+# polling of summarization jobs by `text__asummarize`: first poll after
+# SUMMARIZE_POLL_START seconds, then twice as late each time up to SUMMARIZE_POLL_MAX,
+# unless Azure asks for another delay with Retry-After
+SUMMARIZE_POLL_START = 0.25
+SUMMARIZE_POLL_MAX = 4.0
+SUMMARIZE_TIMEOUT = 60.0
+SUMMARIZE_PENDING_STATUSES = frozenset({"notStarted", "running"})
+
+
+def _entities(document: Dict) -> NamedEntityRecognitionDataClass:
+    items: Sequence[InfosNamedEntityRecognitionDataClass] = []
+    for ent in document["entities"]:
+        entity_type = ent["category"].upper()
+        if entity_type == "DATETIME":
+            entity_type = "DATE"
+        items.append(
+            InfosNamedEntityRecognitionDataClass(
+                entity=ent["text"],
+                importance=ent["confidenceScore"],
+                category=entity_type,
+            )
+        )
+    return NamedEntityRecognitionDataClass(items=items)
+
+
+def _sentiment(document: Dict) -> SentimentAnalysisDataClass:
+    items: Sequence[SegmentSentimentAnalysisDataClass] = []
+    for sentence in document.get("sentences") or []:
+        best_sentiment = {
+            "sentiment": None,
+            "rate": 0,
+        }
+        for sentiment, value in sentence["confidenceScores"].items():
+            if best_sentiment["rate"] < value:
+                best_sentiment["sentiment"] = sentiment
+                best_sentiment["rate"] = value
+
+        items.append(
+            SegmentSentimentAnalysisDataClass(
+                segment=sentence["text"],
+                sentiment=best_sentiment["sentiment"],
+                sentiment_rate=best_sentiment["rate"],
+            )
+        )
+
+    best_general_sentiment = {"sentiment": None, "rate": 0}
+    for sentiment, value in document["confidenceScores"].items():
+        if best_general_sentiment["rate"] < value:
+            best_general_sentiment["sentiment"] = sentiment
+            best_general_sentiment["rate"] = value
+
+    return SentimentAnalysisDataClass(
+        general_sentiment=best_general_sentiment["sentiment"],
+        general_sentiment_rate=best_general_sentiment["rate"],
+        items=items,
+    )
+
+
+def _keywords(document: Dict) -> KeywordExtractionDataClass:
+    items: Sequence[InfosKeywordExtractionDataClass] = []
+    for key_phrase in document.get("keyPhrases") or []:
+        items.append(
+            InfosKeywordExtractionDataClass(keyword=key_phrase, importance=None)
+        )
+    return KeywordExtractionDataClass(items=items)
+
+
+def _summarize_payload(text: str, output_sentences: int) -> Dict:
+    return {
+        "analysisInput": {"documents": [{"id": "1", "text": text}]},
+        "tasks": {
+            "extractiveSummarizationTasks": [
+                {
+                    "parameters": {
+                        "model-version": "latest",
+                        "sentenceCount": output_sentences,
+                        "sortBy": "Offset",
+                    }
+                }
+            ]
+        },
+    }
+
+
+def _summarize_job_error(
+    response: Union[requests.Response, httpx.Response],
+) -> ProviderException:
+    try:
+        err = response.json().get("error", {})
+    except ValueError:
+        err = {}
+    details = (err.get("details", [{}]) or [{}])[0]
+    error_msg = details.get("message", "Microsoft Azure couldn't create job")
+    return ProviderException(error_msg, code=response.status_code)
+
+
+def _summary(data: Dict) -> SummarizeDataClass:
+    sentences = data["tasks"]["extractiveSummarizationTasks"][0]["results"][
+        "documents"
+    ][0]["sentences"]
+    return SummarizeDataClass(
+        result=" ".join([sentence["text"] for sentence in sentences])
+    )
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    """Seconds to wait asked by the Retry-After header, `default` without one"""
+    try:
+        return max(float(response.headers["retry-after"]), 0.0)
+    except (KeyError, ValueError):
+        return default
 
 
 class MicrosoftTextApi(TextInterface):
@@ -41,7 +171,7 @@ class MicrosoftTextApi(TextInterface):
         if not language:
             language = ""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url['text_moderation']}&language={language}",
                 headers=self.headers["text_moderation"],
                 json={"text": text},
@@ -108,7 +238,7 @@ class MicrosoftTextApi(TextInterface):
         the entities and their importances
         """
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -131,24 +261,12 @@ class MicrosoftTextApi(TextInterface):
 
         data = response.json()
         self._check_microsoft_error(data)
-        items: Sequence[InfosNamedEntityRecognitionDataClass] = []
         documents = data["results"]["documents"]
-        if len(documents) > 0:
-            for ent in data["results"]["documents"][0]["entities"]:
-                entity = ent["text"]
-                importance = ent["confidenceScore"]
-                entity_type = ent["category"].upper()
-                if entity_type == "DATETIME":
-                    entity_type = "DATE"
-                items.append(
-                    InfosNamedEntityRecognitionDataClass(
-                        entity=entity,
-                        importance=importance,
-                        category=entity_type,
-                    )
-                )
-
-        standardized_response = NamedEntityRecognitionDataClass(items=items)
+        standardized_response = (
+            _entities(documents[0])
+            if documents
+            else NamedEntityRecognitionDataClass(items=[])
+        )
 
         return ResponseType[NamedEntityRecognitionDataClass](
             original_response=data, standardized_response=standardized_response
@@ -187,29 +305,51 @@ class MicrosoftTextApi(TextInterface):
 
         data = response.json()
         self._check_microsoft_error(data)
-        items: Sequence[InfosNamedEntityRecognitionDataClass] = []
         documents = data["results"]["documents"]
-        if len(documents) > 0:
-            for ent in data["results"]["documents"][0]["entities"]:
-                entity = ent["text"]
-                importance = ent["confidenceScore"]
-                entity_type = ent["category"].upper()
-                if entity_type == "DATETIME":
-                    entity_type = "DATE"
-                items.append(
-                    InfosNamedEntityRecognitionDataClass(
-                        entity=entity,
-                        importance=importance,
-                        category=entity_type,
-                    )
-                )
-
-        standardized_response = NamedEntityRecognitionDataClass(items=items)
+        standardized_response = (
+            _entities(documents[0])
+            if documents
+            else NamedEntityRecognitionDataClass(items=[])
+        )
 
         return ResponseType[NamedEntityRecognitionDataClass](
             original_response=data, standardized_response=standardized_response
         )
 
+    def text__batch_named_entity_recognition(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        result = analyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "EntityRecognition",
+            texts,
+            _entities,
+            BATCH_ENTITIES_LIMITS,
+            language=language,
+        )
+        return ResponseType[BatchNamedEntityRecognitionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchNamedEntityRecognitionDataClass(items=result.items),
+        )
+
+    async def text__abatch_named_entity_recognition(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        result = await aanalyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "EntityRecognition",
+            texts,
+            _entities,
+            BATCH_ENTITIES_LIMITS,
+            language=language,
+        )
+        return ResponseType[BatchNamedEntityRecognitionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchNamedEntityRecognitionDataClass(items=result.items),
+        )
+
     def text__summarize(
         self,
         text: str,
@@ -223,36 +363,20 @@ class MicrosoftTextApi(TextInterface):
         :return:            String that contains output result
         """
 
-        response = requests.post(
+        response = self.session.post(
             self.url["summarization"],
             headers=self.headers["text"],
-            json={
-                "analysisInput": {"documents": [{"id": "1", "text": text}]},
-                "tasks": {
-                    "extractiveSummarizationTasks": [
-                        {
-                            "parameters": {
-                                "model-version": "latest",
-                                "sentenceCount": output_sentences,
-                                "sortBy": "Offset",
-                            }
-                        }
-                    ]
-                },
-            },
+            json=_summarize_payload(text, output_sentences),
         )
 
         if response.status_code != 202:
-            err = response.json().get("error", {})
-            details = (err.get("details", [{}]) or [{}])[0]
-            error_msg = details.get("message", "Microsoft Azure couldn't create job")
-            raise ProviderException(error_msg, code=response.status_code)
+            raise _summarize_job_error(response)
 
         get_url = response.headers.get("operation-location")
         if get_url is None:
             raise ProviderException("Microsoft Azure couldn't create job")
 
-        get_response = requests.get(url=get_url, headers=self.headers["text"])
+        get_response = self.session.get(url=get_url, headers=self.headers["text"])
         if get_response.status_code != 200:
             err = get_response.json().get("error", {})
             error_msg = err.get("message", "Microsoft Azure couldn't fetch job")
@@ -260,7 +384,7 @@ class MicrosoftTextApi(TextInterface):
 
         data = get_response.json()
         wait_time = 0
-        summary = ""
+        standardized_response = SummarizeDataClass(result="")
         while wait_time < 60:  # Wait for the answer from provider
             if error := data.get("error"):
                 raise ProviderException(
@@ -268,22 +392,93 @@ class MicrosoftTextApi(TextInterface):
                     400,
                 )
             if data["status"] == "succeeded":
-                sentences = data["tasks"]["extractiveSummarizationTasks"][0]["results"][
-                    "documents"
-                ][0]["sentences"]
-                summary = " ".join([sentence["text"] for sentence in sentences])
+                standardized_response = _summary(data)
                 break
             sleep(6)
             wait_time += 6
-            get_response = requests.get(url=get_url, headers=self.headers["text"])
+            get_response = self.session.get(url=get_url, headers=self.headers["text"])
             data = get_response.json()
 
-        standardized_response = SummarizeDataClass(result=summary)
-
         return ResponseType[SummarizeDataClass](
             original_response=data, standardized_response=standardized_response
         )
 
+    async def text__asummarize(
+        self,
+        text: str,
+        output_sentences: int,
+        language: str,
+        model: str = None,
+        **kwargs,
+    ) -> ResponseType[SummarizeDataClass]:
+        """
+        Async version of `text__summarize`, the job is polled from a sub-second delay
+        that doubles at each poll (or the Retry-After of Azure), with the shared
+        async client
+        """
+        try:
+            response = await shared_async_client.post(
+                self.url["summarization"],
+                headers=self.headers["text"],
+                json=_summarize_payload(text, output_sentences),
+                timeout=DEFAULT_TIMEOUT,
+            )
+        except httpx.HTTPError as exc:
+            raise ProviderException(str(exc), code=500) from exc
+
+        if response.status_code != 202:
+            raise _summarize_job_error(response)
+
+        get_url = response.headers.get("operation-location")
+        if get_url is None:
+            raise ProviderException("Microsoft Azure couldn't create job")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SUMMARIZE_TIMEOUT
+        delay = SUMMARIZE_POLL_START
+        wait = _retry_after(response, delay)
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise ProviderException(
+                    "Microsoft Azure summarization job timed out", code=504
+                )
+            await asyncio.sleep(min(wait, remaining))
+            try:
+                get_response = await shared_async_client.get(
+                    get_url, headers=self.headers["text"], timeout=DEFAULT_TIMEOUT
+                )
+            except httpx.HTTPError as exc:
+                raise ProviderException(str(exc), code=500) from exc
+            delay = min(delay * 2, SUMMARIZE_POLL_MAX)
+
+            if get_response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                wait = _retry_after(get_response, delay)
+                continue
+            if get_response.status_code != 200:
+                try:
+                    err = get_response.json().get("error", {})
+                except ValueError:
+                    err = {}
+                error_msg = err.get("message", "Microsoft Azure couldn't fetch job")
+                raise ProviderException(error_msg, code=get_response.status_code)
+
+            data = get_response.json()
+            status = data.get("status")
+            if status not in SUMMARIZE_PENDING_STATUSES:
+                break
+            wait = _retry_after(get_response, delay)
+
+        if status != "succeeded":
+            error = data.get("error") or (data.get("errors") or [{}])[0]
+            raise ProviderException(
+                error.get("message") or "Error calling the summarize feature", 400
+            )
+
+        return ResponseType[SummarizeDataClass](
+            original_response=data, standardized_response=_summary(data)
+        )
+
     def text__anonymization(
         self,
         text: str,
@@ -293,7 +488,7 @@ class MicrosoftTextApi(TextInterface):
         **kwargs,
     ) -> ResponseType[AnonymizationDataClass]:
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -366,7 +561,7 @@ class MicrosoftTextApi(TextInterface):
         :return:            TextSentimentAnalysis Object that contains sentiments and their rates
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -387,50 +582,44 @@ class MicrosoftTextApi(TextInterface):
         data = response.json()
         self._check_microsoft_error(data, response.status_code)
 
-        items: Sequence[SegmentSentimentAnalysisDataClass] = []
+        standarize = _sentiment(data["results"]["documents"][0])
 
-        # Getting the explicit label and its score of image
-        default_dict = defaultdict(lambda: None)
-        sentences = (
-            data.get("results", default_dict)
-            .get("documents", [default_dict])[0]
-            .get("sentences")
+        return ResponseType[SentimentAnalysisDataClass](
+            original_response=data, standardized_response=standarize
         )
-        if sentences:
-            for sentence in sentences:
-                best_sentiment = {
-                    "sentiment": None,
-                    "rate": 0,
-                }
-                for sentiment, value in sentence["confidenceScores"].items():
-                    if best_sentiment["rate"] < value:
-                        best_sentiment["sentiment"] = sentiment
-                        best_sentiment["rate"] = value
-
-                items.append(
-                    SegmentSentimentAnalysisDataClass(
-                        segment=sentence["text"],
-                        sentiment=best_sentiment["sentiment"],
-                        sentiment_rate=best_sentiment["rate"],
-                    )
-                )
 
-        best_general_sentiment = {"sentiment": None, "rate": 0}
-        for sentiment, value in data["results"]["documents"][0][
-            "confidenceScores"
-        ].items():
-            if best_general_sentiment["rate"] < value:
-                best_general_sentiment["sentiment"] = sentiment
-                best_general_sentiment["rate"] = value
-
-        standarize = SentimentAnalysisDataClass(
-            general_sentiment=best_general_sentiment["sentiment"],
-            general_sentiment_rate=best_general_sentiment["rate"],
-            items=items,
+    def text__batch_sentiment_analysis(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        result = analyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "SentimentAnalysis",
+            texts,
+            _sentiment,
+            BATCH_SENTIMENT_LIMITS,
+            language=language,
+        )
+        return ResponseType[BatchSentimentAnalysisDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchSentimentAnalysisDataClass(items=result.items),
         )
 
-        return ResponseType[SentimentAnalysisDataClass](
-            original_response=data, standardized_response=standarize
+    async def text__abatch_sentiment_analysis(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        result = await aanalyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "SentimentAnalysis",
+            texts,
+            _sentiment,
+            BATCH_SENTIMENT_LIMITS,
+            language=language,
+        )
+        return ResponseType[BatchSentimentAnalysisDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchSentimentAnalysisDataClass(items=result.items),
         )
 
     def _check_microsoft_error(self, data: Dict, status_code=None):
@@ -458,7 +647,7 @@ class MicrosoftTextApi(TextInterface):
         """
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -476,21 +665,48 @@ class MicrosoftTextApi(TextInterface):
         data = response.json()
         self._check_microsoft_error(data, response.status_code)
 
-        items: Sequence[InfosKeywordExtractionDataClass] = []
-        key_phrases = (
-            data.get("results", {}).get("documents", [{}])[0].get("keyPhrases") or []
+        standardized_response = _keywords(
+            data.get("results", {}).get("documents", [{}])[0]
         )
-        for key_phrase in key_phrases:
-            items.append(
-                InfosKeywordExtractionDataClass(keyword=key_phrase, importance=None)
-            )
-
-        standardized_response = KeywordExtractionDataClass(items=items)
 
         return ResponseType[KeywordExtractionDataClass](
             original_response=data, standardized_response=standardized_response
         )
 
+    def text__batch_keyword_extraction(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchKeywordExtractionDataClass]:
+        result = analyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "KeyPhraseExtraction",
+            texts,
+            _keywords,
+            BATCH_KEY_PHRASES_LIMITS,
+            language=language,
+        )
+        return ResponseType[BatchKeywordExtractionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchKeywordExtractionDataClass(items=result.items),
+        )
+
+    async def text__abatch_keyword_extraction(
+        self, language: str, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchKeywordExtractionDataClass]:
+        result = await aanalyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "KeyPhraseExtraction",
+            texts,
+            _keywords,
+            BATCH_KEY_PHRASES_LIMITS,
+            language=language,
+        )
+        return ResponseType[BatchKeywordExtractionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchKeywordExtractionDataClass(items=result.items),
+        )
+
     def text__spell_check(
         self, text: str, language: str, model: Optional[str] = None, **kwargs
     ) -> ResponseType[SpellCheckDataClass]:
@@ -503,7 +719,7 @@ class MicrosoftTextApi(TextInterface):
         data = {"text": text}
         params = {"mkt": language, "mode": "spell"}
 
-        response = requests.post(
+        response = self.session.post(
             self.url["spell_check"],
             headers=self.headers["spell_check"],
             data=data,
@@ -1,20 +1,52 @@
 from http import HTTPStatus
-from typing import Sequence, Optional
+from typing import Dict, List, Sequence, Optional
 
 import requests
 
 from edenai_apis.features.translation import (
     AutomaticTranslationDataClass,
+    BatchLanguageDetectionDataClass,
+    BatchTranslationDataClass,
     InfosLanguageDetectionDataClass,
     LanguageDetectionDataClass,
 )
 from edenai_apis.features.translation.translation_interface import TranslationInterface
+from edenai_apis.utils.batch_documents import DocumentLimits
+from edenai_apis.utils.batch_translation import (
+    BatchLimits,
+    abatch_translate,
+    batch_translate,
+)
 from edenai_apis.utils.conversion import add_query_param_in_url
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.http_client import async_client, DEFAULT_TIMEOUT
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
+from .microsoft_helpers import aanalyze_text_documents, analyze_text_documents
+
+# 1000 texts and 50 000 characters per request
+BATCH_LIMITS = BatchLimits(max_segments=1000, max_characters=50_000)
+# documents per language detection request, 5120 characters each
+BATCH_LANGUAGE_DETECTION_LIMITS = DocumentLimits(
+    max_documents=1000, max_document_characters=5120
+)
+
+
+def _language(document: Dict) -> LanguageDetectionDataClass:
+    detected = document["detectedLanguage"]
+    return LanguageDetectionDataClass(
+        items=[
+            InfosLanguageDetectionDataClass(
+                language=detected["iso6391Name"],
+                display_name=get_language_name_from_code(
+                    isocode=detected["iso6391Name"]
+                ),
+                confidence=detected["confidenceScore"],
+            )
+        ]
+    )
+
 
 class MicrosoftTranslationApi(TranslationInterface):
 
@@ -36,7 +68,7 @@ class MicrosoftTranslationApi(TranslationInterface):
     def translation__language_detection(
         self, text: str, model: Optional[str] = None, **kwargs
     ) -> ResponseType[LanguageDetectionDataClass]:
-        response = requests.post(
+        response = self.session.post(
             url=f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -50,21 +82,45 @@ class MicrosoftTranslationApi(TranslationInterface):
         data = response.json()
 
         items: Sequence[InfosLanguageDetectionDataClass] = []
-        for lang in data["results"]["documents"]:
-            items.append(
-                InfosLanguageDetectionDataClass(
-                    language=lang["detectedLanguage"]["iso6391Name"],
-                    display_name=get_language_name_from_code(
-                        isocode=lang["detectedLanguage"]["iso6391Name"]
-                    ),
-                    confidence=lang["detectedLanguage"]["confidenceScore"],
-                )
-            )
+        for document in data["results"]["documents"]:
+            items.extend(_language(document).items)
         return ResponseType[LanguageDetectionDataClass](
             original_response=data,
             standardized_response=LanguageDetectionDataClass(items=items),
         )
 
+    def translation__batch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        result = analyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "LanguageDetection",
+            texts,
+            _language,
+            BATCH_LANGUAGE_DETECTION_LIMITS,
+        )
+        return ResponseType[BatchLanguageDetectionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchLanguageDetectionDataClass(items=result.items),
+        )
+
+    async def translation__abatch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        result = await aanalyze_text_documents(
+            self.url["text"],
+            self.headers["text"],
+            "LanguageDetection",
+            texts,
+            _language,
+            BATCH_LANGUAGE_DETECTION_LIMITS,
+        )
+        return ResponseType[BatchLanguageDetectionDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchLanguageDetectionDataClass(items=result.items),
+        )
+
     def translation__automatic_translation(
         self,
         source_language: str,
@@ -93,7 +149,7 @@ class MicrosoftTranslationApi(TranslationInterface):
             }
         ]
         # Getting response of API
-        response = requests.post(url, headers=self.headers["translator"], json=body)
+        response = self.session.post(url, headers=self.headers["translator"], json=body)
         self._raise_on_error(response)
         data = response.json()
 
@@ -146,3 +202,75 @@ class MicrosoftTranslationApi(TranslationInterface):
         return ResponseType[AutomaticTranslationDataClass](
             original_response=data, standardized_response=standardized_response
         )
+
+    def translation__batch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        url = add_query_param_in_url(
+            url=self.url["translator"],
+            query_params={"from": source_language, "to": target_language},
+        )
+
+        def translate_pack(pack: List[str]):
+            body = [{"text": text} for text in pack]
+            response = self.session.post(url, headers=self.headers["translator"], json=body)
+            self._raise_on_error(response)
+            data = response.json()
+            return [item["translations"][0]["text"] for item in data], data
+
+        result = batch_translate(
+            self.provider_name,
+            model,
+            source_language,
+            target_language,
+            texts,
+            translate_pack,
+            BATCH_LIMITS,
+        )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
+    async def translation__abatch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        url = add_query_param_in_url(
+            url=self.url["translator"],
+            query_params={"from": source_language, "to": target_language},
+        )
+
+        async with async_client(DEFAULT_TIMEOUT) as client:
+
+            async def translate_pack(pack: List[str]):
+                body = [{"text": text} for text in pack]
+                response = await client.post(
+                    url, headers=self.headers["translator"], json=body
+                )
+                self._raise_on_error(response)
+                data = response.json()
+                return [item["translations"][0]["text"] for item in data], data
+
+            result = await abatch_translate(
+                self.provider_name,
+                model,
+                source_language,
+                target_language,
+                texts,
+                translate_pack,
+                BATCH_LIMITS,
+            )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Sequence, Optional
+from typing import Dict, List, Sequence, Optional
 
 import requests
 
@@ -8,14 +8,23 @@ from edenai_apis.features.translation import (
     InfosLanguageDetectionDataClass,
     LanguageDetectionDataClass,
     AutomaticTranslationDataClass,
+    BatchTranslationDataClass,
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.batch_translation import (
+    BatchLimits,
+    abatch_translate,
+    batch_translate,
+)
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.http_client import async_client, DEFAULT_TIMEOUT
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
+# 128 texts per request
+BATCH_LIMITS = BatchLimits(max_segments=128, max_characters=10_000)
+
 
 class ModernmtApi(ProviderInterface, TranslationInterface):
     provider_name = "modernmt"
@@ -130,3 +139,80 @@ class ModernmtApi(ProviderInterface, TranslationInterface):
         return ResponseType[AutomaticTranslationDataClass](
             original_response=response, standardized_response=standardized_response
         )
+
+    def translation__batch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        def translate_pack(pack: List[str]):
+            data = {"source": source_language, "target": target_language, "q": pack}
+            response = requests.get(self.url, headers=self.header, data=data).json()
+            if response["status"] != 200:
+                raise ProviderException(
+                    message=response["error"]["message"], code=response["status"]
+                )
+            return [item["translation"] for item in response["data"]], response
+
+        result = batch_translate(
+            self.provider_name,
+            model,
+            source_language,
+            target_language,
+            texts,
+            translate_pack,
+            BATCH_LIMITS,
+        )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
+
+    async def translation__abatch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        headers = {
+            **self.header,
+            "X-HTTP-Method-Override": "GET",
+            "Content-Type": "application/json",
+        }
+
+        async with async_client(DEFAULT_TIMEOUT) as client:
+
+            async def translate_pack(pack: List[str]):
+                data = {"source": source_language, "target": target_language, "q": pack}
+                output = await client.post(self.url, headers=headers, json=data)
+                try:
+                    response = output.json()
+                except json.JSONDecodeError as exc:
+                    raise ProviderException(
+                        message=output.text, code=output.status_code
+                    ) from exc
+                if response.get("status") != 200:
+                    raise ProviderException(
+                        message=response.get("error", {}).get("message", output.text),
+                        code=response.get("status", output.status_code),
+                    )
+                return [item["translation"] for item in response["data"]], response
+
+            result = await abatch_translate(
+                self.provider_name,
+                model,
+                source_language,
+                target_language,
+                texts,
+                translate_pack,
+                BATCH_LIMITS,
+            )
+        return ResponseType[BatchTranslationDataClass](
+            original_response=result.original_response,
+            standardized_response=BatchTranslationDataClass(texts=result.texts),
+        )
@@ -1,13 +1,12 @@
 import base64
-import json
+import threading
 import time
 import uuid
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Union
 
 import requests
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import HTTPAdapter
 
-from edenai_apis.apis.nyckel.nyckel_helpers import check_webhook_result
 from edenai_apis.features import ImageInterface, ProviderInterface
 from edenai_apis.features.image.automl_classification.create_project.automl_classification_create_project_dataclass import (
     AutomlClassificationCreateProjectDataClass,
@@ -43,12 +42,19 @@ from edenai_apis.features.image.search.upload_image.search_upload_image_dataclas
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.bulk_operations import (
+    BulkProgress,
+    BulkReport,
+    DatasetEntry,
+    bulk_run,
+    load_dataset,
+)
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.job_store import JobStatus, job_store
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncErrorResponseType,
     AsyncLaunchJobResponseType,
-    AsyncPendingResponseType,
     AsyncResponseType,
     ResponseType,
 )
@@ -62,6 +68,23 @@ def strip_nyckel_prefix(prefixed_id: str) -> str:
         return prefixed_id
 
 
+# Nyckel limit: 25 requests per second, or 25 concurrent requests
+MAX_CONCURRENT_REQUESTS = 25
+
+# labels known to exist, by project id
+_project_labels: Dict[str, Set[str]] = {}
+_labels_lock = threading.Lock()
+
+
+def _known_label(project_id: str, label_name: str) -> bool:
+    return label_name in _project_labels.get(project_id, ())
+
+
+def _add_known_labels(project_id: str, label_names: Iterable[str]) -> None:
+    with _labels_lock:
+        _project_labels.setdefault(project_id, set()).update(label_names)
+
+
 class NyckelApi(ProviderInterface, ImageInterface):
     provider_name: str = "nyckel"
     DEFAULT_SIMILAR_IMAGE_COUNT = 10
@@ -71,13 +94,18 @@ class NyckelApi(ProviderInterface, ImageInterface):
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
         self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS)
+        )
         self._renew_at = 0
-        self.webhook_settings = load_provider(ProviderDataEnum.KEY, "webhooksite")
-        self.webhook_token = self.webhook_settings["webhook_token"]
+        self._auth_lock = threading.Lock()
 
     def _refresh_session_auth_headers_if_needed(self) -> None:
         if time.time() > self._renew_at:
-            self._renew_session_auth_header()
+            # renewed once when concurrent uploads share the session
+            with self._auth_lock:
+                if time.time() > self._renew_at:
+                    self._renew_session_auth_header()
 
     def _renew_session_auth_header(self) -> None:
         RENEW_MARGIN_SECONDS = 10 * 60
@@ -294,9 +322,23 @@ class NyckelApi(ProviderInterface, ImageInterface):
 
         return True
 
+    def __list_labels(self, project_id: str) -> Set[str]:
+        self._refresh_session_auth_headers_if_needed()
+
+        url = f"https://www.nyckel.com/v1/functions/{project_id}/labels"
+        try:
+            response = self._session.get(url, params={"batchSize": 1000})
+        except Exception as exc:
+            raise ProviderException("Something went wrong !!", 500) from exc
+        if response.status_code >= 400:
+            self._raise_provider_exception(url, {}, response)
+        return {label["name"] for label in response.json()}
+
     def __create_label_if_no_exists(
         self, project_id: str, label_name: str, label_description: str = ""
     ) -> bool:
+        if _known_label(project_id, label_name):
+            return
         self._refresh_session_auth_headers_if_needed()
 
         url = f"https://www.nyckel.com/v1/functions/{project_id}/labels"
@@ -313,27 +355,24 @@ class NyckelApi(ProviderInterface, ImageInterface):
             and "already exists" not in original_response.get("message", "")
         ):
             raise self._raise_provider_exception(url, payload, response)
-
-    def image__automl_classification__upload_data_async__launch_job(
-        self,
-        project_id: str,
-        label: str,
-        type_of_data: str,
-        file: str,
-        file_url: str = "",
-        **kwargs,
-    ) -> AsyncLaunchJobResponseType:
+        _add_known_labels(project_id, [label_name])
+
+    def __create_labels(self, project_id: str, label_names: Set[str]) -> None:
+        missing = {name for name in label_names if not _known_label(project_id, name)}
+        if not missing:
+            return
+        # labels of the project are listed once, not created blindly one by one
+        _add_known_labels(project_id, self.__list_labels(project_id))
+        for label_name in sorted(missing):
+            self.__create_label_if_no_exists(project_id, label_name)
+
+    def __upload_sample(
+        self, project_id: str, label: str, file: str, file_url: str = ""
+    ) -> Dict:
         self._refresh_session_auth_headers_if_needed()
         url = f"https://www.nyckel.com/v1/functions/{project_id}/samples"
         file_ = None
 
-        if not label:
-            raise ProviderException("Label needs to be specified !!")
-
-        # Create Label
-        self.__create_label_if_no_exists(project_id=project_id, label_name=label)
-
-        # Upload Sample
         post_parameters = {"url": url}
         if file_url:
             post_parameters["json"] = {
@@ -345,40 +384,43 @@ class NyckelApi(ProviderInterface, ImageInterface):
             post_parameters["files"] = {"data": file_}
             post_parameters["data"] = {"annotation.labelName": label}
 
-        response = self._session.post(**post_parameters)
-        if file_ is not None:
-            file_.close()
+        try:
+            response = self._session.post(**post_parameters)
+        except requests.RequestException as exp:
+            raise ProviderException("Something went wrong !!", 503) from exp
+        finally:
+            if file_ is not None:
+                file_.close()
         if response.status_code >= 400:
-            # self._raise_provider_exception(url, post_parameters, response)
             self.handle_provider_error(response)
         try:
             original_response = response.json()
         except Exception as exp:
             raise ProviderException("Something went wrong !!", 500) from exp
+        original_response["label_name"] = label
+        return original_response
+
+    def image__automl_classification__upload_data_async__launch_job(
+        self,
+        project_id: str,
+        label: str,
+        type_of_data: str,
+        file: str,
+        file_url: str = "",
+        **kwargs,
+    ) -> AsyncLaunchJobResponseType:
+        if not label:
+            raise ProviderException("Label needs to be specified !!")
 
-        data = original_response
-        data["label_name"] = label
+        self.__create_label_if_no_exists(project_id=project_id, label_name=label)
+        data = self.__upload_sample(project_id, label, file, file_url)
         job_id = str(uuid.uuid4())
-        data_job_id = {job_id: data}
-        s = requests.Session()
-        retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[400, 404, 408, 429, 500, 502, 503, 504],
-        )  # retry in case of failure. Because if it fails, the image will be loaded but for the user it's a fail
-        s.mount("http://", HTTPAdapter(max_retries=retries))
+        # the upload is done, its result is kept for get_job_result
         try:
-            webook_response = s.post(
-                url=f"https://webhook.site/{self.webhook_token}",
-                data=json.dumps(data_job_id),
-                headers={"content-type": "application/json"},
-            )
+            job_store().put(self.provider_name, job_id, JobStatus.SUCCEEDED, data)
         except Exception as exp:
             self.__image__automl_classification_delete_image(project_id, data["id"])
             raise ProviderException("Could not upload image data", 400) from exp
-        if webook_response.status_code >= 400:
-            self.__image__automl_classification_delete_image(project_id, data["id"])
-            raise ProviderException("Could not upload image data", 400)
         return AsyncLaunchJobResponseType(provider_job_id=job_id)
 
     def image__automl_classification__upload_data_async__get_job_result(
@@ -386,34 +428,10 @@ class NyckelApi(ProviderInterface, ImageInterface):
     ) -> AsyncBaseResponseType[AutomlClassificationUploadDataAsyncDataClass]:
         if not provider_job_id:
             raise ProviderException("Job id None or empty!")
-        webhook_result, response_status = check_webhook_result(
-            provider_job_id, self.webhook_settings
-        )
-        if response_status != 200:
-            raise ProviderException(webhook_result, code=response_status)
-        result_object = (
-            next(
-                filter(
-                    lambda response: provider_job_id in response["content"],
-                    webhook_result,
-                ),
-                None,
-            )
-            if webhook_result
-            else None
-        )
-        if not result_object or not result_object.get("content"):
-            raise ProviderException("Provider returned an empty response")
-        try:
-            original_response = json.loads(result_object["content"]).get(
-                provider_job_id, None
-            )
-        except json.JSONDecodeError:
-            raise ProviderException("An error occurred while parsing the response.")
-        if original_response is None:
-            return AsyncPendingResponseType[
-                AutomlClassificationUploadDataAsyncDataClass
-            ](provider_job_id=provider_job_id)
+        state = job_store().get(self.provider_name, provider_job_id)
+        if state is None:
+            raise ProviderException("Job not found or expired", code=404)
+        original_response = state.result
         return AsyncResponseType[AutomlClassificationUploadDataAsyncDataClass](
             original_response=original_response,
             standardized_response=AutomlClassificationUploadDataAsyncDataClass(
@@ -424,6 +442,42 @@ class NyckelApi(ProviderInterface, ImageInterface):
             provider_job_id=provider_job_id,
         )
 
+    def upload_automl_classification_dataset(
+        self,
+        project_id: str,
+        dataset: Union[str, Iterable[Union[DatasetEntry, Tuple[str, str]]]],
+        max_concurrency: int = 8,
+        progress: Optional[Callable[[BulkProgress], None]] = None,
+    ) -> BulkReport:
+        """
+        Upload every labeled image of `dataset` to an automl classification project.
+
+        Labels missing from the project are created once, before any upload. Samples
+        are uploaded concurrently, throttled and failed requests are retried.
+
+        Args:
+            dataset: folder of `<label>/<image>`, CSV manifest of `file,label` (files
+                or urls), or pairs of (file, label)
+            max_concurrency: samples uploaded at once, at most 25 for Nyckel
+            progress: called with the progress after each sample
+        """
+        entries = list(load_dataset(dataset))
+        if any(not entry.label for entry in entries):
+            raise ProviderException("Label needs to be specified !!", 400)
+        self.__create_labels(project_id, {entry.label for entry in entries})
+        return bulk_run(
+            entries,
+            lambda entry: self.__upload_sample(
+                project_id,
+                entry.label,
+                file="" if entry.is_url else entry.file,
+                file_url=entry.file if entry.is_url else "",
+            ),
+            max_concurrency=min(max_concurrency, MAX_CONCURRENT_REQUESTS),
+            progress=progress,
+            total=len(entries),
+        )
+
     def image__automl_classification__train_async__launch_job(
         self, project_id: str, **kwargs
     ) -> AsyncLaunchJobResponseType:
@@ -533,6 +587,8 @@ class NyckelApi(ProviderInterface, ImageInterface):
                 ),
                 code=response.status_code,
             )
+        with _labels_lock:
+            _project_labels.pop(project_id, None)
         return ResponseType[AutomlClassificationDeleteProjectDataClass](
             original_response="",
             standardized_response=AutomlClassificationDeleteProjectDataClass(
@@ -1,7 +1,7 @@
 import base64
 import uuid
 from io import BytesIO
-from typing import List, Optional
+from typing import List, Optional, Union
 
 import aiofiles
 import httpx
@@ -11,7 +11,7 @@ from edenai_apis.features import AudioInterface
 from edenai_apis.utils.file_handling import FileHandler
 from edenai_apis.utils.http_client import async_client, AUDIO_TIMEOUT, ASYNC_JOBS_TIMEOUT
 from edenai_apis.features.audio import TextToSpeechDataClass
-from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.features.audio.tts import StreamTts, TtsDataClass
 from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_dataclass import (
     SpeechDiarization,
     SpeechToTextAsyncDataClass,
@@ -27,7 +27,13 @@ from edenai_apis.utils.upload_s3 import (
     upload_file_bytes_to_s3,
     aupload_file_bytes_to_s3,
 )
-from edenai_apis.utils.tts import normalize_speed_for_openai
+from edenai_apis.utils.tts import (
+    TtsAudioStream,
+    ahttp_audio_chunks,
+    normalize_speed_for_openai,
+)
+from edenai_apis.utils.chunked_tts import long_text_tts
+from edenai_apis.utils.tts_cache import cached_tts
 from edenai_apis.loaders.data_loader import load_provider_subfeature_info
 
 from .helpers import convert_tts_audio_rate
@@ -255,6 +261,8 @@ class OpenaiAudioApi(AudioInterface):
             original_response={}, standardized_response=standardized_response
         )
 
+    @cached_tts
+    @long_text_tts
     async def audio__atts(
         self,
         text: str,
@@ -265,8 +273,9 @@ class OpenaiAudioApi(AudioInterface):
         speaking_pitch: Optional[int] = None,
         speaking_volume: Optional[int] = None,
         provider_params: Optional[dict] = None,
+        stream: bool = False,
         **kwargs,
-    ) -> ResponseType[TtsDataClass]:
+    ) -> Union[ResponseType[TtsDataClass], StreamTts]:
         """Convert text to speech using OpenAI's TTS API (async version).
 
         Args:
@@ -281,6 +290,8 @@ class OpenaiAudioApi(AudioInterface):
             provider_params: Additional OpenAI API parameters passed directly to the request.
                 - instructions: Voice instructions for gpt-4o-mini-tts model
                   (e.g., "Speak in a warm, friendly tone with slight excitement")
+            stream: Yield audio chunks as they are synthesized instead of waiting
+                   for the whole audio (returns a StreamTts)
         """
         provider_params = provider_params or {}
         url = "https://api.openai.com/v1/audio/speech"
@@ -300,6 +311,14 @@ class OpenaiAudioApi(AudioInterface):
             **provider_params,
         }
 
+        if stream:
+            chunks = ahttp_audio_chunks(
+                "POST", url, AUDIO_TIMEOUT, json=payload, headers=self.headers
+            )
+            return StreamTts(
+                stream=TtsAudioStream(chunks, audio_format or "mp3", provider="openai")
+            )
+
         try:
             async with async_client(AUDIO_TIMEOUT) as client:
                 response = await client.post(url, json=payload, headers=self.headers)
@@ -322,6 +341,7 @@ class OpenaiAudioApi(AudioInterface):
         except httpx.RequestError as exc:
             raise ProviderException(message=f"Request failed: {exc}", code=500) from exc
 
+    @cached_tts
     def audio__tts(
         self,
         text: str,
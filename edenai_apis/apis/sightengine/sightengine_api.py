@@ -19,6 +19,7 @@ from edenai_apis.features.video.deepfake_detection_async.deepfake_detection_asyn
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.job_store import JobStatus, job_store
 from edenai_apis.utils.parsing import extract
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -27,6 +28,15 @@ from edenai_apis.utils.types import (
     AsyncResponseType,
     ResponseType,
 )
+from edenai_apis.utils.webhook_receiver import webhook_receiver
+
+# launched jobs completed by the callbacks to the webhook receiver, not polled
+RECEIVER_CHANNEL = "webhook_receiver"
+
+
+def sightengine_job_id(payload: Any) -> Optional[str]:
+    """Job id of a callback, for the `WebhookReceiver` of sightengine"""
+    return extract(payload, ["media", "id"], None)
 
 
 class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
@@ -176,8 +186,13 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
             "models": "deepfake",
             "api_user": self.api_settings["api_user"],
             "api_secret": self.api_settings["api_key"],
-            "callback_url": self.webhook_url,
         }
+        receiver = webhook_receiver(self.provider_name)
+        if receiver is not None:
+            # one-shot url, the receiver reads the job id from the callback
+            payload["callback_url"] = receiver.callback_url()
+        else:
+            payload["callback_url"] = self.webhook_url
 
         method = "POST" if file else "GET"
         url = f"{self.api_url}/video/check.json"
@@ -211,17 +226,25 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
         if not media_id:
             raise ProviderException("Media ID not found in response.")
 
-        requests.post(
-            self.webhook_url,
-            json={"media_id": media_id},
-            headers={"content-type": "application/json"},
-        )
+        if receiver is None:
+            requests.post(
+                self.webhook_url,
+                json={"media_id": media_id},
+                headers={"content-type": "application/json"},
+            )
+            job_store().put(self.provider_name, media_id, JobStatus.PENDING)
+        elif job_store().get(self.provider_name, media_id) is None:
+            # the callback of a short video can come before the job is stored
+            job_store().put(
+                self.provider_name,
+                media_id,
+                JobStatus.PENDING,
+                {"channel": RECEIVER_CHANNEL},
+            )
 
         return AsyncLaunchJobResponseType(provider_job_id=media_id)
 
-    def video__deepfake_detection_async__get_job_result(
-        self, provider_job_id: str
-    ) -> AsyncBaseResponseType[VideoDeepfakeDetectionAsyncDataclass]:
+    def __webhook_result(self, provider_job_id: str) -> Optional[Any]:
         wehbook_result, response_status = check_webhook_result(
             provider_job_id, self.webhook_settings
         )
@@ -242,15 +265,26 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
         )
 
         if not result_object or not result_object.get("content"):
-            return AsyncPendingResponseType[VideoDeepfakeDetectionAsyncDataclass](
-                provider_job_id=provider_job_id
-            )
+            return None
 
         try:
-            original_response = json.loads(result_object["content"])
+            return json.loads(result_object["content"])
         except json.JSONDecodeError:
             raise ProviderException("An error occurred while parsing the response.")
 
+    def video__deepfake_detection_async__get_job_result(
+        self, provider_job_id: str
+    ) -> AsyncBaseResponseType[VideoDeepfakeDetectionAsyncDataclass]:
+        # written by a WebhookReceiver, or by a previous call of this method
+        state = job_store().get(self.provider_name, provider_job_id)
+        if state is not None and state.status == JobStatus.SUCCEEDED:
+            original_response = state.result
+        elif state is not None and state.result == {"channel": RECEIVER_CHANNEL}:
+            # no callback yet, nothing to poll on webhook.site
+            original_response = None
+        else:
+            original_response = self.__webhook_result(provider_job_id)
+
         if original_response is None:
             return AsyncPendingResponseType[VideoDeepfakeDetectionAsyncDataclass](
                 provider_job_id=provider_job_id
@@ -261,6 +295,13 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
         )
         if score is None:
             raise ProviderException("Deepfake score not found in response.")
+        if state is None or state.status != JobStatus.SUCCEEDED:
+            job_store().put(
+                self.provider_name,
+                provider_job_id,
+                JobStatus.SUCCEEDED,
+                original_response,
+            )
 
         prediction = VideoDeepfakeDetectionAsyncDataclass.set_label_based_on_score(
             score
@@ -1,2 +1,2 @@
 from .tts_args import tts_arguments
-from .tts_dataclass import TtsDataClass
+from .tts_dataclass import StreamTts, TtsDataClass
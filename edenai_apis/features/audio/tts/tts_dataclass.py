@@ -1,5 +1,15 @@
-from pydantic import BaseModel, StrictStr
+from typing import AsyncIterable
+
+from pydantic import BaseModel, ConfigDict, StrictStr
 
 
 class TtsDataClass(BaseModel):
     audio_resource_url: StrictStr
+
+
+class StreamTts(BaseModel):
+    """Audio chunks yielded as the provider produces them, see `utils.tts.TtsAudioStream`"""
+
+    stream: AsyncIterable[bytes]
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
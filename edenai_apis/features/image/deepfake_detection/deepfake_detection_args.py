@@ -1,7 +1,7 @@
 import mimetypes
 import os
 from typing import Dict
-from pydub.utils import mediainfo
+from edenai_apis.utils.media_probe import mediainfo
 from edenai_apis.utils.files import FileInfo, FileWrapper
 
 
@@ -13,12 +13,13 @@ def deepfake_detection_arguments(provider_name: str) -> Dict:
     image_path = f"{data_path}/face.jpeg"
 
     mime_type = mimetypes.guess_type(image_path)[0]
+    media_info = mediainfo(image_path)
     file_info = FileInfo(
         os.stat(image_path).st_size,
         mime_type,
         [extension[1:] for extension in mimetypes.guess_all_extensions(mime_type)],
-        mediainfo(image_path).get("sample_rate", "44100"),
-        mediainfo(image_path).get("channels", "1"),
+        media_info.get("sample_rate", "44100"),
+        media_info.get("channels", "1"),
     )
     file_wrapper = FileWrapper(image_path, "", file_info)
     return {"file": file_wrapper}
@@ -3,9 +3,8 @@ import os
 from io import BufferedReader
 from typing import Dict, List
 
-from pydub.utils import mediainfo
-
 from edenai_apis.utils.files import FileInfo, FileWrapper
+from edenai_apis.utils.media_probe import mediainfo
 from ..common_args import COLLECTION_ID
 
 
@@ -23,12 +22,13 @@ def face_recognition_recognize_arguments(provider_name: str) -> Dict:
     face_path = f"{data_path}/face_recognition_1.jpg"
 
     mime_type = mimetypes.guess_type(face_path)[0]
+    media_info = mediainfo(face_path)
     file_info = FileInfo(
         os.stat(face_path).st_size,
         mime_type,
         [extension[1:] for extension in mimetypes.guess_all_extensions(mime_type)],
-        mediainfo(face_path).get("sample_rate", "44100"),
-        mediainfo(face_path).get("channels", "1"),
+        media_info.get("sample_rate", "44100"),
+        media_info.get("channels", "1"),
     )
     file_wrapper = FileWrapper(face_path, "", file_info)
     return {"file": file_wrapper, "collection_id": COLLECTION_ID}
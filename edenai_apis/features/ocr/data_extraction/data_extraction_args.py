@@ -2,9 +2,8 @@ import mimetypes
 import os
 from typing import Dict
 
-from pydub.utils import mediainfo
-
 from edenai_apis.utils.files import FileInfo, FileWrapper
+from edenai_apis.utils.media_probe import mediainfo
 
 
 def data_extraction_arguments(provider_name: str) -> Dict:
@@ -17,6 +16,7 @@ def data_extraction_arguments(provider_name: str) -> Dict:
     ocr_path = f"{data_path}/{filename}"
 
     mime_type = mimetypes.guess_type(ocr_path)[0]
+    media_info = mediainfo(ocr_path)
     file_info = FileInfo(
         os.stat(ocr_path).st_size,
         mime_type,
@@ -24,8 +24,8 @@ def data_extraction_arguments(provider_name: str) -> Dict:
             extension[1:]
             for extension in mimetypes.guess_all_extensions(mime_type or "")
         ],
-        mediainfo(ocr_path).get("sample_rate", "44100"),
-        mediainfo(ocr_path).get("channels", "1"),
+        media_info.get("sample_rate", "44100"),
+        media_info.get("channels", "1"),
     )
     file_wrapper = FileWrapper(ocr_path, "", file_info)
     return {"file": file_wrapper}
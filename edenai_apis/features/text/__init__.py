@@ -3,6 +3,18 @@ from .anonymization import (
     AnonymizationDataClass,
     anonymization_arguments,
 )
+from .batch_keyword_extraction import (
+    BatchKeywordExtractionDataClass,
+    batch_keyword_extraction_arguments,
+)
+from .batch_named_entity_recognition import (
+    BatchNamedEntityRecognitionDataClass,
+    batch_named_entity_recognition_arguments,
+)
+from .batch_sentiment_analysis import (
+    BatchSentimentAnalysisDataClass,
+    batch_sentiment_analysis_arguments,
+)
 from .chat import ChatDataClass, ChatMessageDataClass, chat_arguments
 from .code_generation import CodeGenerationDataClass, code_generation_arguments
 from .custom_classification import (
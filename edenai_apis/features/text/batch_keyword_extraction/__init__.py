@@ -0,0 +1,2 @@
+from .batch_keyword_extraction_args import batch_keyword_extraction_arguments
+from .batch_keyword_extraction_dataclass import BatchKeywordExtractionDataClass
@@ -0,0 +1,16 @@
+from typing import Sequence
+
+from pydantic import BaseModel, Field
+
+from edenai_apis.features.text.keyword_extraction.keyword_extraction_dataclass import (
+    KeywordExtractionDataClass,
+)
+from edenai_apis.utils.types import BatchDocumentItem
+
+
+class BatchKeywordExtractionDataClass(BaseModel):
+    """Results of the documents of a batch, in the order of the request"""
+
+    items: Sequence[BatchDocumentItem[KeywordExtractionDataClass]] = Field(
+        default_factory=list
+    )
@@ -0,0 +1,2 @@
+from .batch_named_entity_recognition_args import batch_named_entity_recognition_arguments
+from .batch_named_entity_recognition_dataclass import BatchNamedEntityRecognitionDataClass
@@ -0,0 +1,9 @@
+def batch_named_entity_recognition_arguments(provider_name: str):
+    return {
+        "language": "en",
+        "texts": [
+            "The delivery was fast and the chair from Ikea is really comfortable.",
+            "Terrible customer service, I waited two weeks for a refund from Amazon.",
+            "The product works as described.",
+        ],
+    }
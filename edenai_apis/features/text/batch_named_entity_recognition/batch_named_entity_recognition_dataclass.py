@@ -0,0 +1,16 @@
+from typing import Sequence
+
+from pydantic import BaseModel, Field
+
+from edenai_apis.features.text.named_entity_recognition.named_entity_recognition_dataclass import (
+    NamedEntityRecognitionDataClass,
+)
+from edenai_apis.utils.types import BatchDocumentItem
+
+
+class BatchNamedEntityRecognitionDataClass(BaseModel):
+    """Results of the documents of a batch, in the order of the request"""
+
+    items: Sequence[BatchDocumentItem[NamedEntityRecognitionDataClass]] = Field(
+        default_factory=list
+    )
@@ -0,0 +1,2 @@
+from .batch_sentiment_analysis_args import batch_sentiment_analysis_arguments
+from .batch_sentiment_analysis_dataclass import BatchSentimentAnalysisDataClass
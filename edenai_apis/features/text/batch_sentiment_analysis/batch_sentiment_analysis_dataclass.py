@@ -0,0 +1,16 @@
+from typing import Sequence
+
+from pydantic import BaseModel, Field
+
+from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass import (
+    SentimentAnalysisDataClass,
+)
+from edenai_apis.utils.types import BatchDocumentItem
+
+
+class BatchSentimentAnalysisDataClass(BaseModel):
+    """Results of the documents of a batch, in the order of the request"""
+
+    items: Sequence[BatchDocumentItem[SentimentAnalysisDataClass]] = Field(
+        default_factory=list
+    )
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict
+from typing import Dict, Tuple
 
 from edenai_apis.features.text.moderation.subcategory import (
     SubCategoryBase,
@@ -57,13 +57,22 @@ class CategoryType(str, Enum):
             CategoryType: The category of the entity.
 
         """
+        category, sub_category = _LABEL_INDEX.get(
+            label.casefold(), (cls.Other, OtherSubCategoryType.Other)
+        )
+        return {"category": category, "subcategory": sub_category}
+
+    @classmethod
+    def label_index(cls) -> Dict[str, Tuple["CategoryType", SubCategoryBase]]:
+        """(category, subcategory) of each case-folded label"""
+        index = {}
         for category, sub_categories in cls.list_choices().items():
-            try:
-                sub_category = sub_categories.choose_label(label)
-                return {"category": category, "subcategory": sub_category}
-            except ValueError:
-                continue
-        return {
-            "category": cls.Other,
-            "subcategory": OtherSubCategoryType.Other,
-        }
+            for label, sub_category in sub_categories.label_index().items():
+                # categories are tried in order, the first one listing a label wins
+                index.setdefault(label, (category, sub_category))
+        return index
+
+
+# built at import, `choose_category_subcategory` is called for every label of every
+# moderation response
+_LABEL_INDEX = CategoryType.label_index()
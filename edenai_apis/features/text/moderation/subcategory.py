@@ -3,6 +3,8 @@ from typing import Dict, List
 
 from edenai_apis.features.text.moderation.pattern import SubCategoryPattern
 
+_label_indexes: Dict[type, Dict[str, "SubCategoryBase"]] = {}
+
 
 class SubCategoryBase(str):
     @classmethod
@@ -22,21 +24,28 @@ class SubCategoryBase(str):
                 f"Unknown subcategory {subcategory}. Only {cls.list_choices().keys()} are allowed."
             )
 
+    @classmethod
+    def label_index(cls) -> Dict[str, "SubCategoryBase"]:
+        """Subcategory of each case-folded label, built once per subcategory type"""
+        index = _label_indexes.get(cls)
+        if index is None:
+            index = {}
+            for subcategory, labels in cls.list_choices().items():
+                for label in labels:
+                    # the first subcategory listing a label wins
+                    index.setdefault(label.casefold(), subcategory)
+            _label_indexes[cls] = index
+        return index
+
     @classmethod
     def choose_label(cls, label: str) -> "SubCategoryBase":
-        normalized_label = label.lower()
-        for subcategory in cls.list_choices().keys():
-            choices: list = list(
-                map(
-                    lambda label: normalized_label == label,
-                    cls.get_choices(subcategory),
-                )
+        try:
+            return cls.label_index()[label.casefold()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown label {label}. "
+                f"Only {cls.list_choices().values()} are allowed."
             )
-            if sum(choices) > 0:
-                return subcategory
-        raise ValueError(
-            f"Unknown label {label}. Only {cls.list_choices().values()} are allowed."
-        )
 
 
 class ToxicSubCategoryType(SubCategoryBase, Enum):
@@ -19,6 +19,9 @@ from edenai_apis.features.text import (
     ChatDataClass,
     PromptOptimizationDataClass,
     EmotionDetectionDataClass,
+    BatchKeywordExtractionDataClass,
+    BatchNamedEntityRecognitionDataClass,
+    BatchSentimentAnalysisDataClass,
 )
 from edenai_apis.features.text.ai_detection.ai_detection_dataclass import (
     AiDetectionDataClass,
@@ -92,6 +95,39 @@ class TextInterface:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def text__batch_keyword_extraction(
+        self,
+        language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchKeywordExtractionDataClass]:
+        """
+        Extract Keywords from a batch of texts, with a result or an error per text
+
+        Args:
+            texts (list): texts to analyze
+            language (str): texts' language code in ISO format
+        """
+        raise NotImplementedError
+
+    async def text__abatch_keyword_extraction(
+        self,
+        language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchKeywordExtractionDataClass]:
+        """
+        Async version of batch keyword extraction.
+
+        Args:
+            texts (list): texts to analyze
+            language (str): texts' language code in ISO format
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def text__named_entity_recognition(
         self,
@@ -128,6 +164,39 @@ class TextInterface:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def text__batch_named_entity_recognition(
+        self,
+        language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        """
+        Identify named entities in a batch of texts, with a result or an error per text
+
+        Args:
+            texts (list): texts to analyze
+            language (str): texts' language code in ISO format
+        """
+        raise NotImplementedError
+
+    async def text__abatch_named_entity_recognition(
+        self,
+        language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchNamedEntityRecognitionDataClass]:
+        """
+        Async version of batch named entity recognition.
+
+        Args:
+            texts (list): texts to analyze
+            language (str): texts' language code in ISO format
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def text__question_answer(
         self,
@@ -195,6 +264,39 @@ class TextInterface:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def text__batch_sentiment_analysis(
+        self,
+        language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        """
+        Analyze sentiment of a batch of texts, with a result or an error per text
+
+        Args:
+            texts (list): texts to analyze
+            language (str): texts' language code in ISO format
+        """
+        raise NotImplementedError
+
+    async def text__abatch_sentiment_analysis(
+        self,
+        language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchSentimentAnalysisDataClass]:
+        """
+        Async version of batch sentiment analysis.
+
+        Args:
+            texts (list): texts to analyze
+            language (str): texts' language code in ISO format
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def text__summarize(
         self,
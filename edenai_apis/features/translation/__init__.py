@@ -2,6 +2,14 @@ from .automatic_translation import (
     AutomaticTranslationDataClass,
     automatic_translation_arguments,
 )
+from .batch_language_detection import (
+    BatchLanguageDetectionDataClass,
+    batch_language_detection_arguments,
+)
+from .batch_translation import (
+    BatchTranslationDataClass,
+    batch_translation_arguments,
+)
 from .language_detection import (
     LanguageDetectionDataClass,
     InfosLanguageDetectionDataClass,
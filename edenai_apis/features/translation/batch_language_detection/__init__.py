@@ -0,0 +1,2 @@
+from .batch_language_detection_args import batch_language_detection_arguments
+from .batch_language_detection_dataclass import BatchLanguageDetectionDataClass
@@ -0,0 +1,8 @@
+def batch_language_detection_arguments(provider_name: str):
+    return {
+        "texts": [
+            "The delivery was fast and the chair is really comfortable.",
+            "La livraison était rapide et la chaise est très confortable.",
+            "Die Lieferung war schnell und der Stuhl ist sehr bequem.",
+        ],
+    }
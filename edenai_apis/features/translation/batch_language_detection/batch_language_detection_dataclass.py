@@ -0,0 +1,16 @@
+from typing import Sequence
+
+from pydantic import BaseModel, Field
+
+from edenai_apis.features.translation.language_detection.language_detection_dataclass import (
+    LanguageDetectionDataClass,
+)
+from edenai_apis.utils.types import BatchDocumentItem
+
+
+class BatchLanguageDetectionDataClass(BaseModel):
+    """Results of the documents of a batch, in the order of the request"""
+
+    items: Sequence[BatchDocumentItem[LanguageDetectionDataClass]] = Field(
+        default_factory=list
+    )
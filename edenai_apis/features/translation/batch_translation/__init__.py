@@ -0,0 +1,2 @@
+from .batch_translation_args import batch_translation_arguments
+from .batch_translation_dataclass import BatchTranslationDataClass
@@ -0,0 +1,11 @@
+def batch_translation_arguments(provider_name: str):
+    return {
+        "texts": [
+            "Chaise en chêne massif",
+            "Table basse en verre trempé",
+            "Lampe de chevet en laiton",
+            "Chaise en chêne massif",
+        ],
+        "source_language": "fr",
+        "target_language": "en",
+    }
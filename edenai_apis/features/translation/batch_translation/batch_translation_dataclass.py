@@ -0,0 +1,7 @@
+from typing import Sequence
+
+from pydantic import BaseModel, Field, StrictStr
+
+
+class BatchTranslationDataClass(BaseModel):
+    texts: Sequence[StrictStr] = Field(default_factory=list)
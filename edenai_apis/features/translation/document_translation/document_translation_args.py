@@ -1,9 +1,8 @@
 import mimetypes
 import os
 
-from pydub.utils import mediainfo
-
 from edenai_apis.utils.files import FileInfo, FileWrapper
+from edenai_apis.utils.media_probe import mediainfo
 
 
 def document_translation_arguments(provider_name: str) -> dict:
@@ -13,12 +12,13 @@ def document_translation_arguments(provider_name: str) -> dict:
     document_path = f"{data_path}/document_translation.pdf"
 
     mime_type = mimetypes.guess_type(document_path)[0]
+    media_info = mediainfo(document_path)
     file_info = FileInfo(
         os.stat(document_path).st_size,
         mime_type,
         [extension[1:] for extension in mimetypes.guess_all_extensions(mime_type)],
-        mediainfo(document_path).get("sample_rate", "44100"),
-        mediainfo(document_path).get("channels", "1"),
+        media_info.get("sample_rate", "44100"),
+        media_info.get("channels", "1"),
     )
     file_wrapper = FileWrapper(document_path, "", file_info)
     return {
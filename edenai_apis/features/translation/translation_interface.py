@@ -1,9 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from edenai_apis.features.translation.automatic_translation.automatic_translation_dataclass import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.batch_language_detection.batch_language_detection_dataclass import (
+    BatchLanguageDetectionDataClass,
+)
+from edenai_apis.features.translation.batch_translation.batch_translation_dataclass import (
+    BatchTranslationDataClass,
+)
 from edenai_apis.features.translation.document_translation import (
     DocumentTranslationDataClass,
 )
@@ -57,6 +63,46 @@ class TranslationInterface:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def translation__batch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        """
+        Translate a batch of texts, returned in the same order
+
+        Args:
+            texts (list): texts to translate
+            source_language (str): texts' language code in ISO format
+            target_language (str): to which language to translate texts
+
+        Note:
+            for some providers, `source_language` can automatically detected
+        """
+        raise NotImplementedError
+
+    async def translation__abatch_translation(
+        self,
+        source_language: str,
+        target_language: str,
+        texts: List[str],
+        model: Optional[str] = None,
+        **kwargs,
+    ) -> ResponseType[BatchTranslationDataClass]:
+        """
+        Async version of batch translation.
+
+        Args:
+            texts (list): texts to translate
+            source_language (str): texts' language code in ISO format
+            target_language (str): to which language to translate texts
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def translation__language_detection(
         self, text: str, model: Optional[str] = None, **kwargs
@@ -69,6 +115,29 @@ class TranslationInterface:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def translation__batch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        """
+        Detect language of a batch of texts, with a result or an error per text
+
+        Args:
+            texts (list): texts to analyze
+        """
+        raise NotImplementedError
+
+    async def translation__abatch_language_detection(
+        self, texts: List[str], model: Optional[str] = None, **kwargs
+    ) -> ResponseType[BatchLanguageDetectionDataClass]:
+        """
+        Async version of batch language detection.
+
+        Args:
+            texts (list): texts to analyze
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def translation__document_translation(
         self,
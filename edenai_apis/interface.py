@@ -2,6 +2,7 @@ import asyncio
 import inspect
 import random
 import time
+from contextlib import nullcontext
 from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Type, Union, overload
 from uuid import uuid4
 
@@ -13,6 +14,12 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum, load_info_file
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.constraints import validate_all_provider_constraints
 from edenai_apis.utils.exception import ProviderException, get_appropriate_error
+from edenai_apis.utils.image_preprocessing import (
+    apreprocessed_image_args,
+    preprocessed_image_args,
+    rescale_coordinates,
+)
+from edenai_apis.utils.sync_offload import run_sync
 from edenai_apis.utils.types import AsyncLaunchJobResponseType
 
 load_dotenv()
@@ -22,6 +29,14 @@ def is_async(func):
     return inspect.iscoroutinefunction(func) or inspect.isasyncgenfunction(func)
 
 
+def _implements(provider_class: Type, method_name: str) -> bool:
+    """The provider defines `method_name`, not only its feature interface"""
+    method = getattr(provider_class, method_name, None)
+    return method is not None and not method.__module__.startswith(
+        "edenai_apis.features."
+    )
+
+
 ProviderDict = Dict[
     str, Dict[str, Dict[str, Union[Dict[str, Literal[True]], Literal[True]]]]
 ]
@@ -235,56 +250,64 @@ def compute_output(
     # suffix is used for async
     suffix = "__launch_job" if is_async else ""
 
-    # if language input, update args with a standardized language
-    args = validate_all_provider_constraints(
-        provider_name, feature, subfeature, phase, args
+    # oversized images are downscaled for the subfeatures declaring image limits
+    image_args = (
+        nullcontext((args, None))
+        if fake
+        else preprocessed_image_args(provider_name, feature, subfeature, phase, args)
     )
+    with image_args as (args, image_scale):
+        # if language input, update args with a standardized language
+        args = validate_all_provider_constraints(
+            provider_name, feature, subfeature, phase, args
+        )
 
-    if fake:
-        time.sleep(
-            random.uniform(0.5, 1.5)
-        )  # sleep to fake the response time from a provider
-        # sample_args = load_feature(
-        #     FeatureDataEnum.SAMPLES_ARGS,
-        #     feature=feature,
-        #     subfeature=subfeature,
-        #     phase=phase,
-        #     provider_name=provider_name,
-        # )
-        # replace File Wrapper by file and file_url inputs and also transform input attributes as settings for tts
-        # sample_args = validate_all_provider_constraints(
-        #     provider_name, feature, subfeature, phase, sample_args
-        # )
-
-        # Return mocked results
-        if is_async:
-            subfeature_result: Any = AsyncLaunchJobResponseType(
-                provider_job_id=str(uuid4())
-            ).model_dump()
-        # TODO: refacto image search to save output with this phase
-        elif phase in ["upload_image", "delete_image"]:
-            subfeature_result = {"status": STATUS_SUCCESS}
-        else:
-            subfeature_result = load_provider(
-                ProviderDataEnum.OUTPUT,
-                provider_name=provider_name,
-                feature=feature,
-                subfeature=subfeature,
-                phase=phase,
-            )
-
-    else:
-        # Fake == False : Compute real output
-        feature_class = getattr(interface_v2, feature.title())
-        subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
-        subfeature_class = getattr(feature_class, subfeature_method_name)
+        if fake:
+            time.sleep(
+                random.uniform(0.5, 1.5)
+            )  # sleep to fake the response time from a provider
+            # sample_args = load_feature(
+            #     FeatureDataEnum.SAMPLES_ARGS,
+            #     feature=feature,
+            #     subfeature=subfeature,
+            #     phase=phase,
+            #     provider_name=provider_name,
+            # )
+            # replace File Wrapper by file and file_url inputs and also transform input attributes as settings for tts
+            # sample_args = validate_all_provider_constraints(
+            #     provider_name, feature, subfeature, phase, sample_args
+            # )
+
+            # Return mocked results
+            if is_async:
+                subfeature_result: Any = AsyncLaunchJobResponseType(
+                    provider_job_id=str(uuid4())
+                ).model_dump()
+            # TODO: refacto image search to save output with this phase
+            elif phase in ["upload_image", "delete_image"]:
+                subfeature_result = {"status": STATUS_SUCCESS}
+            else:
+                subfeature_result = load_provider(
+                    ProviderDataEnum.OUTPUT,
+                    provider_name=provider_name,
+                    feature=feature,
+                    subfeature=subfeature,
+                    phase=phase,
+                )
 
-        try:
-            subfeature_result = subfeature_class(provider_name, api_keys)(
-                **args, **kwargs
-            ).model_dump()
-        except ProviderException as exc:
-            raise get_appropriate_error(provider_name, exc)
+        else:
+            # Fake == False : Compute real output
+            feature_class = getattr(interface_v2, feature.title())
+            subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
+            subfeature_class = getattr(feature_class, subfeature_method_name)
+
+            try:
+                subfeature_result = subfeature_class(provider_name, api_keys)(
+                    **args, **kwargs
+                ).model_dump()
+                subfeature_result = rescale_coordinates(subfeature_result, image_scale)
+            except ProviderException as exc:
+                raise get_appropriate_error(provider_name, exc)
 
     final_result: Dict[str, Any] = {
         **subfeature_result,
@@ -328,46 +351,68 @@ async def acompute_output(
     is_async_job = ("_async" in phase) if phase else ("_async" in subfeature)
     suffix = "__launch_job" if is_async_job else ""
 
-    args = validate_all_provider_constraints(
-        provider_name, feature, subfeature, phase, args
+    # oversized images are downscaled for the subfeatures declaring image limits
+    image_args = (
+        nullcontext((args, None))
+        if fake
+        else apreprocessed_image_args(
+            provider_name, feature, subfeature, phase, args
+        )
     )
+    async with image_args as (args, image_scale):
+        args = validate_all_provider_constraints(
+            provider_name, feature, subfeature, phase, args
+        )
 
-    if fake:
-        kwargs["fake"] = True
-    if fake and not args.get("stream", False):
-        await asyncio.sleep(random.uniform(0.5, 1.5))
+        if fake:
+            kwargs["fake"] = True
+        if fake and not args.get("stream", False):
+            await asyncio.sleep(random.uniform(0.5, 1.5))
 
-        if is_async_job:
-            subfeature_result = AsyncLaunchJobResponseType(
-                provider_job_id=str(uuid4())
-            ).model_dump()
-        else:
-            subfeature_result = load_provider(
-                ProviderDataEnum.OUTPUT,
-                provider_name=provider_name,
-                feature=feature,
-                subfeature=subfeature,
-                phase=phase,
-            )
+            if is_async_job:
+                subfeature_result = AsyncLaunchJobResponseType(
+                    provider_job_id=str(uuid4())
+                ).model_dump()
+            else:
+                subfeature_result = load_provider(
+                    ProviderDataEnum.OUTPUT,
+                    provider_name=provider_name,
+                    feature=feature,
+                    subfeature=subfeature,
+                    phase=phase,
+                )
 
-    else:
-        ProviderClass = load_provider(
-            ProviderDataEnum.CLASS, provider_name=provider_name
-        )
-        provider_instance = ProviderClass(api_keys)
-        func_name = f'{feature}__a{subfeature}{f"__{phase}" if phase else ""}{suffix}'
-        try:
-            subfeature_func = getattr(provider_instance, func_name)
-        except AttributeError:
-            raise NotImplementedError(
-                f'Async method "{func_name}" is not implemented for provider "{provider_name}".'
+        else:
+            ProviderClass = load_provider(
+                ProviderDataEnum.CLASS, provider_name=provider_name
             )
-
-        try:
-            subfeature_result = await subfeature_func(**args, **kwargs)
-            subfeature_result = subfeature_result.model_dump()
-        except ProviderException as exc:
-            raise get_appropriate_error(provider_name, exc)
+            method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
+            func_name = f"{feature}__a{method_name}"
+            sync_func_name = f"{feature}__{method_name}"
+            if not _implements(ProviderClass, func_name) and (
+                args.get("stream", False)
+                or not _implements(ProviderClass, sync_func_name)
+            ):
+                raise NotImplementedError(
+                    f'Async method "{func_name}" is not implemented for provider "{provider_name}".'
+                )
+
+            try:
+                if _implements(ProviderClass, func_name):
+                    subfeature_func = getattr(ProviderClass(api_keys), func_name)
+                    subfeature_result = await subfeature_func(**args, **kwargs)
+                else:
+                    # no native async: the sync method runs in the provider pool
+                    subfeature_result = await run_sync(
+                        provider_name,
+                        lambda: getattr(ProviderClass(api_keys), sync_func_name)(
+                            **args, **kwargs
+                        ),
+                    )
+                subfeature_result = subfeature_result.model_dump()
+                subfeature_result = rescale_coordinates(subfeature_result, image_scale)
+            except ProviderException as exc:
+                raise get_appropriate_error(provider_name, exc)
 
     if args.get("stream", False):
         return subfeature_result["stream"]
@@ -548,20 +593,26 @@ async def aget_async_job_result(
         return fake_result
 
     ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider_name)
-    provider_instance = ProviderClass(api_keys)
-    func_name = (
-        f'{feature}__a{subfeature}{f"__{phase}" if phase else ""}__get_job_result'
-    )
-
-    try:
-        subfeature_func = getattr(provider_instance, func_name)
-    except AttributeError:
+    method_name = f'{subfeature}{f"__{phase}" if phase else ""}__get_job_result'
+    func_name = f"{feature}__a{method_name}"
+    sync_func_name = f"{feature}__{method_name}"
+    if not _implements(ProviderClass, func_name) and not _implements(
+        ProviderClass, sync_func_name
+    ):
         raise NotImplementedError(
             f'Async method "{func_name}" is not implemented for provider "{provider_name}".'
         )
 
     try:
-        subfeature_result = await subfeature_func(async_job_id)
+        if _implements(ProviderClass, func_name):
+            subfeature_func = getattr(ProviderClass(api_keys), func_name)
+            subfeature_result = await subfeature_func(async_job_id)
+        else:
+            # no native async: the sync method runs in the provider pool
+            subfeature_result = await run_sync(
+                provider_name,
+                lambda: getattr(ProviderClass(api_keys), sync_func_name)(async_job_id),
+            )
         subfeature_result = subfeature_result.model_dump()
     except ProviderException as exc:
         raise get_appropriate_error(provider_name, exc)
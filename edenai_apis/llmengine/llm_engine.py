@@ -389,16 +389,14 @@ class LLMEngine:
                         "Either file or file_url must be provided", code=400
                     )
                 file_wrapper = await file_handler.download_file(file_url)
-                file_content = await file_wrapper.get_bytes()
+                base64_data = await file_wrapper.get_file_b64_content()
                 mime_type = file_wrapper.file_info.file_media_type
             else:
                 async with aiofiles.open(file, "rb") as file_:
                     file_content = await file_.read()
-
+                base64_data = base64.b64encode(file_content).decode("utf-8")
                 mime_type = mimetypes.guess_type(file)[0]
 
-            base64_data = base64.b64encode(file_content).decode("utf-8")
-
             messages = await BasePrompt.acompose_prompt(
                 behavior="You are a Logo Detection model. You get an image input and return logos detected inside it. If no logo is detected the items list should be empty",
                 example_file="image/logo_detection/logo_detection_response.json",
@@ -518,7 +516,6 @@ class LLMEngine:
                         "Either file or file_url must be provided", code=400
                     )
                 file_wrapper = await file_handler.download_file(file_url)
-                file_content = await file_wrapper.get_bytes()
                 base64_data = await file_wrapper.get_file_b64_content()
                 mime_type = file_wrapper.file_info.file_media_type
             else:
@@ -4,12 +4,12 @@ from functools import wraps
 from typing import List, Union
 
 import httpx
-from asgiref.sync import async_to_sync
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.http import async_client
+from edenai_apis.utils.loop_bridge import run_coroutine
 
 
 class OpenAIErrorCode(Enum):
@@ -180,7 +180,7 @@ async def check_content_moderation_async(*args, **kwargs):
 
 
 def check_content_moderation(*args, **kwargs):
-    async_to_sync(check_content_moderation_async)(*args, **kwargs)
+    run_coroutine(check_content_moderation_async(*args, **kwargs))
 
 
 def moderate(func):
@@ -207,7 +207,7 @@ def moderate_std(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         if kwargs.get("moderate_content"):
-            async_to_sync(standard_moderation)(*args, **kwargs)
+            run_coroutine(standard_moderation(*args, **kwargs))
         return func(self, *args, **kwargs)
 
     return wrapper
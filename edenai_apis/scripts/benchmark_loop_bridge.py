@@ -0,0 +1,47 @@
+"""
+Per-call overhead of running a coroutine from synchronous code, for each bridge:
+`asyncio.run`, `asgiref.async_to_sync` and `edenai_apis.utils.loop_bridge`.
+
+The coroutine only yields once, so the timings are the cost of the bridge itself
+(event loop setup, thread hops), not of any work.
+
+Usage:
+    python -m edenai_apis.scripts.benchmark_loop_bridge [calls]
+"""
+
+import asyncio
+import sys
+import time
+
+from asgiref.sync import async_to_sync
+
+from edenai_apis.utils.loop_bridge import run_coroutine, stop_bridge_loop
+
+
+async def _noop() -> None:
+    await asyncio.sleep(0)
+
+
+def _time_calls(call, calls: int) -> float:
+    # first call sets up the bridge, not counted
+    call()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - start) / calls
+
+
+def main(calls: int = 2000) -> None:
+    bridges = {
+        "asyncio.run": lambda: asyncio.run(_noop()),
+        "async_to_sync": lambda: async_to_sync(_noop)(),
+        "loop_bridge": lambda: run_coroutine(_noop()),
+    }
+    print(f"{'bridge':<16}{'per call (us)':>16}")
+    for name, call in bridges.items():
+        print(f"{name:<16}{_time_calls(call, calls) * 1e6:>16.1f}")
+    stop_bridge_loop()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
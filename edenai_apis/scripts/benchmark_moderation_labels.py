@@ -0,0 +1,84 @@
+"""
+Time to categorize a batch of moderation labels with
+`CategoryType.choose_category_subcategory`, against the scan over every category
+and subcategory it replaced.
+
+Labels are drawn from every known pattern, with provider casing, plus a share of
+unknown labels (which the scan compared to every pattern).
+
+Usage:
+    python -m edenai_apis.scripts.benchmark_moderation_labels [labels] [unknown_ratio]
+"""
+
+import random
+import sys
+import time
+
+from edenai_apis.features.image.explicit_content.category import (
+    CategoryType as ExplicitContentCategoryType,
+)
+from edenai_apis.features.text.moderation.category import (
+    CategoryType as ModerationCategoryType,
+)
+
+
+def _choose_label(sub_categories, label: str):
+    """`SubCategoryBase.choose_label` before the label index"""
+    normalized_label = label.lower()
+    for sub_category in sub_categories.list_choices().keys():
+        choices = list(
+            map(
+                lambda label: normalized_label == label,
+                sub_categories.get_choices(sub_category),
+            )
+        )
+        if sum(choices) > 0:
+            return sub_category
+    raise ValueError(f"Unknown label {label}")
+
+
+def _scan(category_type, label: str) -> dict:
+    """`choose_category_subcategory` before the label index"""
+    for category, sub_categories in category_type.list_choices().items():
+        try:
+            sub_category = _choose_label(sub_categories, label)
+            return {"category": category, "subcategory": sub_category}
+        except ValueError:
+            continue
+    return {"category": category_type.Other, "subcategory": "Other"}
+
+
+def _labels(category_type, count: int, unknown_ratio: float) -> list:
+    patterns = list(category_type.label_index())
+    rng = random.Random(0)
+    return [
+        f"unknown label {index}"
+        if rng.random() < unknown_ratio
+        else rng.choice(patterns).title()
+        for index in range(count)
+    ]
+
+
+def _time(call, labels: list) -> float:
+    start = time.perf_counter()
+    for label in labels:
+        call(label)
+    return (time.perf_counter() - start) / len(labels)
+
+
+def main(count: int = 100_000, unknown_ratio: float = 0.2) -> None:
+    print(f"{'categories':<20}{'scan (us)':>12}{'index (us)':>12}{'speedup':>10}")
+    for name, category_type in (
+        ("text/moderation", ModerationCategoryType),
+        ("image/explicit", ExplicitContentCategoryType),
+    ):
+        labels = _labels(category_type, count, unknown_ratio)
+        scan = _time(lambda label: _scan(category_type, label), labels)
+        index = _time(category_type.choose_category_subcategory, labels)
+        print(
+            f"{name:<20}{scan * 1e6:>12.2f}{index * 1e6:>12.2f}{scan / index:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
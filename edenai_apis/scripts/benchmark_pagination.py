@@ -0,0 +1,90 @@
+"""
+Peak memory of assembling a paginated Amazon Rekognition label detection result,
+for each way of handling raw pages (see `edenai_apis.utils.pagination.RawPages`).
+
+Every mode runs in its own process so that peak RSS values are not polluted by the
+previous run.
+
+Usage:
+    python -m edenai_apis.scripts.benchmark_pagination [num_pages] [labels_per_page]
+"""
+
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+from edenai_apis.apis.amazon.helpers import amazon_video_labels_parser
+from edenai_apis.utils.pagination import PageAssembler, RawPages, iter_pages
+
+
+def _fake_page(index: int, num_pages: int, labels_per_page: int) -> dict:
+    return {
+        "JobStatus": "SUCCEEDED",
+        "NextToken": str(index + 1) if index + 1 < num_pages else None,
+        "VideoMetadata": {"Codec": "h264", "DurationMillis": 3600 * 1000},
+        "Labels": [
+            {
+                "Timestamp": index * 1000 + label,
+                "Label": {
+                    "Name": f"label {label}",
+                    "Confidence": 90.0,
+                    "Parents": [{"Name": "parent"}],
+                    "Instances": [
+                        {
+                            "BoundingBox": {
+                                "Top": 0.1,
+                                "Left": 0.1,
+                                "Width": 0.5,
+                                "Height": 0.5,
+                            },
+                            "Confidence": 90.0,
+                        }
+                    ]
+                    * 3,
+                },
+            }
+            for label in range(labels_per_page)
+        ],
+    }
+
+
+def _run(mode: RawPages, num_pages: int, labels_per_page: int, results) -> None:
+    fetch_page = lambda token: _fake_page(int(token or 0), num_pages, labels_per_page)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    assembler = PageAssembler(amazon_video_labels_parser, raw_pages=mode).consume(
+        iter_pages(fetch_page)
+    )
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if assembler.spill_path:
+        os.remove(assembler.spill_path)
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results.put((mode.value, len(assembler.items), elapsed, peak, max_rss_kb))
+
+
+def main(num_pages: int = 200, labels_per_page: int = 1000) -> None:
+    print(f"{num_pages} pages x {labels_per_page} labels")
+    print(f"{'mode':<8}{'items':>10}{'time (s)':>10}{'py peak (MB)':>14}{'peak RSS (MB)':>15}")
+    results = multiprocessing.Queue()
+    for mode in RawPages:
+        process = multiprocessing.Process(
+            target=_run, args=(mode, num_pages, labels_per_page, results)
+        )
+        process.start()
+        name, items, elapsed, peak, max_rss_kb = results.get()
+        process.join()
+        print(
+            f"{name:<8}{items:>10}{elapsed:>10.2f}"
+            f"{peak / 1024 / 1024:>14.1f}{max_rss_kb / 1024:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,113 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from edenai_apis.apis.amazon.amazon_image_api import AmazonImageApi
+from edenai_apis.utils.exception import ProviderException
+
+
+def _throttled():
+    return ClientError(
+        {
+            "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"},
+            "ResponseMetadata": {"HTTPStatusCode": 400},
+        },
+        "IndexFaces",
+    )
+
+
+def _face_record(face_id):
+    return {"Face": {"FaceId": face_id}}
+
+
+@pytest.fixture
+def amazon():
+    api = AmazonImageApi.__new__(AmazonImageApi)
+    api.clients = {"image": MagicMock()}
+    return api
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr("edenai_apis.utils.bulk_operations.time.sleep", lambda _: 0)
+
+
+class TestAmazonBulkFaces:
+    @pytest.mark.unit
+    def test_faces_indexed_with_label_and_throttling_retried(
+        self, amazon, tmp_path, no_backoff
+    ):
+        (tmp_path / "john doe").mkdir()
+        (tmp_path / "john doe" / "1.jpg").write_bytes(b"image")
+        (tmp_path / "jane.jpg").write_bytes(b"image")
+        calls = []
+
+        def index_faces(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise _throttled()
+            return {"FaceRecords": [_face_record(kwargs["ExternalImageId"])]}
+
+        amazon.clients["image"].index_faces.side_effect = index_faces
+
+        items = sorted(
+            amazon.bulk_add_faces("collection", str(tmp_path), max_concurrency=1),
+            key=lambda item: item.index,
+        )
+
+        assert [item.status for item in items] == ["success", "success"]
+        assert [item.result.standardized_response.face_ids for item in items] == [
+            ["jane"],
+            ["john_doe"],
+        ]
+        assert items[0].attempts == 2
+        assert calls[0]["Image"] == {"Bytes": b"image"}
+
+    @pytest.mark.unit
+    def test_s3_images_not_downloaded(self, amazon):
+        amazon.clients["image"].index_faces.return_value = {"FaceRecords": []}
+
+        items = list(
+            amazon.bulk_add_faces("collection", [("s3://bucket/a/1.jpg", "a")])
+        )
+
+        assert items[0].status == "fail"
+        assert items[0].error == "No face detected in the image"
+        assert amazon.clients["image"].index_faces.call_args.kwargs["Image"] == {
+            "S3Object": {"Bucket": "bucket", "Name": "a/1.jpg"}
+        }
+
+    @pytest.mark.unit
+    def test_recognition_streamed_as_completed(self, amazon):
+        client = amazon.clients["image"]
+        client.describe_collection.return_value = {"FaceCount": 2}
+        slow_released = threading.Event()
+
+        def search_faces_by_image(**kwargs):
+            if kwargs["Image"]["S3Object"]["Name"] == "slow.jpg":
+                slow_released.wait(5)
+            return {"FaceMatches": [{"Similarity": 90.0, "Face": {"FaceId": "f"}}]}
+
+        client.search_faces_by_image.side_effect = search_faces_by_image
+
+        items = amazon.bulk_recognize_faces(
+            "collection",
+            [("s3://bucket/slow.jpg", "slow"), ("s3://bucket/fast.jpg", "fast")],
+            max_concurrency=2,
+        )
+        first = next(items)
+        slow_released.set()
+        second = next(items)
+
+        assert (first.entry.label, second.entry.label) == ("fast", "slow")
+        assert first.result.standardized_response.items[0].confidence == 0.9
+        client.describe_collection.assert_called_once()
+
+    @pytest.mark.unit
+    def test_recognition_of_empty_collection_rejected(self, amazon):
+        amazon.clients["image"].describe_collection.return_value = {"FaceCount": 0}
+
+        with pytest.raises(ProviderException, match="empty"):
+            amazon.bulk_recognize_faces("collection", [("s3://bucket/1.jpg", "a")])
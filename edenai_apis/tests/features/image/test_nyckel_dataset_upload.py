@@ -0,0 +1,79 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from edenai_apis.apis.nyckel import nyckel_api
+from edenai_apis.apis.nyckel.nyckel_api import NyckelApi
+
+
+def _response(status_code=200, json_data=None):
+    response = MagicMock(status_code=status_code, text="")
+    response.json.return_value = json_data
+    return response
+
+
+@pytest.fixture
+def nyckel():
+    api = NyckelApi.__new__(NyckelApi)
+    api._session = MagicMock()
+    api._renew_at = time.time() + 3600
+    api._auth_lock = MagicMock()
+    nyckel_api._project_labels.clear()
+    return api
+
+
+class TestNyckelDatasetUpload:
+    @pytest.mark.unit
+    def test_labels_created_once_then_samples_uploaded(self, nyckel, tmp_path):
+        for path in ("cat/1.jpg", "cat/2.jpg", "dog/3.jpg", "bird/4.jpg"):
+            (tmp_path / path).parent.mkdir(exist_ok=True)
+            (tmp_path / path).write_bytes(b"image")
+        nyckel._session.get.return_value = _response(json_data=[{"name": "cat"}])
+        created_labels = []
+
+        def post(url, **kwargs):
+            if url.endswith("/labels"):
+                created_labels.append(kwargs["json"]["name"])
+            return _response(json_data={"id": "sample"})
+
+        nyckel._session.post.side_effect = post
+        progress = []
+
+        report = nyckel.upload_automl_classification_dataset(
+            "project", str(tmp_path), progress=lambda state: progress.append(state.done)
+        )
+
+        assert created_labels == ["bird", "dog"]
+        assert [item.result["label_name"] for item in report.items] == [
+            "bird",
+            "cat",
+            "cat",
+            "dog",
+        ]
+        assert progress == [1, 2, 3, 4]
+
+        # labels are cached for the next uploads
+        (tmp_path / "5.jpg").write_bytes(b"image")
+        nyckel.upload_automl_classification_dataset(
+            "project", [(str(tmp_path / "5.jpg"), "dog")]
+        )
+        assert nyckel._session.get.call_count == 1
+        assert created_labels == ["bird", "dog"]
+
+    @pytest.mark.unit
+    def test_throttled_samples_retried(self, nyckel, monkeypatch):
+        monkeypatch.setattr("edenai_apis.utils.bulk_operations.time.sleep", lambda _: 0)
+        nyckel_api._add_known_labels("project", ["cat"])
+        responses = [_response(429), _response(json_data={"id": "sample"})]
+        nyckel._session.post.side_effect = lambda **kwargs: responses.pop(0)
+
+        report = nyckel.upload_automl_classification_dataset(
+            "project", [("https://example.com/1.jpg", "cat")]
+        )
+
+        assert report.items[0].status == "success"
+        assert report.items[0].attempts == 2
+        assert nyckel._session.post.call_args.kwargs["json"]["data"] == (
+            "https://example.com/1.jpg"
+        )
@@ -0,0 +1,45 @@
+import pytest
+
+from edenai_apis.features.image.explicit_content import category as explicit_content
+from edenai_apis.features.text.moderation import category as moderation
+from edenai_apis.features.text.moderation.subcategory import (
+    OtherSubCategoryType,
+    SexualSubCategoryType,
+    ToxicSubCategoryType,
+)
+
+
+@pytest.fixture(params=[moderation, explicit_content], ids=["text", "image"])
+def category_type(request):
+    return request.param.CategoryType
+
+
+class TestModerationLabelIndex:
+    @pytest.mark.unit
+    def test_every_pattern_indexed_in_order(self, category_type):
+        expected = {}
+        for category, sub_categories in category_type.list_choices().items():
+            for sub_category, labels in sub_categories.list_choices().items():
+                for label in labels:
+                    expected.setdefault(label, (category, sub_category))
+
+        for label, (category, sub_category) in expected.items():
+            assert category_type.choose_category_subcategory(label.upper()) == {
+                "category": category,
+                "subcategory": sub_category,
+            }
+
+    @pytest.mark.unit
+    def test_unknown_label_is_other(self, category_type):
+        assert category_type.choose_category_subcategory("not a label") == {
+            "category": category_type.Other,
+            "subcategory": OtherSubCategoryType.Other,
+        }
+
+    @pytest.mark.unit
+    def test_choose_label(self):
+        assert ToxicSubCategoryType.choose_label("Severe_Toxic") == (
+            ToxicSubCategoryType.Toxic
+        )
+        with pytest.raises(ValueError, match="Unknown label"):
+            SexualSubCategoryType.choose_label("insult")
@@ -0,0 +1,142 @@
+import httpx
+import pytest
+
+from edenai_apis.apis.microsoft import microsoft_text_api
+from edenai_apis.apis.microsoft.microsoft_text_api import MicrosoftTextApi
+from edenai_apis.utils.exception import ProviderException
+
+JOB_URL = "https://azure.example.com/jobs/1"
+
+
+def _job(status, sentences=()):
+    return {
+        "status": status,
+        "tasks": {
+            "extractiveSummarizationTasks": [
+                {
+                    "results": {
+                        "documents": [
+                            {"sentences": [{"text": text} for text in sentences]}
+                        ]
+                    }
+                }
+            ]
+        },
+    }
+
+
+class FakeClient:
+    def __init__(self, polls, created=None):
+        self.created = created or httpx.Response(
+            202, headers={"operation-location": JOB_URL}
+        )
+        self.polls = list(polls)
+        self.gets = 0
+
+    async def post(self, url, **kwargs):
+        return self.created
+
+    async def get(self, url, **kwargs):
+        assert url == JOB_URL
+        self.gets += 1
+        return self.polls.pop(0)
+
+
+@pytest.fixture
+def microsoft():
+    api = MicrosoftTextApi.__new__(MicrosoftTextApi)
+    api.url = {"summarization": "https://azure.example.com/summarize"}
+    api.headers = {"text": {}}
+    return api
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(microsoft_text_api.asyncio, "sleep", sleep)
+    return sleeps
+
+
+def _use_client(monkeypatch, client):
+    monkeypatch.setattr(microsoft_text_api, "shared_async_client", client)
+    return client
+
+
+class TestMicrosoftAsyncSummarize:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_adaptive_polling(self, microsoft, sleeps, monkeypatch):
+        client = _use_client(
+            monkeypatch,
+            FakeClient(
+                [
+                    httpx.Response(200, json=_job("notStarted")),
+                    httpx.Response(200, json=_job("running")),
+                    httpx.Response(200, json=_job("succeeded", ["One.", "Two."])),
+                ]
+            ),
+        )
+
+        result = await microsoft.text__asummarize("text", 2, "en")
+
+        assert result.standardized_response.result == "One. Two."
+        assert sleeps == [0.25, 0.5, 1.0]
+        assert client.gets == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_retry_after_honoured(self, microsoft, sleeps, monkeypatch):
+        _use_client(
+            monkeypatch,
+            FakeClient(
+                [
+                    httpx.Response(429, headers={"retry-after": "2"}),
+                    httpx.Response(
+                        200, json=_job("running"), headers={"retry-after": "1"}
+                    ),
+                    httpx.Response(200, json=_job("succeeded", ["One."])),
+                ],
+                created=httpx.Response(
+                    202,
+                    headers={"operation-location": JOB_URL, "retry-after": "0"},
+                ),
+            ),
+        )
+
+        await microsoft.text__asummarize("text", 1, "en")
+
+        assert sleeps == [0, 2.0, 1.0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_job(self, microsoft, sleeps, monkeypatch):
+        failed = {"status": "failed", "errors": [{"message": "Document too long"}]}
+        _use_client(monkeypatch, FakeClient([httpx.Response(200, json=failed)]))
+
+        with pytest.raises(ProviderException, match="Document too long"):
+            await microsoft.text__asummarize("text", 1, "en")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_job_not_created(self, microsoft, sleeps, monkeypatch):
+        error = {"error": {"details": [{"message": "Invalid sentence count"}]}}
+        _use_client(
+            monkeypatch, FakeClient([], created=httpx.Response(400, json=error))
+        )
+
+        with pytest.raises(ProviderException, match="Invalid sentence count"):
+            await microsoft.text__asummarize("text", 0, "en")
+        assert sleeps == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_timeout(self, microsoft, sleeps, monkeypatch):
+        monkeypatch.setattr(microsoft_text_api, "SUMMARIZE_TIMEOUT", 0)
+        _use_client(monkeypatch, FakeClient([]))
+
+        with pytest.raises(ProviderException, match="timed out"):
+            await microsoft.text__asummarize("text", 1, "en")
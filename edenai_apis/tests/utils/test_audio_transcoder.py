@@ -0,0 +1,134 @@
+import asyncio
+import os
+import stat
+import sys
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+from edenai_apis.utils import audio_transcoder
+from edenai_apis.utils.audio_transcoder import (
+    _ffmpeg_command,
+    atranscode_audio,
+    transcode_audio,
+)
+from edenai_apis.utils.exception import ProviderException
+
+# Stands for ffmpeg: copies its input (stdin or `-i` path) as the data of a wav
+# written like ffmpeg does on a pipe, with unknown sizes in the header
+FAKE_FFMPEG = """#!{python}
+import os, struct, sys, time
+args = sys.argv[1:]
+source = args[args.index("-i") + 1]
+if os.environ.get("FAKE_FFMPEG_SLEEP"):
+    time.sleep(float(os.environ["FAKE_FFMPEG_SLEEP"]))
+data = sys.stdin.buffer.read() if source == "pipe:0" else open(source, "rb").read()
+if data.startswith(b"invalid"):
+    sys.stderr.write("pipe:0: Invalid data found when processing input\\n")
+    sys.exit(1)
+rate = int(args[args.index("-ar") + 1]) if "-ar" in args else 44100
+channels = int(args[args.index("-ac") + 1]) if "-ac" in args else 2
+fmt = struct.pack("<HHIIHH", 1, channels, rate, rate * channels * 2, channels * 2, 16)
+sys.stdout.buffer.write(
+    b"RIFF\\xff\\xff\\xff\\xffWAVEfmt " + struct.pack("<I", 16) + fmt
+    + b"data\\xff\\xff\\xff\\xff" + data
+)
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    path = tmp_path / "ffmpeg"
+    path.write_text(FAKE_FFMPEG.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(audio_transcoder, "FFMPEG", str(path))
+    return str(path)
+
+
+class TestFfmpegCommand:
+    @pytest.mark.unit
+    def test_piped_input(self):
+        command = _ffmpeg_command(None, "wav", frame_rate=16000, channels=1)
+        assert command[command.index("-i") + 1] == "pipe:0"
+        assert "-nostdin" not in command
+        assert command[-5:] == ["-f", "wav", "-c:a", "pcm_s16le", "pipe:1"]
+        assert command[command.index("-ar") + 1] == "16000"
+        assert command[command.index("-ac") + 1] == "1"
+
+    @pytest.mark.unit
+    def test_input_path_and_muxer(self):
+        command = _ffmpeg_command("/tmp/audio.mp3", "m4a")
+        assert command[command.index("-i") + 1] == "/tmp/audio.mp3"
+        assert "-nostdin" in command
+        assert command[command.index("-f") + 1] == "ipod"
+        assert "-ar" not in command and "-ac" not in command
+
+    @pytest.mark.unit
+    def test_range_is_an_input_option(self):
+        command = _ffmpeg_command("/tmp/audio.mp3", "wav", start=7.25, duration=8)
+        assert command[command.index("-ss") + 1] == "7.250"
+        assert command[command.index("-t") + 1] == "8.000"
+        assert command.index("-t") < command.index("-i")
+
+
+class TestTranscodeAudio:
+    @pytest.mark.unit
+    def test_piped_file(self, fake_ffmpeg):
+        audio = os.urandom(1024 * 1024)
+        result = transcode_audio(BytesIO(audio), "wav", frame_rate=16000, channels=1)
+        assert (result.frame_rate, result.frame_width, result.channels) == (16000, 2, 1)
+        with wave.open(result.file, "rb") as wav:
+            assert wav.getframerate() == 16000
+            assert wav.readframes(wav.getnframes()) == audio
+
+    @pytest.mark.unit
+    def test_properties_probed_from_output(self, fake_ffmpeg, tmp_path):
+        path = tmp_path / "audio.mp3"
+        path.write_bytes(b"audio")
+        with open(path, "rb") as audio_file:
+            _, frame_rate, frame_width, channels = transcode_audio(audio_file).as_tuple()
+        assert (frame_rate, frame_width, channels) == (44100, 4, 2)
+
+    @pytest.mark.unit
+    def test_ffmpeg_error(self, fake_ffmpeg):
+        with pytest.raises(ProviderException) as exc:
+            transcode_audio(BytesIO(b"invalid audio"))
+        assert "Invalid data found" in str(exc.value)
+
+
+class TestAsyncTranscodeAudio:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_piped_file(self, fake_ffmpeg):
+        audio = os.urandom(1024 * 1024)
+        result = await atranscode_audio(BytesIO(audio), "wav", channels=1)
+        assert (result.frame_rate, result.channels) == (44100, 1)
+        with wave.open(result.file, "rb") as wav:
+            assert wav.readframes(wav.getnframes()) == audio
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_and_async_share_the_limit(self, fake_ffmpeg, monkeypatch):
+        monkeypatch.setenv("FAKE_FFMPEG_SLEEP", "0.2")
+        monkeypatch.setattr(audio_transcoder, "_pool", ThreadPoolExecutor(max_workers=2))
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(
+            asyncio.to_thread(transcode_audio, BytesIO(b"audio")),
+            asyncio.to_thread(transcode_audio, BytesIO(b"audio")),
+            *(atranscode_audio(BytesIO(b"audio")) for _ in range(2)),
+        )
+        assert asyncio.get_running_loop().time() - start >= 0.4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_kills_ffmpeg(self, fake_ffmpeg, monkeypatch):
+        monkeypatch.setenv("FAKE_FFMPEG_SLEEP", "10")
+        task = asyncio.ensure_future(atranscode_audio(BytesIO(b"audio")))
+        await asyncio.sleep(0.2)
+        start = asyncio.get_running_loop().time()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert asyncio.get_running_loop().time() - start < 5
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from edenai_apis.utils.batch_documents import (
+    DocumentLimits,
+    abatch_documents,
+    batch_documents,
+)
+from edenai_apis.utils.exception import ProviderException
+
+
+class FakeAnalyzer:
+    def __init__(self, delay: float = 0):
+        self.chunks: List[List[str]] = []
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, chunk: List[str]):
+        with self._lock:
+            self.chunks.append(chunk)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return [text.upper() for text in chunk], {"chunk": chunk}
+
+    async def analyze(self, chunk: List[str]):
+        self.chunks.append(chunk)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return [text.upper() for text in chunk], {"chunk": chunk}
+
+
+def _results(result):
+    return [(item.status, item.result or item.error) for item in result.items]
+
+
+class TestBatchDocuments:
+    @pytest.mark.unit
+    def test_order_and_chunks(self):
+        analyzer = FakeAnalyzer()
+        result = batch_documents(["a", "b", "c", "d", "e"], analyzer, DocumentLimits(2))
+        assert [item.result for item in result.items] == ["A", "B", "C", "D", "E"]
+        assert [item.index for item in result.items] == [0, 1, 2, 3, 4]
+        assert sorted(analyzer.chunks) == [["a", "b"], ["c", "d"], ["e"]]
+        assert len(result.original_response["responses"]) == 3
+
+    @pytest.mark.unit
+    def test_invalid_documents_not_sent(self):
+        analyzer = FakeAnalyzer()
+        limits = DocumentLimits(10, max_document_bytes=4)
+        result = batch_documents(["a", " ", "ééé", "b"], analyzer, limits)
+        assert _results(result) == [
+            ("success", "A"),
+            ("fail", "Document is empty"),
+            ("fail", "Document exceeds 4 bytes"),
+            ("success", "B"),
+        ]
+        assert analyzer.chunks == [["a", "b"]]
+
+    @pytest.mark.unit
+    def test_document_errors(self):
+        def analyze(chunk):
+            return [ProviderException("Unsupported language"), "ok"], {}
+
+        result = batch_documents(["a", "b"], analyze, DocumentLimits(2))
+        assert _results(result) == [
+            ("fail", "Unsupported language"),
+            ("success", "ok"),
+        ]
+
+    @pytest.mark.unit
+    def test_failed_chunk_fails_its_documents(self):
+        def analyze(chunk):
+            if chunk == ["c"]:
+                raise ProviderException("Too many requests", code=429)
+            return chunk, {}
+
+        result = batch_documents(["a", "b", "c"], analyze, DocumentLimits(2))
+        assert _results(result) == [
+            ("success", "a"),
+            ("success", "b"),
+            ("fail", "Too many requests"),
+        ]
+
+    @pytest.mark.unit
+    def test_every_chunk_failed(self):
+        def analyze(chunk):
+            raise ProviderException("Invalid credentials", code=401)
+
+        with pytest.raises(ProviderException, match="Invalid credentials"):
+            batch_documents(["a", "b", "c"], analyze, DocumentLimits(1))
+
+    @pytest.mark.unit
+    def test_concurrent_chunks(self):
+        analyzer = FakeAnalyzer(delay=0.1)
+        texts = [str(i) for i in range(8)]
+        batch_documents(texts, analyzer, DocumentLimits(1), max_concurrency=3)
+        assert analyzer.max_running == 3
+
+
+class TestAsyncBatchDocuments:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_order_and_concurrency(self):
+        analyzer = FakeAnalyzer(delay=0.05)
+        result = await abatch_documents(
+            ["a", "b", "", "c", "d"],
+            analyzer.analyze,
+            DocumentLimits(1),
+            max_concurrency=2,
+        )
+        assert _results(result) == [
+            ("success", "A"),
+            ("success", "B"),
+            ("fail", "Document is empty"),
+            ("success", "C"),
+            ("success", "D"),
+        ]
+        assert analyzer.max_running == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_chunk_fails_its_documents(self):
+        async def analyze(chunk):
+            if chunk == ["b"]:
+                raise ProviderException("Internal error", code=500)
+            return chunk, {}
+
+        result = await abatch_documents(["a", "b"], analyze, DocumentLimits(1))
+        assert _results(result) == [("success", "a"), ("fail", "Internal error")]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_cancels_chunks(self):
+        cancelled = []
+
+        async def analyze(chunk):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(chunk)
+                raise
+
+        task = asyncio.ensure_future(
+            abatch_documents(["a", "b"], analyze, DocumentLimits(1))
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert sorted(cancelled) == [["a"], ["b"]]
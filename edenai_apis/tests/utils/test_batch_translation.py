@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from edenai_apis.utils.batch_translation import (
+    BatchLimits,
+    TranslationMemory,
+    abatch_translate,
+    batch_translate,
+    memory_key,
+    pack_segments,
+)
+from edenai_apis.utils.exception import ProviderException
+
+
+class FakeTranslator:
+    def __init__(self, delay: float = 0):
+        self.packs: List[List[str]] = []
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, pack: List[str]):
+        with self._lock:
+            self.packs.append(pack)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return [text.upper() for text in pack], {"pack": pack}
+
+    async def translate(self, pack: List[str]):
+        self.packs.append(pack)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return [text.upper() for text in pack], {"pack": pack}
+
+
+def _translate(texts, translator, memory, limits=BatchLimits(2, 100), **kwargs):
+    return batch_translate(
+        "fake", None, "fr", "en", texts, translator, limits, memory=memory, **kwargs
+    )
+
+
+class TestPackSegments:
+    @pytest.mark.unit
+    def test_segments_limit(self):
+        packs = pack_segments(["a", "b", "c", "d", "e"], BatchLimits(2, 100))
+        assert packs == [["a", "b"], ["c", "d"], ["e"]]
+
+    @pytest.mark.unit
+    def test_characters_limit(self):
+        packs = pack_segments(["aaaa", "bb", "cccccccc", "d"], BatchLimits(10, 6))
+        assert packs == [["aaaa", "bb"], ["cccccccc"], ["d"]]
+
+    @pytest.mark.unit
+    def test_empty(self):
+        assert pack_segments([], BatchLimits(10, 6)) == []
+
+
+class TestTranslationMemory:
+    @pytest.mark.unit
+    def test_normalized_key(self):
+        assert memory_key("deepl", None, "fr", "en", " Chaise  en\nchêne ") == memory_key(
+            "deepl", None, "fr", "en", "Chaise en chêne"
+        )
+        key = memory_key("deepl", None, "fr", "en", "Chaise")
+        assert key != memory_key("deepl", "next-gen", "fr", "en", "Chaise")
+        assert key != memory_key("deepl", None, "fr", "de", "Chaise")
+        assert key != memory_key("google", None, "fr", "en", "Chaise")
+
+    @pytest.mark.unit
+    def test_lru(self):
+        memory = TranslationMemory(max_entries=2)
+        memory.put("a", "A")
+        memory.put("b", "B")
+        memory.get("a")
+        memory.put("c", "C")
+        assert memory.get("b") is None
+        assert (memory.get("a"), memory.get("c")) == ("A", "C")
+
+    @pytest.mark.unit
+    def test_disabled(self):
+        memory = TranslationMemory(max_entries=0)
+        memory.put("a", "A")
+        assert memory.get("a") is None
+
+
+class TestBatchTranslate:
+    @pytest.mark.unit
+    def test_order_and_packs(self):
+        translator = FakeTranslator()
+        result = _translate(["a", "b", "c", "d", "e"], translator, TranslationMemory())
+        assert result.texts == ["A", "B", "C", "D", "E"]
+        assert sorted(translator.packs) == [["a", "b"], ["c", "d"], ["e"]]
+        assert len(result.original_response["responses"]) == 3
+
+    @pytest.mark.unit
+    def test_repeats_sent_once(self):
+        translator = FakeTranslator()
+        memory = TranslationMemory()
+        result = _translate(["a", "b", "a ", "", "b"], translator, memory)
+        assert result.texts == ["A", "B", "A", "", "B"]
+        assert translator.packs == [["a", "b"]]
+
+        result = _translate(["b", "c", "a"], translator, memory)
+        assert result.texts == ["B", "C", "A"]
+        assert translator.packs[1:] == [["c"]]
+        assert result.original_response["from_memory"] == 2
+
+    @pytest.mark.unit
+    def test_concurrent_packs(self):
+        translator = FakeTranslator(delay=0.1)
+        _translate(
+            [str(i) for i in range(8)],
+            translator,
+            TranslationMemory(),
+            limits=BatchLimits(1, 100),
+            max_concurrency=3,
+        )
+        assert translator.max_running == 3
+
+    @pytest.mark.unit
+    def test_error_not_memorized(self):
+        memory = TranslationMemory()
+
+        def failing(pack):
+            raise ProviderException("quota exceeded", code=429)
+
+        with pytest.raises(ProviderException):
+            _translate(["a", "b", "c"], failing, memory)
+        assert len(memory) == 0
+
+    @pytest.mark.unit
+    def test_missing_translations(self):
+        with pytest.raises(ProviderException):
+            _translate(["a", "b"], lambda pack: (pack[:1], {}), TranslationMemory())
+
+
+class TestAsyncBatchTranslate:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_order_and_concurrency(self):
+        translator = FakeTranslator(delay=0.05)
+        result = await abatch_translate(
+            "fake",
+            None,
+            "fr",
+            "en",
+            ["a", "b", "c", "a", "d", "e"],
+            translator.translate,
+            BatchLimits(1, 100),
+            max_concurrency=2,
+            memory=TranslationMemory(),
+        )
+        assert result.texts == ["A", "B", "C", "A", "D", "E"]
+        assert len(translator.packs) == 5
+        assert translator.max_running == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_error_cancels_other_packs(self):
+        cancelled = []
+
+        async def translate(pack):
+            if pack == ["a"]:
+                raise ProviderException("error")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(pack)
+                raise
+
+        with pytest.raises(ProviderException):
+            await abatch_translate(
+                "fake",
+                None,
+                "fr",
+                "en",
+                ["b", "a", "c"],
+                translate,
+                BatchLimits(1, 100),
+                memory=TranslationMemory(),
+            )
+        assert sorted(cancelled) == [["b"], ["c"]]
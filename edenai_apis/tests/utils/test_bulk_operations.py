@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+
+import pytest
+
+from edenai_apis.utils.bulk_operations import (
+    DatasetEntry,
+    bulk_run,
+    call_with_retry,
+    iter_bulk,
+    load_dataset,
+)
+from edenai_apis.utils.exception import ProviderException
+
+
+class TestLoadDataset:
+    @pytest.mark.unit
+    def test_directory(self, tmp_path):
+        for path in ("cat/1.jpg", "cat/sub/2.png", "dog/3.JPEG", "dog/notes.txt"):
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_bytes(b"")
+        (tmp_path / "alice.jpg").write_bytes(b"")
+        entries = [
+            (os.path.relpath(entry.file, tmp_path), entry.label)
+            for entry in load_dataset(str(tmp_path))
+        ]
+        assert entries == [
+            ("alice.jpg", "alice"),
+            ("cat/1.jpg", "cat"),
+            ("cat/sub/2.png", "cat"),
+            ("dog/3.JPEG", "dog"),
+        ]
+
+    @pytest.mark.unit
+    def test_manifest(self, tmp_path):
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text(
+            "file,label\nimages/1.jpg,cat\n\nhttps://example.com/2.jpg, dog \n"
+            "s3://bucket/3.jpg,cat\n"
+        )
+        entries = list(load_dataset(str(manifest)))
+        assert entries == [
+            DatasetEntry(str(tmp_path / "images" / "1.jpg"), "cat"),
+            DatasetEntry("https://example.com/2.jpg", "dog"),
+            DatasetEntry("s3://bucket/3.jpg", "cat"),
+        ]
+        assert entries[1].is_url
+
+    @pytest.mark.unit
+    def test_pairs_and_missing(self):
+        assert list(load_dataset([("a.jpg", "cat")])) == [DatasetEntry("a.jpg", "cat")]
+        with pytest.raises(ProviderException):
+            load_dataset("/does/not/exist")
+
+
+class TestCallWithRetry:
+    @pytest.mark.unit
+    def test_retries_throttled_calls(self):
+        calls = []
+
+        def call():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ProviderException("Throttled", code=429)
+            return "ok"
+
+        assert call_with_retry(call, backoff_factor=0) == ("ok", 3)
+
+    @pytest.mark.unit
+    def test_client_errors_not_retried(self):
+        calls = []
+
+        def call():
+            calls.append(1)
+            raise ProviderException("Invalid image", code=400)
+
+        with pytest.raises(ProviderException, match="Invalid image"):
+            call_with_retry(call, backoff_factor=0)
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_errors_without_code_not_retried(self):
+        def call():
+            raise ProviderException("No face detected in the image")
+
+        with pytest.raises(ProviderException, match="No face detected"):
+            call_with_retry(call, backoff_factor=0)
+
+    @pytest.mark.unit
+    def test_gives_up(self):
+        def call():
+            raise ProviderException("Unavailable", code=503)
+
+        with pytest.raises(ProviderException):
+            call_with_retry(call, max_retries=2, backoff_factor=0)
+
+
+class TestBulk:
+    @pytest.mark.unit
+    def test_report_in_dataset_order(self):
+        entries = [DatasetEntry(str(index), "label") for index in range(20)]
+
+        def call(entry):
+            time.sleep(0.001 * (20 - int(entry.file)))
+            if entry.file == "5":
+                raise ProviderException("Invalid image", code=400)
+            return entry.file.upper()
+
+        progress = []
+        report = bulk_run(
+            entries,
+            call,
+            max_concurrency=4,
+            progress=lambda state: progress.append(state.done),
+            total=20,
+        )
+        assert [item.index for item in report.items] == list(range(20))
+        assert [item.entry.file for item in report.failed] == ["5"]
+        assert report.failed[0].error == "Invalid image"
+        assert (report.progress.succeeded, report.progress.failed) == (19, 1)
+        assert progress == list(range(1, 21))
+
+    @pytest.mark.unit
+    def test_bounded_concurrency_and_read_ahead(self):
+        read = []
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def entries():
+            for index in range(100):
+                read.append(index)
+                yield DatasetEntry(str(index), "label")
+
+        def call(entry):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        items = iter_bulk(entries(), call, max_concurrency=3)
+        next(items)
+        assert len(read) <= 7
+        items.close()
+        assert max(max_running) <= 3
+
+    @pytest.mark.unit
+    def test_results_streamed_as_completed(self):
+        def call(entry):
+            time.sleep(float(entry.file))
+            return entry.file
+
+        items = iter_bulk(
+            [DatasetEntry("0.3", "slow"), DatasetEntry("0", "fast")], call
+        )
+        assert next(items).entry.label == "fast"
+        assert next(items).entry.label == "slow"
+
+    @pytest.mark.unit
+    def test_retries_counted(self):
+        failed = set()
+
+        def call(entry):
+            if entry.file not in failed:
+                failed.add(entry.file)
+                raise ProviderException("Throttled", code=429)
+            return entry.file
+
+        report = bulk_run(
+            [DatasetEntry("a", "label")], call, max_concurrency=1, max_retries=1
+        )
+        assert report.items[0].attempts == 2
+        assert report.progress.retries == 1
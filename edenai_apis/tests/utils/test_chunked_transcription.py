@@ -0,0 +1,236 @@
+import asyncio
+import stat
+import sys
+from io import BytesIO
+
+import numpy as np
+import pytest
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_dataclass import (
+    SpeechDiarization,
+    SpeechDiarizationEntry,
+    SpeechToTextAsyncDataClass,
+)
+from edenai_apis.utils import audio_transcoder, chunked_transcription
+from edenai_apis.utils.chunked_transcription import (
+    AudioChunk,
+    asplit_audio_at_silence,
+    atranscribe_long_audio,
+    find_cut_points,
+    frame_loudness,
+    merge_transcriptions,
+    reconcile_speakers,
+    split_audio_at_silence,
+)
+from edenai_apis.utils.files import FileInfo, FileWrapper
+
+
+# Stands for ffmpeg on mono 16 bits wav inputs: cuts the `-ss`/`-t` range of the input
+# and writes it as s16le or wav
+FAKE_FFMPEG = """#!{python}
+import sys, wave
+args = sys.argv[1:]
+option = lambda name, default: args[args.index(name) + 1] if name in args else default
+with wave.open(args[args.index("-i") + 1], "rb") as source:
+    rate = source.getframerate()
+    assert int(option("-ar", rate)) == rate and int(option("-ac", 1)) == 1
+    source.setpos(round(float(option("-ss", 0)) * rate))
+    frames = float(option("-t", source.getnframes() / rate)) * rate
+    data = source.readframes(round(frames))
+if option("-f", "wav") == "s16le":
+    sys.stdout.buffer.write(data)
+else:
+    with wave.open(sys.stdout.buffer, "wb") as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(rate)
+        output.writeframes(data)
+"""
+
+
+@pytest.fixture(autouse=True)
+def fake_ffmpeg(tmp_path, monkeypatch):
+    path = tmp_path / "ffmpeg"
+    path.write_text(FAKE_FFMPEG.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(audio_transcoder, "FFMPEG", str(path))
+
+
+def _speech(seconds: float) -> AudioSegment:
+    return Sine(440).to_audio_segment(duration=int(seconds * 1000)).set_frame_rate(16000)
+
+
+def _silence(seconds: float) -> AudioSegment:
+    return AudioSegment.silent(duration=int(seconds * 1000), frame_rate=16000)
+
+
+@pytest.fixture
+def long_audio(tmp_path):
+    # speech with pauses at 7s and 15s
+    audio = _speech(6) + _silence(2) + _speech(6) + _silence(2) + _speech(4)
+    path = str(tmp_path / "long.wav")
+    audio.export(path, format="wav")
+    return path
+
+
+def _entry(speaker, start, end, word="word"):
+    return SpeechDiarizationEntry(
+        segment=word,
+        start_time=str(start),
+        end_time=str(end),
+        speaker=speaker,
+        confidence=0.9,
+    )
+
+
+def _result(text, entries):
+    return SpeechToTextAsyncDataClass(
+        text=text,
+        diarization=SpeechDiarization(
+            total_speakers=len({e.speaker for e in entries}), entries=entries
+        ),
+    )
+
+
+class TestSplit:
+    @pytest.mark.unit
+    def test_cut_in_longest_silence(self):
+        loudness = np.zeros(100, dtype=np.float32)
+        loudness[60:64] = -80  # short pause
+        loudness[70:80] = -80  # long pause
+        cuts = find_cut_points(loudness, 90, 40, silence_thresh=-50, min_silence_frames=3)
+        assert cuts == [75]
+
+    @pytest.mark.unit
+    def test_hard_cut_without_silence(self):
+        loudness = np.zeros(100, dtype=np.float32)
+        loudness[55] = -1
+        cuts = find_cut_points(loudness, 60, 10, silence_thresh=-50, min_silence_frames=3)
+        assert cuts == [55]  # quietest frame of the window
+
+    @pytest.mark.unit
+    def test_split_at_silences(self, long_audio, tmp_path):
+        chunks = split_audio_at_silence(
+            long_audio, max_segment_duration=10, output_dir=str(tmp_path)
+        )
+        assert [round(chunk.start) for chunk in chunks] == [0, 7, 15]
+        assert all(chunk.duration <= 10 for chunk in chunks)
+        assert chunks[-1].end == pytest.approx(20)
+        total = sum(len(AudioSegment.from_file(chunk.path)) for chunk in chunks)
+        assert total == pytest.approx(20000, abs=5)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_split(self, long_audio, tmp_path):
+        chunks = await asplit_audio_at_silence(
+            long_audio, max_segment_duration=10, output_dir=str(tmp_path)
+        )
+        assert [chunk.index for chunk in chunks] == [0, 1, 2]
+        assert [round(chunk.start) for chunk in chunks] == [0, 7, 15]
+        assert len(AudioSegment.from_file(chunks[1].path)) == pytest.approx(8000, abs=5)
+
+    @pytest.mark.unit
+    def test_loudness_read_by_blocks(self, monkeypatch):
+        monkeypatch.setattr(chunked_transcription, "_FRAMES_PER_BLOCK", 3)
+        audio = _speech(1) + _silence(0.5)
+        pcm = BytesIO(audio.raw_data)
+        loudness, dbfs, num_samples = frame_loudness(pcm)
+        assert num_samples == 24000
+        assert len(loudness) == 150
+        assert dbfs == pytest.approx(audio.dBFS, abs=0.01)
+        assert loudness[:100].min() > -10 and np.isneginf(loudness[100:]).all()
+
+
+class TestMerge:
+    @pytest.mark.unit
+    def test_offsets_and_text(self):
+        chunks = [AudioChunk(0, 0, 7, ""), AudioChunk(1, 7, 15, "")]
+        merged = merge_transcriptions(
+            chunks,
+            [
+                _result("hello", [_entry(1, 0.5, 1.0, "hello")]),
+                _result(" world ", [_entry(1, 0.25, 0.75, "world")]),
+            ],
+        )
+        assert merged.text == "hello world"
+        assert [(e.start_time, e.end_time) for e in merged.diarization.entries] == [
+            ("0.5", "1.0"),
+            ("7.25", "7.75"),
+        ]
+
+    @pytest.mark.unit
+    def test_reconcile_continuing_speaker(self):
+        segments = [
+            [_entry(1, 0, 1), _entry(2, 1, 2)],
+            [_entry(1, 0, 1), _entry(2, 1, 2)],  # local 1 continues global speaker 2
+        ]
+        assert reconcile_speakers(segments) == [{1: 1, 2: 2}, {1: 2, 2: 3}]
+
+    @pytest.mark.unit
+    def test_reconcile_with_max_speakers(self):
+        segments = [
+            [_entry(1, 0, 1), _entry(2, 1, 2)],
+            [_entry(1, 0, 1), _entry(2, 1, 2)],
+        ]
+        assert reconcile_speakers(segments, max_speakers=2) == [
+            {1: 1, 2: 2},
+            {1: 2, 2: 1},
+        ]
+        merged = merge_transcriptions(
+            [AudioChunk(0, 0, 2, ""), AudioChunk(1, 2, 4, "")],
+            [_result("a b", segments[0]), _result("c d", segments[1])],
+            max_speakers=2,
+        )
+        assert merged.diarization.total_speakers == 2
+        assert [e.speaker for e in merged.diarization.entries] == [1, 2, 2, 1]
+
+
+class TestTranscribeLongAudio:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_segments_transcribed_concurrently(self, long_audio, monkeypatch):
+        running = []
+        max_running = []
+        jobs = {}
+
+        async def launch_job(provider_name, args, api_keys):
+            job_id = f"job-{len(jobs)}"
+            jobs[job_id] = args["file"]
+            return job_id
+
+        async def get_job_result(provider_name, job_id, api_keys):
+            running.append(job_id)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(job_id)
+            index = int(job_id.split("-")[1])
+            return {
+                "status": "succeeded",
+                "original_response": {"job": job_id},
+                "standardized_response": _result(
+                    f"part{index}", [_entry(1, 0.5, 1.0, f"part{index}")]
+                ).model_dump(),
+            }
+
+        monkeypatch.setattr(chunked_transcription, "_launch_job", launch_job)
+        monkeypatch.setattr(chunked_transcription, "_get_job_result", get_job_result)
+
+        file_wrapper = FileWrapper(
+            long_audio, "", FileInfo(0, "audio/wav", ["wav"], "16000", "1")
+        )
+        response = await atranscribe_long_audio(
+            "provider",
+            {"file": file_wrapper, "language": "en", "speakers": 1},
+            max_segment_duration=10,
+            max_concurrency=3,
+        )
+
+        assert max(max_running) > 1
+        assert all(wrapper.file_info.file_extension == ["wav"] for wrapper in jobs.values())
+        result = response.standardized_response
+        assert result.text == "part0 part1 part2"
+        assert [e.start_time for e in result.diarization.entries] == ["0.5", "7.5", "15.5"]
+        assert result.diarization.total_speakers == 1
+        assert response.provider_job_id == "job-0,job-1,job-2"
@@ -0,0 +1,310 @@
+import asyncio
+import re
+import struct
+import wave
+from io import BytesIO
+from typing import Optional
+
+import pytest
+
+from edenai_apis.utils import chunked_tts
+from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.utils import upload_s3
+from edenai_apis.utils.chunked_tts import (
+    _ogg_crc,
+    _ogg_pages,
+    asynthesize_long_text,
+    concatenate_audio,
+    concatenate_mp3,
+    concatenate_ogg,
+    long_text_tts,
+)
+from edenai_apis.utils.ssml import is_ssml
+from edenai_apis.utils.tts import split_ssml, split_text, text_size
+from edenai_apis.utils.types import ResponseType
+
+
+def _wav(frames: bytes, rate: int = 16000) -> bytes:
+    output = BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(frames)
+    return output.getvalue()
+
+
+# MPEG 1 layer III, 128 kbps, 44.1 kHz, no padding: 417 bytes frames
+_MP3_HEADER = bytes([0xFF, 0xFB, 0x90, 0x00])
+
+
+def _mp3_frame(fill: bytes) -> bytes:
+    return _MP3_HEADER + fill * (417 - 4)
+
+
+def _mp3(*frames: bytes, vbr_header: bool = True) -> bytes:
+    id3 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"\x00" * 5
+    xing = _MP3_HEADER + b"\x00" * 32 + b"Xing" + b"\x00" * (417 - 40)
+    return id3 + (xing if vbr_header else b"") + b"".join(frames)
+
+
+def _ogg_page(header_type, granule, serial, sequence, packets):
+    segments = bytearray()
+    for packet in packets:
+        segments += b"\xff" * (len(packet) // 255) + bytes([len(packet) % 255])
+    page = bytearray(
+        struct.pack(
+            "<4sBBqIIIB", b"OggS", 0, header_type, granule, serial, sequence, 0, len(segments)
+        )
+    )
+    page += segments + b"".join(packets)
+    struct.pack_into("<I", page, 22, _ogg_crc(page))
+    return bytes(page)
+
+
+def _opus(serial, *audio_pages):
+    pages = [
+        _ogg_page(0x02, 0, serial, 0, [b"OpusHead" + b"\x01" * 11]),
+        _ogg_page(0x00, 0, serial, 1, [b"OpusTags" + b"\x00" * 8]),
+    ]
+    for index, (granule, packet) in enumerate(audio_pages):
+        last = index == len(audio_pages) - 1
+        pages.append(_ogg_page(0x04 if last else 0, granule, serial, index + 2, [packet]))
+    return b"".join(pages)
+
+
+class TestSplitText:
+    @pytest.mark.unit
+    def test_sentence_boundaries(self):
+        text = "First sentence here. Second one, with a clause; and more. Third!"
+        chunks = split_text(text, 40)
+        assert chunks == [
+            "First sentence here.",
+            "Second one, with a clause; and more.",
+            "Third!",
+        ]
+
+    @pytest.mark.unit
+    def test_chunks_are_filled_and_within_limit(self):
+        text = "\n\n".join(
+            " ".join(f"Sentence {p}.{s} of the chapter." for s in range(20))
+            for p in range(5)
+        )
+        chunks = split_text(text, 300)
+        assert all(text_size(chunk) <= 300 for chunk in chunks)
+        assert all(text_size(chunk) > 200 for chunk in chunks[:-1])
+        assert " ".join(chunks).split() == text.split()
+
+    @pytest.mark.unit
+    def test_limit_in_bytes(self):
+        chunks = split_text("é" * 10, 4)
+        assert chunks == ["éé"] * 5
+
+
+class TestSplitSsml:
+    @pytest.mark.unit
+    def test_open_elements_are_reopened(self):
+        ssml = (
+            '<speak version="1.0"><voice name="x"><prosody rate="fast">'
+            "Hello there. How are you today? Fine thanks. Bye now."
+            "</prosody></voice></speak>"
+        )
+        chunks = split_ssml(ssml, 110)
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert is_ssml(chunk)
+            assert text_size(chunk) <= 110
+            assert chunk.startswith('<speak version="1.0"><voice name="x"><prosody')
+            assert chunk.endswith("</prosody></voice></speak>")
+        spoken = "".join(re.sub(r"<[^>]+>", "", chunk) for chunk in chunks)
+        assert spoken == "Hello there. How are you today? Fine thanks. Bye now."
+
+    @pytest.mark.unit
+    def test_atomic_elements_are_not_cut(self):
+        ssml = (
+            "<speak>Call me. "
+            '<say-as interpret-as="characters">A. B. C. D. E. F.</say-as>'
+            " Thanks.</speak>"
+        )
+        chunks = split_ssml(ssml, 30)
+        assert any(
+            '<say-as interpret-as="characters">A. B. C. D. E. F.</say-as>' in chunk
+            for chunk in chunks
+        )
+
+    @pytest.mark.unit
+    def test_short_document_unchanged(self):
+        ssml = "<speak>Hello.</speak>"
+        assert split_ssml(ssml, 100) == [ssml]
+
+
+class TestConcatenate:
+    @pytest.mark.unit
+    def test_wav_lossless(self):
+        first, second = b"\x01\x00" * 100, b"\x02\x00" * 50
+        audio = concatenate_audio([_wav(first), _wav(second)], "wav")
+        with wave.open(BytesIO(audio)) as wav:
+            assert wav.getframerate() == 16000
+            assert wav.readframes(wav.getnframes()) == first + second
+
+    @pytest.mark.unit
+    def test_wav_with_streamed_header(self):
+        streamed = bytearray(_wav(b"\x01\x00" * 10))
+        streamed[40:44] = b"\xff\xff\xff\xff"  # unknown data size
+        audio = concatenate_audio([bytes(streamed), _wav(b"\x02\x00" * 10)], "wav")
+        with wave.open(BytesIO(audio)) as wav:
+            assert wav.getnframes() == 20
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("data_size", [0, 0xFFFFFFFF, 1000])
+    def test_wav_with_unknown_data_size(self, data_size):
+        streamed = bytearray(_wav(b"\x01\x00" * 10) + b"\x01")  # incomplete frame
+        streamed[40:44] = struct.pack("<I", data_size)
+        audio = concatenate_audio([bytes(streamed), _wav(b"\x02\x00" * 10)], "wav")
+        with wave.open(BytesIO(audio)) as wav:
+            assert wav.readframes(wav.getnframes()) == b"\x01\x00" * 10 + b"\x02\x00" * 10
+
+    @pytest.mark.unit
+    def test_ogg_single_logical_stream(self):
+        first = _opus(1, (960, b"a" * 300), (1920, b"b" * 10))
+        second = _opus(2, (960, b"c" * 10))
+        audio = concatenate_ogg([first, second])
+
+        pages = _ogg_pages(audio)
+        assert {serial for _, _, serial, _, _ in pages} == {1}
+        assert [body for *_, body in pages][2:] == [b"a" * 300, b"b" * 10, b"c" * 10]
+        assert [granule for _, granule, *_ in pages] == [0, 0, 960, 1920, 2880]
+        assert [header_type & 0x06 for header_type, *_ in pages] == [2, 0, 0, 0, 4]
+        # pages are renumbered and their checksum computed again
+        position = 0
+        for sequence in range(len(pages)):
+            count = audio[position + 26]
+            length = 27 + count + sum(audio[position + 27 : position + 27 + count])
+            page = bytearray(audio[position : position + length])
+            assert struct.unpack_from("<I", page, 18)[0] == sequence
+            checksum = struct.unpack_from("<I", page, 22)[0]
+            page[22:26] = b"\x00" * 4
+            assert _ogg_crc(bytes(page)) == checksum
+            position += length
+
+    @pytest.mark.unit
+    def test_ogg_crc(self):
+        assert _ogg_crc(b"123456789") == 0x89A1897F
+
+    @pytest.mark.unit
+    def test_mp3_frame_boundaries(self):
+        first = _mp3(_mp3_frame(b"\x01"), _mp3_frame(b"\x02"))
+        second = _mp3(_mp3_frame(b"\x03")) + b"TAG" + b"\x00" * 125
+        assert concatenate_mp3([first, second]) == (
+            _mp3_frame(b"\x01") + _mp3_frame(b"\x02") + _mp3_frame(b"\x03")
+        )
+
+
+class TestSynthesizeLongText:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunks_synthesized_concurrently(self, monkeypatch):
+        running = []
+        max_running = []
+        uploads = []
+
+        async def synthesize(provider_name, args, api_keys):
+            running.append(args["text"])
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(args["text"])
+            return _wav(args["text"].encode().ljust(40, b" ")[:40]), "wav"
+
+        async def upload(content, file_extension):
+            uploads.append((content, file_extension))
+            return "https://bucket/audio.wav"
+
+        monkeypatch.setattr(chunked_tts, "_synthesize", synthesize)
+        monkeypatch.setattr(chunked_tts, "upload_audio", upload)
+
+        text = " ".join(f"Sentence number {i}." for i in range(12))
+        response = await asynthesize_long_text(
+            "provider", {"text": text}, max_concurrency=4, max_text_length=40
+        )
+
+        texts = response.original_response["texts"]
+        assert len(texts) > 4
+        assert max(max_running) == 4
+        assert response.standardized_response.audio_resource_url == "https://bucket/audio.wav"
+        with wave.open(BytesIO(uploads[0][0])) as wav:
+            frames = wav.readframes(wav.getnframes())
+        assert frames == b"".join(t.encode().ljust(40, b" ")[:40] for t in texts)
+
+
+class FakeUploadingProvider:
+    """Synthesizes the text itself and uploads it, as amazon or microsoft do"""
+
+    provider_name = "fake"
+
+    def __init__(self):
+        self.texts = []
+
+    @long_text_tts
+    async def audio__atts(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        audio_format: str = "wav",
+        **kwargs,
+    ):
+        self.texts.append(text)
+        audio = _wav(text.encode().ljust(40, b" ")[:40])
+        url = await upload_s3.aupload_file_bytes_to_s3(
+            BytesIO(audio), ".wav", upload_s3.USER_PROCESS
+        )
+        return ResponseType[TtsDataClass](
+            original_response={},
+            standardized_response=TtsDataClass(audio_resource_url=url),
+        )
+
+
+class TestLongTextTts:
+    @pytest.fixture
+    def uploads(self, monkeypatch):
+        uploads = []
+
+        async def upload(content, file_extension):
+            uploads.append((content, file_extension))
+            return "https://bucket/audio.wav"
+
+        monkeypatch.setattr(chunked_tts, "upload_audio", upload)
+        monkeypatch.setattr(
+            chunked_tts, "get_tts_config", lambda provider: {"max_text_length": 40}
+        )
+        return uploads
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunks_kept_in_memory(self, uploads, monkeypatch):
+        async def fail(*args, **kwargs):
+            raise AssertionError("chunks must not be uploaded")
+
+        monkeypatch.setattr(upload_s3, "as3_client_load", fail)
+        provider = FakeUploadingProvider()
+        text = " ".join(f"Sentence number {i}." for i in range(6))
+        response = await provider.audio__atts(text, voice="x")
+
+        assert len(provider.texts) > 1
+        assert response.standardized_response.audio_resource_url == "https://bucket/audio.wav"
+        assert response.original_response["texts"] == provider.texts
+        with wave.open(BytesIO(uploads[0][0])) as wav:
+            frames = wav.readframes(wav.getnframes())
+        assert frames == b"".join(t.encode().ljust(40, b" ")[:40] for t in provider.texts)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_short_text_left_to_the_provider(self, uploads, monkeypatch):
+        async def upload_bytes(file, file_name, process_type):
+            return "https://bucket/short.wav"
+
+        monkeypatch.setattr(upload_s3, "aupload_file_bytes_to_s3", upload_bytes)
+        provider = FakeUploadingProvider()
+        response = await provider.audio__atts("Hello.")
+        assert provider.texts == ["Hello."]
+        assert response.standardized_response.audio_resource_url == "https://bucket/short.wav"
+        assert uploads == []
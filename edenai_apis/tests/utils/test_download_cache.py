@@ -0,0 +1,247 @@
+import asyncio
+import gc
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from PIL import Image
+
+from edenai_apis.apis.microsoft import microsoft_ocr_api
+from edenai_apis.apis.microsoft.microsoft_ocr_api import MicrosoftOcrApi
+from edenai_apis.utils import download_cache, file_handling
+from edenai_apis.utils.download_cache import CachedDownload, DownloadCache
+from edenai_apis.utils.file_handling import FileHandler
+
+URL = "https://example.com/file.png"
+
+
+class FakeServer:
+    """Stand-in for FileHandler._fetch_to_cache"""
+
+    def __init__(self, content: bytes = b"content", etag: str = '"v1"'):
+        self.content = content
+        self.etag = etag
+        self.calls = []
+
+    async def fetch(self, file_url, conditional_headers):
+        self.calls.append(conditional_headers)
+        await asyncio.sleep(0.01)
+        if conditional_headers.get("If-None-Match") == self.etag:
+            return None
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.content)
+        return CachedDownload(
+            path=path,
+            size=len(self.content),
+            content_type="image/png",
+            file_extension="png",
+            etag=self.etag,
+        )
+
+
+@pytest.mark.asyncio
+class TestDownloadCache:
+    @pytest.mark.unit
+    async def test_concurrent_downloads_are_deduplicated(self):
+        cache = DownloadCache()
+        server = FakeServer()
+        wrappers = await asyncio.gather(
+            *[cache.get(URL, server.fetch) for _ in range(5)]
+        )
+        assert len(server.calls) == 1
+        assert len({wrapper.file_path for wrapper in wrappers}) == 1
+        assert await wrappers[0].get_bytes() == b"content"
+        assert wrappers[0].file_info.file_media_type == "image/png"
+        for wrapper in wrappers:
+            wrapper.close_file()
+        cache.clear()
+
+    @pytest.mark.unit
+    async def test_file_kept_until_released(self):
+        cache = DownloadCache()
+        server = FakeServer()
+        wrapper = await cache.get(URL, server.fetch)
+        wrapper.close_file()
+        # still cached after being released
+        assert os.path.exists(wrapper.file_path)
+        other = await cache.get(URL, server.fetch)
+        assert other.file_path == wrapper.file_path
+        assert len(server.calls) == 1
+
+        cache.clear()
+        # in use: not deleted until closed
+        assert os.path.exists(other.file_path)
+        other.close_file()
+        assert not os.path.exists(other.file_path)
+
+    @pytest.mark.unit
+    async def test_revalidation_with_etag(self):
+        cache = DownloadCache(max_age=0)
+        server = FakeServer()
+        first = await cache.get(URL, server.fetch)
+        first.close_file()
+
+        not_modified = await cache.get(URL, server.fetch)
+        assert server.calls[-1] == {"If-None-Match": '"v1"'}
+        assert not_modified.file_path == first.file_path
+        not_modified.close_file()
+
+        server.content, server.etag = b"new content", '"v2"'
+        modified = await cache.get(URL, server.fetch)
+        assert await modified.get_bytes() == b"new content"
+        assert not os.path.exists(first.file_path)
+        modified.close_file()
+        cache.clear()
+
+    @pytest.mark.unit
+    async def test_size_bound_evicts_least_recently_used(self):
+        cache = DownloadCache(max_size=15)
+        server = FakeServer(content=b"0123456789")
+        first = await cache.get("https://example.com/1", server.fetch)
+        first.close_file()
+        second = await cache.get("https://example.com/2", server.fetch)
+        assert len(cache) == 1
+        assert cache.size == 10
+        assert not os.path.exists(first.file_path)
+        second.close_file()
+        cache.clear()
+
+    @pytest.mark.unit
+    async def test_entries_in_use_are_evicted(self):
+        cache = DownloadCache(max_size=15)
+        server = FakeServer(content=b"0123456789")
+        first = await cache.get("https://example.com/1", server.fetch)
+        second = await cache.get("https://example.com/2", server.fetch)
+        assert len(cache) == 1
+        assert cache.size == 10
+        # evicted, but deleted only once released
+        assert os.path.exists(first.file_path)
+        first.close_file()
+        assert not os.path.exists(first.file_path)
+        second.close_file()
+        cache.clear()
+
+    @pytest.mark.unit
+    async def test_forgotten_wrapper_is_released(self):
+        cache = DownloadCache()
+        server = FakeServer()
+        wrapper = await cache.get(URL, server.fetch)
+        path = wrapper.file_path
+        del wrapper
+        gc.collect()
+        cache.clear()
+        assert not os.path.exists(path)
+
+
+class FakeResponse:
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.headers = {"Content-Type": "image/png", "Content-Length": str(len(content))}
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    async def aiter_bytes(self):
+        yield self.content
+
+
+@pytest.mark.asyncio
+class TestFileHandlerCache:
+    @pytest.fixture
+    def serve(self, monkeypatch):
+        requests = []
+
+        def serve(content: bytes):
+            @asynccontextmanager
+            async def stream(method, url, headers=None):
+                requests.append(url)
+                yield FakeResponse(content)
+
+            monkeypatch.setattr(file_handling.async_client, "stream", stream)
+            return requests
+
+        return serve
+
+    @pytest.mark.unit
+    async def test_small_files_cached_in_memory(self, serve):
+        requests = serve(b"content")
+        cache = DownloadCache()
+        file_handler = FileHandler(cache=cache)
+        file_wrapper = await file_handler.download_file(URL)
+        assert file_wrapper.file_path is None
+        assert await file_wrapper.get_bytes() == b"content"
+        assert (len(cache), cache.memory_size, cache.size) == (1, 7, 0)
+
+        # another provider needing the same url
+        other = await FileHandler(cache=cache).download_file(URL)
+        assert await other.get_bytes() == b"content"
+        on_disk = await file_handler.download_file(URL, force_file_create=True)
+        assert open(on_disk.file_path, "rb").read() == b"content"
+        on_disk.close_file()
+        assert requests == [URL]
+        assert len(cache) == 1
+        cache.clear()
+
+    @pytest.mark.unit
+    async def test_memory_size_bounded(self, serve):
+        serve(b"0123456789")
+        cache = DownloadCache(max_memory_size=15)
+        file_handler = FileHandler(cache=cache)
+        first = await file_handler.download_file("https://example.com/1")
+        await file_handler.download_file("https://example.com/2")
+        assert list(cache._entries) == ["https://example.com/2"]
+        assert cache.memory_size == 10
+        # evicted, but still readable by its user
+        assert await first.get_bytes() == b"0123456789"
+
+        small_cache = DownloadCache(max_memory_size=5)
+        too_large = await FileHandler(cache=small_cache).download_file(URL)
+        assert await too_large.get_bytes() == b"0123456789"
+        assert len(small_cache) == 0
+
+    @pytest.mark.unit
+    async def test_large_files_cached(self, serve, monkeypatch):
+        serve(b"content")
+        monkeypatch.setattr(FileHandler, "SIZE_THRESHOLD", 4)
+        cache = DownloadCache()
+        file_wrapper = await FileHandler(cache=cache).download_file(URL)
+        assert len(cache) == 1
+        assert open(file_wrapper.file_path, "rb").read() == b"content"
+        file_wrapper.close_file()
+        cache.clear()
+
+    @pytest.mark.unit
+    async def test_microsoft_ocr_reuses_cached_download(self, serve, monkeypatch):
+        image = BytesIO()
+        Image.new("RGB", (200, 100)).save(image, format="PNG")
+        requests = serve(image.getvalue())
+        cache = DownloadCache()
+        monkeypatch.setattr(download_cache, "download_cache", cache)
+        monkeypatch.setattr(file_handling, "download_cache", cache)
+
+        @asynccontextmanager
+        async def azure_client(timeout):
+            client = MagicMock()
+            word = {"text": "hello", "boundingBox": "20,10,40,20"}
+            response = {"regions": [{"lines": [{"words": [word]}]}]}
+            client.post = AsyncMock(return_value=httpx.Response(200, json=response))
+            yield client
+
+        monkeypatch.setattr(microsoft_ocr_api, "async_client", azure_client)
+        api = MicrosoftOcrApi.__new__(MicrosoftOcrApi)
+        api.api_settings = {"vision": {"url": "https://azure.example.com"}}
+        api.headers = {"vision": {}}
+
+        # another provider already downloaded the url
+        await FileHandler().download_file(URL)
+        result = await api.ocr__aocr(file="", language="en", file_url=URL)
+
+        box = result.standardized_response.bounding_boxes[0]
+        assert (box.left, box.top, box.width, box.height) == (0.1, 0.1, 0.2, 0.2)
+        assert requests == [URL]
@@ -0,0 +1,104 @@
+import base64
+import gc
+import os
+
+import pytest
+
+from edenai_apis.utils.files import FileInfo, FileWrapper
+
+CONTENT = bytes(range(256)) * 40
+
+
+def _file_info():
+    return FileInfo(
+        file_size=len(CONTENT),
+        file_mimetype="application/octet-stream",
+        file_extension="bin",
+    )
+
+
+@pytest.fixture
+def file_path(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(CONTENT)
+    return str(path)
+
+
+@pytest.mark.asyncio
+class TestFileWrapper:
+    @pytest.mark.unit
+    async def test_bytes_backed_is_not_copied(self):
+        file_wrapper = FileWrapper(None, "", _file_info(), file_bytes=CONTENT)
+        assert await file_wrapper.get_bytes() is CONTENT
+        assert file_wrapper.get_memoryview().obj is CONTENT
+
+    @pytest.mark.unit
+    async def test_b64_is_lazy_and_cached(self):
+        file_wrapper = FileWrapper(None, "", _file_info(), file_bytes=CONTENT)
+        assert file_wrapper._file_b64_content is None
+        b64_content = await file_wrapper.get_file_b64_content()
+        assert b64_content == base64.b64encode(CONTENT).decode()
+        assert await file_wrapper.get_file_b64_content() is b64_content
+
+    @pytest.mark.unit
+    async def test_b64_backed_decodes_once(self):
+        b64_content = base64.b64encode(CONTENT).decode()
+        file_wrapper = FileWrapper(None, "", _file_info(), b64_content)
+        content = await file_wrapper.get_bytes()
+        assert content == CONTENT
+        assert await file_wrapper.get_bytes() is content
+
+    @pytest.mark.unit
+    async def test_file_backed_uses_mmap(self, file_path):
+        file_wrapper = FileWrapper(file_path, "", _file_info())
+        view = file_wrapper.get_memoryview()
+        assert bytes(view) == CONTENT
+        view.release()
+        assert await file_wrapper.get_file_b64_content() == base64.b64encode(
+            CONTENT
+        ).decode()
+        file_wrapper.close_file()
+
+    @pytest.mark.unit
+    async def test_close_releases_views(self, file_path):
+        file_wrapper = FileWrapper(file_path, "", _file_info())
+        view = file_wrapper.get_memoryview()
+        file_wrapper.close_file()
+        assert not os.path.exists(file_path)
+        with pytest.raises(ValueError):
+            bytes(view)
+
+    @pytest.mark.unit
+    async def test_unlink_deferred_while_mapped(self, file_path):
+        file_wrapper = FileWrapper(file_path, "", _file_info())
+        chunk = file_wrapper.get_memoryview()[:16]
+        file_wrapper.close_file()
+        assert os.path.exists(file_path)
+        assert bytes(chunk) == CONTENT[:16]
+        chunk.release()
+        gc.collect()
+        assert not os.path.exists(file_path)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backing", ["path", "bytes"])
+    async def test_iter_chunks(self, file_path, backing):
+        if backing == "path":
+            file_wrapper = FileWrapper(file_path, "", _file_info())
+        else:
+            file_wrapper = FileWrapper(None, "", _file_info(), file_bytes=CONTENT)
+        chunks = [chunk async for chunk in file_wrapper.iter_chunks(chunk_size=1000)]
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert b"".join(chunks) == CONTENT
+
+    @pytest.mark.unit
+    async def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        file_wrapper = FileWrapper(str(path), "", _file_info())
+        assert bytes(file_wrapper.get_memoryview()) == b""
+        assert [chunk async for chunk in file_wrapper.iter_chunks()] == []
+
+    @pytest.mark.unit
+    async def test_no_content(self):
+        with pytest.raises(Exception):
+            await FileWrapper(None, "", _file_info()).get_bytes()
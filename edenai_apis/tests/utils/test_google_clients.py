@@ -0,0 +1,117 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from edenai_apis.apis.google import google_api, google_clients
+from edenai_apis.apis.google.google_api import GoogleApi
+
+
+def _settings(project_id):
+    return {"project_id": project_id, "private_key": "key", "client_email": "a@b.c"}
+
+
+@pytest.fixture(autouse=True)
+def clients_cache():
+    google_clients.clear()
+    yield
+    google_clients.clear()
+
+
+@pytest.fixture
+def constructors(monkeypatch):
+    """Client constructors of GoogleApi, each call returns a new client"""
+    vision = MagicMock()
+    vision.ImageAnnotatorClient.side_effect = lambda **kwargs: object()
+    credentials = MagicMock()
+    credentials.Credentials.from_service_account_info.side_effect = (
+        lambda info: ("credentials", info["project_id"])
+    )
+    aiplatform = MagicMock()
+    monkeypatch.setattr(google_api, "vision", vision)
+    monkeypatch.setattr(google_api, "service_account", credentials)
+    monkeypatch.setattr(google_api, "LLMEngine", MagicMock())
+    monkeypatch.setattr(google_clients, "aiplatform", aiplatform)
+    return {"vision": vision, "aiplatform": aiplatform}
+
+
+def _google_api(monkeypatch, project_id):
+    def load_provider(data, provider_name, **kwargs):
+        if provider_name == "webhooksite":
+            return {"webhook_token": "token"}
+        return _settings(project_id), None
+
+    monkeypatch.setattr(google_api, "load_provider", load_provider)
+    return GoogleApi()
+
+
+class TestGoogleClients:
+    @pytest.mark.unit
+    def test_same_credentials_share_lazy_clients(self, monkeypatch, constructors):
+        first = _google_api(monkeypatch, "project")
+        second = _google_api(monkeypatch, "project")
+        assert constructors["vision"].ImageAnnotatorClient.call_count == 0
+
+        assert first.clients["image"] is second.clients["image"]
+        assert constructors["vision"].ImageAnnotatorClient.call_count == 1
+
+    @pytest.mark.unit
+    def test_different_credentials_different_clients(self, monkeypatch, constructors):
+        first = _google_api(monkeypatch, "project")
+        second = _google_api(monkeypatch, "other")
+
+        assert first.credentials_key != second.credentials_key
+        assert first.clients["image"] is not second.clients["image"]
+        assert first.clients_payload["credentials"] == ("credentials", "project")
+        assert second.clients_payload["credentials"] == ("credentials", "other")
+
+    @pytest.mark.unit
+    def test_aiplatform_init_rerun_on_credentials_change(
+        self, monkeypatch, constructors
+    ):
+        init = constructors["aiplatform"].init
+        _google_api(monkeypatch, "project")
+        _google_api(monkeypatch, "project")
+        assert init.call_count == 1
+
+        _google_api(monkeypatch, "other")
+        _google_api(monkeypatch, "project")
+        assert [call.kwargs["project"] for call in init.call_args_list] == [
+            "project",
+            "other",
+            "project",
+        ]
+
+    @pytest.mark.unit
+    def test_least_recently_used_evicted(self, monkeypatch):
+        monkeypatch.setattr(google_clients, "MAX_CACHED_CLIENTS", 2)
+        first = google_clients.get_client("a", "image", object)
+        google_clients.get_client("b", "image", object)
+        # "a" is used again, "b" is now the least recently used
+        assert google_clients.get_client("a", "image", object) is first
+        google_clients.get_client("c", "image", object)
+
+        assert list(google_clients._clients) == [("a", "image"), ("c", "image")]
+        assert google_clients.get_client("a", "image", object) is first
+
+    @pytest.mark.unit
+    def test_discovery_services_per_thread(self, monkeypatch):
+        build = MagicMock(side_effect=lambda **kwargs: object())
+        monkeypatch.setattr(google_clients.googleapiclient.discovery, "build", build)
+        credentials = object()
+
+        service = google_clients.discovery_service("speech", "v1", credentials)
+        assert google_clients.discovery_service("speech", "v1", credentials) is service
+
+        other_thread = []
+        thread = threading.Thread(
+            target=lambda: other_thread.append(
+                google_clients.discovery_service("speech", "v1", credentials)
+            )
+        )
+        thread.start()
+        thread.join()
+
+        assert other_thread[0] is not service
+        assert build.call_count == 2
+        assert build.call_args.kwargs["static_discovery"] is True
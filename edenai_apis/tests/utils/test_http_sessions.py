@@ -0,0 +1,120 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from edenai_apis.utils.http_sessions import (
+    SessionPolicy,
+    configure_session,
+    provider_session,
+    session_stats,
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # statuses to answer before a 200, by path
+    failures = {}
+    calls = {}
+
+    def _answer(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        Handler.calls[self.path] = Handler.calls.get(self.path, 0) + 1
+        statuses = Handler.failures.get(self.path) or []
+        status = statuses.pop(0) if statuses else 200
+        body = b"{}"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Set-Cookie", "session=secret")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _answer
+    do_POST = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def provider(request):
+    name = f"test_{request.node.name}"
+    configure_session(name, SessionPolicy(max_retries=2, backoff_factor=0))
+    return name
+
+
+class TestProviderSession:
+    @pytest.mark.unit
+    def test_connections_reused(self, server, provider):
+        session = provider_session(provider)
+        for _ in range(5):
+            assert session.get(f"{server}/reuse").status_code == 200
+        stats = session_stats()[provider]
+        assert (stats.requests, stats.connections) == (5, 1)
+        assert stats.reuse_ratio == 0.8
+
+    @pytest.mark.unit
+    def test_shared_session(self, provider):
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(provider_session(provider)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(session is sessions[0] for session in sessions)
+
+    @pytest.mark.unit
+    def test_idempotent_retried(self, server, provider):
+        Handler.failures["/get"] = [503, 502]
+        response = provider_session(provider).get(f"{server}/get")
+        assert response.status_code == 200
+        assert Handler.calls["/get"] == 3
+        assert session_stats()[provider].retries == 2
+
+    @pytest.mark.unit
+    def test_post_not_retried_on_server_error(self, server, provider):
+        Handler.failures["/post"] = [503]
+        response = provider_session(provider).post(f"{server}/post", json={})
+        assert response.status_code == 503
+        assert Handler.calls["/post"] == 1
+
+    @pytest.mark.unit
+    def test_post_retried_on_too_many_requests(self, server, provider):
+        Handler.failures["/rejected"] = [429]
+        response = provider_session(provider).post(f"{server}/rejected", json={})
+        assert response.status_code == 200
+        assert Handler.calls["/rejected"] == 2
+
+    @pytest.mark.unit
+    def test_last_response_returned(self, server, provider):
+        Handler.failures["/down"] = [503, 503, 503, 503]
+        response = provider_session(provider).get(f"{server}/down")
+        assert response.status_code == 503
+        assert Handler.calls["/down"] == 3
+
+    @pytest.mark.unit
+    def test_cookies_not_stored(self, server, provider):
+        session = provider_session(provider)
+        session.get(f"{server}/cookie")
+        assert len(session.cookies) == 0
+
+    @pytest.mark.unit
+    def test_configure_replaces_session(self, provider):
+        session = provider_session(provider)
+        configure_session(provider, SessionPolicy(pool_maxsize=4))
+        assert provider_session(provider) is not session
@@ -0,0 +1,207 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+from PIL import Image
+
+from edenai_apis.apis.microsoft import microsoft_image_api
+from edenai_apis.apis.microsoft.microsoft_image_api import MicrosoftImageApi
+from edenai_apis.utils import image_preprocessing
+from edenai_apis.utils.files import FileInfo, FileWrapper
+from edenai_apis.utils.image_preprocessing import (
+    ImageLimits,
+    apreprocessed_image_args,
+    downscale_image,
+    image_limits,
+    preprocessed_image_args,
+    rescale_coordinates,
+)
+
+
+def _image(width: int, height: int, fmt: str = "JPEG", mode: str = "RGB") -> bytes:
+    # noise doesn't compress, which makes the size limits meaningful
+    image = Image.frombytes(mode, (width, height), os.urandom(width * height * len(mode)))
+    output = BytesIO()
+    image.save(output, format=fmt, **({"quality": 95} if fmt == "JPEG" else {}))
+    return output.getvalue()
+
+
+def _wrapper(tmp_path, content: bytes, mimetype: str = "image/jpeg") -> FileWrapper:
+    path = tmp_path / "image"
+    path.write_bytes(content)
+    return FileWrapper(
+        str(path), "https://example.com/image", FileInfo(len(content), mimetype, ["jpg"])
+    )
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    limits = ImageLimits(max_dimension=512, max_size=100 * 1024, pixel_coordinates=True)
+    monkeypatch.setattr(image_preprocessing, "image_limits", lambda *args: limits)
+    # threads share the patched module, unlike worker processes
+    monkeypatch.setattr(image_preprocessing, "_pool", ThreadPoolExecutor(max_workers=1))
+    return limits
+
+
+class TestImageLimits:
+    @pytest.mark.unit
+    def test_opt_in(self):
+        assert ImageLimits.from_constraints({"languages": ["en"]}) is None
+        assert ImageLimits.from_constraints(None) is None
+        limits = ImageLimits.from_constraints({"image_max_size": 1024})
+        assert (limits.max_size, limits.max_dimension) == (1024, None)
+        assert not limits.pixel_coordinates
+
+
+class TestDownscaleImage:
+    @pytest.mark.unit
+    def test_fits_max_dimension(self):
+        image = downscale_image(_image(1200, 600), max_dimension=400, max_size=None)
+        with Image.open(BytesIO(image.content)) as result:
+            assert result.size == (400, 200)
+            assert result.format == "JPEG"
+        assert (image.scale_x, image.scale_y) == pytest.approx((1 / 3, 1 / 3))
+
+    @pytest.mark.unit
+    def test_shrinks_under_max_size(self):
+        image = downscale_image(_image(1000, 1000), max_dimension=None, max_size=50 * 1024)
+        assert len(image.content) <= 50 * 1024
+        assert image.scale_x < 1
+
+    @pytest.mark.unit
+    def test_transparency_kept(self):
+        image = downscale_image(_image(800, 400, "PNG", "RGBA"), 200, None)
+        assert (image.extension, image.mimetype) == ("png", "image/png")
+        with Image.open(BytesIO(image.content)) as result:
+            assert result.mode == "RGBA"
+
+    @pytest.mark.unit
+    def test_exif_kept(self):
+        output = BytesIO()
+        exif = Image.Exif()
+        exif[0x0112] = 6  # orientation: rotated 90°
+        Image.new("RGB", (800, 400)).save(output, format="JPEG", exif=exif)
+        image = downscale_image(output.getvalue(), 200, None)
+        with Image.open(BytesIO(image.content)) as result:
+            assert result.getexif()[0x0112] == 6
+
+
+class TestPreprocessedImageArgs:
+    @pytest.mark.unit
+    def test_small_image_unchanged(self, tmp_path, limits):
+        args = {"file": _wrapper(tmp_path, _image(100, 100))}
+        with preprocessed_image_args("p", "image", "object_detection", "", args) as (
+            new_args,
+            scale,
+        ):
+            assert new_args is args
+            assert scale is None
+
+    @pytest.mark.unit
+    def test_large_image_replaced(self, tmp_path, limits):
+        original = _wrapper(tmp_path, _image(2048, 1024))
+        args = {"file": original, "language": "en"}
+        with preprocessed_image_args("p", "image", "object_detection", "", args) as (
+            new_args,
+            scale,
+        ):
+            file = new_args["file"]
+            assert file is not original
+            assert file.file_url == original.file_url
+            assert new_args["language"] == "en"
+            assert file.file_info.file_size <= limits.max_size
+            with Image.open(file.file_path) as image:
+                assert max(image.size) <= 512
+            assert scale == pytest.approx((image.size[0] / 2048, image.size[1] / 1024))
+            path = file.file_path
+        assert not os.path.exists(path)
+        assert os.path.exists(original.file_path)
+
+    @pytest.mark.unit
+    def test_not_an_image(self, tmp_path, limits):
+        args = {"file": _wrapper(tmp_path, b"%PDF" * 100000, "application/pdf")}
+        with preprocessed_image_args("p", "ocr", "ocr", "", args) as (new_args, _):
+            assert new_args is args
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async(self, tmp_path, limits):
+        args = {"file": _wrapper(tmp_path, _image(1024, 1024))}
+        async with apreprocessed_image_args(
+            "p", "image", "object_detection", "", args
+        ) as (new_args, scale):
+            with Image.open(new_args["file"].file_path) as image:
+                assert image.size == (512, 512)
+            assert scale == (0.5, 0.5)
+
+
+class TestRescaleCoordinates:
+    @pytest.mark.unit
+    def test_pixel_coordinates(self):
+        result = {
+            "original_response": {"x_min": 10},
+            "standardized_response": {
+                "items": [{"label": "cat", "x_min": 10, "y_min": 5, "confidence": 0.5}]
+            },
+        }
+        rescaled = rescale_coordinates(result, (0.5, 0.25))
+        assert rescaled["standardized_response"]["items"][0] == {
+            "label": "cat",
+            "x_min": 20,
+            "y_min": 20,
+            "confidence": 0.5,
+        }
+        assert rescaled["original_response"] == {"x_min": 10}
+
+    @pytest.mark.unit
+    def test_no_scale(self):
+        result = {"standardized_response": {"x_min": 0.1}}
+        assert rescale_coordinates(result, None) is result
+
+
+class TestMicrosoftLogoDetection:
+    @pytest.mark.unit
+    def test_vertices_scaled_back_to_original_image(self, tmp_path, monkeypatch):
+        limits = image_limits("microsoft", "image", "logo_detection")
+        assert limits.pixel_coordinates
+        monkeypatch.setattr(
+            image_preprocessing, "_pool", ThreadPoolExecutor(max_workers=1)
+        )
+        sent_sizes = []
+
+        def post(url, data, **kwargs):
+            with Image.open(data) as image:
+                sent_sizes.append(image.size)
+            # Azure returns the rectangle in pixels of the image it received
+            brand = {
+                "name": "Brand",
+                "confidence": 0.9,
+                "rectangle": {"x": 100, "y": 10, "w": 200, "h": 20},
+            }
+            return MagicMock(status_code=200, json=lambda: {"brands": [brand]})
+
+        monkeypatch.setattr(microsoft_image_api.requests, "post", post)
+        api = MicrosoftImageApi.__new__(MicrosoftImageApi)
+        api.url = {"vision": "https://azure.example.com/vision"}
+        api.headers = {"vision": {}}
+
+        args = {"file": _wrapper(tmp_path, _image(5000, 100))}
+        with preprocessed_image_args(
+            "microsoft", "image", "logo_detection", "", args
+        ) as (new_args, scale):
+            result = api.image__logo_detection(new_args["file"].file_path)
+        result = rescale_coordinates(result.model_dump(), scale)
+
+        assert max(sent_sizes[0]) == 4096
+        scale_x, scale_y = scale
+        vertices = result["standardized_response"]["items"][0]["bounding_poly"][
+            "vertices"
+        ]
+        assert [vertex["x"] for vertex in vertices] == pytest.approx(
+            [100 / scale_x, 300 / scale_x, 300 / scale_x, 100 / scale_x]
+        )
+        assert [vertex["y"] for vertex in vertices] == pytest.approx(
+            [10 / scale_y, 10 / scale_y, 30 / scale_y, 30 / scale_y]
+        )
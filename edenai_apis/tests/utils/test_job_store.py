@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from edenai_apis.utils.job_store import JobStatus, SQLiteJobStore
+
+
+@pytest.fixture(params=["file", "memory"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return SQLiteJobStore(":memory:")
+    return SQLiteJobStore(str(tmp_path / "jobs" / "jobs.sqlite3"))
+
+
+class TestSQLiteJobStore:
+    @pytest.mark.unit
+    def test_put_get(self, store):
+        store.put("nyckel", "job", JobStatus.PENDING)
+        assert store.get("nyckel", "job").status == JobStatus.PENDING
+        store.put("nyckel", "job", JobStatus.SUCCEEDED, {"data": [1, "a"]})
+        state = store.get("nyckel", "job")
+        assert (state.status, state.result) == (JobStatus.SUCCEEDED, {"data": [1, "a"]})
+        assert state.provider_job_id == "job"
+        assert store.get("nyckel", "other") is None
+        assert store.get("sightengine", "job") is None
+
+    @pytest.mark.unit
+    def test_expired_states_ignored_and_purged(self, store):
+        # the first put purges, the next ones wait for PURGE_INTERVAL
+        store.put("nyckel", "alive", JobStatus.SUCCEEDED)
+        store.put("nyckel", "expired", JobStatus.SUCCEEDED, ttl=-1)
+        assert store.get("nyckel", "expired") is None
+        assert store.statuses("nyckel", ["expired", "alive"]) == {
+            "alive": JobStatus.SUCCEEDED
+        }
+        assert store.purge_expired() == 1
+
+    @pytest.mark.unit
+    def test_bulk_statuses(self, store):
+        for index in range(1200):
+            status = JobStatus.SUCCEEDED if index % 2 else JobStatus.FAILED
+            store.put("nyckel", str(index), status)
+        statuses = store.statuses("nyckel", [str(index) for index in range(1300)])
+        assert len(statuses) == 1200
+        assert statuses["7"] == JobStatus.SUCCEEDED
+        assert statuses["8"] == JobStatus.FAILED
+
+    @pytest.mark.unit
+    def test_delete(self, store):
+        store.put("nyckel", "job", JobStatus.SUCCEEDED)
+        store.delete("nyckel", "job")
+        assert store.get("nyckel", "job") is None
+
+    @pytest.mark.unit
+    def test_shared_between_stores_of_a_file(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+        SQLiteJobStore(path).put("nyckel", "job", JobStatus.SUCCEEDED, "result")
+        assert SQLiteJobStore(path).get("nyckel", "job").result == "result"
+
+    @pytest.mark.unit
+    def test_concurrent_writers(self, store):
+        def write(thread_index):
+            for index in range(50):
+                store.put("nyckel", f"{thread_index}-{index}", JobStatus.SUCCEEDED)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        job_ids = [f"{i}-{index}" for i in range(8) for index in range(50)]
+        assert len(store.statuses("nyckel", job_ids)) == 400
@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from edenai_apis.utils.loop_bridge import bridge_loop, run_coroutine, stop_bridge_loop
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    ports = set()
+
+    def do_GET(self):
+        Handler.ports.add(self.client_address[1])
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+async def _loop_and_thread():
+    return asyncio.get_running_loop(), threading.current_thread().name
+
+
+class TestLoopBridge:
+    @pytest.mark.unit
+    def test_single_long_lived_loop(self):
+        first_loop, thread_name = run_coroutine(_loop_and_thread())
+        second_loop, _ = run_coroutine(_loop_and_thread())
+        assert first_loop is second_loop is bridge_loop()
+        assert thread_name == "edenai_loop_bridge"
+
+    @pytest.mark.unit
+    def test_context_propagated(self):
+        async def get_request_id():
+            return request_id.get()
+
+        request_id.set("abc")
+        assert run_coroutine(get_request_id()) == "abc"
+
+    @pytest.mark.unit
+    def test_exception_raised(self):
+        async def fail():
+            raise ValueError("failed")
+
+        with pytest.raises(ValueError, match="failed"):
+            run_coroutine(fail())
+
+    @pytest.mark.unit
+    def test_timeout_cancels(self):
+        cancelled = threading.Event()
+
+        async def wait():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            run_coroutine(wait(), timeout=0.05)
+        assert cancelled.wait(1)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_running_loop_rejected(self):
+        with pytest.raises(RuntimeError, match="running event loop"):
+            run_coroutine(asyncio.sleep(0))
+
+    @pytest.mark.unit
+    def test_async_client_connections_reused(self, server):
+        Handler.ports.clear()
+        client = run_coroutine(_new_client())
+        try:
+            for _ in range(3):
+                assert run_coroutine(client.get(server)).status_code == 200
+        finally:
+            run_coroutine(client.aclose())
+        assert len(Handler.ports) == 1
+
+    @pytest.mark.unit
+    def test_restarted_after_stop(self):
+        loop = bridge_loop()
+        stop_bridge_loop()
+        assert loop.is_closed()
+        new_loop, _ = run_coroutine(_loop_and_thread())
+        assert new_loop is not loop
+
+
+async def _new_client():
+    return httpx.AsyncClient()
@@ -0,0 +1,154 @@
+import os
+import struct
+from collections import OrderedDict
+
+import pytest
+from PIL import Image
+from settings import base_path
+
+from edenai_apis.utils import media_probe
+from edenai_apis.utils.media_probe import (
+    get_image_size,
+    get_pdf_size,
+    mediainfo,
+    probe,
+)
+
+
+def _data(path: str) -> str:
+    return os.path.join(base_path, "features", path)
+
+
+class TestProbeAudio:
+    @pytest.mark.unit
+    def test_wav(self):
+        info = probe(_data("audio/data/out.wav"))
+        assert info.format == "wav"
+        assert info.sample_rate == 44100
+        assert info.channels == 1
+        assert info.duration == pytest.approx(3.6, abs=0.01)
+
+    @pytest.mark.unit
+    def test_mp3(self):
+        info = probe(_data("audio/data/conversation.mp3"))
+        assert info.format == "mp3"
+        assert info.sample_rate == 44100
+        assert info.channels == 2
+        assert info.duration == pytest.approx(17, abs=0.5)
+
+    @pytest.mark.unit
+    def test_mp4_audio_track(self):
+        info = probe(_data("video/data/shot.mp4"))
+        assert info.format == "mp4"
+        assert info.sample_rate == 44100
+        assert info.channels == 2
+        assert info.duration == pytest.approx(13.12, abs=0.01)
+
+    @pytest.mark.unit
+    def test_flac(self):
+        # STREAMINFO: 16000 Hz, 2 channels, 16 bits, 32000 samples
+        streaminfo = struct.pack(">HH", 4096, 4096) + b"\x00" * 6
+        streaminfo += ((16000 << 44) | (1 << 41) | (15 << 36) | 32000).to_bytes(8, "big")
+        streaminfo += b"\x00" * 16
+        content = b"fLaC" + b"\x80" + len(streaminfo).to_bytes(3, "big") + streaminfo
+        info = probe(content)
+        assert (info.format, info.sample_rate, info.channels) == ("flac", 16000, 2)
+        assert info.duration == pytest.approx(2)
+
+    @pytest.mark.unit
+    def test_ogg_opus(self):
+        opus_head = b"OpusHead" + bytes([1, 2]) + struct.pack("<HI", 312, 24000)
+        first_page = b"OggS" + b"\x00" * 22 + bytes([1, len(opus_head)]) + opus_head
+        last_page = b"OggS\x00\x04" + struct.pack("<q", 48000 + 312) + b"\x00" * 14
+        info = probe(first_page + last_page)
+        assert (info.format, info.sample_rate, info.channels) == ("ogg", 24000, 2)
+        assert info.duration == pytest.approx(1)
+
+    @pytest.mark.unit
+    def test_mediainfo_is_pydub_compatible(self):
+        info = mediainfo(_data("audio/data/out.wav"))
+        assert info["sample_rate"] == "44100"
+        assert info["channels"] == "1"
+
+
+class TestProbeImage:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "image/data/32x24.jpg",
+            "image/data/objects.png",
+            "ocr/data/receipt.jpg",
+            "video/data/image.jpg",
+        ],
+    )
+    def test_matches_pil(self, path):
+        with Image.open(_data(path)) as img:
+            assert get_image_size(_data(path)) == img.size
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("image_format", ["GIF", "WEBP", "TIFF"])
+    def test_other_formats(self, image_format, tmp_path):
+        path = str(tmp_path / f"image.{image_format.lower()}")
+        Image.new("RGB", (37, 21)).save(path, format=image_format)
+        info = probe(path)
+        assert (info.width, info.height) == (37, 21)
+        with open(path, "rb") as f:
+            assert get_image_size(f.read()) == (37, 21)
+
+    @pytest.mark.unit
+    def test_unknown_format(self):
+        assert probe(_data("audio/data/test.txt")) is None
+        assert probe(b"") is None
+
+
+class TestProbePdf:
+    @pytest.mark.unit
+    def test_first_page_mediabox(self):
+        assert get_pdf_size(_data("ocr/data/resume.pdf")) == (612.0, 792.0)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "path, size",
+        [
+            ("ocr/data/invoice-multipages.pdf", (595.28, 841.89)),
+            ("ocr/data/ocr_multipages.pdf", (595.22, 842.0)),
+        ],
+    )
+    def test_cross_reference_streams(self, path, size):
+        assert get_pdf_size(_data(path)) == size
+
+    @pytest.mark.unit
+    def test_only_needed_objects_are_read(self, monkeypatch):
+        read = []
+        original_read_at = media_probe._Reader.read_at
+
+        def read_at(reader, offset, size):
+            content = original_read_at(reader, offset, size)
+            read.append(len(content))
+            return content
+
+        monkeypatch.setattr(media_probe._Reader, "read_at", read_at)
+        path = _data("ocr/data/resume.pdf")
+        with open(path, "rb") as f:
+            assert get_pdf_size(f.read()) == (612.0, 792.0)
+        assert sum(read) < os.path.getsize(path) / 4
+
+    @pytest.mark.unit
+    def test_mediainfo_without_ffprobe(self, monkeypatch):
+        monkeypatch.setattr(media_probe, "_probe_pdf", lambda reader: None)
+        monkeypatch.setattr(media_probe, "_probe_cache", OrderedDict())
+        assert mediainfo(_data("ocr/data/resume.pdf")) == {"format_name": "pdf"}
+
+    @pytest.mark.unit
+    def test_cache_follows_file_changes(self, tmp_path):
+        path = tmp_path / "image.gif"
+        path.write_bytes(b"GIF89a" + struct.pack("<HH", 10, 20))
+        assert get_image_size(str(path)) == (10, 20)
+        path.write_bytes(b"GIF89a" + struct.pack("<HH", 30, 40))
+        os.utime(path, ns=(0, 10**9))
+        assert get_image_size(str(path)) == (30, 40)
+
+    @pytest.mark.unit
+    def test_not_a_pdf(self):
+        assert get_pdf_size(_data("image/data/objects.png")) is None
@@ -0,0 +1,123 @@
+import gc
+import os
+
+import pytest
+
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.pagination import (
+    PageAssembler,
+    RawPages,
+    aiter_pages,
+    iter_pages,
+    read_spilled_pages,
+)
+
+PAGES = {
+    None: {"Items": [1, 2], "NextToken": "a"},
+    "a": {"Items": [3], "NextToken": "b"},
+    "b": {"Items": [4, 5]},
+}
+
+
+def parse_page(page):
+    return [item * 10 for item in page["Items"]]
+
+
+class TestIterPages:
+    @pytest.mark.unit
+    def test_follows_pagination_token(self):
+        fetched = []
+
+        def fetch_page(token):
+            fetched.append(token)
+            return PAGES[token]
+
+        pages = iter_pages(fetch_page)
+        assert fetched == []  # lazy
+        assert list(pages) == list(PAGES.values())
+        assert fetched == [None, "a", "b"]
+
+    @pytest.mark.unit
+    def test_first_page_already_fetched(self):
+        fetched = []
+
+        def fetch_page(token):
+            fetched.append(token)
+            return PAGES[token]
+
+        assert len(list(iter_pages(fetch_page, first_page=PAGES[None]))) == 3
+        assert fetched == ["a", "b"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async(self):
+        async def fetch_page(token):
+            return PAGES[token]
+
+        assert [page async for page in aiter_pages(fetch_page)] == list(PAGES.values())
+
+
+class TestPageAssembler:
+    @pytest.mark.unit
+    def test_inline(self):
+        assembler = PageAssembler(parse_page, raw_pages=RawPages.INLINE).consume(
+            iter_pages(PAGES.get)
+        )
+        assert assembler.items == [10, 20, 30, 40, 50]
+        assert assembler.original_response == list(PAGES.values())
+
+    @pytest.mark.unit
+    def test_drop(self):
+        assembler = PageAssembler(parse_page, raw_pages=RawPages.DROP).consume(
+            iter_pages(PAGES.get)
+        )
+        assert assembler.items == [10, 20, 30, 40, 50]
+        assert assembler.original_response == {"num_pages": 3}
+
+    @pytest.mark.unit
+    def test_spill(self, tmp_path):
+        assembler = PageAssembler(
+            parse_page, raw_pages=RawPages.SPILL, spill_dir=str(tmp_path)
+        ).consume(iter_pages(PAGES.get))
+        assert assembler.items == [10, 20, 30, 40, 50]
+        path = assembler.original_response["raw_pages_path"]
+        assert os.path.dirname(path) == str(tmp_path)
+        assert list(read_spilled_pages(path)) == list(PAGES.values())
+
+    @pytest.mark.unit
+    def test_spill_file_removed_with_response(self, tmp_path):
+        assembler = PageAssembler(
+            parse_page, raw_pages=RawPages.SPILL, spill_dir=str(tmp_path)
+        ).consume(iter_pages(PAGES.get))
+        original_response = assembler.original_response
+        path = original_response["raw_pages_path"]
+        del assembler
+        gc.collect()
+        assert os.path.exists(path)
+        del original_response
+        gc.collect()
+        assert not os.path.exists(path)
+
+    @pytest.mark.unit
+    def test_spill_file_removed_on_error(self, tmp_path):
+        def fetch_page(token):
+            if token:
+                raise ProviderException("page not found")
+            return PAGES[token]
+
+        assembler = PageAssembler(
+            parse_page, raw_pages=RawPages.SPILL, spill_dir=str(tmp_path)
+        )
+        with pytest.raises(ProviderException):
+            assembler.consume(iter_pages(fetch_page))
+        assert not os.path.exists(assembler.spill_path)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_aconsume(self):
+        async def fetch_page(token):
+            return PAGES[token]
+
+        assembler = await PageAssembler(parse_page).aconsume(aiter_pages(fetch_page))
+        assert assembler.num_pages == 3
+        assert assembler.items == [10, 20, 30, 40, 50]
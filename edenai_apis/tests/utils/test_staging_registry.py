@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from edenai_apis.utils.staging_registry import StagingRegistry, content_hash
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"RIFF" + b"\x00" * 1000)
+    return str(path)
+
+
+class Uploader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        return f"https://bucket/{self.calls}"
+
+
+class TestContentHash:
+    @pytest.mark.unit
+    def test_same_content_same_hash(self, audio_file, tmp_path):
+        copy = tmp_path / "copy.wav"
+        with open(audio_file, "rb") as f:
+            content = f.read()
+        copy.write_bytes(content)
+        assert content_hash(audio_file) == content_hash(str(copy)) == content_hash(content)
+
+    @pytest.mark.unit
+    def test_modified_file(self, audio_file):
+        digest = content_hash(audio_file)
+        with open(audio_file, "ab") as f:
+            f.write(b"more")
+        assert content_hash(audio_file) != digest
+
+
+class TestStagingRegistry:
+    @pytest.mark.unit
+    def test_reuses_location(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        upload = Uploader()
+        first = registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        second = registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        assert first == second
+        assert upload.calls == 1
+        assert registry.holds(first)
+
+    @pytest.mark.unit
+    def test_destinations_are_separate(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        upload = Uploader()
+        registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        registry.stage("gcs:bucket", audio_file, upload, ttl=3600)
+        assert upload.calls == 2
+
+    @pytest.mark.unit
+    def test_not_reused_close_to_expiry(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        upload = Uploader()
+        registry.stage("s3:bucket", audio_file, upload, ttl=600, min_validity=900)
+        registry.stage("s3:bucket", audio_file, upload, ttl=600, min_validity=900)
+        assert upload.calls == 2
+
+    @pytest.mark.unit
+    def test_expired_entry_calls_on_expire(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        expired = []
+        location = registry.stage(
+            "gemini", audio_file, Uploader(), ttl=0.01, on_expire=expired.append
+        )
+        time.sleep(0.02)
+        registry.purge_expired()
+        assert [staged.location for staged in expired] == [location]
+        assert not registry.holds(location)
+
+    @pytest.mark.unit
+    def test_invalidate(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        upload = Uploader()
+        location = registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        registry.invalidate(location)
+        registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        assert upload.calls == 2
+
+    @pytest.mark.unit
+    def test_disabled(self, audio_file):
+        registry = StagingRegistry(enabled=False)
+        upload = Uploader()
+        registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        registry.stage("s3:bucket", audio_file, upload, ttl=3600)
+        assert upload.calls == 2
+        assert len(registry) == 0
+
+    @pytest.mark.unit
+    def test_concurrent_threads_upload_once(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        calls = []
+
+        def upload():
+            calls.append(1)
+            time.sleep(0.05)
+            return "location"
+
+        threads = [
+            threading.Thread(
+                target=registry.stage, args=("s3:bucket", audio_file, upload, 3600)
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+        assert registry._key_locks == {}
+
+    @pytest.mark.unit
+    def test_key_locks_released(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+
+        def fail():
+            raise RuntimeError("upload failed")
+
+        with pytest.raises(RuntimeError):
+            registry.stage("s3:bucket", audio_file, fail, 3600)
+        for content in (b"first", b"second"):
+            registry.stage("s3:bucket", content, Uploader(), 3600)
+        assert registry._key_locks == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_async_upload_once(self, audio_file):
+        registry = StagingRegistry(enabled=True)
+        calls = []
+
+        async def upload():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "location"
+
+        locations = await asyncio.gather(
+            *(registry.astage("s3:bucket", audio_file, upload, 3600) for _ in range(5))
+        )
+        assert locations == ["location"] * 5
+        assert len(calls) == 1
+        assert await registry.astage("s3:bucket", audio_file, upload, 3600) == "location"
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_expiration_off_the_event_loop(self, audio_file, tmp_path):
+        registry = StagingRegistry(enabled=True)
+        expired = threading.Event()
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def on_expire(staged):
+            # eg: a blocking DELETE request to the provider
+            threads.append(threading.get_ident())
+            time.sleep(0.2)
+            expired.set()
+
+        async def upload():
+            return "location"
+
+        await registry.astage("gemini", audio_file, upload, ttl=0.01, on_expire=on_expire)
+        await asyncio.sleep(0.02)
+        start = time.monotonic()
+        other = tmp_path / "other.wav"
+        other.write_bytes(b"other")
+        await registry.astage("gemini", str(other), upload, ttl=3600)
+        assert time.monotonic() - start < 0.1
+        assert await asyncio.to_thread(expired.wait, 5)
+        assert threads and threads[0] != loop_thread
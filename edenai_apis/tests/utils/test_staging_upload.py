@@ -0,0 +1,207 @@
+import asyncio
+import os
+
+import pytest
+
+from edenai_apis.utils.staging_upload import (
+    MB,
+    S3_MAX_PARTS,
+    UploadConfig,
+    _s3_part_size,
+    aupload_file_to_s3_bucket,
+    aupload_stream_to_s3_bucket,
+    split_parts,
+    upload_file_to_gcs,
+)
+
+
+def _check_body(body):
+    # same validation as botocore: memoryviews or strings are rejected
+    if not isinstance(body, (bytes, bytearray)) and not hasattr(body, "read"):
+        raise TypeError(f"Invalid type for parameter Body, value: {type(body)}")
+    return body.read() if hasattr(body, "read") else bytes(body)
+
+
+class FakeAsyncS3Client:
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.objects = {}
+        self.parts = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.aborted = False
+
+    async def put_object(self, Bucket, Key, Body):
+        self.objects[(Bucket, Key)] = _check_body(Body)
+
+    async def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload-id"}
+
+    async def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if PartNumber == self.fail_part:
+            raise ConnectionError("part failed")
+        self.parts[PartNumber] = _check_body(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    async def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(self.parts)
+        self.objects[(Bucket, Key)] = b"".join(self.parts[n] for n in numbers)
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+class FakeBlob:
+    chunk_size = None
+
+    def upload_from_filename(self, file_path, content_type=None):
+        self.uploaded = file_path
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    content = os.urandom(12 * MB + 123)
+    path = tmp_path / "big.bin"
+    path.write_bytes(content)
+    return str(path), content
+
+
+class TestSplitParts:
+    @pytest.mark.unit
+    def test_parts_cover_file(self):
+        parts = split_parts(10, 4)
+        assert parts == [(1, 0, 4), (2, 4, 4), (3, 8, 2)]
+
+    @pytest.mark.unit
+    def test_s3_part_size_limits(self):
+        assert _s3_part_size(100 * MB, 1) == 5 * MB
+        size = 200 * 1024 * MB
+        assert len(split_parts(size, _s3_part_size(size, 5 * MB))) <= S3_MAX_PARTS
+
+
+class TestAsyncS3Upload:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_multipart_from_disk(self, big_file):
+        path, content = big_file
+        client = FakeAsyncS3Client()
+        config = UploadConfig(part_size=5 * MB, max_concurrency=2, multipart_threshold=MB)
+        await aupload_file_to_s3_bucket(client, path, "bucket", "key", config)
+        assert client.objects[("bucket", "key")] == content
+        assert len(client.parts) == 3
+        assert client.max_in_flight == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_multipart_from_bytes(self, big_file):
+        _, content = big_file
+        client = FakeAsyncS3Client()
+        config = UploadConfig(part_size=5 * MB, max_concurrency=8, multipart_threshold=MB)
+        await aupload_file_to_s3_bucket(client, content, "bucket", "key", config)
+        assert client.objects[("bucket", "key")] == content
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_small_file_single_request(self, tmp_path):
+        path = tmp_path / "small.bin"
+        path.write_bytes(b"small")
+        client = FakeAsyncS3Client()
+        await aupload_file_to_s3_bucket(client, str(path), "bucket", "key")
+        assert client.objects[("bucket", "key")] == b"small"
+        assert client.parts == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_small_bytearray_single_request(self):
+        client = FakeAsyncS3Client()
+        await aupload_file_to_s3_bucket(client, bytearray(b"small"), "bucket", "key")
+        assert client.objects[("bucket", "key")] == b"small"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_upload(self, big_file):
+        path, _ = big_file
+        client = FakeAsyncS3Client(fail_part=2)
+        config = UploadConfig(part_size=5 * MB, max_concurrency=2, multipart_threshold=MB)
+        with pytest.raises(ConnectionError):
+            await aupload_file_to_s3_bucket(client, path, "bucket", "key", config)
+        assert client.aborted
+        assert ("bucket", "key") not in client.objects
+
+
+async def _stream(content, chunk_size, events=None):
+    for offset in range(0, len(content), chunk_size):
+        if events is not None:
+            events.append(offset)
+        yield content[offset : offset + chunk_size]
+        await asyncio.sleep(0)
+
+
+class TestAsyncS3StreamUpload:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_parts_sent_while_streaming(self, big_file):
+        _, content = big_file
+        client = FakeAsyncS3Client()
+        sent = []
+        original_upload_part = client.upload_part
+
+        async def upload_part(**kwargs):
+            sent.append((kwargs["PartNumber"], len(produced)))
+            return await original_upload_part(**kwargs)
+
+        produced = []
+        client.upload_part = upload_part
+        config = UploadConfig(part_size=5 * MB, max_concurrency=2)
+        await aupload_stream_to_s3_bucket(
+            client, _stream(content, MB, produced), "bucket", "key", config
+        )
+        assert client.objects[("bucket", "key")] == content
+        assert len(client.parts) == 3
+        # the first part is sent once 5 MB are produced, not at the end of the stream
+        assert sent[0] == (1, 5)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_small_stream_single_request(self):
+        client = FakeAsyncS3Client()
+        await aupload_stream_to_s3_bucket(client, _stream(b"small", 2), "bucket", "key")
+        assert client.objects[("bucket", "key")] == b"small"
+        assert client.parts == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_part_aborts_upload(self, big_file):
+        _, content = big_file
+        client = FakeAsyncS3Client(fail_part=1)
+        config = UploadConfig(part_size=5 * MB, max_concurrency=1)
+        with pytest.raises(ConnectionError):
+            await aupload_stream_to_s3_bucket(
+                client, _stream(content, MB), "bucket", "key", config
+            )
+        assert client.aborted
+        assert ("bucket", "key") not in client.objects
+
+
+class TestGcsUpload:
+    @pytest.mark.unit
+    def test_resumable_chunks_below_threshold(self, big_file):
+        path, _ = big_file
+        blob = FakeBlob()
+        config = UploadConfig(part_size=5 * MB + 1, multipart_threshold=100 * MB)
+        upload_file_to_gcs(blob, path, config)
+        assert blob.uploaded == path
+        assert blob.chunk_size == 5 * MB  # aligned on 256 KB
+
+    @pytest.mark.unit
+    def test_small_file_single_request(self, tmp_path):
+        path = tmp_path / "small.bin"
+        path.write_bytes(b"small")
+        blob = FakeBlob()
+        upload_file_to_gcs(blob, str(path))
+        assert blob.chunk_size is None
@@ -0,0 +1,151 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+import pytest
+
+from edenai_apis import interface
+from edenai_apis.features.text.text_interface import TextInterface
+from edenai_apis.utils.sync_offload import configure_offload, offload_stats, run_sync
+from edenai_apis.utils.types import ResponseType
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class TestRunSync:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_runs_in_provider_thread(self):
+        configure_offload("test_thread", 2)
+        request_id.set("abc")
+
+        def work(value):
+            return value, threading.current_thread().name, request_id.get()
+
+        value, thread_name, context_value = await run_sync("test_thread", work, 1)
+        assert value == 1
+        assert thread_name.startswith("offload_test_thread")
+        assert context_value == "abc"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_bounded_pool_and_queue_depth(self):
+        configure_offload("test_bounded", 2)
+        running = []
+        release = threading.Event()
+
+        def work():
+            running.append(1)
+            release.wait(5)
+
+        tasks = [
+            asyncio.ensure_future(run_sync("test_bounded", work)) for _ in range(5)
+        ]
+        await asyncio.sleep(0.1)
+        stats = offload_stats()["test_bounded"]
+        assert (stats.workers, stats.running, stats.queued) == (2, 2, 3)
+        assert len(running) == 2
+        release.set()
+        await asyncio.gather(*tasks)
+        stats = offload_stats()["test_bounded"]
+        assert (stats.running, stats.queued, stats.completed) == (0, 0, 5)
+        assert stats.max_queued >= 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancelled_while_queued(self):
+        configure_offload("test_cancel", 1)
+        started = []
+        release = threading.Event()
+
+        def work(index):
+            started.append(index)
+            release.wait(5)
+
+        first = asyncio.ensure_future(run_sync("test_cancel", work, 0))
+        second = asyncio.ensure_future(run_sync("test_cancel", work, 1))
+        await asyncio.sleep(0.1)
+        second.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await first
+        assert started == [0]
+        assert offload_stats()["test_cancel"].queued == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_providers_isolated(self):
+        configure_offload("test_slow", 1)
+        configure_offload("test_fast", 1)
+        slow = asyncio.ensure_future(run_sync("test_slow", time.sleep, 0.5))
+        start = time.monotonic()
+        await run_sync("test_fast", lambda: None)
+        assert time.monotonic() - start < 0.4
+        await slow
+
+
+class SyncOnlyApi(TextInterface):
+    def __init__(self, api_keys=None):
+        pass
+
+    def text__sentiment_analysis(self, language, text, model=None, **kwargs):
+        return ResponseType[dict](
+            original_response={"thread": threading.current_thread().name},
+            standardized_response={"text": text},
+        )
+
+
+class NativeAsyncApi(SyncOnlyApi):
+    async def text__asentiment_analysis(self, language, text, model=None, **kwargs):
+        return ResponseType[dict](
+            original_response={"thread": "event_loop"},
+            standardized_response={"text": text},
+        )
+
+
+@pytest.fixture
+def provider_class(monkeypatch):
+    classes = {}
+
+    def load_provider(data, provider_name=None, **kwargs):
+        return classes[provider_name]
+
+    monkeypatch.setattr(interface, "load_provider", load_provider)
+    monkeypatch.setattr(
+        interface, "validate_all_provider_constraints", lambda *args: args[-1]
+    )
+    return classes
+
+
+class TestAcomputeOutput:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_provider_offloaded(self, provider_class):
+        provider_class["sync_only"] = SyncOnlyApi
+        result = await interface.acompute_output(
+            "sync_only", "text", "sentiment_analysis", {"language": "en", "text": "a"}
+        )
+        assert result["standardized_response"] == {"text": "a"}
+        assert result["original_response"]["thread"].startswith("offload_sync_only")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_native_async_preferred(self, provider_class):
+        provider_class["native"] = NativeAsyncApi
+        result = await interface.acompute_output(
+            "native", "text", "sentiment_analysis", {"language": "en", "text": "a"}
+        )
+        assert result["original_response"]["thread"] == "event_loop"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_not_implemented(self, provider_class):
+        provider_class["sync_only"] = SyncOnlyApi
+        with pytest.raises(NotImplementedError):
+            await interface.acompute_output(
+                "sync_only",
+                "text",
+                "keyword_extraction",
+                {"language": "en", "text": "a"},
+            )
@@ -0,0 +1,180 @@
+import os
+import time
+from io import BytesIO
+from typing import Optional
+
+import pytest
+
+from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.utils import tts_cache as tts_cache_module
+from edenai_apis.utils import upload_s3
+from edenai_apis.utils.tts_cache import TtsCache, cached_tts, tts_cache_key
+from edenai_apis.utils.types import ResponseType
+
+
+def _signed_url(name: str, expires_in: float) -> str:
+    return f"https://cdn.example.com/{name}?Expires={int(time.time() + expires_in)}&Signature=x"
+
+
+class FakeTtsProvider:
+    provider_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def _synthesize(self, text: str) -> ResponseType[TtsDataClass]:
+        self.calls += 1
+        filename = f"{self.calls}_.mp3"
+        url = _signed_url(filename, 7 * 24 * 3600)
+        upload_s3._record_upload(
+            BytesIO(text.encode()), filename, url, upload_s3.USER_PROCESS
+        )
+        return ResponseType[TtsDataClass](
+            original_response={"call": self.calls},
+            standardized_response=TtsDataClass(audio_resource_url=url),
+        )
+
+    @cached_tts
+    def audio__tts(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        audio_format: str = "mp3",
+        speed: Optional[float] = None,
+        provider_params: Optional[dict] = None,
+        **kwargs,
+    ):
+        return self._synthesize(text)
+
+    @cached_tts
+    async def audio__atts(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        audio_format: str = "mp3",
+        stream: bool = False,
+        **kwargs,
+    ):
+        return self._synthesize(text)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = TtsCache(directory=str(tmp_path / "tts"), max_size=1024, enabled=True)
+    monkeypatch.setattr(tts_cache_module, "tts_cache", cache)
+    return cache
+
+
+class TestCacheKey:
+    @pytest.mark.unit
+    def test_normalized_text(self):
+        assert tts_cache_key("openai", "Hello   world \n", voice="Alloy") == tts_cache_key(
+            "openai", "Hello world", voice="alloy"
+        )
+
+    @pytest.mark.unit
+    def test_prosody_and_settings_change_key(self):
+        key = tts_cache_key("openai", "Hello", voice="alloy")
+        assert key != tts_cache_key("openai", "Hello", voice="alloy", speed=1.5)
+        assert key != tts_cache_key(
+            "openai", "Hello", voice="alloy", provider_params={"sampling_rate": 8000}
+        )
+        assert key != tts_cache_key("google", "Hello", voice="alloy")
+        assert key != tts_cache_key(
+            "openai", "Hello", voice="alloy", extra_params={"emotion": "happy"}
+        )
+
+
+class TestTtsCache:
+    @pytest.mark.unit
+    def test_lru_eviction_by_size(self, cache):
+        for name in ("a", "b", "c"):
+            cache.put(name, b"x" * 400, "mp3", _signed_url(name, 3600 * 48))
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        cache.put("d", b"x" * 400, "mp3", _signed_url("d", 3600 * 48))
+        assert cache.get("c") is None  # b was used more recently
+        assert cache.get("b") is not None
+
+    @pytest.mark.unit
+    def test_persisted_on_disk(self, cache):
+        cache.put("a", b"audio", "wav", _signed_url("a", 3600 * 48), original_response={"x": 1})
+        reloaded = TtsCache(directory=cache.directory, enabled=True)
+        entry = reloaded.get("a")
+        assert reloaded.read(entry) == b"audio"
+        assert entry.original_response == {"x": 1}
+
+    @pytest.mark.unit
+    def test_private_directory(self, cache):
+        cache.put("a", b"audio", "wav", _signed_url("a", 3600 * 48))
+        assert os.stat(cache.directory).st_mode & 0o777 == 0o700
+
+    @pytest.mark.unit
+    def test_shared_directory_restricted(self, tmp_path):
+        directory = tmp_path / "shared"
+        directory.mkdir(mode=0o777)
+        directory.chmod(0o777)
+        cache = TtsCache(directory=str(directory), enabled=True)
+        assert len(cache) == 0
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    @pytest.mark.unit
+    def test_foreign_directory_disables_cache(self, cache, monkeypatch):
+        os.makedirs(cache.directory)
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(cache.directory).st_uid + 1)
+        assert cache.get("a") is None
+        assert not cache.enabled
+        assert cache.put("a", b"audio", "wav", _signed_url("a", 3600 * 48)) is None
+
+    @pytest.mark.unit
+    def test_cloudfront_url_signed_again(self, cache, monkeypatch):
+        monkeypatch.setattr(upload_s3, "CLOUDFRONT_KEY_ID", "key-id")
+        monkeypatch.setattr(
+            upload_s3,
+            "get_cloud_front_file_url",
+            lambda filename, process_time: _signed_url(filename, process_time),
+        )
+        entry = cache.put(
+            "a", b"audio", "mp3", _signed_url("a.mp3", 3600), object_key="a.mp3", cloudfront=True
+        )
+        url = cache.resource_url(entry)
+        assert url != _signed_url("a.mp3", 3600)
+        assert cache.get("a").url_expires_at > time.time() + 6 * 24 * 3600
+
+
+class TestCachedTts:
+    @pytest.mark.unit
+    def test_second_call_served_from_cache(self, cache):
+        provider = FakeTtsProvider()
+        first = provider.audio__tts("Hello  world", voice="alloy")
+        second = provider.audio__tts(text="Hello world", voice="ALLOY")
+        assert provider.calls == 1
+        assert second.standardized_response == first.standardized_response
+        assert second.original_response == {"call": 1}
+        entry = cache.get(tts_cache_key("fake", "Hello world", voice="alloy", audio_format="mp3"))
+        assert cache.read(entry) == b"Hello  world"
+
+    @pytest.mark.unit
+    def test_different_voice_not_shared(self, cache):
+        provider = FakeTtsProvider()
+        provider.audio__tts("Hello", voice="alloy")
+        provider.audio__tts("Hello", voice="echo")
+        assert provider.calls == 2
+
+    @pytest.mark.unit
+    def test_extra_arguments_not_shared(self, cache):
+        provider = FakeTtsProvider()
+        provider.audio__tts("Hello", voice="alloy", emotion="happy")
+        provider.audio__tts("Hello", voice="alloy", emotion="sad")
+        provider.audio__tts("Hello", voice="alloy", emotion="sad")
+        assert provider.calls == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async_and_stream(self, cache):
+        provider = FakeTtsProvider()
+        await provider.audio__atts("Hello")
+        await provider.audio__atts("Hello")
+        assert provider.calls == 1
+        await provider.audio__atts("Hello", stream=True)
+        assert provider.calls == 2
@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+
+from edenai_apis.utils import tts
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.tts import TtsAudioStream, ahttp_audio_chunks
+
+
+async def _chunks(parts, delay=0.0, fail_after=None):
+    for index, part in enumerate(parts):
+        if fail_after is not None and index == fail_after:
+            raise ProviderException("synthesis failed")
+        await asyncio.sleep(delay)
+        yield part
+
+
+class Uploader:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.received = []
+        self.uploads = []
+
+    async def __call__(self, chunks, file_extension):
+        async for chunk in chunks:
+            self.received.append(chunk)
+        await asyncio.sleep(self.delay)
+        self.uploads.append((b"".join(self.received), file_extension))
+        return f"https://bucket/audio.{file_extension}"
+
+
+def _mock_client(handler):
+    @asynccontextmanager
+    async def client(timeout):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            yield c
+
+    return client
+
+
+class TestTtsAudioStream:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunks_and_upload(self):
+        upload = Uploader()
+        stream = TtsAudioStream(
+            _chunks([b"ab", b"", b"cd"], delay=0.01), "mp3", provider="test", upload=upload
+        )
+        received = [chunk async for chunk in stream]
+
+        assert received == [b"ab", b"cd"]
+        assert await stream.aresource_url() == "https://bucket/audio.mp3"
+        assert upload.uploads == [(b"abcd", "mp3")]
+        assert stream.audio_resource_url == "https://bucket/audio.mp3"
+        assert stream.metrics.chunks == 2
+        assert stream.metrics.total_bytes == 4
+        assert 0 < stream.metrics.time_to_first_byte <= stream.metrics.total_time
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_chunks_uploaded_as_they_arrive(self):
+        upload = Uploader(delay=0.5)
+        stream = TtsAudioStream(_chunks([b"ab", b"cd"], delay=0.05), "mp3", upload=upload)
+        iterator = stream.__aiter__()
+        assert await iterator.__anext__() == b"ab"
+        await asyncio.sleep(0.01)
+        assert upload.received == [b"ab"]  # before the provider sent the next chunk
+
+        start = asyncio.get_running_loop().time()
+        assert [chunk async for chunk in iterator] == [b"cd"]
+        assert asyncio.get_running_loop().time() - start < 0.4  # upload not awaited
+        assert stream.audio_resource_url is None
+        assert await stream.aresource_url() == "https://bucket/audio.mp3"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_error_mid_stream_skips_upload(self):
+        upload = Uploader()
+        stream = TtsAudioStream(_chunks([b"ab", b"cd"], fail_after=1), "mp3", upload=upload)
+        received = []
+        with pytest.raises(ProviderException):
+            async for chunk in stream:
+                received.append(chunk)
+        await asyncio.sleep(0)
+        assert received == [b"ab"]
+        assert upload.uploads == []
+        assert stream.audio_resource_url is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_without_upload(self):
+        stream = TtsAudioStream(_chunks([b"ab"]), "wav", upload=None)
+        assert [chunk async for chunk in stream] == [b"ab"]
+        assert await stream.aresource_url() is None
+
+
+class TestHttpAudioChunks:
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_streams_body(self, monkeypatch):
+        monkeypatch.setattr(
+            tts,
+            "async_client",
+            _mock_client(lambda request: httpx.Response(200, content=b"x" * 10)),
+        )
+        chunks = [chunk async for chunk in ahttp_audio_chunks("POST", "https://tts")]
+        assert b"".join(chunks) == b"x" * 10
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_error_status(self, monkeypatch):
+        monkeypatch.setattr(
+            tts,
+            "async_client",
+            _mock_client(lambda request: httpx.Response(401, text="invalid key")),
+        )
+        with pytest.raises(ProviderException) as exc:
+            async for _ in ahttp_audio_chunks("POST", "https://tts"):
+                pass
+        assert exc.value.code == 401
+        assert "invalid key" in str(exc.value)
@@ -0,0 +1,157 @@
+import asyncio
+import os
+import stat
+import sys
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from edenai_apis.utils import video_keyframes
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.video_keyframes import (
+    Keyframe,
+    _keyframes_command,
+    _spread,
+    _split_jpegs,
+    aextract_keyframes,
+    extract_keyframes,
+    video_proxy,
+)
+
+# Stands for ffmpeg: writes FAKE_FFMPEG_FRAMES jpegs (mjpeg on stdout with showinfo
+# lines on stderr), or copies its input to the output path of a proxy
+FAKE_FFMPEG = """#!{python}
+import os, shutil, sys, time
+from io import BytesIO
+from PIL import Image
+args = sys.argv[1:]
+source = args[args.index("-i") + 1]
+if os.environ.get("FAKE_FFMPEG_SLEEP"):
+    time.sleep(float(os.environ["FAKE_FFMPEG_SLEEP"]))
+if open(source, "rb").read().startswith(b"invalid"):
+    sys.stderr.write(source + ": Invalid data found when processing input\\n")
+    sys.exit(1)
+if args[-1] != "pipe:1":
+    shutil.copyfile(source, args[-1])
+    sys.exit(0)
+for n in range(int(os.environ.get("FAKE_FFMPEG_FRAMES", "3"))):
+    frame = BytesIO()
+    Image.new("RGB", (32, 16), (n * 10, 0, 0)).save(frame, format="JPEG")
+    sys.stdout.buffer.write(frame.getvalue())
+    sys.stderr.write(
+        "[Parsed_showinfo_2 @ 0x1] n:%4d pts:%7d pts_time:%-7g duration:1\\n"
+        % (n, n * 2500, n * 2.5)
+    )
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    path = tmp_path / "ffmpeg"
+    path.write_text(FAKE_FFMPEG.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(video_keyframes, "FFMPEG", str(path))
+    return str(path)
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"video")
+    return str(path)
+
+
+class TestKeyframesCommand:
+    @pytest.mark.unit
+    def test_scene_selection(self):
+        command = _keyframes_command("/tmp/video.mp4", 0.4, 1, 10, 512)
+        video_filter = command[command.index("-vf") + 1]
+        assert "gt(scene,0.4)" in video_filter
+        assert "gte(t-prev_selected_t,10)" in video_filter
+        assert "min(iw,512)" in video_filter
+        assert video_filter.endswith(",showinfo")
+        assert command[command.index("-i") + 1] == "/tmp/video.mp4"
+
+
+class TestSpread:
+    @pytest.mark.unit
+    def test_evenly_picked(self):
+        keyframes = [Keyframe(float(t), b"") for t in range(10)]
+        picked = _spread(keyframes, 4)
+        assert [k.timestamp for k in picked] == [0, 3, 6, 9]
+        assert _spread(keyframes, 20) == keyframes
+        assert [k.timestamp for k in _spread(keyframes, 1)] == [0]
+
+
+class TestSplitJpegs:
+    @pytest.mark.unit
+    def test_concatenated_frames(self):
+        frames = []
+        for color in ("red", "blue"):
+            output = BytesIO()
+            Image.new("RGB", (8, 8), color).save(output, format="JPEG")
+            frames.append(output.getvalue())
+        assert _split_jpegs(b"".join(frames)) == frames
+        assert _split_jpegs(b"") == []
+
+
+class TestExtractKeyframes:
+    @pytest.mark.unit
+    def test_frames_and_timestamps(self, fake_ffmpeg, video):
+        keyframes = extract_keyframes(video)
+        assert [k.timestamp for k in keyframes] == [0, 2.5, 5]
+        with Image.open(BytesIO(keyframes[1].content)) as frame:
+            assert frame.size == (32, 16)
+
+    @pytest.mark.unit
+    def test_capped(self, fake_ffmpeg, video, monkeypatch):
+        monkeypatch.setenv("FAKE_FFMPEG_FRAMES", "9")
+        keyframes = extract_keyframes(video, max_frames=3)
+        assert [k.timestamp for k in keyframes] == [0, 10, 20]
+
+    @pytest.mark.unit
+    def test_ffmpeg_error(self, fake_ffmpeg, tmp_path):
+        path = tmp_path / "invalid.mp4"
+        path.write_bytes(b"invalid")
+        with pytest.raises(ProviderException) as exc:
+            extract_keyframes(str(path))
+        assert "Invalid data found" in str(exc.value)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_async(self, fake_ffmpeg, video):
+        keyframes = await aextract_keyframes(video, max_frames=2)
+        assert [k.timestamp for k in keyframes] == [0, 5]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_kills_ffmpeg(self, fake_ffmpeg, video, monkeypatch):
+        monkeypatch.setenv("FAKE_FFMPEG_SLEEP", "10")
+        task = asyncio.ensure_future(aextract_keyframes(video))
+        await asyncio.sleep(0.2)
+        start = asyncio.get_running_loop().time()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert asyncio.get_running_loop().time() - start < 5
+
+
+class TestVideoProxy:
+    @pytest.mark.unit
+    def test_proxy_file(self, fake_ffmpeg, video):
+        proxy = video_proxy(video)
+        try:
+            assert proxy.endswith(".mp4")
+            assert open(proxy, "rb").read() == b"video"
+        finally:
+            os.remove(proxy)
+
+    @pytest.mark.unit
+    def test_removed_on_error(self, fake_ffmpeg, tmp_path, monkeypatch):
+        monkeypatch.setattr(video_keyframes.tempfile, "tempdir", str(tmp_path))
+        path = tmp_path / "invalid.mp4"
+        path.write_bytes(b"invalid")
+        with pytest.raises(ProviderException):
+            video_proxy(str(path))
+        assert sorted(os.listdir(tmp_path)) == ["ffmpeg", "invalid.mp4"]
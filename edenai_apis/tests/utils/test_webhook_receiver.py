@@ -0,0 +1,274 @@
+import asyncio
+
+import httpx
+import pytest
+
+from edenai_apis.apis.sightengine import sightengine_api
+from edenai_apis.apis.sightengine.sightengine_api import (
+    SightEngineApi,
+    sightengine_job_id,
+)
+from edenai_apis.utils.job_store import JobStatus, SQLiteJobStore, set_job_store
+from edenai_apis.utils.webhook_receiver import (
+    PollingChannel,
+    WebhookReceiver,
+    default_job_id_extractor,
+    set_webhook_receiver,
+    webhook_receiver,
+)
+
+
+class TestDefaultJobIdExtractor:
+    @pytest.mark.unit
+    def test_top_level_key(self):
+        assert default_job_id_extractor({"job_id": "abc"}) == "abc"
+
+    @pytest.mark.unit
+    def test_nested_id(self):
+        assert default_job_id_extractor({"media": {"id": "med-1"}}) == "med-1"
+
+    @pytest.mark.unit
+    def test_not_found(self):
+        assert default_job_id_extractor({"status": "done"}) is None
+        assert default_job_id_extractor("raw text") is None
+
+
+@pytest.mark.asyncio
+class TestWebhookReceiver:
+    @pytest.mark.unit
+    async def test_callback_on_job_path_completes_waiter(self):
+        async with WebhookReceiver() as receiver:
+            waiter = asyncio.create_task(
+                receiver.wait_for_result("job-1", max_time=5)
+            )
+            await asyncio.sleep(0)
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    receiver.callback_url("job-1"), json={"status": "done"}
+                )
+            assert response.status_code == 200
+            assert await waiter == {"status": "done"}
+
+    @pytest.mark.unit
+    async def test_callback_routed_by_body(self):
+        async with WebhookReceiver() as receiver:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(
+                    receiver.callback_url(), json={"provider_job_id": "job-2", "ok": 1}
+                )
+            assert response.status_code == 200
+            # callback received before anyone waited on it
+            result = await receiver.wait_for_result("job-2", max_time=1)
+            assert result == {"provider_job_id": "job-2", "ok": 1}
+
+    @pytest.mark.unit
+    async def test_unroutable_callbacks_are_rejected(self):
+        async with WebhookReceiver() as receiver:
+            async with httpx.AsyncClient() as client:
+                no_job = await client.post(receiver.callback_url(), json={"a": 1})
+                wrong_path = await client.post(f"{receiver.base_url}/other", json={})
+                wrong_method = await client.get(receiver.callback_url("job"))
+            assert no_job.status_code == 400
+            assert wrong_path.status_code == 404
+            assert wrong_method.status_code == 405
+
+    @pytest.mark.unit
+    async def test_unsigned_or_unknown_callbacks_are_rejected(self):
+        async with WebhookReceiver(secret=b"secret", result_ttl=1) as receiver:
+            url = receiver.callback_url("job-6")
+            launch_url = receiver.callback_url()
+            async with httpx.AsyncClient() as client:
+                unsigned = await client.post(url.split("?")[0], json={})
+                forged = await client.post(
+                    receiver.callback_url("job-6").replace("job-6", "job-7"), json={}
+                )
+                once = await client.post(launch_url, json={"job_id": "job-8"})
+                twice = await client.post(launch_url, json={"job_id": "job-9"})
+                job_url = receiver.callback_url("job-10")
+                accepted = await client.post(job_url, json={})
+                replayed = await client.post(job_url, json={})
+                await asyncio.sleep(1.1)
+                expired = await client.post(url, json={})
+            assert unsigned.status_code == 403
+            assert forged.status_code == 403
+            assert once.status_code == 200
+            assert twice.status_code == 404
+            assert accepted.status_code == 200
+            assert replayed.status_code == 404
+            assert expired.status_code == 404
+
+    @pytest.mark.unit
+    async def test_unclaimed_results_are_bounded(self):
+        async with WebhookReceiver(max_pending=2) as receiver:
+            for job_id in ("a", "b", "c"):
+                receiver.complete(job_id, job_id)
+            assert list(receiver._received) == ["b", "c"]
+
+    @pytest.mark.unit
+    async def test_fallback_to_polling_when_no_callback(self):
+        calls = []
+
+        async def poll():
+            calls.append(1)
+            return {"polled": True} if len(calls) == 2 else None
+
+        async with WebhookReceiver() as receiver:
+            result = await receiver.wait_for_result(
+                "job-3", callback_timeout=0.05, poll=poll, poll_interval=0.01, max_time=5
+            )
+        assert result == {"polled": True}
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    async def test_late_callback_wins_over_polling(self):
+        async def poll():
+            return None
+
+        async with WebhookReceiver() as receiver:
+            waiter = asyncio.create_task(
+                receiver.wait_for_result(
+                    "job-4", callback_timeout=0, poll=poll, poll_interval=1, max_time=5
+                )
+            )
+            await asyncio.sleep(0.05)
+            async with httpx.AsyncClient() as client:
+                await client.post(receiver.callback_url("job-4"), json={"late": True})
+            assert await asyncio.wait_for(waiter, 0.5) == {"late": True}
+
+    @pytest.mark.unit
+    async def test_timeout_without_callback_nor_poll(self):
+        async with WebhookReceiver() as receiver:
+            with pytest.raises(asyncio.TimeoutError):
+                await receiver.wait_for_result("job-5", max_time=0.05)
+            assert "job-5" not in receiver._waiters
+
+    @pytest.mark.unit
+    async def test_callbacks_written_to_job_store(self):
+        store = SQLiteJobStore(":memory:")
+        async with WebhookReceiver(
+            job_store=store, provider_name="sightengine"
+        ) as receiver:
+            async with httpx.AsyncClient() as client:
+                await client.post(receiver.callback_url(), json={"media": {"id": "m"}})
+        state = store.get("sightengine", "m")
+        assert state.status == JobStatus.SUCCEEDED
+        assert state.result == {"media": {"id": "m"}}
+
+    @pytest.mark.unit
+    async def test_registered_receiver(self):
+        store = SQLiteJobStore(":memory:")
+        receiver = WebhookReceiver(job_store=store, provider_name="sightengine")
+        with pytest.raises(ValueError):
+            set_webhook_receiver("sightengine", WebhookReceiver())
+        with pytest.raises(ValueError):
+            set_webhook_receiver("amazon", receiver)
+        set_webhook_receiver("sightengine", receiver)
+        try:
+            # not listening yet
+            assert webhook_receiver("sightengine") is None
+            async with receiver:
+                assert webhook_receiver("sightengine") is receiver
+        finally:
+            set_webhook_receiver("sightengine", None)
+        assert webhook_receiver("sightengine") is None
+
+
+@pytest.mark.asyncio
+class TestSightengineCallbacks:
+    @pytest.fixture
+    def api(self, monkeypatch):
+        api = SightEngineApi.__new__(SightEngineApi)
+        api.api_settings = {"api_user": "user", "api_key": "key"}
+        api.api_url = "https://api.sightengine.com/1.0"
+        api.webhook_settings = {"webhook_token": "token"}
+        api.webhook_url = "https://webhook.site/token"
+        launched = []
+
+        class Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"media": {"id": "med-1"}}
+
+        def request(method, url, params=None, **kwargs):
+            launched.append(params)
+            return Response()
+
+        def check_webhook_result(*args):
+            raise AssertionError("webhook.site polled")
+
+        monkeypatch.setattr(sightengine_api.requests, "request", request)
+        monkeypatch.setattr(
+            sightengine_api, "check_webhook_result", check_webhook_result
+        )
+        api.launched = launched
+        return api
+
+    @pytest.mark.unit
+    async def test_job_completed_by_callback(self, api):
+        store = SQLiteJobStore(":memory:")
+        set_job_store(store)
+        receiver = WebhookReceiver(
+            job_store=store,
+            provider_name="sightengine",
+            job_id_extractor=sightengine_job_id,
+        )
+        set_webhook_receiver("sightengine", receiver)
+        try:
+            async with receiver:
+                job = api.video__deepfake_detection_async__launch_job(
+                    file="", file_url="https://example.com/video.mp4"
+                )
+                assert job.provider_job_id == "med-1"
+                callback_url = api.launched[0]["callback_url"]
+                assert callback_url.startswith(receiver.base_url)
+
+                pending = api.video__deepfake_detection_async__get_job_result("med-1")
+                assert pending.status == "pending"
+
+                async with httpx.AsyncClient() as client:
+                    response = await client.post(
+                        callback_url,
+                        json={
+                            "request": {"id": "req-1"},
+                            "media": {"id": "med-1"},
+                            "data": {
+                                "frames": [
+                                    {"info": {"position": 0}, "type": {"deepfake": 0.9}}
+                                ]
+                            },
+                        },
+                    )
+                assert response.status_code == 200
+
+            result = api.video__deepfake_detection_async__get_job_result("med-1")
+            assert result.status == "succeeded"
+            assert result.standardized_response.average_score == 0.9
+        finally:
+            set_webhook_receiver("sightengine", None)
+            set_job_store(None)
+
+
+@pytest.mark.asyncio
+class TestPollingChannel:
+    @pytest.mark.unit
+    async def test_polls_until_result(self):
+        results = iter([None, None, "done"])
+
+        async def poll():
+            return next(results)
+
+        channel = PollingChannel()
+        assert channel.callback_url("job") is None
+        assert await channel.wait_for_result("job", poll=poll, poll_interval=0) == "done"
+
+    @pytest.mark.unit
+    async def test_timeout(self):
+        async def poll():
+            return None
+
+        with pytest.raises(asyncio.TimeoutError):
+            await PollingChannel().wait_for_result(
+                "job", poll=poll, poll_interval=0.01, max_time=0.05
+            )
@@ -1,14 +1,16 @@
+import asyncio
 from io import BufferedReader
 from typing import Union, List, Dict
 
 from pydub import AudioSegment
-from pydub.utils import mediainfo
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.audio_transcoder import atranscode_audio, transcode_audio
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.files import FileWrapper
 from edenai_apis.utils.languages import provide_appropriate_language
+from edenai_apis.utils.media_probe import mediainfo
 
 VOICE_EXCEPTION_MESSAGE = "Wrong voice id"
 SSML_TAG_EXCEPTION_MESSAGE = (
@@ -38,6 +40,9 @@ def audio_converter(
     """Convert an audio file in a given format.
     Format for destination audio file. ('mp3', 'wav', 'raw', 'ogg' or other ffmpeg/avconv supported files)
 
+    The audio is streamed through ffmpeg (see `utils.audio_transcoder`) instead of being
+    decoded in memory.
+
     Args:
         audio_file (BufferedReader): The audio file to be converted, in the form of a BufferedReader object.
         export_format (str, optional): The format of the exported audio file. Defaults to "wav".
@@ -48,10 +53,19 @@ def audio_converter(
         Tuple with new audio format, frame_rate, frame_width and the number of channels in audio
     """
     file_extension = audio_file.name.split(".")[-1]
+    try:
+        return transcode_audio(
+            audio_file, export_format, frame_rate, channels, input_format=file_extension
+        ).as_tuple()
+    except FileNotFoundError:
+        # no ffmpeg binary, pydub still handles wav files by itself
+        audio_file.seek(0)
+        return _pydub_converter(
+            audio_file, file_extension, export_format, frame_rate, channels
+        )
 
-    # if file_extension not in AUDIO_FILE_FORMAT:
-    #     return None
 
+def _pydub_converter(audio_file, file_extension, export_format, frame_rate, channels):
     audio_out: AudioSegment = AudioSegment.from_file(audio_file, format=file_extension)
 
     if frame_rate:
@@ -68,6 +82,26 @@ def audio_converter(
     )
 
 
+async def aaudio_converter(
+    audio_file: BufferedReader,
+    export_format: str = "wav",
+    frame_rate: Union[int, None] = None,
+    channels: Union[int, None] = None,
+):
+    """Async version of `audio_converter`, the event loop is not blocked while converting"""
+    file_extension = audio_file.name.split(".")[-1]
+    try:
+        result = await atranscode_audio(
+            audio_file, export_format, frame_rate, channels, input_format=file_extension
+        )
+    except FileNotFoundError:
+        audio_file.seek(0)
+        return await asyncio.to_thread(
+            _pydub_converter, audio_file, file_extension, export_format, frame_rate, channels
+        )
+    return result.as_tuple()
+
+
 def get_audio_attributes(audio_file: BufferedReader):
     file_features = mediainfo(audio_file.name)
     return int(file_features.get("channels", "1")), int(
@@ -0,0 +1,340 @@
+"""
+Streaming audio transcoding with ffmpeg.
+
+Audio is piped through an ffmpeg process instead of being decoded in memory with pydub
+(`AudioSegment.from_file` holds the whole decoded PCM, ~600 MB for an hour of stereo
+44.1 kHz audio):
+    - the input is read from its path by ffmpeg, or fed to its stdin in small chunks,
+    - the output is read from its stdout into a spooled temporary file, kept in memory
+      while small and moved to disk past `SPOOL_SIZE`,
+    - every transcoding runs on one shared pool of `MAX_TRANSCODERS` workers
+      (`EDENAI_TRANSCODER_WORKERS`), which bounds the number of ffmpeg processes for the
+      sync and async front-ends together,
+    - `atranscode_audio` never blocks the event loop: pipes and output file are handled
+      by the worker, cancelling the call kills ffmpeg.
+
+Usage:
+    result = await atranscode_audio(audio_file, "wav", frame_rate=16000, channels=1)
+    result.file, result.frame_rate, result.frame_width, result.channels
+"""
+
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import IO, List, Optional, Tuple, Union
+
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.media_probe import PROBE_SIZE, probe
+
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+MAX_TRANSCODERS = int(os.environ.get("EDENAI_TRANSCODER_WORKERS", os.cpu_count() or 2))
+IO_CHUNK_SIZE = 256 * 1024
+SPOOL_SIZE = 16 * 1024 * 1024
+SAMPLE_WIDTH = 2  # ffmpeg writes 16 bits pcm, as pydub exports decoded audio
+
+# containers that can't be demuxed from a pipe (index at the end of the file)
+_SEEKABLE_INPUTS = {"mp4", "m4a", "mov", "3gp", "m4b"}
+# ffmpeg muxer and options of export formats not named like their muxer
+_MUXERS = {
+    "raw": ["-f", "s16le"],
+    "pcm": ["-f", "s16le"],
+    "wav": ["-f", "wav", "-c:a", "pcm_s16le"],
+    "m4a": ["-f", "ipod", "-movflags", "frag_keyframe+empty_moov"],
+    "mp4": ["-f", "mp4", "-movflags", "frag_keyframe+empty_moov"],
+    "aac": ["-f", "adts"],
+    "wma": ["-f", "asf"],
+    "mka": ["-f", "matroska"],
+}
+
+AudioInput = Union[str, IO[bytes]]
+
+# every transcoding (sync or async) runs on this pool, its size bounds the number of
+# ffmpeg processes and keeps the pipes and the output file off the event loop
+_pool = ThreadPoolExecutor(max_workers=MAX_TRANSCODERS, thread_name_prefix="transcoder")
+
+
+@dataclass
+class TranscodeResult:
+    """Transcoded audio, `file` is positioned at its start"""
+
+    file: IO[bytes]
+    frame_rate: Optional[int]
+    frame_width: Optional[int]
+    channels: Optional[int]
+
+    def as_tuple(self) -> Tuple[IO[bytes], Optional[int], Optional[int], Optional[int]]:
+        return self.file, self.frame_rate, self.frame_width, self.channels
+
+
+def _input_path(audio_file: AudioInput) -> Optional[str]:
+    if isinstance(audio_file, str):
+        return audio_file
+    name = getattr(audio_file, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name
+    return None
+
+
+def _ffmpeg_command(
+    input_path: Optional[str],
+    export_format: str,
+    frame_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
+) -> List[str]:
+    command = [FFMPEG, "-hide_banner", "-loglevel", "error"]
+    # input options: only the [start, start + duration] range is decoded
+    if start:
+        command += ["-ss", f"{start:.3f}"]
+    if duration is not None:
+        command += ["-t", f"{duration:.3f}"]
+    if input_path is None:
+        command += ["-i", "pipe:0"]
+    else:
+        command += ["-nostdin", "-i", input_path]
+    command += ["-vn"]
+    if frame_rate:
+        command += ["-ar", str(frame_rate)]
+    if channels:
+        command += ["-ac", str(channels)]
+    command += _MUXERS.get(export_format, ["-f", export_format])
+    return command + ["pipe:1"]
+
+
+def _output_properties(
+    head: bytes, frame_rate: Optional[int], channels: Optional[int]
+) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Frame rate, frame width and channels of the output, probed from its first bytes"""
+    if frame_rate is None or channels is None:
+        info = probe(head)
+        if info is not None:
+            frame_rate = frame_rate or info.sample_rate
+            channels = channels or info.channels
+    frame_width = SAMPLE_WIDTH * channels if channels else None
+    return frame_rate, frame_width, channels
+
+
+def _prepare(
+    audio_file: AudioInput, input_format: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    """(input path, temporary copy to remove) of an input, no path if it is piped"""
+    input_path = _input_path(audio_file)
+    if input_path is not None:
+        return input_path, None
+    if input_format in _SEEKABLE_INPUTS:
+        # these containers need random access, copy them to a file instead of piping
+        with tempfile.NamedTemporaryFile(suffix=f".{input_format}", delete=False) as copy:
+            shutil.copyfileobj(audio_file, copy, IO_CHUNK_SIZE)
+        return copy.name, copy.name
+    return None, None
+
+
+def _finalize(
+    output: IO[bytes],
+    export_format: str,
+    frame_rate: Optional[int],
+    channels: Optional[int],
+) -> TranscodeResult:
+    output.seek(0)
+    head = output.read(PROBE_SIZE)
+    if export_format == "wav":
+        _fix_wav_sizes(output, head)
+    output.seek(0)
+    return TranscodeResult(output, *_output_properties(head, frame_rate, channels))
+
+
+def _fix_wav_sizes(output: IO[bytes], head: bytes) -> None:
+    """ffmpeg can't seek back in a pipe to write the sizes of the wav header, write them"""
+    data_offset = head.find(b"data", 12)
+    if head[:4] != b"RIFF" or data_offset < 0:
+        return
+    size = output.seek(0, os.SEEK_END)
+    output.seek(4)
+    output.write(min(size - 8, 0xFFFFFFFF).to_bytes(4, "little"))
+    output.seek(data_offset + 4)
+    output.write(min(size - data_offset - 8, 0xFFFFFFFF).to_bytes(4, "little"))
+
+
+def _error(returncode: int, stderr: bytes) -> ProviderException:
+    message = stderr.decode("utf-8", errors="replace").strip().splitlines()
+    return ProviderException(
+        f"Audio transcoding failed (ffmpeg returned {returncode}): "
+        f"{message[-1] if message else 'no output'}",
+        code=400,
+    )
+
+
+class _TranscodeJob:
+    """ffmpeg process of a transcoding, killed if the job is cancelled"""
+
+    def __init__(self) -> None:
+        self.process: Optional[subprocess.Popen] = None
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def start(self, command: List[str], piped: bool) -> subprocess.Popen:
+        with self._lock:
+            if self.cancelled:
+                raise ProviderException("Audio transcoding cancelled")
+            self.process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE if piped else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            return self.process
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
+
+
+def _run(
+    job: _TranscodeJob,
+    audio_file: AudioInput,
+    export_format: str,
+    frame_rate: Optional[int],
+    channels: Optional[int],
+    input_format: Optional[str],
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
+) -> TranscodeResult:
+    """Run ffmpeg on a worker of the pool, every file operation happens here"""
+    export_format = export_format.lower()
+    input_path, temporary = _prepare(audio_file, input_format)
+    command = _ffmpeg_command(
+        input_path, export_format, frame_rate, channels, start, duration
+    )
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    stderr_chunks: List[bytes] = []
+    try:
+        process = job.start(command, piped=input_path is None)
+
+        def feed() -> None:
+            try:
+                for chunk in iter(lambda: audio_file.read(IO_CHUNK_SIZE), b""):
+                    process.stdin.write(chunk)
+            except (BrokenPipeError, ValueError):
+                # ffmpeg stopped reading, its exit code tells why
+                pass
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        threads = [
+            threading.Thread(
+                target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+            )
+        ]
+        if input_path is None:
+            threads.append(threading.Thread(target=feed, daemon=True))
+        for thread in threads:
+            thread.start()
+        try:
+            for chunk in iter(lambda: process.stdout.read(IO_CHUNK_SIZE), b""):
+                output.write(chunk)
+            returncode = process.wait()
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            for thread in threads:
+                thread.join()
+        if job.cancelled:
+            raise ProviderException("Audio transcoding cancelled")
+        if returncode != 0:
+            raise _error(returncode, b"".join(stderr_chunks))
+        return _finalize(output, export_format, frame_rate, channels)
+    except BaseException:
+        output.close()
+        raise
+    finally:
+        if temporary:
+            os.remove(temporary)
+
+
+def transcode_audio(
+    audio_file: AudioInput,
+    export_format: str = "wav",
+    frame_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    input_format: Optional[str] = None,
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
+) -> TranscodeResult:
+    """Convert an audio file with a streaming ffmpeg process.
+
+    Args:
+        audio_file: Path or binary file object of the audio to convert
+        export_format: Format of the converted audio ('mp3', 'wav', 'raw', 'ogg' or any
+            ffmpeg muxer). Defaults to "wav"
+        frame_rate: Frame rate of the converted audio, defaults to the input's
+        channels: Number of channels of the converted audio, defaults to the input's
+        input_format: Extension of the input, file objects of containers that can't be
+            read from a pipe (mp4, m4a...) are copied to a temporary file
+        start: Offset in seconds of the part of the input to convert, defaults to 0
+        duration: Duration in seconds of the part to convert, defaults to the rest
+
+    Returns:
+        TranscodeResult with the converted file, its frame rate, frame width and channels
+    """
+    job = _TranscodeJob()
+    future = _pool.submit(
+        _run,
+        job,
+        audio_file,
+        export_format,
+        frame_rate,
+        channels,
+        input_format,
+        start,
+        duration,
+    )
+    try:
+        return future.result()
+    except BaseException:
+        # eg: KeyboardInterrupt while waiting
+        job.cancel()
+        raise
+
+
+async def atranscode_audio(
+    audio_file: AudioInput,
+    export_format: str = "wav",
+    frame_rate: Optional[int] = None,
+    channels: Optional[int] = None,
+    input_format: Optional[str] = None,
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
+) -> TranscodeResult:
+    """Async version of `transcode_audio`, ffmpeg is killed if the call is cancelled"""
+    job = _TranscodeJob()
+    future = asyncio.wrap_future(
+        _pool.submit(
+            _run,
+            job,
+            audio_file,
+            export_format,
+            frame_rate,
+            channels,
+            input_format,
+            start,
+            duration,
+        )
+    )
+    try:
+        return await future
+    except asyncio.CancelledError:
+        # a queued job is dropped by the pool, a running one is killed
+        job.cancel()
+        raise
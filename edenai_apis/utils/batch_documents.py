@@ -0,0 +1,198 @@
+"""
+Analysis of many documents with as few provider requests as possible.
+
+    - documents are split, in order, into chunks of at most `max_documents`
+      documents (the limit of one batch request of the provider),
+    - empty documents and documents over the size limit of the provider are not
+      sent, they get an error,
+    - chunks are sent concurrently, at most `max_concurrency` at once,
+    - a failed chunk fails its documents only, the other results are kept. When
+      every chunk failed (eg: invalid credentials) the first error is raised.
+
+Usage:
+    def analyze_chunk(texts: List[str]) -> Tuple[List[Union[T, Exception]], Any]:
+        response = call_provider(texts)
+        return [standardize(document) for document in response], response
+
+    result = batch_documents(texts, analyze_chunk, DocumentLimits(25, 5000))
+    result.items, result.original_response
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.types import BatchDocumentItem
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+# results of a chunk, in order, an exception for a document the provider failed on
+ChunkAnalysis = Tuple[List[Union[Any, Exception]], Any]
+
+
+@dataclass(frozen=True)
+class DocumentLimits:
+    """Limits of one batch request of a provider"""
+
+    max_documents: int
+    max_document_bytes: Optional[int] = None  # utf-8 encoded
+    max_document_characters: Optional[int] = None
+
+
+@dataclass
+class BatchDocumentsResult:
+    items: List[BatchDocumentItem]
+    original_response: Dict[str, Any]
+
+
+def _document_error(text: str, limits: DocumentLimits) -> Optional[str]:
+    if not text.strip():
+        return "Document is empty"
+    if (
+        limits.max_document_characters is not None
+        and len(text) > limits.max_document_characters
+    ):
+        return f"Document exceeds {limits.max_document_characters} characters"
+    if (
+        limits.max_document_bytes is not None
+        and len(text.encode("utf-8")) > limits.max_document_bytes
+    ):
+        return f"Document exceeds {limits.max_document_bytes} bytes"
+    return None
+
+
+class _Batch:
+    """Documents of a batch, split into the chunks to send"""
+
+    def __init__(self, texts: Sequence[str], limits: DocumentLimits) -> None:
+        self.items: List[Optional[BatchDocumentItem]] = [None] * len(texts)
+        self.chunks: List[List[int]] = []
+        chunk: List[int] = []
+        for index, text in enumerate(texts):
+            error = _document_error(text, limits)
+            if error:
+                self.items[index] = BatchDocumentItem(
+                    index=index, status="fail", error=error
+                )
+                continue
+            if len(chunk) >= limits.max_documents:
+                self.chunks.append(chunk)
+                chunk = []
+            chunk.append(index)
+        if chunk:
+            self.chunks.append(chunk)
+
+    def result(
+        self, outcomes: List[Union[ChunkAnalysis, BaseException]]
+    ) -> BatchDocumentsResult:
+        failures = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if failures and len(failures) == len(outcomes):
+            raise failures[0]
+        responses = []
+        for indexes, outcome in zip(self.chunks, outcomes):
+            if isinstance(outcome, Exception):
+                results = [outcome] * len(indexes)
+            else:
+                results, response = outcome
+                responses.append(response)
+                if len(results) != len(indexes):
+                    error = ProviderException(
+                        f"Provider returned {len(results)} results "
+                        f"for {len(indexes)} documents"
+                    )
+                    results = [error] * len(indexes)
+            for index, result in zip(indexes, results):
+                if isinstance(result, Exception):
+                    item = BatchDocumentItem(
+                        index=index, status="fail", error=str(result)
+                    )
+                else:
+                    item = BatchDocumentItem(
+                        index=index, status="success", result=result
+                    )
+                self.items[index] = item
+        return BatchDocumentsResult(
+            items=self.items, original_response={"responses": responses}
+        )
+
+
+def _analyze(
+    analyze_chunk: Callable[[List[str]], ChunkAnalysis], texts: List[str]
+) -> Union[ChunkAnalysis, Exception]:
+    try:
+        return analyze_chunk(texts)
+    except Exception as exc:
+        return exc
+
+
+def batch_documents(
+    texts: Sequence[str],
+    analyze_chunk: Callable[[List[str]], ChunkAnalysis],
+    limits: DocumentLimits,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> BatchDocumentsResult:
+    """Analyze documents by concurrent chunks, with an outcome per document.
+
+    Args:
+        texts: Documents to analyze
+        analyze_chunk: Analyzes a chunk of documents in one request, returns the
+            standardized result (or the error) of each document in order, and the
+            provider response
+        limits: Documents and size limits of one request
+        max_concurrency: Maximum number of requests sent at once
+
+    Returns:
+        BatchDocumentsResult: one item per document in the order of `texts`, and the
+        responses of the successful requests
+    """
+    batch = _Batch(texts, limits)
+    chunks = [[texts[index] for index in indexes] for indexes in batch.chunks]
+    if len(chunks) <= 1:
+        return batch.result([_analyze(analyze_chunk, chunk) for chunk in chunks])
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        outcomes = list(
+            executor.map(lambda chunk: _analyze(analyze_chunk, chunk), chunks)
+        )
+    return batch.result(outcomes)
+
+
+async def abatch_documents(
+    texts: Sequence[str],
+    analyze_chunk: Callable[[List[str]], Awaitable[ChunkAnalysis]],
+    limits: DocumentLimits,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> BatchDocumentsResult:
+    """Async version of `batch_documents`, `analyze_chunk` is a coroutine function"""
+    batch = _Batch(texts, limits)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(indexes: List[int]) -> ChunkAnalysis:
+        async with semaphore:
+            return await analyze_chunk([texts[index] for index in indexes])
+
+    tasks = [asyncio.ensure_future(send(indexes)) for indexes in batch.chunks]
+    try:
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    except BaseException:
+        # cancelled: don't leave chunks running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+            raise outcome
+    return batch.result(list(outcomes))
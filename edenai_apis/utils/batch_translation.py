@@ -0,0 +1,296 @@
+"""
+Translation of many segments with as few provider requests as possible.
+
+    - segments are packed, in order, into requests holding at most `max_segments`
+      segments and `max_characters` characters (the limits of each provider API),
+    - packs are sent concurrently, at most `max_concurrency` at once,
+    - a translation memory keyed by (provider, model, source, target, normalized text)
+      serves segments already translated, repeated segments of a batch are only sent
+      once. Its size is bounded by `EDENAI_TRANSLATION_MEMORY_SIZE` (0 disables it).
+
+Usage:
+    def translate_pack(texts: List[str]) -> Tuple[List[str], Any]:
+        response = call_provider(texts)
+        return [item["text"] for item in response], response
+
+    result = batch_translate(
+        "deepl", None, "fr", "en", texts, translate_pack, BatchLimits(50, 30000)
+    )
+    result.texts, result.original_response
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from edenai_apis.utils.exception import ProviderException
+
+TRANSLATION_MEMORY_SIZE = int(
+    os.environ.get("EDENAI_TRANSLATION_MEMORY_SIZE", 100_000)
+)
+DEFAULT_MAX_CONCURRENCY = 4
+
+_WHITESPACES = re.compile(r"\s+")
+
+PackTranslation = Tuple[List[str], Any]
+
+
+@dataclass(frozen=True)
+class BatchLimits:
+    """Limits of one translation request of a provider"""
+
+    max_segments: int
+    max_characters: int
+
+
+@dataclass
+class BatchTranslationResult:
+    texts: List[str]
+    original_response: Dict[str, Any]
+
+
+class TranslationMemory:
+    """Thread-safe LRU memory of segment translations"""
+
+    def __init__(self, max_entries: int = TRANSLATION_MEMORY_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            translation = self._entries.get(key)
+            if translation is not None:
+                self._entries.move_to_end(key)
+            return translation
+
+    def put(self, key: str, translation: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = translation
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+translation_memory = TranslationMemory()
+
+
+def normalize_segment(text: str) -> str:
+    """Unicode (NFC) and whitespace normalized segment"""
+    return _WHITESPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def memory_key(
+    provider_name: str,
+    model: Optional[str],
+    source_language: Optional[str],
+    target_language: str,
+    text: str,
+) -> str:
+    identity = json.dumps(
+        [
+            provider_name,
+            model,
+            source_language,
+            target_language,
+            normalize_segment(text),
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def pack_segments(texts: Sequence[str], limits: BatchLimits) -> List[List[str]]:
+    """
+    Consecutive packs of segments within the limits of a request. A segment longer than
+    `max_characters` is sent alone, the provider tells if it is too long.
+    """
+    packs: List[List[str]] = []
+    pack: List[str] = []
+    characters = 0
+    for text in texts:
+        if pack and (
+            len(pack) >= limits.max_segments
+            or characters + len(text) > limits.max_characters
+        ):
+            packs.append(pack)
+            pack, characters = [], 0
+        pack.append(text)
+        characters += len(text)
+    if pack:
+        packs.append(pack)
+    return packs
+
+
+class _Batch:
+    """Segments of a batch left to translate once the memory is looked up"""
+
+    def __init__(
+        self,
+        provider_name: str,
+        model: Optional[str],
+        source_language: Optional[str],
+        target_language: str,
+        texts: Sequence[str],
+        memory: TranslationMemory,
+    ) -> None:
+        self.memory = memory
+        self.translations: List[Optional[str]] = [None] * len(texts)
+        # positions of every segment to translate, by memory key
+        self.pending: Dict[str, List[int]] = {}
+        self.pending_texts: List[str] = []
+        self.from_memory = 0
+        for index, text in enumerate(texts):
+            if not text.strip():
+                # nothing to translate, some APIs reject empty segments
+                self.translations[index] = text
+                continue
+            key = memory_key(
+                provider_name, model, source_language, target_language, text
+            )
+            translation = memory.get(key)
+            if translation is not None:
+                self.translations[index] = translation
+                self.from_memory += 1
+            elif key in self.pending:
+                self.pending[key].append(index)
+            else:
+                self.pending[key] = [index]
+                self.pending_texts.append(text)
+
+    def result(self, outcomes: List[PackTranslation]) -> BatchTranslationResult:
+        translated = [text for texts, _ in outcomes for text in texts]
+        if len(translated) != len(self.pending):
+            raise ProviderException(
+                f"Provider returned {len(translated)} translations "
+                f"for {len(self.pending)} segments"
+            )
+        for (key, indexes), translation in zip(self.pending.items(), translated):
+            self.memory.put(key, translation)
+            for index in indexes:
+                self.translations[index] = translation
+        return BatchTranslationResult(
+            texts=self.translations,
+            original_response={
+                "responses": [response for _, response in outcomes],
+                "from_memory": self.from_memory,
+            },
+        )
+
+
+def batch_translate(
+    provider_name: str,
+    model: Optional[str],
+    source_language: Optional[str],
+    target_language: str,
+    texts: Sequence[str],
+    translate_pack: Callable[[List[str]], PackTranslation],
+    limits: BatchLimits,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    memory: Optional[TranslationMemory] = None,
+) -> BatchTranslationResult:
+    """Translate segments by concurrent packs, with a translation memory.
+
+    Args:
+        provider_name: Provider, part of the memory key
+        model: Model, part of the memory key
+        source_language: Language of the segments, part of the memory key
+        target_language: Language of the translations, part of the memory key
+        texts: Segments to translate
+        translate_pack: Translates a pack of segments in one request, returns the
+            translations in order and the provider response
+        limits: Segments and characters limits of one request
+        max_concurrency: Maximum number of requests sent at once
+        memory: Translation memory, defaults to the process one
+
+    Returns:
+        BatchTranslationResult: translations in the order of `texts`, and the provider
+        responses with the number of segments served by the memory
+    """
+    batch = _Batch(
+        provider_name,
+        model,
+        source_language,
+        target_language,
+        texts,
+        translation_memory if memory is None else memory,
+    )
+    packs = pack_segments(batch.pending_texts, limits)
+    if len(packs) <= 1:
+        return batch.result([translate_pack(pack) for pack in packs])
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [executor.submit(translate_pack, pack) for pack in packs]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        if any(future.exception() for future in done):
+            # don't send the packs still queued
+            for future in futures:
+                future.cancel()
+        outcomes = [future.result() for future in futures]
+    return batch.result(outcomes)
+
+
+async def abatch_translate(
+    provider_name: str,
+    model: Optional[str],
+    source_language: Optional[str],
+    target_language: str,
+    texts: Sequence[str],
+    translate_pack: Callable[[List[str]], Awaitable[PackTranslation]],
+    limits: BatchLimits,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    memory: Optional[TranslationMemory] = None,
+) -> BatchTranslationResult:
+    """Async version of `batch_translate`, `translate_pack` is a coroutine function"""
+    batch = _Batch(
+        provider_name,
+        model,
+        source_language,
+        target_language,
+        texts,
+        translation_memory if memory is None else memory,
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def send(pack: List[str]) -> PackTranslation:
+        async with semaphore:
+            return await translate_pack(pack)
+
+    tasks = [
+        asyncio.ensure_future(send(pack))
+        for pack in pack_segments(batch.pending_texts, limits)
+    ]
+    try:
+        outcomes = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return batch.result(list(outcomes))
@@ -0,0 +1,250 @@
+"""
+Run one provider call per entry of a dataset (directory or manifest of files).
+
+Dataset imports (automl samples, face collections...) are made of thousands of
+independent calls:
+    - a dataset is a directory, a CSV manifest or pairs of (file, label), read lazily,
+    - calls run concurrently, at most `max_concurrency` at once, and only a bounded
+      window of entries is read ahead, whatever the size of the dataset,
+    - throttled and transient failures (429, 5xx by default) are retried with an
+      exponential backoff and jitter, other failures fail their entry only,
+    - results are yielded as they complete, `progress` is called after each of them.
+
+Usage:
+    for item in iter_bulk(load_dataset("photos/"), upload_sample, max_concurrency=8):
+        item.entry, item.status, item.result, item.error
+"""
+
+import csv
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from edenai_apis.utils.exception import ProviderException
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_RETRIES = 5
+RETRYABLE_CODES = frozenset({429, 500, 502, 503, 504})
+IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp"}
+)
+
+
+@dataclass(frozen=True)
+class DatasetEntry:
+    """A file of a dataset, `file` is a local path or an url"""
+
+    file: str
+    label: str
+
+    @property
+    def is_url(self) -> bool:
+        return self.file.startswith(("http://", "https://"))
+
+
+@dataclass(frozen=True)
+class BulkItem:
+    """Outcome of the call of one entry, `index` is its position in the dataset"""
+
+    index: int
+    entry: DatasetEntry
+    status: Literal["success", "fail"]
+    result: Any = None
+    error: Optional[str] = None
+    attempts: int = 1
+
+
+@dataclass
+class BulkProgress:
+    total: Optional[int] = None
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+
+    @property
+    def done(self) -> int:
+        return self.succeeded + self.failed
+
+
+@dataclass
+class BulkReport:
+    items: List[BulkItem] = field(default_factory=list)
+    progress: BulkProgress = field(default_factory=BulkProgress)
+
+    @property
+    def failed(self) -> List[BulkItem]:
+        return [item for item in self.items if item.status == "fail"]
+
+
+def _directory_entries(directory: str) -> Iterator[DatasetEntry]:
+    """
+    Images of `directory`: the label of an image is the name of its sub folder
+    (`<label>/<image>`), or its name without extension when directly in `directory`
+    """
+    for root, folders, files in os.walk(directory):
+        folders.sort()
+        relative_root = os.path.relpath(root, directory)
+        for name in sorted(files):
+            stem, extension = os.path.splitext(name)
+            if extension.lower() not in IMAGE_EXTENSIONS:
+                continue
+            label = stem if relative_root == "." else relative_root.split(os.sep)[0]
+            yield DatasetEntry(file=os.path.join(root, name), label=label)
+
+
+def _manifest_entries(manifest: str) -> Iterator[DatasetEntry]:
+    """
+    Rows of a CSV manifest `file,label`, with an optional header. Files are urls
+    (`https://`, `s3://`...) or paths, relative to the folder of the manifest
+    """
+    base = os.path.dirname(os.path.abspath(manifest))
+    with open(manifest, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.reader(f)):
+            if not row or not row[0].strip():
+                continue
+            if len(row) < 2:
+                raise ProviderException(
+                    f"Manifest line {line + 1}: expected file,label", code=400
+                )
+            file, label = row[0].strip(), row[1].strip()
+            if line == 0 and (file.lower(), label.lower()) == ("file", "label"):
+                continue
+            if "://" not in file:
+                file = os.path.join(base, file)
+            yield DatasetEntry(file=file, label=label)
+
+
+def load_dataset(
+    source: Union[str, Iterable[Union[DatasetEntry, Tuple[str, str]]]],
+) -> Iterator[DatasetEntry]:
+    """Entries of a directory, a CSV manifest, or of pairs of (file, label)"""
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            return _directory_entries(source)
+        if os.path.isfile(source):
+            return _manifest_entries(source)
+        raise ProviderException(f"Dataset {source} not found", code=400)
+    return (
+        entry if isinstance(entry, DatasetEntry) else DatasetEntry(*entry)
+        for entry in source
+    )
+
+
+def is_retryable_error(exc: Exception) -> bool:
+    return isinstance(exc, ProviderException) and exc.status_code in RETRYABLE_CODES
+
+
+def call_with_retry(
+    func: Callable[[], Any],
+    is_retryable: Callable[[Exception], bool] = is_retryable_error,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = 0.5,
+    backoff_max: float = 20.0,
+    on_retry: Optional[Callable[[], None]] = None,
+) -> Tuple[Any, int]:
+    """Result of `func` and how many times it was called"""
+    attempt = 1
+    while True:
+        try:
+            return func(), attempt
+        except Exception as exc:
+            if attempt > max_retries or not is_retryable(exc):
+                raise
+        # full jitter, concurrent callers throttled together don't retry together
+        time.sleep(random.uniform(0, min(backoff_max, backoff_factor * 2**attempt)))
+        attempt += 1
+        if on_retry is not None:
+            on_retry()
+
+
+def iter_bulk(
+    entries: Iterable[DatasetEntry],
+    call: Callable[[DatasetEntry], Any],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    is_retryable: Callable[[Exception], bool] = is_retryable_error,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    progress: Optional[Callable[[BulkProgress], None]] = None,
+    total: Optional[int] = None,
+) -> Iterator[BulkItem]:
+    """Call `call` for every entry, yield the items in completion order"""
+    state = BulkProgress(total=total)
+    lock = threading.Lock()
+
+    def count_retry() -> None:
+        with lock:
+            state.retries += 1
+
+    def run(entry: DatasetEntry) -> Tuple[Any, int]:
+        return call_with_retry(
+            lambda: call(entry), is_retryable, max_retries, on_retry=count_retry
+        )
+
+    entries = iter(entries)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        running: Dict[Future, Tuple[int, DatasetEntry]] = {}
+        index = 0
+        try:
+            while True:
+                # read ahead a bounded window of entries, not the whole dataset
+                while len(running) < 2 * max_concurrency:
+                    entry = next(entries, None)
+                    if entry is None:
+                        break
+                    running[executor.submit(run, entry)] = (index, entry)
+                    index += 1
+                if not running:
+                    return
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item_index, entry = running.pop(future)
+                    try:
+                        result, attempts = future.result()
+                    except Exception as exc:
+                        state.failed += 1
+                        item = BulkItem(item_index, entry, "fail", error=str(exc))
+                    else:
+                        state.succeeded += 1
+                        item = BulkItem(
+                            item_index, entry, "success", result, attempts=attempts
+                        )
+                    if progress is not None:
+                        progress(state)
+                    yield item
+        finally:
+            # stopped early by the caller, queued calls are dropped
+            for future in running:
+                future.cancel()
+
+
+def bulk_run(
+    entries: Iterable[DatasetEntry],
+    call: Callable[[DatasetEntry], Any],
+    **kwargs: Any,
+) -> BulkReport:
+    """`iter_bulk` collected in a report, items in dataset order"""
+    progress = kwargs.pop("progress", None)
+    report = BulkReport(progress=BulkProgress(total=kwargs.get("total")))
+
+    def track(state: BulkProgress) -> None:
+        report.progress = state
+        if progress is not None:
+            progress(state)
+
+    items = list(iter_bulk(entries, call, progress=track, **kwargs))
+    report.items = sorted(items, key=lambda item: item.index)
+    return report
@@ -0,0 +1,490 @@
+"""
+Parallel transcription of long audio files.
+
+The audio is split at silences into segments of at most `max_segment_duration` seconds
+(with ffmpeg, without decoding the file in memory),
+every segment is transcribed concurrently as its own `speech_to_text_async` job (with any
+provider), and the results are stitched back into a single `SpeechToTextAsyncDataClass`:
+    - timestamps are offset by the start of their segment,
+    - speaker labels, which are local to each segment, are reconciled across segments.
+
+Usage:
+    result = await atranscribe_long_audio("deepgram", args, max_segment_duration=600)
+"""
+
+import asyncio
+import mimetypes
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from edenai_apis import interface
+from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_dataclass import (
+    SpeechDiarization,
+    SpeechDiarizationEntry,
+    SpeechToTextAsyncDataClass,
+)
+from edenai_apis.utils.audio_transcoder import (
+    IO_CHUNK_SIZE,
+    SAMPLE_WIDTH,
+    TranscodeResult,
+    atranscode_audio,
+    transcode_audio,
+)
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.files import FileInfo, FileWrapper
+from edenai_apis.utils.types import AsyncResponseType
+from edenai_apis.utils.webhook_receiver import CompletionChannel, PollingChannel
+
+DEFAULT_MAX_SEGMENT_DURATION = 10 * 60  # seconds
+# silences are looked for in the last `search_window` seconds before a segment limit
+DEFAULT_SEARCH_WINDOW = 60
+DEFAULT_MIN_SILENCE_LEN = 300  # ms
+# frames quieter than the average loudness of the file minus this value are silent
+DEFAULT_SILENCE_OFFSET = 16  # dB
+FRAME_MS = 10
+DEFAULT_MAX_CONCURRENCY = 4
+
+# silences are detected on a mono 16 kHz decode of the file, streamed from ffmpeg
+ANALYSIS_FRAME_RATE = 16000
+# number of frames processed at once when computing the loudness
+_FRAMES_PER_BLOCK = 6000
+_MAX_AMPLITUDE = float(2 ** (8 * SAMPLE_WIDTH - 1))
+
+
+@dataclass
+class AudioChunk:
+    """Segment of the original audio file, `start` and `end` in seconds"""
+
+    index: int
+    start: float
+    end: float
+    path: str
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def frame_loudness(
+    pcm: IO[bytes], frame_rate: int = ANALYSIS_FRAME_RATE, frame_ms: int = FRAME_MS
+) -> Tuple[np.ndarray, float, int]:
+    """
+    Loudness of mono 16 bits pcm audio, read block by block from a file.
+
+    Returns:
+        Tuple[np.ndarray, float, int]: loudness (dBFS) of each `frame_ms` frame (-inf
+        for digital silence), loudness of the whole audio and its number of samples
+    """
+    frame_size = max(int(frame_rate * frame_ms / 1000), 1)
+    block_size = frame_size * _FRAMES_PER_BLOCK * SAMPLE_WIDTH
+    blocks = []
+    total_square = 0.0
+    num_samples = 0
+    for data in iter(lambda: pcm.read(block_size), b""):
+        block = np.frombuffer(data, dtype=np.int16, count=len(data) // SAMPLE_WIDTH)
+        block = block.astype(np.float32)
+        total_square += float(np.dot(block, block))
+        num_samples += len(block)
+        padding = -len(block) % frame_size
+        if padding:
+            block = np.pad(block, (0, padding))
+        rms = np.sqrt(np.mean(np.square(block.reshape(-1, frame_size)), axis=1))
+        with np.errstate(divide="ignore"):
+            blocks.append((20 * np.log10(rms / _MAX_AMPLITUDE)).astype(np.float32))
+
+    loudness = np.concatenate(blocks) if blocks else np.empty(0, dtype=np.float32)
+    with np.errstate(divide="ignore"):
+        dbfs = 20 * np.log10(np.sqrt(total_square / max(num_samples, 1)) / _MAX_AMPLITUDE)
+    return loudness, float(dbfs), num_samples
+
+
+def find_cut_points(
+    loudness: np.ndarray,
+    max_segment_frames: int,
+    search_window_frames: int,
+    silence_thresh: float,
+    min_silence_frames: int,
+) -> List[int]:
+    """
+    Frame indexes where the audio should be cut so that no segment is longer than
+    `max_segment_frames`.
+
+    Each cut is placed in the middle of the longest silence found in the search window
+    preceding the segment limit. Without any silence long enough, the quietest frame of
+    the window is used.
+    """
+    total = len(loudness)
+    cuts = []
+    start = 0
+    while total - start > max_segment_frames:
+        window_end = start + max_segment_frames
+        window_start = max(window_end - search_window_frames, start + 1)
+        window = loudness[window_start:window_end]
+
+        cut = None
+        silent = np.concatenate(([False], window < silence_thresh, [False]))
+        edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+        if len(edges):
+            run_starts, run_ends = edges[::2], edges[1::2]
+            lengths = run_ends - run_starts
+            longest = int(np.argmax(lengths))
+            if lengths[longest] >= min_silence_frames:
+                cut = window_start + int(run_starts[longest] + run_ends[longest]) // 2
+        if cut is None:
+            cut = window_start + int(np.argmin(window))
+
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def segment_bounds(
+    pcm: IO[bytes],
+    max_segment_duration: float = DEFAULT_MAX_SEGMENT_DURATION,
+    search_window: float = DEFAULT_SEARCH_WINDOW,
+    min_silence_len: int = DEFAULT_MIN_SILENCE_LEN,
+    silence_thresh: Optional[float] = None,
+) -> List[Tuple[float, float]]:
+    """(start, end) in seconds of the segments of mono 16 kHz 16 bits pcm audio"""
+    loudness, dbfs, num_samples = frame_loudness(pcm)
+    if silence_thresh is None:
+        silence_thresh = dbfs - DEFAULT_SILENCE_OFFSET
+    search_window = min(search_window, max_segment_duration / 2)
+    cuts = find_cut_points(
+        loudness,
+        max_segment_frames=int(max_segment_duration * 1000 / FRAME_MS),
+        search_window_frames=int(search_window * 1000 / FRAME_MS),
+        silence_thresh=silence_thresh,
+        min_silence_frames=max(int(min_silence_len / FRAME_MS), 1),
+    )
+    bounds = [0.0] + [cut * FRAME_MS / 1000 for cut in cuts]
+    bounds.append(num_samples / ANALYSIS_FRAME_RATE)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _write_segment(result: TranscodeResult, path: str) -> None:
+    with result.file, open(path, "wb") as output:
+        shutil.copyfileobj(result.file, output, IO_CHUNK_SIZE)
+
+
+def split_audio_at_silence(
+    file: str,
+    max_segment_duration: float = DEFAULT_MAX_SEGMENT_DURATION,
+    search_window: float = DEFAULT_SEARCH_WINDOW,
+    min_silence_len: int = DEFAULT_MIN_SILENCE_LEN,
+    silence_thresh: Optional[float] = None,
+    output_dir: Optional[str] = None,
+    export_format: str = "wav",
+) -> List[AudioChunk]:
+    """
+    Split an audio file at silences into segments of at most `max_segment_duration`
+    seconds, written to `output_dir` (a new temporary directory by default).
+
+    The file is never decoded in memory: silences are detected on a mono 16 kHz pcm
+    stream decoded by ffmpeg, then each segment is cut from the original file by ffmpeg.
+
+    Args:
+        file (str): path of the audio file
+        max_segment_duration (float): maximum duration of a segment, in seconds
+        search_window (float): seconds before a segment limit in which to look for a silence
+        min_silence_len (int): minimum length of a silence, in ms
+        silence_thresh (float): loudness (dBFS) under which audio is silent, defaults to
+            the average loudness of the file minus 16 dB
+        output_dir (str): directory of the segments files
+        export_format (str): format of the segments files
+    """
+    output_dir = output_dir or tempfile.mkdtemp(prefix="audio_chunks_")
+    analysis = transcode_audio(
+        file, "raw", frame_rate=ANALYSIS_FRAME_RATE, channels=1
+    )
+    with analysis.file:
+        bounds = segment_bounds(
+            analysis.file,
+            max_segment_duration,
+            search_window,
+            min_silence_len,
+            silence_thresh,
+        )
+
+    chunks = []
+    for index, (start, end) in enumerate(bounds):
+        path = os.path.join(output_dir, f"chunk_{index:04d}.{export_format}")
+        segment = transcode_audio(file, export_format, start=start, duration=end - start)
+        _write_segment(segment, path)
+        chunks.append(AudioChunk(index, start, end, path))
+    return chunks
+
+
+async def asplit_audio_at_silence(
+    file: str,
+    max_segment_duration: float = DEFAULT_MAX_SEGMENT_DURATION,
+    search_window: float = DEFAULT_SEARCH_WINDOW,
+    min_silence_len: int = DEFAULT_MIN_SILENCE_LEN,
+    silence_thresh: Optional[float] = None,
+    output_dir: Optional[str] = None,
+    export_format: str = "wav",
+) -> List[AudioChunk]:
+    """
+    Async version of `split_audio_at_silence`, segments are cut concurrently on the
+    transcoder pool
+    """
+    output_dir = output_dir or tempfile.mkdtemp(prefix="audio_chunks_")
+    analysis = await atranscode_audio(
+        file, "raw", frame_rate=ANALYSIS_FRAME_RATE, channels=1
+    )
+    with analysis.file:
+        bounds = await asyncio.to_thread(
+            segment_bounds,
+            analysis.file,
+            max_segment_duration,
+            search_window,
+            min_silence_len,
+            silence_thresh,
+        )
+
+    async def cut(index: int, start: float, end: float) -> AudioChunk:
+        path = os.path.join(output_dir, f"chunk_{index:04d}.{export_format}")
+        segment = await atranscode_audio(
+            file, export_format, start=start, duration=end - start
+        )
+        await asyncio.to_thread(_write_segment, segment, path)
+        return AudioChunk(index, start, end, path)
+
+    return list(
+        await asyncio.gather(
+            *(cut(index, start, end) for index, (start, end) in enumerate(bounds))
+        )
+    )
+
+
+def _offset_time(value: Optional[str], offset: float) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        return str(round(float(value) + offset, 3))
+    except ValueError:
+        return value
+
+
+def reconcile_speakers(
+    segments: Sequence[Sequence[SpeechDiarizationEntry]],
+    max_speakers: Optional[int] = None,
+) -> List[Dict[int, int]]:
+    """
+    Map the speakers of every segment to global speakers.
+
+    Segments are cut in silences between two sentences, so the first speaker of a segment
+    is most often the last speaker of the previous one. The other speakers of a segment
+    become new global speakers, unless `max_speakers` is reached: they are then mapped to
+    the most recently active global speakers not already used in the segment.
+
+    Returns:
+        List[Dict[int, int]]: for every segment, local speaker -> global speaker
+    """
+    mappings: List[Dict[int, int]] = []
+    last_seen: Dict[int, int] = {}  # global speaker -> index of its last segment
+    previous_last: Optional[int] = None
+    next_speaker = 1
+
+    for index, entries in enumerate(segments):
+        mapping: Dict[int, int] = {}
+        for entry in entries:
+            if entry.speaker in mapping:
+                continue
+            if not mapping and previous_last is not None:
+                mapping[entry.speaker] = previous_last
+                continue
+            if max_speakers is None or next_speaker <= max_speakers:
+                mapping[entry.speaker] = next_speaker
+                next_speaker += 1
+                continue
+            used = set(mapping.values())
+            candidates = [speaker for speaker in last_seen if speaker not in used]
+            if candidates:
+                mapping[entry.speaker] = max(candidates, key=last_seen.get)
+            else:
+                mapping[entry.speaker] = next_speaker
+                next_speaker += 1
+        for speaker in mapping.values():
+            last_seen[speaker] = index
+        if entries:
+            previous_last = mapping[entries[-1].speaker]
+        mappings.append(mapping)
+    return mappings
+
+
+def merge_transcriptions(
+    chunks: Sequence[AudioChunk],
+    results: Sequence[SpeechToTextAsyncDataClass],
+    max_speakers: Optional[int] = None,
+) -> SpeechToTextAsyncDataClass:
+    """Stitch the transcriptions of consecutive segments into one"""
+    mappings = reconcile_speakers(
+        [result.diarization.entries for result in results], max_speakers
+    )
+    entries = []
+    errors = []
+    for chunk, result, mapping in zip(chunks, results, mappings):
+        if result.diarization.error_message:
+            errors.append(result.diarization.error_message)
+        for entry in result.diarization.entries:
+            entries.append(
+                entry.model_copy(
+                    update={
+                        "start_time": _offset_time(entry.start_time, chunk.start),
+                        "end_time": _offset_time(entry.end_time, chunk.start),
+                        "speaker": mapping[entry.speaker],
+                    }
+                )
+            )
+    text = " ".join(result.text.strip() for result in results if result.text.strip())
+    return SpeechToTextAsyncDataClass(
+        text=text,
+        diarization=SpeechDiarization(
+            total_speakers=len({entry.speaker for entry in entries}),
+            entries=entries,
+            error_message="\n".join(dict.fromkeys(errors)) or None,
+        ),
+    )
+
+
+async def _launch_job(provider_name: str, args: Dict, api_keys: Dict) -> str:
+    try:
+        launched = await interface.acompute_output(
+            provider_name, "audio", "speech_to_text_async", args, api_keys=api_keys
+        )
+    except NotImplementedError:
+        launched = await asyncio.to_thread(
+            interface.compute_output,
+            provider_name,
+            "audio",
+            "speech_to_text_async",
+            args,
+            api_keys=api_keys,
+        )
+    return launched["provider_job_id"]
+
+
+async def _get_job_result(
+    provider_name: str, provider_job_id: str, api_keys: Dict
+) -> Optional[Dict]:
+    """Job result, None while the job is pending"""
+    try:
+        result = await interface.aget_async_job_result(
+            provider_name, "audio", "speech_to_text_async", provider_job_id, api_keys=api_keys
+        )
+    except NotImplementedError:
+        result = await asyncio.to_thread(
+            interface.get_async_job_result,
+            provider_name,
+            "audio",
+            "speech_to_text_async",
+            provider_job_id,
+            api_keys=api_keys,
+        )
+    if result["status"] == "pending":
+        return None
+    if result["status"] == "failed":
+        raise ProviderException(result.get("error") or "Segment transcription failed")
+    return result
+
+
+def _chunk_args(args: Dict, chunk: AudioChunk, file_info: FileInfo) -> Dict:
+    extension = os.path.splitext(chunk.path)[1][1:]
+    chunk_info = FileInfo(
+        os.path.getsize(chunk.path),
+        mimetypes.guess_type(chunk.path)[0] or f"audio/{extension}",
+        [extension],
+        getattr(file_info, "file_frame_rate", None),
+        getattr(file_info, "file_channels", None),
+        duration=chunk.duration,
+    )
+    return {**args, "file": FileWrapper(chunk.path, "", chunk_info)}
+
+
+async def atranscribe_long_audio(
+    provider_name: str,
+    args: Dict[str, Any],
+    api_keys: Optional[Dict] = None,
+    max_segment_duration: float = DEFAULT_MAX_SEGMENT_DURATION,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    channel: Optional[CompletionChannel] = None,
+    poll_interval: float = 5,
+    max_time: float = 3600,
+    **split_kwargs,
+) -> AsyncResponseType[SpeechToTextAsyncDataClass]:
+    """
+    Transcribe a long audio file by transcribing segments of it concurrently.
+
+    Args:
+        provider_name (str): provider implementing `audio__speech_to_text_async`
+        args (dict): speech_to_text_async arguments, as given to `interface.compute_output`
+            (`file` is a FileWrapper of a local file)
+        api_keys (dict): optional user's api_keys
+        max_segment_duration (float): maximum duration of a segment, in seconds
+        max_concurrency (int): maximum number of segment jobs running at once
+        channel (CompletionChannel): how to wait for segment jobs, polling by default
+        poll_interval (float): seconds between two polls of a segment job
+        max_time (float): maximum time to wait for a segment job, in seconds
+        split_kwargs: other arguments of `asplit_audio_at_silence`
+
+    Returns:
+        AsyncResponseType: the merged transcription, `original_response` holds the result
+        of every segment and `provider_job_id` their comma separated job ids
+    """
+    api_keys = api_keys or {}
+    channel = channel or PollingChannel()
+    file_wrapper: FileWrapper = args["file"]
+    if not file_wrapper.file_path:
+        raise ProviderException("Long audio transcription requires a local file", code=400)
+
+    output_dir = tempfile.mkdtemp(prefix="audio_chunks_")
+    try:
+        chunks = await asplit_audio_at_silence(
+            file_wrapper.file_path,
+            max_segment_duration,
+            output_dir=output_dir,
+            **split_kwargs,
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def transcribe(chunk: AudioChunk) -> Tuple[str, Dict]:
+            async with semaphore:
+                chunk_args = _chunk_args(args, chunk, file_wrapper.file_info)
+                job_id = await _launch_job(provider_name, chunk_args, api_keys)
+                result = await channel.wait_for_result(
+                    job_id,
+                    poll=lambda: _get_job_result(provider_name, job_id, api_keys),
+                    poll_interval=poll_interval,
+                    max_time=max_time,
+                )
+                return job_id, result
+
+        tasks = [asyncio.ensure_future(transcribe(chunk)) for chunk in chunks]
+        try:
+            outcomes = await asyncio.gather(*tasks)
+        except BaseException:
+            # segments not launched yet would fail anyway once their file is removed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    results = [
+        SpeechToTextAsyncDataClass(**result["standardized_response"])
+        for _, result in outcomes
+    ]
+    return AsyncResponseType[SpeechToTextAsyncDataClass](
+        original_response=[result.get("original_response") for _, result in outcomes],
+        standardized_response=merge_transcriptions(
+            chunks, results, max_speakers=args.get("speakers") or None
+        ),
+        provider_job_id=",".join(job_id for job_id, _ in outcomes),
+    )
@@ -0,0 +1,499 @@
+"""
+Parallel synthesis of long texts.
+
+The text (or SSML document) is split at paragraph and sentence boundaries into chunks
+that fit the provider's request limit (`max_text_length` in the tts constraints of its
+info.json), every chunk is synthesized concurrently, and the audio of the chunks is
+joined back into a single file:
+    - wav and raw pcm are joined losslessly, under a single wav header,
+    - mp3 is joined on frame boundaries, dropping the tags and the VBR header frames of
+      each chunk,
+    - ogg (vorbis, opus) chunks are merged into a single logical stream: the headers of
+      the first chunk are kept and the pages of the others are renumbered,
+    - other formats are decoded and encoded again with pydub.
+
+Chunks are synthesized in memory (streamed, or with the provider uploads recorded
+without being sent to s3), only the joined audio is uploaded.
+
+Provider `audio__atts` methods decorated with `long_text_tts` synthesize texts longer
+than their `max_text_length` this way.
+
+Usage:
+    result = await asynthesize_long_text("openai", {"text": chapter, "voice": "alloy"})
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import struct
+from io import BytesIO
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from pydub import AudioSegment
+
+from edenai_apis import interface
+from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http_client import AUDIO_TIMEOUT, async_client
+from edenai_apis.utils.tts import (
+    TtsAudioStream,
+    get_tts_config,
+    split_tts_text,
+    text_size,
+    upload_audio,
+)
+from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.upload_s3 import RecordedUpload, record_uploads
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+_PCM_FORMATS = {"pcm", "raw", "linear16"}
+_OGG_FORMATS = {"ogg", "opus", "oga"}
+
+# MPEG audio layer III bitrates (kbps) by bitrate index, for MPEG 1 and MPEG 2/2.5
+_MP3_BITRATES = {
+    1: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    2: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+# sample rates by version bits (0: MPEG 2.5, 2: MPEG 2, 3: MPEG 1)
+_MP3_SAMPLE_RATES = {
+    0: [11025, 12000, 8000],
+    2: [22050, 24000, 16000],
+    3: [44100, 48000, 32000],
+}
+_MP3_VBR_TAGS = (b"Xing", b"Info", b"VBRI")
+
+
+def _wav_chunks(content: bytes) -> Tuple[bytes, bytes]:
+    """fmt and data chunks of a wav file. Streamed wav files may have an unknown data size"""
+    if content[:4] != b"RIFF" or content[8:12] != b"WAVE":
+        raise ProviderException("Invalid wav audio returned by the provider")
+    fmt = None
+    position = 12
+    while position + 8 <= len(content):
+        chunk_id = content[position : position + 4]
+        (size,) = struct.unpack("<I", content[position + 4 : position + 8])
+        start = position + 8
+        if chunk_id == b"fmt ":
+            fmt = content[start : start + size]
+        elif chunk_id == b"data":
+            if fmt is None:
+                break
+            if size in (0, 0xFFFFFFFF) or start + size > len(content):
+                # size unknown when the header was written: the data is the rest
+                # of the file, without any incomplete frame
+                block_align = struct.unpack("<H", fmt[12:14])[0] if len(fmt) >= 14 else 1
+                size = len(content) - start
+                size -= size % max(block_align, 1)
+            return fmt, content[start : start + size]
+        position = start + size + (size % 2)
+    raise ProviderException("Invalid wav audio returned by the provider")
+
+
+def concatenate_wav(parts: List[bytes]) -> bytes:
+    """Join wav files of the same sample format under a single header"""
+    fmt = None
+    data = []
+    for part in parts:
+        part_fmt, part_data = _wav_chunks(part)
+        if fmt is not None and part_fmt[:16] != fmt[:16]:
+            raise ProviderException("Audio chunks have different sample formats")
+        fmt = fmt or part_fmt
+        data.append(part_data)
+    audio = b"".join(data)
+    header = (
+        b"RIFF"
+        + struct.pack("<I", 4 + 8 + len(fmt) + 8 + len(audio))
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt))
+        + fmt
+        + b"data"
+        + struct.pack("<I", len(audio))
+    )
+    return header + audio
+
+
+def _mp3_frame_length(header: bytes) -> Optional[int]:
+    """Length of a layer III frame from its 4 bytes header, None if it is not one"""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    bitrate = _MP3_BITRATES[1 if version == 3 else 2][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+    return (144 if version == 3 else 72) * bitrate // sample_rate + padding
+
+
+def _mp3_frames(content: bytes) -> bytes:
+    """Audio frames of an mp3 file, without ID3 tags and VBR header frame"""
+    start = 0
+    while content[start : start + 3] == b"ID3":
+        size = content[start + 6 : start + 10]
+        footer = 10 if content[start + 5] & 0x10 else 0
+        start += 10 + footer + sum(byte << (7 * (3 - i)) for i, byte in enumerate(size))
+    end = len(content)
+    if end - start >= 128 and content[end - 128 : end - 125] == b"TAG":
+        end -= 128
+
+    # skip any garbage until the first frame
+    while start < end - 4 and _mp3_frame_length(content[start : start + 4]) is None:
+        start += 1
+    frame_length = _mp3_frame_length(content[start : start + 4])
+    if frame_length and any(
+        tag in content[start : start + min(frame_length, 64)] for tag in _MP3_VBR_TAGS
+    ):
+        # the VBR header of a chunk holds the number of frames of this chunk only
+        start += frame_length
+    return content[start:end]
+
+
+def concatenate_mp3(parts: List[bytes]) -> bytes:
+    """Join mp3 files on frame boundaries"""
+    return b"".join(_mp3_frames(part) for part in parts)
+
+
+# Ogg pages: "OggS", version, header type, granule position, serial number, sequence
+# number, checksum, number of segments, then the segment table
+_OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+_OGG_CONTINUED, _OGG_BOS, _OGG_EOS = 0x01, 0x02, 0x04
+# number of header packets of the codecs, by first bytes of their first packet
+_OGG_HEADER_PACKETS = {b"OpusHead": 2, b"\x01vorbis": 3, b"Speex   ": 2}
+
+
+def _ogg_crc_table() -> List[int]:
+    table = []
+    for index in range(256):
+        crc = index << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+
+_OGG_CRC_TABLE = _ogg_crc_table()
+
+
+def _ogg_crc(page: bytes) -> int:
+    crc = 0
+    for byte in page:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _OGG_CRC_TABLE[(crc >> 24) ^ byte]
+    return crc
+
+
+def _ogg_pages(content: bytes) -> List[Tuple[int, int, int, List[int], bytes]]:
+    """(header type, granule position, serial number, segment table, body) of each page"""
+    pages = []
+    position = 0
+    while position < len(content):
+        if content[position : position + 4] != b"OggS":
+            raise ProviderException("Invalid ogg audio returned by the provider")
+        _, _, header_type, granule, serial, _, _, count = _OGG_PAGE_HEADER.unpack_from(
+            content, position
+        )
+        start = position + _OGG_PAGE_HEADER.size
+        segments = list(content[start : start + count])
+        end = start + count + sum(segments)
+        if end > len(content):
+            raise ProviderException("Truncated ogg audio returned by the provider")
+        body = content[start + count : end]
+        pages.append((header_type, granule, serial, segments, body))
+        position = end
+    return pages
+
+
+def _ogg_page(
+    header_type: int,
+    granule: int,
+    serial: int,
+    sequence: int,
+    segments: List[int],
+    body: bytes,
+) -> bytes:
+    page = bytearray(
+        _OGG_PAGE_HEADER.pack(
+            b"OggS", 0, header_type, granule, serial, sequence, 0, len(segments)
+        )
+    )
+    page += bytes(segments) + body
+    struct.pack_into("<I", page, 22, _ogg_crc(page))
+    return bytes(page)
+
+
+def concatenate_ogg(parts: List[bytes]) -> bytes:
+    """
+    Join ogg files holding one logical stream of the same codec settings into a single
+    logical stream: the header packets of the first file are kept, the pages of the
+    others are renumbered and their granule positions shifted
+    """
+    output = []
+    serial = sequence = granule_offset = 0
+    last_page = None
+    for index, part in enumerate(parts):
+        pages = _ogg_pages(part)
+        if not pages or len({page[2] for page in pages}) != 1:
+            raise ProviderException("Unsupported ogg audio returned by the provider")
+        header_packets = next(
+            (
+                count
+                for magic, count in _OGG_HEADER_PACKETS.items()
+                if pages[0][4].startswith(magic)
+            ),
+            None,
+        )
+        if header_packets is None:
+            raise ProviderException("Unsupported ogg codec returned by the provider")
+        if index == 0:
+            serial = pages[0][2]
+
+        packets = 0
+        part_granule = 0
+        for header_type, granule, _, segments, body in pages:
+            if packets < header_packets:
+                # header pages, the codec headers end on a page boundary
+                packets += sum(1 for lacing in segments if lacing < 255)
+                if index > 0:
+                    continue
+            elif granule != -1:
+                part_granule = granule
+                granule += granule_offset
+            if last_page is not None:
+                output.append(_ogg_page(*last_page))
+            last_page = [header_type & ~_OGG_EOS, granule, serial, sequence, segments, body]
+            sequence += 1
+        granule_offset += part_granule
+
+    if last_page is not None:
+        last_page[0] |= _OGG_EOS
+        output.append(_ogg_page(*last_page))
+    return b"".join(output)
+
+
+def concatenate_audio(parts: List[bytes], audio_format: str) -> bytes:
+    """Join the audio of consecutive chunks of a synthesis
+
+    Args:
+        parts: Audio files, in order, all in the same format
+        audio_format: Format (extension) of the files
+
+    Returns:
+        The audio of all the parts, as a single file of the same format
+    """
+    audio_format = audio_format.lower().lstrip(".")
+    if len(parts) == 1:
+        return parts[0]
+    if audio_format == "wav":
+        return concatenate_wav(parts)
+    if audio_format in _PCM_FORMATS:
+        return b"".join(parts)
+    if audio_format == "mp3":
+        return concatenate_mp3(parts)
+    if audio_format in _OGG_FORMATS:
+        return concatenate_ogg(parts)
+
+    audio = sum(
+        (AudioSegment.from_file(BytesIO(part), format=audio_format) for part in parts),
+        AudioSegment.empty(),
+    )
+    output = BytesIO()
+    audio.export(output, format=audio_format)
+    return output.getvalue()
+
+
+def _supports_streaming(provider_name: str) -> bool:
+    ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider_name)
+    method = getattr(ProviderClass, "audio__atts", None)
+    return method is not None and "stream" in inspect.signature(method).parameters
+
+
+async def _download_audio(url: str) -> bytes:
+    async with async_client(AUDIO_TIMEOUT) as client:
+        response = await client.get(url)
+    if response.is_error:
+        raise ProviderException(
+            f"Could not download synthesized audio: {response.status_code}",
+            code=response.status_code,
+        )
+    return response.content
+
+
+def _recorded_audio(
+    url: str, uploads: List[RecordedUpload]
+) -> Optional[Tuple[bytes, str]]:
+    """Audio and format of a result whose upload was recorded instead of being sent"""
+    upload = next((upload for upload in uploads if upload.url == url), None)
+    if upload is None:
+        return None
+    return upload.content, os.path.splitext(upload.filename)[1][1:]
+
+
+async def _result_audio(
+    result: Any, uploads: List[RecordedUpload], audio_format: Optional[str]
+) -> Tuple[bytes, str]:
+    """Audio and format of a synthesis result, downloaded if it is hosted elsewhere"""
+    if isinstance(result, ResponseType):
+        url = result.standardized_response.audio_resource_url
+    else:
+        url = result["standardized_response"]["audio_resource_url"]
+    recorded = _recorded_audio(url, uploads)
+    if recorded is not None:
+        return recorded
+    extension = os.path.splitext(urlparse(url).path)[1][1:]
+    return await _download_audio(url), extension or audio_format or "mp3"
+
+
+async def _stream_audio(stream: TtsAudioStream) -> Tuple[bytes, str]:
+    # chunks are only uploaded once joined
+    stream.upload = None
+    audio = b"".join([chunk async for chunk in stream])
+    return audio, stream.file_extension
+
+
+async def _synthesize(
+    provider_name: str, args: Dict[str, Any], api_keys: Dict
+) -> Tuple[bytes, str]:
+    """Audio and format of one chunk"""
+    if _supports_streaming(provider_name):
+        stream = await interface.acompute_output(
+            provider_name, "audio", "tts", {**args, "stream": True}, api_keys=api_keys
+        )
+        return await _stream_audio(stream)
+
+    # the audio is kept in memory instead of being uploaded by the provider
+    with record_uploads(upload=False) as uploads:
+        try:
+            result = await interface.acompute_output(
+                provider_name, "audio", "tts", args, api_keys=api_keys
+            )
+        except NotImplementedError:
+            result = await asyncio.to_thread(
+                interface.compute_output,
+                provider_name,
+                "audio",
+                "tts",
+                args,
+                api_keys=api_keys,
+            )
+    return await _result_audio(result, uploads, args.get("audio_format"))
+
+
+async def _synthesize_chunks(
+    texts: List[str],
+    synthesize: Callable[[str], Awaitable[Tuple[bytes, str]]],
+    max_concurrency: int,
+) -> ResponseType[TtsDataClass]:
+    """Synthesize the chunks concurrently, join their audio and upload it"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def synthesize_chunk(text: str) -> Tuple[bytes, str]:
+        async with semaphore:
+            return await synthesize(text)
+
+    tasks = [asyncio.ensure_future(synthesize_chunk(text)) for text in texts]
+    try:
+        outcomes = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    audio_format = outcomes[0][1]
+    audio = await asyncio.to_thread(
+        concatenate_audio, [audio for audio, _ in outcomes], audio_format
+    )
+    resource_url = await upload_audio(audio, audio_format)
+    return ResponseType[TtsDataClass](
+        original_response={"chunks": len(texts), "texts": texts},
+        standardized_response=TtsDataClass(audio_resource_url=resource_url),
+    )
+
+
+async def asynthesize_long_text(
+    provider_name: str,
+    args: Dict[str, Any],
+    api_keys: Optional[Dict] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_text_length: Optional[int] = None,
+) -> ResponseType[TtsDataClass]:
+    """
+    Synthesize a long text by synthesizing chunks of it concurrently.
+
+    Args:
+        provider_name (str): provider implementing `audio__tts`
+        args (dict): tts arguments, as given to `interface.compute_output`
+        api_keys (dict): optional user's api_keys
+        max_concurrency (int): maximum number of chunks synthesized at once
+        max_text_length (int): maximum size of a chunk in UTF-8 bytes, defaults to the
+            provider's limit
+
+    Returns:
+        ResponseType: url of the joined audio, `original_response` holds the number of
+        chunks and the text of each of them
+    """
+    api_keys = api_keys or {}
+    max_text_length = max_text_length or get_tts_config(provider_name)["max_text_length"]
+    texts = split_tts_text(args["text"], max_text_length)
+    if not texts:
+        raise ProviderException("Text is empty", code=400)
+
+    return await _synthesize_chunks(
+        texts,
+        lambda text: _synthesize(provider_name, {**args, "text": text}, api_keys),
+        max_concurrency,
+    )
+
+
+def long_text_tts(func: Callable) -> Callable:
+    """
+    Synthesize the texts longer than the provider's `max_text_length` given to a provider
+    `audio__atts` method in concurrent chunks joined into a single audio file.
+    Streamed syntheses and texts within the limit are left to the method.
+    """
+    signature = inspect.signature(func)
+    streaming = "stream" in signature.parameters
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+        except TypeError:
+            return await func(self, *args, **kwargs)
+        bound.apply_defaults()
+        text = bound.arguments.get("text")
+        max_text_length = get_tts_config(self.provider_name).get("max_text_length")
+        if (
+            bound.arguments.get("stream")
+            or not isinstance(text, str)
+            or not max_text_length
+            or text_size(text) <= max_text_length
+        ):
+            return await func(self, *args, **kwargs)
+
+        async def synthesize(chunk_text: str) -> Tuple[bytes, str]:
+            chunk = signature.bind(*bound.args, **bound.kwargs)
+            chunk.arguments["text"] = chunk_text
+            if streaming:
+                chunk.arguments["stream"] = True
+                result = await func(*chunk.args, **chunk.kwargs)
+                return await _stream_audio(result.stream)
+            with record_uploads(upload=False) as uploads:
+                result = await func(*chunk.args, **chunk.kwargs)
+            return await _result_audio(
+                result, uploads, bound.arguments.get("audio_format")
+            )
+
+        return await _synthesize_chunks(
+            split_tts_text(text, max_text_length), synthesize, DEFAULT_MAX_CONCURRENCY
+        )
+
+    return wrapper
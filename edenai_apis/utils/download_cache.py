@@ -0,0 +1,245 @@
+"""
+Process-wide cache of files downloaded from `file_url` inputs.
+
+Downloads are kept in memory (small files) or in temporary files, and shared between
+every provider (and every internal use) needing the same url:
+    - concurrent downloads of the same url are deduplicated (single-flight),
+    - cached entries are revalidated with their ETag/Last-Modified validators once
+      older than `max_age`,
+    - the total size of the cached files, and of the contents kept in memory, are
+      bounded, least recently used entries are evicted first, even while in use,
+    - an evicted file is only deleted once every FileWrapper using it has been closed
+      (or garbage collected without being closed).
+"""
+
+import asyncio
+import os
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional
+
+from edenai_apis.utils.files import FileInfo, FileWrapper
+
+DOWNLOAD_CACHE_ENABLED = os.environ.get("EDENAI_DOWNLOAD_CACHE", "1") != "0"
+DEFAULT_MAX_SIZE = 2 * 1024 * 1024 * 1024  # 2 Gb
+DEFAULT_MAX_MEMORY_SIZE = int(
+    os.environ.get("EDENAI_DOWNLOAD_CACHE_MEMORY", 256 * 1024 * 1024)
+)
+DEFAULT_MAX_AGE = 60  # seconds before revalidating an entry with the server
+
+
+@dataclass
+class CachedDownload:
+    """
+    File downloaded on disk (`path`) or in memory (`content`) with the validators
+    returned by the server
+    """
+
+    path: Optional[str]
+    size: int
+    content_type: str
+    file_extension: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content: Optional[bytes] = None
+
+    @property
+    def in_memory(self) -> bool:
+        return self.content is not None
+
+
+@dataclass(eq=False)
+class _CacheEntry:
+    download: CachedDownload
+    fetched_at: float = field(default_factory=time.monotonic)
+    refcount: int = 0
+    # removed from the cache, the file is deleted once released by every user
+    discarded: bool = False
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.download.etag:
+            headers["If-None-Match"] = self.download.etag
+        if self.download.last_modified:
+            headers["If-Modified-Since"] = self.download.last_modified
+        return headers
+
+
+# fetch(url, conditional_headers) -> None if the server answered 304 Not Modified
+FetchCallable = Callable[[str, Dict[str, str]], Awaitable[Optional[CachedDownload]]]
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _memory_file_wrapper(download: CachedDownload, file_url: str) -> FileWrapper:
+    """
+    FileWrapper over a content cached in memory, shared without copy (bytes are
+    immutable) and freed by the garbage collector once evicted and unused
+    """
+    return FileWrapper(
+        None,
+        file_url,
+        FileInfo(
+            file_size=download.size,
+            file_mimetype=download.content_type,
+            file_extension=download.file_extension,
+        ),
+        file_bytes=download.content,
+    )
+
+
+class CachedFileWrapper(FileWrapper):
+    """FileWrapper over a cached download: closing it releases the file instead of deleting it"""
+
+    def __init__(self, cache: "DownloadCache", entry: _CacheEntry, file_url: str):
+        download = entry.download
+        super().__init__(
+            download.path,
+            file_url,
+            FileInfo(
+                file_size=download.size,
+                file_mimetype=download.content_type,
+                file_extension=download.file_extension,
+            ),
+        )
+        entry.refcount += 1
+        # releases the entry when closed, or when the wrapper is forgotten without it
+        self._release = weakref.finalize(self, cache.release, entry)
+
+    def close_file(self):
+        self._close_mmap()
+        self._release()
+
+
+class DownloadCache:
+    """
+    Args:
+        max_size (int): maximum size in bytes of the cached files
+        max_age (float): seconds during which an entry is served without revalidation
+        max_memory_size (int): maximum size in bytes of the contents kept in memory
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE,
+    ) -> None:
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_memory_size = max_memory_size
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._size = 0
+        self._memory_size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def memory_size(self) -> int:
+        return self._memory_size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, file_url: str, fetch: FetchCallable) -> FileWrapper:
+        """Get a FileWrapper over the content of `file_url`, downloading it with `fetch` if needed"""
+        entry = await self._get_entry(file_url, fetch)
+        if entry.download.in_memory:
+            return _memory_file_wrapper(entry.download, file_url)
+        return CachedFileWrapper(self, entry, file_url)
+
+    def release(self, entry: _CacheEntry) -> None:
+        entry.refcount -= 1
+        if entry.refcount <= 0 and entry.discarded:
+            _remove_file(entry.download.path)
+
+    def clear(self) -> None:
+        for file_url in list(self._entries):
+            self._discard(file_url)
+
+    async def _get_entry(self, file_url: str, fetch: FetchCallable) -> _CacheEntry:
+        task = self._inflight.get(file_url)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.hits += 1
+            return await asyncio.shield(task)
+
+        entry = self._entries.get(file_url)
+        if entry is not None and time.monotonic() - entry.fetched_at < self.max_age:
+            self.hits += 1
+            self._entries.move_to_end(file_url)
+            return entry
+
+        task = asyncio.ensure_future(self._refresh(file_url, entry, fetch))
+        self._inflight[file_url] = task
+        task.add_done_callback(
+            lambda done: self._inflight.pop(file_url, None)
+            if self._inflight.get(file_url) is done
+            else None
+        )
+        return await asyncio.shield(task)
+
+    async def _refresh(
+        self, file_url: str, entry: Optional[_CacheEntry], fetch: FetchCallable
+    ) -> _CacheEntry:
+        download = None
+        if entry is not None:
+            download = await fetch(file_url, entry.validators())
+            if download is None and not entry.discarded:
+                self.hits += 1
+                entry.fetched_at = time.monotonic()
+                self._entries.move_to_end(file_url)
+                return entry
+        self.misses += 1
+        if download is None:
+            download = await fetch(file_url, {})
+
+        if file_url in self._entries:
+            self._discard(file_url)
+        new_entry = _CacheEntry(download=download)
+        self._entries[file_url] = new_entry
+        if download.in_memory:
+            self._memory_size += download.size
+        else:
+            self._size += download.size
+        self._evict(keep=new_entry)
+        return new_entry
+
+    def _discard(self, file_url: str) -> None:
+        entry = self._entries.pop(file_url)
+        entry.discarded = True
+        if entry.download.in_memory:
+            self._memory_size -= entry.download.size
+            return
+        self._size -= entry.download.size
+        if entry.refcount <= 0:
+            _remove_file(entry.download.path)
+
+    def _evict(self, keep: Optional[_CacheEntry] = None) -> None:
+        """
+        Remove least recently used entries until the cache fits in max_size and
+        max_memory_size. Files still in use are deleted once released.
+        """
+        for file_url, entry in list(self._entries.items()):
+            disk_full = self._size > self.max_size
+            memory_full = self._memory_size > self.max_memory_size
+            if not disk_full and not memory_full:
+                return
+            if entry is keep:
+                continue
+            if memory_full if entry.download.in_memory else disk_full:
+                self._discard(file_url)
+
+
+download_cache = DownloadCache()
@@ -1,12 +1,18 @@
-import base64
 import mimetypes
+import os
 import random
 import tempfile
-from typing import AsyncIterator
+from typing import AsyncIterator, Dict, Optional
 
 import aiofiles
 from curl_cffi.requests import AsyncSession
 
+from edenai_apis.utils.download_cache import (
+    DOWNLOAD_CACHE_ENABLED,
+    CachedDownload,
+    DownloadCache,
+    download_cache,
+)
 from edenai_apis.utils.files import FileInfo, FileWrapper
 from edenai_apis.utils.http import async_client
 
@@ -37,12 +43,28 @@ class _ShouldFallbackToCurl(Exception):
     """Signal to fall back to curl_cffi on 403 (TLS fingerprinting block)."""
 
 
+class _KeptInMemory(Exception):
+    """Signal that a download is kept in memory but too large for the memory cache."""
+
+    def __init__(self, file_type: str, content: bytes):
+        super().__init__(file_type)
+        self.file_type = file_type
+        self.content = content
+
+
+async def _single_chunk(content: bytes) -> AsyncIterator[bytes]:
+    yield content
+
+
 class FileHandler:
 
     SIZE_THRESHOLD = 100 * 1024 * 1024  # 100 Mb
 
-    def __init__(self):
-        pass
+    def __init__(self, cache: Optional[DownloadCache] = None, use_cache: bool = True):
+        # the process-wide download cache is shared by every provider
+        self.cache = None
+        if use_cache and DOWNLOAD_CACHE_ENABLED:
+            self.cache = cache if cache is not None else download_cache
 
     @staticmethod
     def get_user_agent():
@@ -115,12 +137,12 @@ class FileHandler:
         if force_file_create or file_size == -1 or file_size > self.SIZE_THRESHOLD:
             tmp_path = await self._stream_to_file(chunk_iterator)
             file_wrapper_params["file_path"] = tmp_path
-            file_wrapper_params["file_b64_content"] = None
         else:
-            content = await self._read_all_chunks(chunk_iterator)
-            b64_content = base64.b64encode(content).decode("utf-8")
+            # base64 is computed lazily by the FileWrapper, only if a provider needs it
             file_wrapper_params["file_path"] = None
-            file_wrapper_params["file_b64_content"] = b64_content
+            file_wrapper_params["file_bytes"] = await self._read_all_chunks(
+                chunk_iterator
+            )
 
         return FileWrapper(**file_wrapper_params)
 
@@ -135,10 +157,88 @@ class FileHandler:
             force_file_create: if True, always download to disk;
                 if False, small files are kept in memory
         """
+        if self.cache is None:
+            try:
+                return await self._download_with_httpx(file_url, force_file_create)
+            except _ShouldFallbackToCurl:
+                return await self._download_with_curl_cffi(file_url, force_file_create)
+        try:
+            file_wrapper = await self.cache.get(file_url, self._fetch_to_cache)
+        except _KeptInMemory as small:
+            return await self._build_file_wrapper(
+                file_url=file_url,
+                file_type=small.file_type,
+                file_size=len(small.content),
+                chunk_iterator=_single_chunk(small.content),
+                force_file_create=force_file_create,
+            )
+        if file_wrapper.file_path is None and force_file_create:
+            # cached in memory, the caller gets a file of its own
+            content = await file_wrapper.get_bytes()
+            return await self._build_file_wrapper(
+                file_url=file_url,
+                file_type=file_wrapper.file_info.file_media_type,
+                file_size=len(content),
+                chunk_iterator=_single_chunk(content),
+                force_file_create=True,
+            )
+        return file_wrapper
+
+    async def _fetch_to_cache(
+        self, file_url: str, conditional_headers: Dict[str, str]
+    ) -> Optional[CachedDownload]:
+        """
+        Download a file for the download cache, in memory up to SIZE_THRESHOLD.
+        Returns None if the server answered that the cached version is still valid,
+        raises _KeptInMemory if the file doesn't fit in the memory of the cache.
+        """
         try:
-            return await self._download_with_httpx(file_url, force_file_create)
+            async with async_client.stream(
+                "GET", file_url, headers={**self.get_user_agent(), **conditional_headers}
+            ) as response:
+                if response.status_code == 403:
+                    raise _ShouldFallbackToCurl(f"httpx got 403 for {file_url}")
+                if response.status_code == 304:
+                    return None
+                response.raise_for_status()
+                return await self._build_cached_download(
+                    response.headers, response.aiter_bytes()
+                )
         except _ShouldFallbackToCurl:
-            return await self._download_with_curl_cffi(file_url, force_file_create)
+            impersonate = self.get_browser_impersonation()
+            async with AsyncSession(impersonate=impersonate, timeout=120) as session:
+                response = await session.get(file_url, stream=True)
+                try:
+                    response.raise_for_status()
+                    return await self._build_cached_download(
+                        response.headers, response.aiter_content()
+                    )
+                finally:
+                    await response.aclose()
+
+    async def _build_cached_download(
+        self, headers, chunk_iterator: AsyncIterator[bytes]
+    ) -> CachedDownload:
+        file_size = self.parse_content_length(headers.get("Content-Length"))
+        if file_size == 0:
+            raise Exception("File size is 0")
+        file_type = headers.get("Content-Type", "application/octet-stream")
+        path, content = None, None
+        if 0 < file_size <= self.SIZE_THRESHOLD:
+            content = await self._read_all_chunks(chunk_iterator)
+            if len(content) > self.cache.max_memory_size:
+                raise _KeptInMemory(file_type, content)
+        else:
+            path = await self._stream_to_file(chunk_iterator)
+        return CachedDownload(
+            path=path,
+            size=len(content) if content is not None else os.path.getsize(path),
+            content_type=file_type,
+            file_extension=self.get_file_extension(file_type),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content=content,
+        )
 
     async def _download_with_httpx(
         self, file_url: str, force_file_create: bool
@@ -1,9 +1,18 @@
 import asyncio
 import base64
+import logging
+import mmap
 import os
-from typing import List, Optional
+import weakref
+from typing import AsyncIterator, List, Optional, Union
 import aiofiles
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 Mb
+
+FileContent = Union[bytes, bytearray, memoryview]
+
 
 class FileInfo:
     def __init__(
@@ -27,49 +36,109 @@ class FileInfo:
 
 
 class FileWrapper:
+    """
+    Input file given to a provider, either stored on disk (`file_path`),
+    in memory (`file_bytes`) or as base64 (`file_b64_content`).
+
+    Content is never copied more than needed: on-disk files are read through `mmap`,
+    in-memory content is exposed as a `memoryview` and base64 is computed lazily,
+    only once.
+    """
+
     def __init__(
         self,
         file_path,
         file_url,
         file_info,
         file_b64_content: str = None,
+        file_bytes: Optional[FileContent] = None,
     ) -> None:
         self.file_path = file_path
         self.file_url = file_url
         self.file_info = file_info
         self._file_b64_content = file_b64_content
+        self._file_bytes = file_bytes
+        self._mmap: Optional[mmap.mmap] = None
+        # views handed out over the map, released when the file is closed
+        self._mmap_views: List[memoryview] = []
 
     file_path: Optional[str]
     file_url: Optional[str]
     file_info: FileInfo
 
     _file_b64_content: Optional[str] = None
+    _file_bytes: Optional[FileContent] = None
+
+    def _get_mmap(self) -> Optional[mmap.mmap]:
+        """Map the file in memory (read only), None for empty files"""
+        if self._mmap is None or self._mmap.closed:
+            with open(self.file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get_memoryview(self) -> memoryview:
+        """Zero-copy view over the file content"""
+        if self._file_bytes is not None:
+            return memoryview(self._file_bytes)
+        if self.file_path:
+            file_map = self._get_mmap()
+            if file_map is None:
+                return memoryview(b"")
+            view = memoryview(file_map)
+            self._mmap_views.append(view)
+            return view
+        if self._file_b64_content:
+            self._file_bytes = base64.b64decode(self._file_b64_content)
+            return memoryview(self._file_bytes)
+        raise Exception("No file found...!")
 
     async def get_file_b64_content(self):
         if self._file_b64_content:
             return self._file_b64_content
-        if self.file_path:
-            async with aiofiles.open(self.file_path, "rb") as f:
-                content = await f.read()
-                self._file_b64_content = base64.b64encode(content).decode("utf-8")
-                f.close()
-                return self._file_b64_content
+        if self._file_bytes is not None or self.file_path:
+            # Offload CPU-bound base64 encoding to thread pool
+            encoded = await asyncio.to_thread(base64.b64encode, self.get_memoryview())
+            self._file_b64_content = encoded.decode("utf-8")
+            return self._file_b64_content
         raise Exception("No file found...!")
 
     async def get_bytes(self):
+        if isinstance(self._file_bytes, bytes):
+            return self._file_bytes
+        if self._file_bytes is not None:
+            return bytes(self._file_bytes)
         # If there's a filepath
         if self.file_path:
             async with aiofiles.open(self.file_path, "rb") as f:
                 return await f.read()
-        # If there's only the b64 info, decode and return bytes directly
+        # If there's only the b64 info, decode once and keep the bytes
         if self._file_b64_content:
             # Offload CPU-bound base64 decoding to thread pool
-            return await asyncio.to_thread(
+            self._file_bytes = await asyncio.to_thread(
                 base64.b64decode,
                 self._file_b64_content
             )
+            return self._file_bytes
         raise Exception("No file found...!")
 
+    async def iter_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Iterate over the file content without loading it entirely, eg: to stream an upload:
+            `await client.post(url, content=file_wrapper.iter_chunks())`
+        """
+        if self._file_bytes is None and self.file_path:
+            async with aiofiles.open(self.file_path, "rb") as f:
+                while chunk := await f.read(chunk_size):
+                    yield chunk
+            return
+        view = self.get_memoryview()
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+
     def get_file_content(self):
         if self.file_url:
             return self.file_url
@@ -77,11 +146,38 @@ class FileWrapper:
             return self.file_path
         raise Exception("No file found...!")
 
+    def _close_mmap(self) -> Optional[mmap.mmap]:
+        """Close the map, return it if it is still used and can't be closed yet"""
+        file_map, self._mmap = self._mmap, None
+        for view in self._mmap_views:
+            view.release()
+        self._mmap_views = []
+        if file_map is None or file_map.closed:
+            return None
+        try:
+            file_map.close()
+        except BufferError:
+            # slices of a released view are still alive somewhere
+            return file_map
+        return None
+
     def close_file(self):
+        file_map = self._close_mmap()
         if not self.file_path:
             return
-        try:
-            os.remove(self.file_path)
-        except OSError as e:
-            # The file was moved or deleted before the tempfile could unlink
-            pass
+        if file_map is not None:
+            logger.warning(
+                "%s is still mapped in memory, it will be removed once released",
+                self.file_path,
+            )
+            weakref.finalize(file_map, _remove_file, self.file_path)
+            return
+        _remove_file(self.file_path)
+
+
+def _remove_file(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+    except OSError:
+        # The file was moved or deleted before the tempfile could unlink
+        pass
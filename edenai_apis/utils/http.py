@@ -1,9 +1,10 @@
-import asyncio
 import logging
 from enum import Enum
 
 import httpx
 
+from edenai_apis.utils.loop_bridge import run_coroutine
+
 logger = logging.getLogger(__name__)
 
 async_client = httpx.AsyncClient(
@@ -21,9 +22,10 @@ def close():
     """Synchronously close both sync and async httpx clients."""
     try:
         if not async_client.is_closed:
-            asyncio.run(async_client.aclose())
+            # connections of the sync code paths are bound to the bridge loop
+            run_coroutine(async_client.aclose())
     except RuntimeError as exc:
-        # We're in an async event loop: can't use asyncio.run
+        # We're in an async event loop: can't block on the bridge loop
         raise RuntimeError(
             f"Couldn't close async_client: {exc}. "
             "Please use `aclose` if you are running in an event loop."
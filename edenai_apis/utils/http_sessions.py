@@ -0,0 +1,200 @@
+"""
+Process-wide `requests.Session` per provider, for synchronous code paths.
+
+Calling `requests.post` opens a new connection (and TLS handshake) on every call.
+Sessions of this registry keep connections alive and share them between threads:
+    - `pool_maxsize` connections are kept per host (`EDENAI_HTTP_POOL_SIZE`),
+    - responses with a retryable status (429, 502, 503, 504) are retried with an
+      exponential backoff, honoring `Retry-After` (capped to `max_retry_after`).
+      Only idempotent methods are retried, except on 429: a rejected request was
+      not processed, whatever its method. Connection failures are retried too.
+      The last response is returned as is, error handling stays with the caller,
+    - cookies are never stored, a session is shared by every caller of a provider,
+    - `session_stats` tells how many requests reused a connection.
+
+Usage:
+    response = provider_session("deepl").post(url, headers=headers, data=data)
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, FrozenSet, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+POOL_MAXSIZE = int(os.environ.get("EDENAI_HTTP_POOL_SIZE", 32))
+MAX_RETRIES = int(os.environ.get("EDENAI_HTTP_RETRIES", 3))
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class SessionPolicy:
+    """Connection pool and retry policy of the session of a provider"""
+
+    pool_maxsize: int = POOL_MAXSIZE
+    # number of hosts whose pool is kept
+    pool_connections: int = 10
+    max_retries: int = MAX_RETRIES
+    backoff_factor: float = 0.5
+    backoff_max: float = 20.0
+    max_retry_after: float = 30.0
+    retry_statuses: FrozenSet[int] = RETRY_STATUSES
+
+
+@dataclass
+class SessionStats:
+    """Requests sent and connections opened by the session of a provider"""
+
+    requests: int = 0
+    connections: int = 0
+    retries: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests sent on an already open connection"""
+        return max(self.requests - self.connections, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+
+class _ProviderRetry(Retry):
+    """Retry counting its retries, retrying any method on 429"""
+
+    stats: Optional[SessionStats] = None
+    max_retry_after: Optional[float] = None
+
+    def new(self, **kwargs) -> "_ProviderRetry":
+        retry = super().new(**kwargs)
+        retry.stats = self.stats
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code == 429 and status_code in self.status_forcelist:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None or self.max_retry_after is None:
+            return retry_after
+        return min(retry_after, self.max_retry_after)
+
+    def increment(self, *args, **kwargs) -> "_ProviderRetry":
+        retry = super().increment(*args, **kwargs)
+        if self.stats is not None:
+            self.stats.record("retries")
+        return retry
+
+
+def _counting_pool(pool_class, stats: SessionStats):
+    class CountingPool(pool_class):
+        def _new_conn(self):
+            stats.record("connections")
+            return super()._new_conn()
+
+    return CountingPool
+
+
+class _ProviderAdapter(HTTPAdapter):
+    def __init__(self, policy: SessionPolicy, stats: SessionStats) -> None:
+        self.stats = stats
+        retry = _ProviderRetry(
+            total=policy.max_retries,
+            connect=policy.max_retries,
+            read=policy.max_retries,
+            status=policy.max_retries,
+            backoff_factor=policy.backoff_factor,
+            backoff_max=policy.backoff_max,
+            status_forcelist=policy.retry_statuses,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        retry.stats = stats
+        retry.max_retry_after = policy.max_retry_after
+        super().__init__(
+            pool_connections=policy.pool_connections,
+            pool_maxsize=policy.pool_maxsize,
+            max_retries=retry,
+        )
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.stats),
+            "https": _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, *args, **kwargs) -> requests.Response:
+        self.stats.record("requests")
+        return super().send(request, *args, **kwargs)
+
+
+_policies: Dict[str, SessionPolicy] = {}
+_sessions: Dict[str, requests.Session] = {}
+_stats: Dict[str, SessionStats] = {}
+_lock = threading.Lock()
+
+
+def _new_session(policy: SessionPolicy, stats: SessionStats) -> requests.Session:
+    session = requests.Session()
+    # no state shared between the callers of a provider
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = _ProviderAdapter(policy, stats)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_session(provider_name: str, policy: SessionPolicy) -> None:
+    """Set the policy of a provider, its current session is replaced"""
+    with _lock:
+        _policies[provider_name] = policy
+        session = _sessions.pop(provider_name, None)
+    if session is not None:
+        session.close()
+
+
+def provider_session(provider_name: str) -> requests.Session:
+    """Shared session of a provider, created on first use"""
+    session = _sessions.get(provider_name)
+    if session is not None:
+        return session
+    with _lock:
+        if provider_name not in _sessions:
+            stats = _stats.setdefault(provider_name, SessionStats())
+            policy = _policies.get(provider_name, SessionPolicy())
+            _sessions[provider_name] = _new_session(policy, stats)
+        return _sessions[provider_name]
+
+
+def session_stats() -> Dict[str, SessionStats]:
+    """Connection reuse of the sessions, by provider"""
+    with _lock:
+        return dict(_stats)
+
+
+def close_sessions() -> None:
+    """Close the sessions of every provider, new ones are created on next use"""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
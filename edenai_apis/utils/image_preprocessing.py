@@ -0,0 +1,289 @@
+"""
+Downscaling and recompression of input images before they are sent to a provider.
+
+Phone photos are often 8-12 MB, far more than what most image subfeatures need. A
+subfeature opts in by declaring limits in the constraints of its info.json:
+    - `image_max_dimension`: maximum width and height, in pixels,
+    - `image_max_size`: maximum size of the file, in bytes,
+    - `image_pixel_coordinates`: true if the provider returns coordinates in pixels of
+      the image it received, they are then scaled back to the original image.
+
+Images within the limits are sent as they are. Larger ones are resized (keeping the
+aspect ratio and EXIF orientation) and recompressed in a pool of worker processes, as
+decoding and encoding are CPU bound.
+
+Usage:
+    with preprocessed_image_args("amazon", "image", "object_detection", "", args) as (
+        args, scale
+    ):
+        result = call(**args)
+    result = rescale_coordinates(result, scale)
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, Union
+
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.files import FileInfo, FileWrapper
+from edenai_apis.utils.media_probe import get_image_size
+
+MAX_IMAGE_WORKERS = int(os.environ.get("EDENAI_IMAGE_WORKERS", os.cpu_count() or 2))
+# quality steps tried until the image fits `image_max_size`
+JPEG_QUALITIES = (90, 80, 70, 60)
+# dimension reduction applied when the lowest quality is still too large
+SHRINK_FACTOR = 0.75
+MIN_DIMENSION = 256
+
+_X_COORDINATES = {"x", "x_min", "x_max", "left", "width"}
+_Y_COORDINATES = {"y", "y_min", "y_max", "top", "height"}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+@dataclass
+class ImageLimits:
+    max_dimension: Optional[int] = None
+    max_size: Optional[int] = None
+    pixel_coordinates: bool = False
+
+    @classmethod
+    def from_constraints(cls, constraints: Optional[Dict]) -> Optional["ImageLimits"]:
+        constraints = constraints or {}
+        if not constraints.get("image_max_dimension") and not constraints.get(
+            "image_max_size"
+        ):
+            return None
+        return cls(
+            max_dimension=constraints.get("image_max_dimension"),
+            max_size=constraints.get("image_max_size"),
+            pixel_coordinates=bool(constraints.get("image_pixel_coordinates")),
+        )
+
+
+@dataclass
+class DownscaledImage:
+    content: bytes
+    extension: str
+    mimetype: str
+    # size of the new image relative to the original one
+    scale_x: float
+    scale_y: float
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=MAX_IMAGE_WORKERS)
+    return _pool
+
+
+def _encode(image: Any, fmt: str, quality: int, exif: Optional[bytes]) -> bytes:
+    output = BytesIO()
+    options: Dict[str, Any] = {"optimize": True}
+    if fmt == "JPEG":
+        options["quality"] = quality
+    if exif:
+        options["exif"] = exif
+    image.save(output, format=fmt, **options)
+    return output.getvalue()
+
+
+def downscale_image(
+    content: bytes, max_dimension: Optional[int], max_size: Optional[int]
+) -> DownscaledImage:
+    """
+    Resize an image to fit in `max_dimension` and recompress it under `max_size`.
+    Runs in a worker process.
+    """
+    from PIL import Image
+
+    with Image.open(BytesIO(content)) as original:
+        width, height = original.size
+        exif = original.info.get("exif")
+        # transparency is kept with png, everything else becomes jpeg
+        has_alpha = original.mode in ("RGBA", "LA", "P") and (
+            original.mode != "P" or "transparency" in original.info
+        )
+        fmt = "PNG" if has_alpha else "JPEG"
+        image = original.convert("RGBA" if has_alpha else "RGB")
+
+    target = max(width, height)
+    if max_dimension:
+        target = min(target, max_dimension)
+    while True:
+        resized = image
+        if target < max(width, height):
+            ratio = target / max(width, height)
+            size = (max(1, round(width * ratio)), max(1, round(height * ratio)))
+            resized = image.resize(size, Image.LANCZOS)
+        for quality in JPEG_QUALITIES if fmt == "JPEG" else (None,):
+            data = _encode(resized, fmt, quality or 0, exif)
+            if not max_size or len(data) <= max_size:
+                break
+        if not max_size or len(data) <= max_size or target <= MIN_DIMENSION:
+            break
+        target = max(int(target * SHRINK_FACTOR), MIN_DIMENSION)
+
+    return DownscaledImage(
+        content=data,
+        extension="png" if fmt == "PNG" else "jpg",
+        mimetype="image/png" if fmt == "PNG" else "image/jpeg",
+        scale_x=resized.size[0] / width,
+        scale_y=resized.size[1] / height,
+    )
+
+
+def image_limits(
+    provider_name: str, feature: str, subfeature: str, phase: str = ""
+) -> Optional[ImageLimits]:
+    """Image limits declared in the constraints of a subfeature, None if it didn't opt in"""
+    info = load_provider(
+        ProviderDataEnum.PROVIDER_INFO,
+        provider_name=provider_name,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+    )
+    return ImageLimits.from_constraints(info.get("constraints"))
+
+
+def _is_resizable_image(file: Any) -> bool:
+    if not isinstance(file, FileWrapper):
+        return False
+    media_type = getattr(file.file_info, "file_media_type", None) or ""
+    # animated gifs would lose their frames
+    return media_type.startswith("image/") and media_type != "image/gif"
+
+
+def _source(file: FileWrapper) -> Union[str, bytes]:
+    """Path of the image if it is on disk, its content otherwise"""
+    if file._file_bytes is None and file.file_path:
+        return file.file_path
+    return bytes(file.get_memoryview())
+
+
+def _exceeds(source: Union[str, bytes], limits: ImageLimits) -> bool:
+    size = os.path.getsize(source) if isinstance(source, str) else len(source)
+    if limits.max_size and size > limits.max_size:
+        return True
+    if limits.max_dimension:
+        try:
+            width, height = get_image_size(source)
+        except Exception:
+            # not decodable here, let the provider tell
+            return False
+        return max(width, height) > limits.max_dimension
+    return False
+
+
+def _read(source: Union[str, bytes]) -> bytes:
+    if isinstance(source, bytes):
+        return source
+    with open(source, "rb") as image_file:
+        return image_file.read()
+
+
+def _downscaled_wrapper(file: FileWrapper, image: DownscaledImage) -> FileWrapper:
+    with tempfile.NamedTemporaryFile(
+        suffix=f".{image.extension}", delete=False
+    ) as output:
+        output.write(image.content)
+    file_info = FileInfo(len(image.content), image.mimetype, [image.extension])
+    # a file_url still points to the original image
+    return FileWrapper(output.name, file.file_url, file_info, file_bytes=image.content)
+
+
+def _replace_file(
+    args: Dict[str, Any], file: FileWrapper, image: DownscaledImage, limits: ImageLimits
+) -> Tuple[Dict[str, Any], FileWrapper, Optional[Tuple[float, float]]]:
+    wrapper = _downscaled_wrapper(file, image)
+    scale = (image.scale_x, image.scale_y) if limits.pixel_coordinates else None
+    return {**args, "file": wrapper}, wrapper, scale
+
+
+@contextmanager
+def preprocessed_image_args(
+    provider_name: str, feature: str, subfeature: str, phase: str, args: Dict[str, Any]
+) -> Iterator[Tuple[Dict[str, Any], Optional[Tuple[float, float]]]]:
+    """
+    Arguments of a call with their `file` image downscaled if it exceeds the limits of
+    the subfeature, and the (x, y) scale to undo on pixel coordinates of the result.
+    The downscaled file is removed when leaving the context.
+    """
+    limits = image_limits(provider_name, feature, subfeature, phase)
+    if not limits or not _is_resizable_image(args.get("file")):
+        yield args, None
+        return
+    source = _source(args["file"])
+    if not _exceeds(source, limits):
+        yield args, None
+        return
+    image = _get_pool().submit(
+        downscale_image, _read(source), limits.max_dimension, limits.max_size
+    ).result()
+    new_args, wrapper, scale = _replace_file(args, args["file"], image, limits)
+    try:
+        yield new_args, scale
+    finally:
+        wrapper.close_file()
+
+
+@asynccontextmanager
+async def apreprocessed_image_args(
+    provider_name: str, feature: str, subfeature: str, phase: str, args: Dict[str, Any]
+) -> AsyncIterator[Tuple[Dict[str, Any], Optional[Tuple[float, float]]]]:
+    """Async version of `preprocessed_image_args`, no image is decoded on the event loop"""
+    limits = image_limits(provider_name, feature, subfeature, phase)
+    if not limits or not _is_resizable_image(args.get("file")):
+        yield args, None
+        return
+    source = await asyncio.to_thread(_source, args["file"])
+    if not await asyncio.to_thread(_exceeds, source, limits):
+        yield args, None
+        return
+    content = await asyncio.to_thread(_read, source)
+    image = await asyncio.wrap_future(
+        _get_pool().submit(
+            downscale_image, content, limits.max_dimension, limits.max_size
+        )
+    )
+    new_args, wrapper, scale = await asyncio.to_thread(
+        _replace_file, args, args["file"], image, limits
+    )
+    try:
+        yield new_args, scale
+    finally:
+        wrapper.close_file()
+
+
+def rescale_coordinates(result: Any, scale: Optional[Tuple[float, float]]) -> Any:
+    """Pixel coordinates of a result (dict) scaled back to the original image"""
+    if scale is None:
+        return result
+    scale_x, scale_y = scale
+
+    def rescale(value: Any, key: Optional[str] = None) -> Any:
+        if isinstance(value, dict):
+            return {k: rescale(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [rescale(item, key) for item in value]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if key in _X_COORDINATES:
+                return value / scale_x
+            if key in _Y_COORDINATES:
+                return value / scale_y
+        return value
+
+    if isinstance(result, dict) and "standardized_response" in result:
+        return {
+            **result,
+            "standardized_response": rescale(result["standardized_response"]),
+        }
+    return result
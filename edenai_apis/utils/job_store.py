@@ -0,0 +1,265 @@
+"""
+Durable state of asynchronous provider jobs, shared by the launch and the result
+requests of a job.
+
+Pseudo-async jobs (whose result is known at launch) and jobs completed by a
+provider callback keep their result here, so that `get_job_result` is a local
+lookup instead of a search over a remote webhook inbox:
+    - states are read and written by `(provider_name, provider_job_id)`,
+    - every state expires after a ttl (`EDENAI_JOB_TTL` seconds, 7 days by default),
+      expired states are never returned and are purged from time to time,
+    - `statuses` returns the status of many jobs in one query.
+
+`JobStore` is the interface a shared store (Redis...) implements to be used by every
+host of a deployment, `set_job_store` installs it. The default `SQLiteJobStore` is
+stored in `EDENAI_JOB_STORE_PATH` (by default in a folder of the temporary directory
+specific to the user), and can be shared by the processes of a host.
+
+Usage:
+    job_store().put("nyckel", job_id, JobStatus.SUCCEEDED, result)
+    state = job_store().get("nyckel", job_id)
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_JOB_TTL = int(os.environ.get("EDENAI_JOB_TTL", 7 * 24 * 3600))
+DEFAULT_JOB_STORE_PATH = os.environ.get(
+    "EDENAI_JOB_STORE_PATH",
+    os.path.join(
+        tempfile.gettempdir(),
+        f"edenai_jobs_{os.getuid()}" if hasattr(os, "getuid") else "edenai_jobs",
+        "jobs.sqlite3",
+    ),
+)
+STORE_DIR_MODE = 0o700
+# seconds between two purges of the expired states
+PURGE_INTERVAL = 300
+# maximum number of job ids in one query of `statuses`
+_QUERY_CHUNK_SIZE = 500
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class JobState:
+    """State of a job, `result` is any JSON serializable value"""
+
+    provider_name: str
+    provider_job_id: str
+    status: JobStatus
+    result: Any
+    updated_at: float
+    expires_at: float
+
+
+class JobStore(ABC):
+    """Store of the states of asynchronous provider jobs"""
+
+    @abstractmethod
+    def put(
+        self,
+        provider_name: str,
+        provider_job_id: str,
+        status: JobStatus,
+        result: Any = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Create or replace the state of a job, kept for `ttl` seconds"""
+
+    @abstractmethod
+    def get(self, provider_name: str, provider_job_id: str) -> Optional[JobState]:
+        """State of a job, None if unknown or expired"""
+
+    @abstractmethod
+    def statuses(
+        self, provider_name: str, provider_job_ids: Iterable[str]
+    ) -> Dict[str, JobStatus]:
+        """Statuses of the known jobs among `provider_job_ids`"""
+
+    @abstractmethod
+    def delete(self, provider_name: str, provider_job_id: str) -> None:
+        """Forget a job"""
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Remove the expired states, returns how many were removed"""
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Args:
+        path (str): database file, ":memory:" for a store private to the process
+        default_ttl (float): seconds a state is kept when `put` is not given a ttl
+    """
+
+    def __init__(
+        self, path: str = DEFAULT_JOB_STORE_PATH, default_ttl: float = DEFAULT_JOB_TTL
+    ) -> None:
+        self.path = path
+        self.default_ttl = default_ttl
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memory_connection: Optional[sqlite3.Connection] = None
+        self._next_purge = 0.0
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, mode=STORE_DIR_MODE, exist_ok=True)
+            if hasattr(os, "getuid") and os.stat(directory).st_uid != os.getuid():
+                raise PermissionError(f"Job store folder {directory} can't be used")
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "provider_name TEXT NOT NULL, provider_job_id TEXT NOT NULL, "
+                "status TEXT NOT NULL, result TEXT, "
+                "updated_at REAL NOT NULL, expires_at REAL NOT NULL, "
+                "PRIMARY KEY (provider_name, provider_job_id)) WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_expires_at ON jobs (expires_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        if self.path != ":memory:":
+            # readers don't block the writer, committed writes survive a crash of
+            # the process (but not of the host)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        if self.path == ":memory:":
+            # every connection to ":memory:" opens a different database
+            if self._memory_connection is None:
+                self._memory_connection = self._connect()
+            return self._memory_connection
+        # one connection per thread, not inherited by a forked child
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.connection = self._connect()
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        if self.path != ":memory:":
+            yield self._connection()
+            return
+        # the connection to ":memory:" is shared by every thread
+        with self._lock:
+            yield self._connection()
+
+    def put(
+        self,
+        provider_name: str,
+        provider_job_id: str,
+        status: JobStatus,
+        result: Any = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        now = time.time()
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (provider_name, provider_job_id) DO UPDATE SET "
+                "status = excluded.status, result = excluded.result, "
+                "updated_at = excluded.updated_at, expires_at = excluded.expires_at",
+                (
+                    provider_name,
+                    str(provider_job_id),
+                    JobStatus(status).value,
+                    json.dumps(result),
+                    now,
+                    expires_at,
+                ),
+            )
+        if now >= self._next_purge:
+            self._next_purge = now + PURGE_INTERVAL
+            self.purge_expired()
+
+    def get(self, provider_name: str, provider_job_id: str) -> Optional[JobState]:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT status, result, updated_at, expires_at FROM jobs "
+                "WHERE provider_name = ? AND provider_job_id = ? AND expires_at > ?",
+                (provider_name, str(provider_job_id), time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        status, result, updated_at, expires_at = row
+        return JobState(
+            provider_name=provider_name,
+            provider_job_id=str(provider_job_id),
+            status=JobStatus(status),
+            result=json.loads(result) if result is not None else None,
+            updated_at=updated_at,
+            expires_at=expires_at,
+        )
+
+    def statuses(
+        self, provider_name: str, provider_job_ids: Iterable[str]
+    ) -> Dict[str, JobStatus]:
+        job_ids: List[str] = list(dict.fromkeys(str(id_) for id_ in provider_job_ids))
+        statuses: Dict[str, JobStatus] = {}
+        now = time.time()
+        with self._transaction() as connection:
+            for start in range(0, len(job_ids), _QUERY_CHUNK_SIZE):
+                chunk = job_ids[start : start + _QUERY_CHUNK_SIZE]
+                rows = connection.execute(
+                    "SELECT provider_job_id, status FROM jobs "
+                    "WHERE provider_name = ? AND expires_at > ? "
+                    f"AND provider_job_id IN ({', '.join('?' * len(chunk))})",
+                    (provider_name, now, *chunk),
+                )
+                statuses.update((job_id, JobStatus(status)) for job_id, status in rows)
+        return statuses
+
+    def delete(self, provider_name: str, provider_job_id: str) -> None:
+        with self._transaction() as connection:
+            connection.execute(
+                "DELETE FROM jobs WHERE provider_name = ? AND provider_job_id = ?",
+                (provider_name, str(provider_job_id)),
+            )
+
+    def purge_expired(self) -> int:
+        with self._transaction() as connection:
+            return connection.execute(
+                "DELETE FROM jobs WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def job_store() -> JobStore:
+    """Store of the process, a `SQLiteJobStore` unless `set_job_store` was called"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SQLiteJobStore()
+    return _store
+
+
+def set_job_store(store: Optional[JobStore]) -> None:
+    """Use `store` for every job of the process, None restores the default"""
+    global _store
+    with _store_lock:
+        _store = store
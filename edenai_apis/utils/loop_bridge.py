@@ -0,0 +1,113 @@
+"""
+Run coroutines from synchronous code on one long-lived event loop.
+
+`asgiref.async_to_sync` and `asyncio.run` set up a new event loop for every call,
+and the connections pooled by an `httpx.AsyncClient` on that loop can't be reused
+by the next one. Every sync -> async hop of the package goes through this bridge:
+    - one daemon thread runs a single event loop for the whole process, started on
+      first use (and again in a forked child, threads don't survive a fork),
+    - coroutines are submitted with `asyncio.run_coroutine_threadsafe`, the calling
+      thread blocks on the result, context variables are propagated,
+    - calling the bridge from a running event loop raises a `RuntimeError`, as
+      `async_to_sync` does: blocking the loop would stall every other task.
+
+Usage:
+    run_coroutine(check_content_moderation_async(*args, **kwargs))
+"""
+
+import asyncio
+import atexit
+import contextvars
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _LoopThread:
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.pid = os.getpid()
+        self._started = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, name="edenai_loop_bridge", daemon=True
+        )
+        self.thread.start()
+        self._started.wait()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    def stop(self) -> None:
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+
+
+_loop_thread: Optional[_LoopThread] = None
+_lock = threading.Lock()
+
+
+def bridge_loop() -> asyncio.AbstractEventLoop:
+    """Event loop of the bridge, started on first use"""
+    global _loop_thread
+    loop_thread = _loop_thread
+    if loop_thread is not None and loop_thread.pid == os.getpid():
+        return loop_thread.loop
+    with _lock:
+        if _loop_thread is None or _loop_thread.pid != os.getpid():
+            _loop_thread = _LoopThread()
+        return _loop_thread.loop
+
+
+async def _in_context(
+    coro: Coroutine[Any, Any, T], context: contextvars.Context
+) -> T:
+    return await asyncio.get_running_loop().create_task(coro, context=context)
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run `coro` on the bridge loop and wait for its result
+
+    Raises:
+        RuntimeError: called from a running event loop
+        TimeoutError: no result after `timeout` seconds, `coro` is cancelled
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "run_coroutine can't be called from a running event loop, "
+            "await the coroutine instead."
+        )
+    future = asyncio.run_coroutine_threadsafe(
+        _in_context(coro, contextvars.copy_context()), bridge_loop()
+    )
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def stop_bridge_loop() -> None:
+    """Stop the loop of the bridge, a new one is started on next use"""
+    global _loop_thread
+    with _lock:
+        loop_thread, _loop_thread = _loop_thread, None
+    if loop_thread is not None and loop_thread.pid == os.getpid():
+        loop_thread.stop()
+
+
+atexit.register(stop_bridge_loop)
@@ -0,0 +1,692 @@
+"""
+Header-only media probing.
+
+Reads the few bytes of container headers needed to get the properties of a media file,
+instead of spawning an ffprobe subprocess (`pydub.utils.mediainfo`) or fully decoding it
+(`PIL.Image.open`, `pypdf.PdfReader`):
+    - audio: WAV, FLAC, MP3, OGG (Vorbis/Opus), M4A/MP4 -> sample rate, channels, duration
+    - image: PNG, JPEG, WebP, GIF, TIFF -> width, height
+    - pdf: MediaBox of the first page -> width, height
+
+ffprobe / PIL / pypdf are only used as a fallback when the headers can't be parsed.
+Results are cached by path, inode, size and modification time of the probed file.
+"""
+
+import asyncio
+import os
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple, Union
+
+# Bytes read at the beginning (and end) of a file to find its headers
+PROBE_SIZE = 64 * 1024
+CACHE_SIZE = 4096
+
+Source = Union[str, bytes, bytearray, memoryview]
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    format: str
+    width: Optional[float] = None
+    height: Optional[float] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    duration: Optional[float] = None
+    bit_rate: Optional[int] = None
+
+
+class _Reader:
+    """Random access over a file path or in-memory content, reading only what's asked"""
+
+    def __init__(self, source: Source) -> None:
+        if isinstance(source, str):
+            self._file = open(source, "rb")
+            self._data = None
+            self.size = os.fstat(self._file.fileno()).st_size
+        else:
+            self._file = None
+            self._data = memoryview(source)
+            self.size = len(self._data)
+
+    def read_at(self, offset: int, size: int) -> bytes:
+        if offset < 0 or offset >= self.size:
+            return b""
+        if self._data is not None:
+            return bytes(self._data[offset : offset + size])
+        self._file.seek(offset)
+        return self._file.read(size)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+# ---------------------------------------------------------------- audio
+
+
+def _probe_wav(reader: _Reader, head: bytes) -> Optional[MediaInfo]:
+    offset = 12
+    sample_rate = channels = byte_rate = None
+    while offset + 8 <= reader.size:
+        chunk = reader.read_at(offset, 24)
+        if len(chunk) < 8:
+            return None
+        chunk_id, chunk_size = chunk[:4], struct.unpack("<I", chunk[4:8])[0]
+        if chunk_id == b"fmt ":
+            channels, sample_rate, byte_rate = struct.unpack("<HII", chunk[10:20])
+        elif chunk_id == b"data":
+            if not sample_rate:
+                return None
+            duration = chunk_size / byte_rate if byte_rate else None
+            return MediaInfo(
+                "wav",
+                sample_rate=sample_rate,
+                channels=channels,
+                duration=duration,
+                bit_rate=byte_rate * 8 if byte_rate else None,
+            )
+        offset += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _skip_id3(reader: _Reader) -> int:
+    header = reader.read_at(0, 10)
+    if header[:3] != b"ID3" or len(header) < 10:
+        return 0
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _probe_flac(reader: _Reader, offset: int) -> Optional[MediaInfo]:
+    block = reader.read_at(offset + 4, 4 + 34)
+    if len(block) < 38 or block[0] & 0x7F != 0:  # STREAMINFO must come first
+        return None
+    info = int.from_bytes(block[14:22], "big")
+    sample_rate = info >> 44
+    channels = ((info >> 41) & 0x7) + 1
+    total_samples = info & 0xFFFFFFFFF
+    duration = total_samples / sample_rate if sample_rate and total_samples else None
+    return MediaInfo("flac", sample_rate=sample_rate, channels=channels, duration=duration)
+
+
+_MP3_BITRATES = {
+    # (mpeg1, layer) -> kbps by index
+    (True, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (True, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (True, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (False, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (False, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _parse_mp3_frame_header(header: bytes) -> Optional[Tuple[int, int, int, int, int, int]]:
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = (header[1] >> 3) & 0x3
+    layer = 4 - ((header[1] >> 1) & 0x3)
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[(mpeg1, layer if mpeg1 or layer == 1 else 2)][bitrate_index]
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+    channels = 1 if header[3] >> 6 == 3 else 2
+    samples_per_frame = 384 if layer == 1 else (1152 if mpeg1 or layer == 2 else 576)
+    return version, layer, bitrate * 1000, sample_rate, channels, samples_per_frame
+
+
+def _probe_mp3(reader: _Reader, offset: int) -> Optional[MediaInfo]:
+    data = reader.read_at(offset, PROBE_SIZE)
+    for index in range(len(data) - 4):
+        frame = _parse_mp3_frame_header(data[index : index + 4])
+        if frame is None:
+            continue
+        version, _, bit_rate, sample_rate, channels, samples_per_frame = frame
+        # validate with the next frame to avoid false sync words
+        padding = (data[index + 2] >> 1) & 0x1
+        frame_length = samples_per_frame // 8 * bit_rate // sample_rate + padding
+        next_header = data[index + frame_length : index + frame_length + 4]
+        if _parse_mp3_frame_header(next_header) is None:
+            continue
+
+        duration = None
+        # Xing/Info (VBR) header gives the number of frames
+        side_info = (32 if channels == 2 else 17) if version == 3 else (17 if channels == 2 else 9)
+        xing_offset = index + 4 + side_info
+        if data[xing_offset : xing_offset + 4] in (b"Xing", b"Info"):
+            flags = struct.unpack(">I", data[xing_offset + 4 : xing_offset + 8])[0]
+            if flags & 0x1:
+                frames = struct.unpack(">I", data[xing_offset + 8 : xing_offset + 12])[0]
+                duration = frames * samples_per_frame / sample_rate
+        if duration is None:
+            duration = (reader.size - offset - index) * 8 / bit_rate
+            # ID3v1 tag at the end of the file
+            if reader.read_at(reader.size - 128, 3) == b"TAG":
+                duration = (reader.size - offset - index - 128) * 8 / bit_rate
+        return MediaInfo(
+            "mp3",
+            sample_rate=sample_rate,
+            channels=channels,
+            duration=duration,
+            bit_rate=bit_rate,
+        )
+    return None
+
+
+def _probe_ogg(reader: _Reader, head: bytes) -> Optional[MediaInfo]:
+    # first packet starts after the page header and its segment table
+    segments = head[26] if len(head) > 26 else 0
+    packet = head[27 + segments : 27 + segments + 30]
+    pre_skip = 0
+    if packet[:7] == b"\x01vorbis":
+        channels = packet[11]
+        sample_rate = struct.unpack("<I", packet[12:16])[0]
+        granule_rate = sample_rate
+    elif packet[:8] == b"OpusHead":
+        channels = packet[9]
+        pre_skip = struct.unpack("<H", packet[10:12])[0]
+        sample_rate = struct.unpack("<I", packet[12:16])[0] or 48000
+        granule_rate = 48000  # opus granule positions are always at 48kHz
+    else:
+        return None
+
+    # last page granule position gives the number of samples
+    tail_offset = max(0, reader.size - PROBE_SIZE)
+    tail = reader.read_at(tail_offset, PROBE_SIZE)
+    last_page = tail.rfind(b"OggS")
+    duration = None
+    if last_page != -1 and len(tail) >= last_page + 14:
+        granule = struct.unpack("<q", tail[last_page + 6 : last_page + 14])[0]
+        if granule > 0:
+            duration = (granule - pre_skip) / granule_rate
+    return MediaInfo("ogg", sample_rate=sample_rate, channels=channels, duration=duration)
+
+
+_MP4_CONTAINERS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _iter_boxes(reader: _Reader, start: int, end: int):
+    offset = start
+    while offset + 8 <= end:
+        header = reader.read_at(offset, 16)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_size = 16
+        elif size == 0:
+            size = end - offset
+        if size < header_size:
+            return
+        yield box_type, offset + header_size, offset + size
+        offset += size
+
+
+def _probe_mp4(reader: _Reader) -> Optional[MediaInfo]:
+    info = {}
+
+    def walk(start: int, end: int) -> None:
+        for box_type, body, box_end in _iter_boxes(reader, start, end):
+            if box_type in _MP4_CONTAINERS:
+                walk(body, box_end)
+            elif box_type == b"mvhd" and "duration" not in info:
+                data = reader.read_at(body, 32)
+                if data[0] == 1:
+                    timescale, duration = struct.unpack(">IQ", data[20:32])
+                else:
+                    timescale, duration = struct.unpack(">II", data[12:20])
+                if timescale:
+                    info["duration"] = duration / timescale
+            elif box_type == b"stsd" and "sample_rate" not in info:
+                # full box header (4) + entry count (4), then the first sample entry
+                entry = reader.read_at(body + 8, 8 + 28 + 4)
+                if entry[4:8] in (b"mp4a", b"alac", b"ac-3", b"ec-3", b"Opus", b"fLaC"):
+                    channels, _, _, _, sample_rate = struct.unpack(">HHHHI", entry[24:36])
+                    info["channels"] = channels
+                    info["sample_rate"] = sample_rate >> 16
+
+    walk(0, reader.size)
+    if "sample_rate" not in info and "duration" not in info:
+        return None
+    return MediaInfo("mp4", **info)
+
+
+# ---------------------------------------------------------------- image
+
+
+def _probe_jpeg(reader: _Reader) -> Optional[MediaInfo]:
+    offset = 2
+    while offset + 4 <= reader.size:
+        marker = reader.read_at(offset, 4)
+        if marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code == 0xFF:  # fill byte
+            offset += 1
+            continue
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            offset += 2
+            continue
+        length = struct.unpack(">H", marker[2:4])[0]
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", reader.read_at(offset + 5, 4))
+            return MediaInfo("jpeg", width=width, height=height)
+        offset += 2 + length
+    return None
+
+
+def _probe_webp(head: bytes) -> Optional[MediaInfo]:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return MediaInfo("webp", width=width & 0x3FFF, height=height & 0x3FFF)
+    if chunk == b"VP8L" and head[20] == 0x2F:
+        bits = struct.unpack("<I", head[21:25])[0]
+        return MediaInfo(
+            "webp", width=(bits & 0x3FFF) + 1, height=((bits >> 14) & 0x3FFF) + 1
+        )
+    if chunk == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return MediaInfo("webp", width=width, height=height)
+    return None
+
+
+def _probe_tiff(reader: _Reader, head: bytes) -> Optional[MediaInfo]:
+    endian = "<" if head[:2] == b"II" else ">"
+    ifd_offset = struct.unpack(endian + "I", head[4:8])[0]
+    count_data = reader.read_at(ifd_offset, 2)
+    if len(count_data) < 2:
+        return None
+    entries = reader.read_at(ifd_offset + 2, struct.unpack(endian + "H", count_data)[0] * 12)
+    size = {}
+    for index in range(0, len(entries) - 11, 12):
+        tag, field_type = struct.unpack(endian + "HH", entries[index : index + 4])
+        if tag not in (256, 257):
+            continue
+        if field_type == 3:  # SHORT
+            value = struct.unpack(endian + "H", entries[index + 8 : index + 10])[0]
+        else:  # LONG
+            value = struct.unpack(endian + "I", entries[index + 8 : index + 12])[0]
+        size[tag] = value
+    if 256 not in size or 257 not in size:
+        return None
+    return MediaInfo("tiff", width=size[256], height=size[257])
+
+
+# ---------------------------------------------------------------- pdf
+
+_NUMBER = rb"(-?\d+(?:\.\d+)?|-?\.\d+)"
+_MEDIABOX_ARRAY = rb"\[\s*" + rb"\s+".join([_NUMBER] * 4) + rb"\s*\]"
+_MEDIABOX_REGEX = re.compile(rb"/MediaBox\s*" + _MEDIABOX_ARRAY)
+_MEDIABOX_REF_REGEX = re.compile(rb"/MediaBox\s+(\d+)\s+\d+\s+R")
+_ARRAY_REGEX = re.compile(_MEDIABOX_ARRAY)
+_STARTXREF_REGEX = re.compile(rb"startxref\s+(\d+)")
+_XREF_SUBSECTION_REGEX = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*\r?\n?")
+_OBJECT_HEADER_REGEX = re.compile(rb"\s*\d+\s+\d+\s+obj\b")
+_ROOT_REGEX = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PREV_REGEX = re.compile(rb"/Prev\s+(\d+)")
+_PAGES_REGEX = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_FIRST_KID_REGEX = re.compile(rb"/Kids\s*\[\s*(\d+)\s+\d+\s+R")
+_PAGES_TYPE_REGEX = re.compile(rb"/Type\s*/Pages\b")
+_LENGTH_REGEX = re.compile(rb"/Length\s+(\d+)(?!\s+\d+\s+R)")
+_STREAM_START_REGEX = re.compile(rb"stream\r?\n")
+PDF_TAIL_SIZE = 1024
+PDF_OBJECT_SIZE = 4096
+_MAX_PDF_DEPTH = 32
+
+
+def _pdf_integers(dictionary: bytes, key: bytes) -> Optional[List[int]]:
+    match = re.search(rb"/" + key + rb"\s*\[([\d\s]*)\]", dictionary)
+    return [int(value) for value in match.group(1).split()] if match else None
+
+
+def _pdf_integer(dictionary: bytes, key: bytes, default: int) -> int:
+    match = re.search(rb"/" + key + rb"\s+(\d+)(?!\s+\d+\s+R)", dictionary)
+    return int(match.group(1)) if match else default
+
+
+def _png_unpredict(data: bytes, columns: int) -> bytes:
+    """Undo the PNG predictors (/Predictor >= 10) of a stream with one byte per pixel"""
+    rows = []
+    previous = bytearray(columns)
+    for start in range(0, len(data), columns + 1):
+        predictor, row = data[start], bytearray(data[start + 1 : start + 1 + columns])
+        for i in range(len(row)):
+            left = row[i - 1] if i else 0
+            if predictor == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif predictor == 2:
+                row[i] = (row[i] + previous[i]) & 0xFF
+            elif predictor == 3:
+                row[i] = (row[i] + (left + previous[i]) // 2) & 0xFF
+            elif predictor == 4:
+                up_left = previous[i - 1] if i else 0
+                estimate = left + previous[i] - up_left
+                distances = (
+                    abs(estimate - left),
+                    abs(estimate - previous[i]),
+                    abs(estimate - up_left),
+                )
+                row[i] = (
+                    row[i] + (left, previous[i], up_left)[distances.index(min(distances))]
+                ) & 0xFF
+        rows.append(bytes(row))
+        previous = row
+    return b"".join(rows)
+
+
+class _PdfDocument:
+    """
+    Lazy access to the objects of a pdf: the cross-reference table (or stream) is read
+    from the end of the file, then each object is read from its offset when asked.
+    """
+
+    def __init__(self, reader: _Reader) -> None:
+        self.reader = reader
+        # object number -> byte offset, or (object stream number, index in the stream)
+        self.xref: Dict[int, Union[int, Tuple[int, int]]] = {}
+        self.root: Optional[int] = None
+        self._object_streams: Dict[int, Tuple[bytes, List[int]]] = {}
+        tail = reader.read_at(max(reader.size - PDF_TAIL_SIZE, 0), PDF_TAIL_SIZE)
+        matches = _STARTXREF_REGEX.findall(tail)
+        offset = int(matches[-1]) if matches else None
+        seen = set()
+        # follow the /Prev of incremental updates, the most recent one is read first
+        while offset is not None and offset not in seen and len(seen) < _MAX_PDF_DEPTH:
+            seen.add(offset)
+            if reader.read_at(offset, 4) == b"xref":
+                trailer = self._read_xref_table(offset + 4)
+            else:
+                trailer = self._read_xref_stream(offset)
+            root = _ROOT_REGEX.search(trailer)
+            if self.root is None and root:
+                self.root = int(root.group(1))
+            prev = _PREV_REGEX.search(trailer)
+            offset = int(prev.group(1)) if prev else None
+
+    def _read_xref_table(self, position: int) -> bytes:
+        while True:
+            subsection = _XREF_SUBSECTION_REGEX.match(self.reader.read_at(position, 64))
+            if subsection is None:
+                break
+            first, count = (int(value) for value in subsection.groups())
+            position += subsection.end()
+            # entries are exactly 20 bytes: "oooooooooo ggggg n\r\n"
+            table = self.reader.read_at(position, count * 20)
+            for index in range(count):
+                entry = table[index * 20 : index * 20 + 20]
+                if entry[17:18] == b"n":
+                    self.xref.setdefault(first + index, int(entry[:10]))
+            position += count * 20
+        trailer = self.reader.read_at(position, PDF_OBJECT_SIZE)
+        end = trailer.find(b"startxref")
+        return trailer[:end] if end >= 0 else trailer
+
+    def _read_xref_stream(self, offset: int) -> bytes:
+        dictionary, data = self._stream(offset)
+        widths = _pdf_integers(dictionary, b"W")
+        if widths is None or len(widths) != 3:
+            raise ValueError("invalid pdf cross-reference stream")
+        index = _pdf_integers(dictionary, b"Index") or [
+            0,
+            _pdf_integer(dictionary, b"Size", 0),
+        ]
+        entry_size = sum(widths)
+        position = 0
+        for first, count in zip(index[::2], index[1::2]):
+            for number in range(first, first + count):
+                entry = data[position : position + entry_size]
+                position += entry_size
+                fields, start = [], 0
+                for width in widths:
+                    fields.append(int.from_bytes(entry[start : start + width], "big"))
+                    start += width
+                kind = fields[0] if widths[0] else 1
+                if kind == 1:
+                    self.xref.setdefault(number, fields[1])
+                elif kind == 2:
+                    self.xref.setdefault(number, (fields[1], fields[2]))
+        return dictionary
+
+    def _stream(self, offset: int) -> Tuple[bytes, bytes]:
+        """Dictionary and decoded data of the stream object at `offset`"""
+        content = self.reader.read_at(offset, PDF_OBJECT_SIZE)
+        if _OBJECT_HEADER_REGEX.match(content) is None:
+            raise ValueError("invalid pdf stream object")
+        start = _STREAM_START_REGEX.search(content)
+        length = _LENGTH_REGEX.search(content, 0, start.start() if start else None)
+        if start is None or length is None:
+            raise ValueError("unsupported pdf stream")
+        dictionary = content[: start.start()]
+        data = self.reader.read_at(offset + start.end(), int(length.group(1)))
+        if b"/Filter" in dictionary:
+            if not re.search(rb"/Filter\s*\[?\s*/FlateDecode\s*\]?", dictionary):
+                raise ValueError("unsupported pdf stream filter")
+            data = zlib.decompress(data)
+        if _pdf_integer(dictionary, b"Predictor", 1) >= 10:
+            data = _png_unpredict(data, _pdf_integer(dictionary, b"Columns", 1))
+        return dictionary, data
+
+    def object(self, number: int) -> bytes:
+        """Content of an indirect object, without its stream data"""
+        location = self.xref.get(number)
+        if location is None:
+            raise ValueError(f"pdf object {number} not found")
+        if isinstance(location, tuple):
+            return self._compressed_object(*location)
+        content = self.reader.read_at(location, PDF_OBJECT_SIZE)
+        if _OBJECT_HEADER_REGEX.match(content) is None:
+            raise ValueError(f"invalid pdf object {number}")
+        end = content.find(b"endobj")
+        if end < 0:
+            # eg: a page with a large inline dictionary
+            content = self.reader.read_at(location, PROBE_SIZE)
+            end = content.find(b"endobj")
+        if end >= 0:
+            content = content[:end]
+        stream = _STREAM_START_REGEX.search(content)
+        return content[: stream.start()] if stream else content
+
+    def _compressed_object(self, stream_number: int, index: int) -> bytes:
+        if stream_number not in self._object_streams:
+            offset = self.xref.get(stream_number)
+            if not isinstance(offset, int):
+                raise ValueError(f"pdf object stream {stream_number} not found")
+            dictionary, data = self._stream(offset)
+            first = _pdf_integer(dictionary, b"First", 0)
+            header = [int(value) for value in data[:first].split()]
+            offsets = [first + offset for offset in header[1::2]] + [len(data)]
+            self._object_streams[stream_number] = (data, offsets)
+        data, offsets = self._object_streams[stream_number]
+        return data[offsets[index] : offsets[index + 1]]
+
+    def mediabox(self, body: bytes) -> Optional[Tuple[bytes, ...]]:
+        mediabox = _MEDIABOX_REGEX.search(body)
+        if mediabox:
+            return mediabox.groups()
+        reference = _MEDIABOX_REF_REGEX.search(body)
+        if reference:
+            array = _ARRAY_REGEX.search(self.object(int(reference.group(1))))
+            return array.groups() if array else None
+        return None
+
+
+def _probe_pdf(reader: _Reader) -> Optional[MediaInfo]:
+    """
+    MediaBox of the first page, found from the trailer: only the cross-reference
+    table, the catalog and the page tree nodes down to the first page are read.
+    The MediaBox can be inherited from the page tree nodes.
+    """
+    document = _PdfDocument(reader)
+    if document.root is None:
+        return None
+    pages = _PAGES_REGEX.search(document.object(document.root))
+    if pages is None:
+        return None
+    node, mediabox = int(pages.group(1)), None
+    for _ in range(_MAX_PDF_DEPTH):
+        body = document.object(node)
+        mediabox = document.mediabox(body) or mediabox
+        kid = _FIRST_KID_REGEX.search(body)
+        if not _PAGES_TYPE_REGEX.search(body) or kid is None:
+            break
+        node = int(kid.group(1))
+    if mediabox is None:
+        return None
+    x1, y1, x2, y2 = (float(value) for value in mediabox)
+    return MediaInfo("pdf", width=abs(x2 - x1), height=abs(y2 - y1))
+
+
+# ---------------------------------------------------------------- probe
+
+
+def _probe_headers(reader: _Reader) -> Optional[MediaInfo]:
+    head = reader.read_at(0, 64)
+    if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", head[16:24])
+        return MediaInfo("png", width=width, height=height)
+    if head[:3] == b"\xff\xd8\xff":
+        return _probe_jpeg(reader)
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        width, height = struct.unpack("<HH", head[6:10])
+        return MediaInfo("gif", width=width, height=height)
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return _probe_webp(head)
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return _probe_wav(reader, head)
+    if head[:4] in (b"II*\x00", b"MM\x00*"):
+        return _probe_tiff(reader, head)
+    if head[:5] == b"%PDF-":
+        return _probe_pdf(reader)
+    if head[:4] == b"OggS":
+        return _probe_ogg(reader, head)
+    if head[4:8] == b"ftyp":
+        return _probe_mp4(reader)
+
+    offset = _skip_id3(reader)
+    if reader.read_at(offset, 4) == b"fLaC":
+        return _probe_flac(reader, offset)
+    return _probe_mp3(reader, offset)
+
+
+_probe_cache: "OrderedDict[Tuple, Optional[MediaInfo]]" = OrderedDict()
+
+# formats recognized from their signature that ffprobe can't tell more about
+_NON_MEDIA_SIGNATURES = (
+    (0, b"%PDF-", "pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpeg"),
+    (0, b"GIF8", "gif"),
+    (8, b"WEBP", "webp"),
+    (0, b"II*\x00", "tiff"),
+    (0, b"MM\x00*", "tiff"),
+)
+
+
+def _non_media_format(head: bytes) -> Optional[str]:
+    for offset, signature, name in _NON_MEDIA_SIGNATURES:
+        if head[offset : offset + len(signature)] == signature:
+            return name
+    return None
+
+
+def _probe_source(source: Source) -> Optional[MediaInfo]:
+    reader = _Reader(source)
+    try:
+        return _probe_headers(reader)
+    except (struct.error, IndexError, ValueError, ZeroDivisionError, zlib.error):
+        return None
+    finally:
+        reader.close()
+
+
+def probe(source: Source) -> Optional[MediaInfo]:
+    """
+    Get media properties of a file path or in-memory content from its headers only.
+    Results for file paths are cached by path, inode, size and modification time.
+
+    Returns:
+        MediaInfo, or None if the format isn't recognized or the headers are invalid
+    """
+    if not isinstance(source, str):
+        return _probe_source(source)
+
+    stat = os.stat(source)
+    key = (source, stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    if key in _probe_cache:
+        _probe_cache.move_to_end(key)
+        return _probe_cache[key]
+
+    result = _probe_source(source)
+    _probe_cache[key] = result
+    if len(_probe_cache) > CACHE_SIZE:
+        _probe_cache.popitem(last=False)
+    return result
+
+
+def mediainfo(file_path: str) -> Dict[str, str]:
+    """
+    Drop-in replacement of `pydub.utils.mediainfo`: probes headers and only spawns
+    ffprobe for audio/video formats that can't be parsed. Documents and images whose
+    headers can't be parsed only get their "format_name".
+
+    Returns:
+        Dict[str, str]: "sample_rate", "channels", "duration", "bit_rate", "width", "height"
+        when known (values are strings, like ffprobe's)
+    """
+    info = probe(file_path)
+    if info is None:
+        with open(file_path, "rb") as f:
+            non_media_format = _non_media_format(f.read(16))
+        if non_media_format is not None:
+            return {"format_name": non_media_format}
+
+        from pydub.utils import mediainfo as ffprobe_mediainfo
+
+        return ffprobe_mediainfo(file_path)
+    return {
+        key: str(value)
+        for key, value in asdict(info).items()
+        if value is not None and key != "format"
+    } | {"format_name": info.format}
+
+
+def get_image_size(content: Source) -> Tuple[float, float]:
+    """Width and height of an image (file path or content), decoding it with PIL only if needed"""
+    info = probe(content)
+    if info is not None and info.width is not None and info.height is not None:
+        return info.width, info.height
+
+    from PIL import Image
+
+    with Image.open(content if isinstance(content, str) else BytesIO(content)) as img:
+        return img.size
+
+
+async def aget_image_size(content: Source) -> Tuple[float, float]:
+    """Async version of `get_image_size`, decoding with PIL happens in a worker thread"""
+    info = probe(content)
+    if info is not None and info.width is not None and info.height is not None:
+        return info.width, info.height
+    return await asyncio.to_thread(get_image_size, content)
+
+
+def get_pdf_size(content: Source) -> Optional[Tuple[float, float]]:
+    """Width and height of the first page of a pdf from its MediaBox, None if unknown"""
+    info = probe(content)
+    if info is None or info.format != "pdf":
+        return None
+    return info.width, info.height
@@ -0,0 +1,202 @@
+"""
+Bounded-memory assembly of paginated provider results.
+
+Instead of accumulating every raw page in a list and parsing them all at the end,
+each page is parsed into standardized items as soon as it is fetched. What happens to
+the raw page afterwards depends on `RawPages`:
+    - INLINE: kept and returned as `original_response` (list of pages, historical
+      behavior)
+    - DROP: discarded, `original_response` only holds the number of pages
+    - SPILL: appended to a JSON lines file on disk, `original_response` gives its path.
+      The file is removed once that `original_response` is garbage collected, when
+      `cleanup` is called, or right away if the pages can't all be fetched.
+
+The default mode can be set with the `EDENAI_RAW_PAGES` environment variable.
+"""
+
+import json
+import os
+import tempfile
+import weakref
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class RawPages(str, Enum):
+    INLINE = "inline"
+    DROP = "drop"
+    SPILL = "spill"
+
+
+DEFAULT_RAW_PAGES = RawPages(os.environ.get("EDENAI_RAW_PAGES", RawPages.INLINE.value))
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class SpilledPages(dict):
+    """`original_response` of spilled raw pages, their file lives as long as it does"""
+
+
+def iter_pages(
+    fetch_page: Callable[[Optional[str]], dict],
+    first_page: Optional[dict] = None,
+    token_key: str = "NextToken",
+) -> Iterator[dict]:
+    """
+    Yield pages one at a time, following the pagination token.
+
+    Args:
+        fetch_page (Callable): fetch a page from its pagination token (None for the
+            first page)
+        first_page (dict): first page if already fetched (eg: to check the job status)
+        token_key (str): key of the pagination token in a page
+    """
+    page = first_page if first_page is not None else fetch_page(None)
+    while True:
+        yield page
+        token = page.get(token_key)
+        if not token:
+            return
+        page = fetch_page(token)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[dict]],
+    first_page: Optional[dict] = None,
+    token_key: str = "NextToken",
+) -> AsyncIterator[dict]:
+    """Async version of `iter_pages`"""
+    page = first_page if first_page is not None else await fetch_page(None)
+    while True:
+        yield page
+        token = page.get(token_key)
+        if not token:
+            return
+        page = await fetch_page(token)
+
+
+class PageAssembler(Generic[T]):
+    """
+    Parse pages into standardized items as they arrive.
+
+    Usage:
+        assembler = PageAssembler(amazon_video_labels_parser).consume(iter_pages(fetch))
+        LabelDetectionAsyncDataClass(labels=assembler.items)
+
+    Args:
+        parse_page (Callable): returns the standardized items of a raw page
+        raw_pages (RawPages): what to do with raw pages once parsed
+        spill_dir (str): directory of the spill file, defaults to the temp directory
+    """
+
+    def __init__(
+        self,
+        parse_page: Callable[[Any], Iterable[T]],
+        raw_pages: Optional[RawPages] = None,
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        self.parse_page = parse_page
+        self.raw_pages = RawPages(raw_pages or DEFAULT_RAW_PAGES)
+        self.spill_dir = spill_dir
+        self.items: List[T] = []
+        self.num_pages = 0
+        self._pages: List[Any] = []
+        self._spill_file = None
+        self._spilled: Optional[SpilledPages] = None
+        self._remove_spill: Optional[weakref.finalize] = None
+        self.spill_path: Optional[str] = None
+
+    def add(self, page: Any) -> None:
+        self.items.extend(self.parse_page(page))
+        self.num_pages += 1
+        if self.raw_pages == RawPages.INLINE:
+            self._pages.append(page)
+        elif self.raw_pages == RawPages.SPILL:
+            self._spill(page)
+
+    def consume(self, pages: Iterable[Any]) -> "PageAssembler[T]":
+        try:
+            for page in pages:
+                self.add(page)
+        except BaseException:
+            self.cleanup()
+            raise
+        finally:
+            self.close()
+        return self
+
+    async def aconsume(self, pages: AsyncIterator[Any]) -> "PageAssembler[T]":
+        try:
+            async for page in pages:
+                self.add(page)
+        except BaseException:
+            self.cleanup()
+            raise
+        finally:
+            self.close()
+        return self
+
+    def _spill(self, page: Any) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.NamedTemporaryFile(
+                "w",
+                suffix=".jsonl",
+                prefix="raw_pages_",
+                dir=self.spill_dir,
+                delete=False,
+                encoding="utf-8",
+            )
+            self.spill_path = self._spill_file.name
+            self._spilled = SpilledPages(raw_pages_path=self.spill_path)
+            self._remove_spill = weakref.finalize(
+                self._spilled, _remove_file, self.spill_path
+            )
+        self._spill_file.write(json.dumps(page, default=str))
+        self._spill_file.write("\n")
+
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def cleanup(self) -> None:
+        """Remove the spill file, if any"""
+        self.close()
+        if self._remove_spill is not None:
+            self._remove_spill()
+
+    @property
+    def original_response(self) -> Any:
+        if self.raw_pages == RawPages.INLINE:
+            return self._pages
+        if self.raw_pages == RawPages.SPILL:
+            if self._spilled is None:
+                return {"num_pages": 0, "raw_pages_path": None}
+            self._spilled["num_pages"] = self.num_pages
+            return self._spilled
+        return {"num_pages": self.num_pages}
+
+
+def read_spilled_pages(path: str) -> Iterator[dict]:
+    """Read back the raw pages spilled by a PageAssembler"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
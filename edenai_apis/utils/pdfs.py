@@ -1,19 +1,28 @@
 from io import BufferedReader
-from typing import Tuple
+from typing import Tuple, Union
 
 import pypdf
 
+from edenai_apis.utils.media_probe import get_pdf_size
 
-def get_pdf_width_height(pdf_file: BufferedReader) -> Tuple[float, float]:
+
+def get_pdf_width_height(pdf_file: Union[str, BufferedReader]) -> Tuple[float, float]:
     """
     Read a pdf file and returns its width and height
 
     Args:
-        - pdf_file (io.BufferedReaer): a pdf file
+        - pdf_file (io.BufferedReaer | str): a pdf file or its path
 
     Returns:
         - width, height: a tuple(float, float) representing width & height
     """
+    # header probe first, pypdf only if the MediaBox can't be found directly
+    size = get_pdf_size(pdf_file if isinstance(pdf_file, str) else pdf_file.read())
+    if size is not None:
+        return size
+
+    if not isinstance(pdf_file, str):
+        pdf_file.seek(0)
     reader = pypdf.PdfReader(pdf_file)
     rectangle_box = reader.pages[0].mediabox
     width = float(rectangle_box.width)
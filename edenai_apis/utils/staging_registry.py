@@ -0,0 +1,337 @@
+"""
+Process-wide registry of files staged on provider-side storage, keyed by content hash.
+
+When the same file is sent to several providers (or several times to the same one),
+it is only uploaded once per destination. The location returned by the first upload
+(presigned url, gs:// uri, provider file name...) is reused as long as it stays valid
+for at least `min_validity` seconds:
+    - concurrent uploads of the same content to the same destination are deduplicated,
+    - entries expire after the `ttl` given at upload time (eg: presigned url expiration),
+    - an optional `on_expire` callback is called when an entry expires or is evicted,
+      to delete the staged file. Callbacks never run under the registry lock, and run
+      in a worker thread when triggered from `astage`, as they usually do blocking I/O.
+
+The registry can be disabled with `EDENAI_STAGING_DEDUP=0`.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+STAGING_DEDUP_ENABLED = os.environ.get("EDENAI_STAGING_DEDUP", "1") != "0"
+# staged files are kept at most 3 hours, like the files uploaded to Gemini
+DEFAULT_STAGING_TTL = 3 * 3600
+# minimum remaining validity for a location to be reused, so that the provider
+# still has time to fetch it
+DEFAULT_MIN_VALIDITY = int(os.environ.get("EDENAI_STAGING_MIN_VALIDITY", 15 * 60))
+DEFAULT_MAX_ENTRIES = 4096
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+Key = Tuple[str, str]
+
+
+@dataclass
+class StagedObject:
+    """File staged on a destination"""
+
+    location: str
+    expires_at: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    on_expire: Optional[Callable[["StagedObject"], None]] = None
+
+    def remaining(self) -> float:
+        return self.expires_at - time.time()
+
+
+_hash_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+_HASH_CACHE_SIZE = 256
+_hash_lock = threading.Lock()
+
+
+def content_hash(file: Union[str, bytes, memoryview]) -> str:
+    """
+    Hash of a file content (path or bytes).
+
+    Hashes of files on disk are cached by path, size, inode and modification time so that
+    a file shared by several providers is only read once.
+    """
+    if not isinstance(file, str):
+        return hashlib.blake2b(file, digest_size=20).hexdigest()
+
+    stat = os.stat(file)
+    cache_key = (os.path.realpath(file), stat.st_size, stat.st_ino, stat.st_mtime_ns)
+    with _hash_lock:
+        digest = _hash_cache.get(cache_key)
+        if digest is not None:
+            _hash_cache.move_to_end(cache_key)
+            return digest
+
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(file, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    digest = hasher.hexdigest()
+
+    with _hash_lock:
+        _hash_cache[cache_key] = digest
+        while len(_hash_cache) > _HASH_CACHE_SIZE:
+            _hash_cache.popitem(last=False)
+    return digest
+
+
+class StagingRegistry:
+    """
+    Args:
+        max_entries (int): maximum number of staged files tracked
+        enabled (bool): if False, every call uploads the file
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, enabled: bool = STAGING_DEDUP_ENABLED
+    ) -> None:
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[Key, StagedObject]" = OrderedDict()
+        self._locations: Dict[str, Key] = {}
+        self._lock = threading.Lock()
+        # lock of each key being staged, with how many calls hold or wait for it
+        self._key_locks: Dict[Key, Tuple[threading.Lock, int]] = {}
+        self._inflight: Dict[Key, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(
+        self, destination: str, digest: str, min_validity: Optional[float] = None
+    ) -> Optional[StagedObject]:
+        """Staged object for this content if still valid for at least `min_validity` seconds"""
+        self.purge_expired()
+        return self._lookup(destination, digest, min_validity)
+
+    def _lookup(
+        self, destination: str, digest: str, min_validity: Optional[float]
+    ) -> Optional[StagedObject]:
+        if min_validity is None:
+            min_validity = DEFAULT_MIN_VALIDITY
+        key = (destination, digest)
+        with self._lock:
+            staged = self._entries.get(key)
+            if staged is None or staged.remaining() < min_validity:
+                return None
+            self._entries.move_to_end(key)
+            return staged
+
+    def register(
+        self,
+        destination: str,
+        digest: str,
+        location: str,
+        ttl: float,
+        metadata: Optional[Dict[str, Any]] = None,
+        on_expire: Optional[Callable[[StagedObject], None]] = None,
+    ) -> StagedObject:
+        staged, expired = self._register(
+            destination, digest, location, ttl, metadata, on_expire
+        )
+        self._expire(expired)
+        return staged
+
+    def _register(
+        self,
+        destination: str,
+        digest: str,
+        location: str,
+        ttl: float,
+        metadata: Optional[Dict[str, Any]] = None,
+        on_expire: Optional[Callable[[StagedObject], None]] = None,
+    ) -> Tuple[StagedObject, List[StagedObject]]:
+        """Register a staged object, returns it with the entries it replaced or evicted"""
+        staged = StagedObject(
+            location=location,
+            expires_at=time.time() + ttl,
+            metadata=metadata or {},
+            on_expire=on_expire,
+        )
+        if not self.enabled:
+            return staged, []
+        key = (destination, digest)
+        expired = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._locations.pop(previous.location, None)
+                expired.append(previous)
+            self._entries[key] = staged
+            self._locations[location] = key
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._locations.pop(evicted.location, None)
+                expired.append(evicted)
+        return staged, expired
+
+    def holds(self, location: str) -> bool:
+        """Whether the registry may hand out this location to other calls"""
+        with self._lock:
+            return location in self._locations
+
+    def invalidate(self, location: str) -> None:
+        """Forget a staged location (eg: deleted or rejected by the provider)"""
+        with self._lock:
+            key = self._locations.pop(location, None)
+            if key is not None:
+                self._entries.pop(key, None)
+
+    def purge_expired(self) -> None:
+        self._expire(self._pop_expired())
+
+    def _pop_expired(self) -> List[StagedObject]:
+        now = time.time()
+        expired = []
+        with self._lock:
+            for key, staged in list(self._entries.items()):
+                if staged.expires_at <= now:
+                    del self._entries[key]
+                    self._locations.pop(staged.location, None)
+                    expired.append(staged)
+        return expired
+
+    def clear(self) -> None:
+        with self._lock:
+            expired = list(self._entries.values())
+            self._entries.clear()
+            self._locations.clear()
+        self._expire(expired)
+
+    def stage(
+        self,
+        destination: str,
+        file: Union[str, bytes],
+        upload: Callable[[], str],
+        ttl: float = DEFAULT_STAGING_TTL,
+        min_validity: Optional[float] = None,
+        on_expire: Optional[Callable[[StagedObject], None]] = None,
+    ) -> str:
+        """
+        Location of `file` on `destination`, calling `upload` only if it is not
+        already staged there.
+
+        Args:
+            destination (str): storage the file is uploaded to (eg: "s3:bucket")
+            file (str | bytes): path or content of the file
+            upload (Callable): uploads the file and returns its location
+            ttl (float): seconds during which the returned location stays valid
+            min_validity (float): minimum remaining validity to reuse a location
+            on_expire (Callable): called with the staged object once it expires
+        """
+        if not self.enabled:
+            return upload()
+        digest = content_hash(file)
+        key = (destination, digest)
+        key_lock = self._acquire_key_lock(key)
+        try:
+            with key_lock:
+                staged = self.lookup(destination, digest, min_validity)
+                if staged is not None:
+                    self.hits += 1
+                    return staged.location
+                self.misses += 1
+                location = upload()
+                self.register(destination, digest, location, ttl, on_expire=on_expire)
+        finally:
+            self._release_key_lock(key)
+        return location
+
+    def _acquire_key_lock(self, key: Key) -> threading.Lock:
+        """Lock of `key`, dropped when no call holds or waits for it anymore"""
+        with self._lock:
+            key_lock, users = self._key_locks.get(key, (None, 0))
+            if key_lock is None:
+                key_lock = threading.Lock()
+            self._key_locks[key] = (key_lock, users + 1)
+        return key_lock
+
+    def _release_key_lock(self, key: Key) -> None:
+        with self._lock:
+            key_lock, users = self._key_locks[key]
+            if users == 1:
+                del self._key_locks[key]
+            else:
+                self._key_locks[key] = (key_lock, users - 1)
+
+    async def astage(
+        self,
+        destination: str,
+        file: Union[str, bytes],
+        upload: Callable[[], Awaitable[str]],
+        ttl: float = DEFAULT_STAGING_TTL,
+        min_validity: Optional[float] = None,
+        on_expire: Optional[Callable[[StagedObject], None]] = None,
+    ) -> str:
+        """Async version of `stage`"""
+        if not self.enabled:
+            return await upload()
+        if isinstance(file, str):
+            digest = await asyncio.to_thread(content_hash, file)
+        else:
+            digest = content_hash(file)
+        key = (destination, digest)
+
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.hits += 1
+            return await asyncio.shield(task)
+
+        self._aexpire(self._pop_expired())
+        staged = self._lookup(destination, digest, min_validity)
+        if staged is not None:
+            self.hits += 1
+            return staged.location
+
+        self.misses += 1
+
+        async def _upload() -> str:
+            location = await upload()
+            _, expired = self._register(
+                destination, digest, location, ttl, on_expire=on_expire
+            )
+            self._aexpire(expired)
+            return location
+
+        task = asyncio.ensure_future(_upload())
+        self._inflight[key] = task
+        task.add_done_callback(
+            lambda done: self._inflight.pop(key, None)
+            if self._inflight.get(key) is done
+            else None
+        )
+        return await asyncio.shield(task)
+
+    def _aexpire(self, expired: List[StagedObject]) -> None:
+        """Run the expiration callbacks in a worker thread, without waiting for them"""
+        if any(staged.on_expire is not None for staged in expired):
+            asyncio.get_running_loop().run_in_executor(None, self._expire, expired)
+
+    @staticmethod
+    def _expire(expired: List[StagedObject]) -> None:
+        for staged in expired:
+            if staged.on_expire is None:
+                continue
+            try:
+                staged.on_expire(staged)
+            except Exception as exc:
+                # cleanup is best effort, the provider expires staged files anyway
+                logger.warning("Could not clean up staged file %s: %s", staged.location, exc)
+
+
+staging_registry = StagingRegistry()
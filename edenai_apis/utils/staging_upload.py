@@ -0,0 +1,287 @@
+"""
+Upload local files to provider-side storage (S3 / GCS) before launching async jobs.
+
+Large files are never loaded in memory: they are split in parts read from disk and
+uploaded concurrently.
+    - S3: multipart upload, `max_concurrency` parts in flight at a time. Content produced
+      on the fly (eg: streamed audio) is uploaded part by part as it arrives
+    - GCS: XML multipart upload via `transfer_manager.upload_chunks_concurrently`,
+      resumable chunked upload for files below the threshold
+
+Part size, parallelism and multipart threshold can be tuned with the
+`EDENAI_UPLOAD_PART_SIZE`, `EDENAI_UPLOAD_CONCURRENCY` and
+`EDENAI_UPLOAD_MULTIPART_THRESHOLD` environment variables (sizes in bytes).
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, Dict, List, Optional, Tuple, Union
+
+from boto3.s3.transfer import TransferConfig
+
+MB = 1024 * 1024
+
+# S3 multipart constraints
+S3_MIN_PART_SIZE = 5 * MB
+S3_MAX_PARTS = 10000
+# GCS resumable chunks must be a multiple of 256 KB
+GCS_CHUNK_ALIGNMENT = 256 * 1024
+
+
+@dataclass
+class UploadConfig:
+    part_size: int = field(
+        default_factory=lambda: int(os.environ.get("EDENAI_UPLOAD_PART_SIZE", 16 * MB))
+    )
+    max_concurrency: int = field(
+        default_factory=lambda: int(os.environ.get("EDENAI_UPLOAD_CONCURRENCY", 8))
+    )
+    multipart_threshold: int = field(
+        default_factory=lambda: int(
+            os.environ.get("EDENAI_UPLOAD_MULTIPART_THRESHOLD", 32 * MB)
+        )
+    )
+
+    def s3_transfer_config(self) -> TransferConfig:
+        return TransferConfig(
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunksize=max(self.part_size, S3_MIN_PART_SIZE),
+            max_concurrency=self.max_concurrency,
+            use_threads=self.max_concurrency > 1,
+        )
+
+
+def _s3_part_size(size: int, part_size: int) -> int:
+    """Part size honoring S3 limits: at least 5 MB and at most 10000 parts"""
+    part_size = max(part_size, S3_MIN_PART_SIZE)
+    min_part_size = -(-size // S3_MAX_PARTS)
+    return max(part_size, min_part_size)
+
+
+def split_parts(size: int, part_size: int) -> List[Tuple[int, int, int]]:
+    """Returns (part_number, offset, length) of every part, part numbers start at 1"""
+    return [
+        (number, offset, min(part_size, size - offset))
+        for number, offset in enumerate(range(0, size, part_size), start=1)
+    ]
+
+
+def _read_range(file_path: str, offset: int, length: int) -> bytes:
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+# S3
+def upload_file_to_s3_bucket(
+    s3_client: Any,
+    file_path: str,
+    bucket: str,
+    key: str,
+    config: Optional[UploadConfig] = None,
+) -> None:
+    """Upload a local file with a boto3 S3 client, using concurrent multipart above the threshold"""
+    config = config or UploadConfig()
+    s3_client.upload_file(file_path, bucket, key, Config=config.s3_transfer_config())
+
+
+async def aupload_file_to_s3_bucket(
+    s3_client: Any,
+    file: Union[str, bytes],
+    bucket: str,
+    key: str,
+    config: Optional[UploadConfig] = None,
+    extra_args: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Upload a local file (or bytes) with an aioboto3 S3 client.
+
+    Above the multipart threshold, parts are read from disk when they are sent, so
+    at most `max_concurrency * part_size` bytes are held in memory. The multipart
+    upload is aborted if any part fails.
+    """
+    config = config or UploadConfig()
+    extra_args = extra_args or {}
+    if isinstance(file, str):
+        size = os.path.getsize(file)
+        read_part = lambda offset, length: asyncio.to_thread(
+            _read_range, file, offset, length
+        )
+    else:
+        size = len(file)
+        view = memoryview(file)
+
+        async def read_part(offset: int, length: int) -> bytes:
+            # botocore only accepts bytes, bytearray or file objects as Body
+            if offset == 0 and length == size and isinstance(file, bytes):
+                return file
+            return bytes(view[offset : offset + length])
+
+    if size < config.multipart_threshold:
+        body = await read_part(0, size)
+        await s3_client.put_object(Bucket=bucket, Key=key, Body=body, **extra_args)
+        return
+
+    multipart = await s3_client.create_multipart_upload(
+        Bucket=bucket, Key=key, **extra_args
+    )
+    upload_id = multipart["UploadId"]
+    semaphore = asyncio.Semaphore(max(config.max_concurrency, 1))
+
+    async def upload_part(number: int, offset: int, length: int) -> Dict[str, Any]:
+        async with semaphore:
+            body = await read_part(offset, length)
+            response = await s3_client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    tasks = [
+        asyncio.ensure_future(upload_part(*part))
+        for part in split_parts(size, _s3_part_size(size, config.part_size))
+    ]
+    try:
+        parts = await asyncio.gather(*tasks)
+        await s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await s3_client.abort_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id
+        )
+        raise
+
+
+async def aupload_stream_to_s3_bucket(
+    s3_client: Any,
+    chunks: AsyncIterable[bytes],
+    bucket: str,
+    key: str,
+    config: Optional[UploadConfig] = None,
+    extra_args: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Upload content of unknown size, produced chunk by chunk, with an aioboto3 S3 client.
+
+    Each part is sent as soon as `part_size` bytes are buffered, while the next ones are
+    still being produced. Content smaller than one part is sent with a single request.
+    At most `max_concurrency` parts are in flight, producing more waits for one of them.
+    The multipart upload is aborted if any part fails or the upload is cancelled.
+    """
+    config = config or UploadConfig()
+    extra_args = extra_args or {}
+    part_size = max(config.part_size, S3_MIN_PART_SIZE)
+    buffer = bytearray()
+    upload_id: Optional[str] = None
+    tasks: List["asyncio.Future[Dict[str, Any]]"] = []
+
+    async def upload_part(number: int, body: bytes) -> Dict[str, Any]:
+        response = await s3_client.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body
+        )
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    async def send_part(body: bytes) -> None:
+        in_flight = [task for task in tasks if not task.done()]
+        if len(in_flight) >= max(config.max_concurrency, 1):
+            await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            if task.done():
+                task.result()  # raise the error of a failed part early
+        tasks.append(asyncio.ensure_future(upload_part(len(tasks) + 1, body)))
+
+    try:
+        async for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= part_size:
+                if upload_id is None:
+                    multipart = await s3_client.create_multipart_upload(
+                        Bucket=bucket, Key=key, **extra_args
+                    )
+                    upload_id = multipart["UploadId"]
+                body = bytes(buffer[:part_size])
+                del buffer[:part_size]
+                await send_part(body)
+
+        if upload_id is None:
+            await s3_client.put_object(
+                Bucket=bucket, Key=key, Body=bytes(buffer), **extra_args
+            )
+            return
+        if buffer:
+            await send_part(bytes(buffer))
+        parts = await asyncio.gather(*tasks)
+        await s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if upload_id is not None:
+            await s3_client.abort_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id
+            )
+        raise
+
+
+# GCS
+def upload_file_to_gcs(
+    blob: Any,
+    file_path: str,
+    config: Optional[UploadConfig] = None,
+    content_type: Optional[str] = None,
+) -> None:
+    """
+    Upload a local file to a google.cloud.storage Blob.
+
+    Above the multipart threshold, chunks are uploaded concurrently by a thread pool.
+    Otherwise files bigger than a part use a resumable chunked upload.
+    """
+    from google.cloud.storage import transfer_manager
+
+    config = config or UploadConfig()
+    size = os.path.getsize(file_path)
+    chunk_size = max(
+        config.part_size // GCS_CHUNK_ALIGNMENT * GCS_CHUNK_ALIGNMENT,
+        GCS_CHUNK_ALIGNMENT,
+    )
+
+    if size >= config.multipart_threshold and config.max_concurrency > 1:
+        transfer_manager.upload_chunks_concurrently(
+            file_path,
+            blob,
+            content_type=content_type,
+            chunk_size=chunk_size,
+            worker_type=transfer_manager.THREAD,
+            max_workers=config.max_concurrency,
+        )
+        return
+
+    if size > chunk_size:
+        blob.chunk_size = chunk_size
+    blob.upload_from_filename(file_path, content_type=content_type)
+
+
+async def aupload_file_to_gcs(
+    blob: Any,
+    file_path: str,
+    config: Optional[UploadConfig] = None,
+    content_type: Optional[str] = None,
+) -> None:
+    """Async version of `upload_file_to_gcs`, run in a worker thread"""
+    await asyncio.to_thread(upload_file_to_gcs, blob, file_path, config, content_type)
@@ -0,0 +1,130 @@
+"""
+Run synchronous provider code from asyncio, in a bounded thread pool per provider.
+
+Providers without a native async implementation of a subfeature are called in a
+thread, so that one event loop can serve every provider:
+    - each provider has its own pool of `EDENAI_SYNC_OFFLOAD_WORKERS` threads (8 by
+      default, `configure_offload` changes it), a slow provider only queues its
+      own calls,
+    - calls over the pool size wait in its queue, `offload_stats` reports the
+      queued and running calls of each provider,
+    - a call cancelled while queued never runs, context variables are propagated.
+
+Usage:
+    result = await run_sync("amazon", provider.text__sentiment_analysis, **args)
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+OFFLOAD_WORKERS = int(os.environ.get("EDENAI_SYNC_OFFLOAD_WORKERS", 8))
+
+
+@dataclass(frozen=True)
+class OffloadStats:
+    """Snapshot of the calls of a provider pool"""
+
+    workers: int
+    queued: int
+    running: int
+    completed: int
+    max_queued: int
+
+
+class _ProviderPool:
+    def __init__(self, provider_name: str, workers: int) -> None:
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"offload_{provider_name}"
+        )
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queued = 0
+        self._lock = threading.Lock()
+
+    def _run(self, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        try:
+            return func()
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            # dropped from the queue, `_run` never started
+            with self._lock:
+                self.queued -= 1
+
+    def submit(self, func: Callable[[], Any]) -> Future:
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        try:
+            future = self.executor.submit(self._run, func)
+        except BaseException:
+            with self._lock:
+                self.queued -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def stats(self) -> OffloadStats:
+        with self._lock:
+            return OffloadStats(
+                workers=self.workers,
+                queued=self.queued,
+                running=self.running,
+                completed=self.completed,
+                max_queued=self.max_queued,
+            )
+
+
+_workers: Dict[str, int] = {}
+_pools: Dict[str, _ProviderPool] = {}
+_lock = threading.Lock()
+
+
+def configure_offload(provider_name: str, workers: int) -> None:
+    """Set the number of threads of a provider, from its next pool"""
+    with _lock:
+        _workers[provider_name] = workers
+        pool = _pools.pop(provider_name, None)
+    if pool is not None:
+        # calls already submitted still complete
+        pool.executor.shutdown(wait=False)
+
+
+def _pool(provider_name: str) -> _ProviderPool:
+    with _lock:
+        if provider_name not in _pools:
+            _pools[provider_name] = _ProviderPool(
+                provider_name, _workers.get(provider_name, OFFLOAD_WORKERS)
+            )
+        return _pools[provider_name]
+
+
+async def run_sync(
+    provider_name: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    """Await `func(*args, **kwargs)` run in the thread pool of `provider_name`"""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.wrap_future(_pool(provider_name).submit(call))
+
+
+def offload_stats() -> Dict[str, OffloadStats]:
+    """Queued, running and completed calls, by provider"""
+    with _lock:
+        pools: Tuple[Tuple[str, _ProviderPool], ...] = tuple(_pools.items())
+    return {provider_name: pool.stats() for provider_name, pool in pools}
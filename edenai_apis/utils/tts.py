@@ -1,10 +1,58 @@
 """Utility functions for Text-to-Speech (TTS) operations."""
 
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, Any
+from io import BytesIO
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import httpx
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http_client import AUDIO_TIMEOUT, async_client
+from edenai_apis.utils.ssml import (
+    get_index_after_first_speak_tag,
+    get_index_before_last_speak_tag,
+    is_ssml,
+)
+from edenai_apis.utils.upload_s3 import (
+    USER_PROCESS,
+    aupload_file_bytes_to_s3,
+    aupload_stream_to_s3,
+)
+
+logger = logging.getLogger(__name__)
+
+# text size (UTF-8 bytes) accepted by most providers in one request
+DEFAULT_MAX_TEXT_LENGTH = 2000
+
+# boundaries a text is split at, from the most to the least natural one
+_TEXT_BOUNDARIES = [
+    (re.compile(r"\n\s*\n"), "\n\n"),  # paragraphs
+    (re.compile(r"(?<=[.!?…。！？])\s+"), " "),  # sentences
+    (re.compile(r"(?<=[,;:])\s+"), " "),  # clauses
+    (re.compile(r"\s+"), " "),  # words
+]
+
+_SSML_TAG = re.compile(r"<[^>]+>")
+_SSML_TAG_NAME = re.compile(r"<\s*/?\s*([\w:.-]+)")
+# elements whose content is spoken as a whole
+_SSML_ATOMIC = {"say-as", "sub", "phoneme", "audio", "w", "token"}
 
 
 @lru_cache(maxsize=32)
@@ -20,6 +68,7 @@ def get_tts_config(provider_name: str) -> Dict[str, Any]:
         - default_voice: Default voice name
         - voice_ids: Dict mapping voice names to IDs (for elevenlabs, lovoai)
         - voices_lookup: Dict mapping lowercase voice names to original names (for amazon, microsoft, deepgram)
+        - max_text_length: Maximum size of the text of one request, in UTF-8 bytes
     """
     info = load_provider(ProviderDataEnum.PROVIDER_INFO, provider_name, "audio", "tts")
     constraints = info.get("constraints", {})
@@ -28,6 +77,7 @@ def get_tts_config(provider_name: str) -> Dict[str, Any]:
         "default_voice": constraints.get("default_voice"),
         "voice_ids": constraints.get("voice_ids", {}),
         "voices": constraints.get("voices", []),
+        "max_text_length": constraints.get("max_text_length", DEFAULT_MAX_TEXT_LENGTH),
     }
 
 
@@ -75,3 +125,334 @@ def normalize_speed_for_lovoai(speed: float) -> float:
     if speed is None:
         return 1.0
     return max(0.5, min(1.5, speed))
+
+
+def text_size(text: str) -> int:
+    """Size of a text as counted by TTS providers limits (UTF-8 bytes)"""
+    return len(text.encode("utf-8"))
+
+
+def _hard_split(text: str, max_length: int) -> List[str]:
+    parts: List[str] = []
+    current = ""
+    for char in text:
+        if current and text_size(current + char) > max_length:
+            parts.append(current)
+            current = ""
+        current += char
+    if current:
+        parts.append(current)
+    return parts
+
+
+def _split_text(text: str, max_length: int, level: int) -> List[str]:
+    if text_size(text) <= max_length:
+        return [text]
+    if level == len(_TEXT_BOUNDARIES):
+        return _hard_split(text, max_length)
+
+    pattern, joiner = _TEXT_BOUNDARIES[level]
+    units: List[str] = []
+    for piece in pattern.split(text):
+        if piece.strip():
+            units.extend(_split_text(piece.strip(), max_length, level + 1))
+
+    chunks: List[str] = []
+    current = ""
+    for unit in units:
+        candidate = f"{current}{joiner}{unit}" if current else unit
+        if text_size(candidate) <= max_length:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = unit
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_text(text: str, max_length: int) -> List[str]:
+    """Split a plain text in chunks of at most `max_length` UTF-8 bytes.
+
+    Chunks are cut at paragraph boundaries, then sentences, clauses and words, so that
+    each chunk is synthesized with a natural intonation. Chunks are filled up to
+    `max_length` to keep the number of requests low.
+
+    Args:
+        text: The text to split
+        max_length: Maximum size of a chunk, in UTF-8 bytes
+
+    Returns:
+        List of chunks, in order
+    """
+    text = text.strip()
+    if not text:
+        return []
+    return _split_text(text, max_length, 0)
+
+
+def _ssml_units(body: str, max_length: int) -> List[Tuple[str, str]]:
+    """Tags and sentences of an SSML body, as ("tag" | "text", value)"""
+    units: List[Tuple[str, str]] = []
+    position = 0
+    for match in _SSML_TAG.finditer(body):
+        units.extend(_ssml_text_units(body[position : match.start()], max_length))
+        units.append(("tag", match.group()))
+        position = match.end()
+    units.extend(_ssml_text_units(body[position:], max_length))
+    return units
+
+
+def _ssml_text_units(text: str, max_length: int) -> List[Tuple[str, str]]:
+    # keep the whitespace after each sentence, the text is copied verbatim
+    units = []
+    position = 0
+    for match in _TEXT_BOUNDARIES[1][0].finditer(text):
+        units.append(text[position : match.end()])
+        position = match.end()
+    units.append(text[position:])
+    return [
+        ("text", part)
+        for unit in units
+        if unit
+        for part in (
+            [unit] if text_size(unit) <= max_length else split_text(unit, max_length)
+        )
+    ]
+
+
+def split_ssml(ssml_text: str, max_length: int) -> List[str]:
+    """Split an SSML document in SSML documents of at most `max_length` UTF-8 bytes.
+
+    The document is cut between sentences or tags. Elements open at a cut (voice, prosody,
+    paragraph...) are closed at the end of a chunk and opened again at the start of the
+    next one, and every chunk is wrapped in the original `<speak>` tag. Elements whose
+    content cannot be spoken in parts (say-as, sub, phoneme...) are never cut.
+
+    Args:
+        ssml_text: The SSML document
+        max_length: Maximum size of a chunk, in UTF-8 bytes. A single sentence larger
+            than the limit once wrapped in its open elements is still sent as one chunk.
+
+    Returns:
+        List of SSML documents, in order
+    """
+    if text_size(ssml_text) <= max_length:
+        return [ssml_text]
+    start = get_index_after_first_speak_tag(ssml_text)
+    end = get_index_before_last_speak_tag(ssml_text)
+    speak_open, body, speak_close = ssml_text[:start], ssml_text[start:end], ssml_text[end:]
+    wrapper_size = text_size(speak_open) + text_size(speak_close)
+
+    # (name, opening tag) of the elements open at the current position
+    stack: List[Tuple[str, str]] = []
+    chunks: List[str] = []
+    current: List[str] = []
+    current_size = 0
+    has_text = False
+
+    def closing(elements) -> str:
+        return "".join(f"</{name}>" for name, _ in reversed(elements))
+
+    def flush() -> None:
+        chunks.append(speak_open + "".join(current) + closing(stack) + speak_close)
+
+    for kind, value in _ssml_units(body, max(max_length - wrapper_size, 1)):
+        next_stack = stack
+        is_closing = False
+        if kind == "tag":
+            name = _SSML_TAG_NAME.match(value).group(1).lower()
+            is_closing = value[1:].lstrip().startswith("/")
+            if is_closing:
+                names = [element_name for element_name, _ in stack]
+                if name in names:
+                    next_stack = stack[: len(names) - 1 - names[::-1].index(name)]
+            elif not value.rstrip(">").rstrip().endswith("/"):
+                next_stack = stack + [(name, value)]
+
+        size = wrapper_size + current_size + text_size(value)
+        can_cut = (
+            has_text
+            and not is_closing
+            and not any(name in _SSML_ATOMIC for name, _ in stack)
+        )
+        if can_cut and size + text_size(closing(next_stack)) > max_length:
+            flush()
+            current = [opening for _, opening in stack]
+            current_size = sum(text_size(opening) for opening in current)
+            has_text = False
+
+        current.append(value)
+        current_size += text_size(value)
+        has_text = has_text or (kind == "text" and bool(value.strip()))
+        stack = next_stack
+
+    if has_text:
+        flush()
+    return chunks
+
+
+def split_tts_text(text: str, max_length: int) -> List[str]:
+    """Split a text or an SSML document in chunks that can be synthesized separately.
+
+    Args:
+        text: The text to split, SSML documents are split with `split_ssml`
+        max_length: Maximum size of a chunk, in UTF-8 bytes
+
+    Returns:
+        List of chunks, in order. SSML chunks are complete SSML documents.
+    """
+    if is_ssml(text):
+        return split_ssml(text, max_length)
+    return split_text(text, max_length)
+
+
+@dataclass
+class TtsStreamMetrics:
+    """Latency of a streamed synthesis, in seconds from the start of the iteration"""
+
+    provider: str = ""
+    time_to_first_byte: Optional[float] = None
+    total_time: Optional[float] = None
+    upload_time: Optional[float] = None
+    total_bytes: int = 0
+    chunks: int = 0
+
+
+async def upload_audio(content: bytes, file_extension: str) -> str:
+    return await aupload_file_bytes_to_s3(
+        BytesIO(content), f".{file_extension}", USER_PROCESS
+    )
+
+
+async def upload_audio_stream(chunks: AsyncIterator[bytes], file_extension: str) -> str:
+    return await aupload_stream_to_s3(chunks, f".{file_extension}", USER_PROCESS)
+
+
+class TtsAudioStream:
+    """
+    Async iterator over the audio chunks of a synthesis, yielded as the provider
+    produces them.
+
+    Chunks are tee'd to a background task which streams them to S3, part by part as
+    they arrive (multipart upload). The iteration ends as soon as the provider is done,
+    without waiting for the end of the upload: `aresource_url()` waits for it and
+    returns the url, `audio_resource_url` is set once it is done. The upload is
+    cancelled if the iteration fails or is abandoned.
+
+    Usage:
+        stream = TtsAudioStream(chunks, "mp3", provider="openai")
+        async for chunk in stream:
+            play(chunk)
+        await stream.aresource_url(), stream.metrics.time_to_first_byte
+
+    Args:
+        chunks (AsyncIterator[bytes]): audio chunks from the provider
+        file_extension (str): extension of the uploaded file
+        provider (str): provider name, for metrics
+        upload (Callable): uploads the audio chunks and returns the url, None to skip
+            the upload
+    """
+
+    def __init__(
+        self,
+        chunks: AsyncIterator[bytes],
+        file_extension: str,
+        provider: str = "",
+        upload: Optional[
+            Callable[[AsyncIterator[bytes], str], Awaitable[str]]
+        ] = upload_audio_stream,
+    ) -> None:
+        self._chunks = chunks
+        self.file_extension = file_extension
+        self.upload = upload
+        self.audio_resource_url: Optional[str] = None
+        self.metrics = TtsStreamMetrics(provider=provider)
+        self._iterator: Optional[AsyncIterator[bytes]] = None
+        self._upload_task: Optional["asyncio.Future[str]"] = None
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        if self._iterator is None:
+            self._iterator = self._iterate()
+        return self._iterator
+
+    async def __anext__(self) -> bytes:
+        return await self.__aiter__().__anext__()
+
+    async def aresource_url(self) -> Optional[str]:
+        """Url of the uploaded audio, waits for the end of the upload"""
+        if self._upload_task is None:
+            return self.audio_resource_url
+        return await asyncio.shield(self._upload_task)
+
+    @staticmethod
+    async def _queued(queue: "asyncio.Queue[Optional[bytes]]") -> AsyncIterator[bytes]:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+
+    async def _upload(self, queue: "asyncio.Queue[Optional[bytes]]") -> str:
+        start = time.perf_counter()
+        url = await self.upload(self._queued(queue), self.file_extension)
+        self.metrics.upload_time = time.perf_counter() - start
+        self.audio_resource_url = url
+        return url
+
+    def _upload_done(self, task: "asyncio.Future[str]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "%s tts: audio upload failed: %r",
+                self.metrics.provider,
+                task.exception(),
+            )
+
+    async def _iterate(self) -> AsyncIterator[bytes]:
+        start = time.perf_counter()
+        queue: "asyncio.Queue[Optional[bytes]]" = asyncio.Queue()
+        if self.upload is not None:
+            self._upload_task = asyncio.ensure_future(self._upload(queue))
+            self._upload_task.add_done_callback(self._upload_done)
+        completed = False
+        try:
+            async for chunk in self._chunks:
+                if not chunk:
+                    continue
+                if self.metrics.time_to_first_byte is None:
+                    self.metrics.time_to_first_byte = time.perf_counter() - start
+                    logger.info(
+                        "%s tts: first audio byte after %.3fs",
+                        self.metrics.provider,
+                        self.metrics.time_to_first_byte,
+                    )
+                self.metrics.chunks += 1
+                self.metrics.total_bytes += len(chunk)
+                queue.put_nowait(chunk)
+                yield chunk
+            # the upload finishes in the background
+            queue.put_nowait(None)
+            completed = True
+            self.metrics.total_time = time.perf_counter() - start
+        finally:
+            if not completed and self._upload_task is not None:
+                self._upload_task.cancel()
+
+
+async def ahttp_audio_chunks(
+    method: str,
+    url: str,
+    timeout: Union[httpx.Timeout, float] = AUDIO_TIMEOUT,
+    chunk_size: Optional[int] = None,
+    **request_kwargs,
+) -> AsyncIterator[bytes]:
+    """Stream the body of an HTTP response, raising ProviderException on error statuses"""
+    try:
+        async with async_client(timeout) as client:
+            async with client.stream(method, url, **request_kwargs) as response:
+                if response.is_error:
+                    await response.aread()
+                    raise ProviderException(response.text, code=response.status_code)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+    except httpx.TimeoutException as exc:
+        raise ProviderException(message="Request timed out", code=408) from exc
+    except httpx.RequestError as exc:
+        raise ProviderException(message=f"Request failed: {exc}", code=500) from exc
@@ -0,0 +1,440 @@
+"""
+Cache of text to speech results, stored on disk.
+
+The same prompts (greetings, IVR phrases...) are synthesized over and over. A result is
+identified by everything that changes the audio: provider, model, voice, normalized
+text or SSML, audio format, speed, pitch, volume and provider settings (sampling rate...).
+For each of them, the cache keeps the audio and the url it was uploaded to:
+    - a cached result is returned without calling the provider nor uploading the audio,
+    - CloudFront urls close to their expiration are signed again for the same object,
+      other urls are replaced by a new upload of the cached audio,
+    - the total size on disk is bounded, least recently used results are removed first.
+
+Provider methods opt in with the `cached_tts` decorator. The cache is off unless
+`EDENAI_TTS_CACHE=1`; it is stored in `EDENAI_TTS_CACHE_DIR` (by default a folder of the
+temporary directory specific to the user), which must be owned by the process user and
+is only accessible to them (0o700).
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from io import BytesIO
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from edenai_apis.features.audio.tts import TtsDataClass
+from edenai_apis.utils import upload_s3
+from edenai_apis.utils.types import ResponseType
+
+logger = logging.getLogger(__name__)
+
+TTS_CACHE_ENABLED = os.environ.get("EDENAI_TTS_CACHE", "0") == "1"
+DEFAULT_CACHE_DIR = os.environ.get(
+    "EDENAI_TTS_CACHE_DIR",
+    os.path.join(
+        tempfile.gettempdir(),
+        f"edenai_tts_cache_{os.getuid()}" if hasattr(os, "getuid") else "edenai_tts_cache",
+    ),
+)
+CACHE_DIR_MODE = 0o700
+DEFAULT_MAX_SIZE = int(os.environ.get("EDENAI_TTS_CACHE_MAX_SIZE", 512 * 1024 * 1024))
+# urls expiring sooner than this are signed again before being returned
+DEFAULT_MIN_URL_VALIDITY = 24 * 3600
+
+_WHITESPACES = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """Text as it matters for the synthesis: unicode normalized, with collapsed whitespaces"""
+    return _WHITESPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def tts_cache_key(
+    provider_name: str,
+    text: str,
+    model: Optional[str] = None,
+    voice: Optional[str] = None,
+    audio_format: Optional[str] = None,
+    speed: Optional[float] = None,
+    speaking_pitch: Optional[int] = None,
+    speaking_volume: Optional[int] = None,
+    provider_params: Optional[Dict[str, Any]] = None,
+    extra_params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Key of a synthesis, the same for every request producing the same audio"""
+    request = {
+        "provider": provider_name,
+        "text": normalize_tts_text(text),
+        "model": (model or "").lower(),
+        "voice": (voice or "").lower(),
+        "audio_format": (audio_format or "").lower(),
+        "speed": speed,
+        "speaking_pitch": speaking_pitch,
+        "speaking_volume": speaking_volume,
+        # sampling rate, style prompt... all change the audio
+        "provider_params": provider_params or {},
+        # other arguments given to the provider method
+        "extra_params": extra_params or {},
+    }
+    serialized = json.dumps(request, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _url_expiration(url: str, default_validity: float) -> float:
+    """Expiration timestamp of a signed url (CloudFront `Expires` or S3 `X-Amz-Expires`)"""
+    query = parse_qs(urlparse(url).query)
+    if "Expires" in query:
+        return float(query["Expires"][0])
+    return time.time() + float(query.get("X-Amz-Expires", [default_validity])[0])
+
+
+@dataclass
+class CachedTts:
+    """Synthesized audio stored on disk with the url it was uploaded to"""
+
+    key: str
+    file_extension: str
+    size: int
+    resource_url: str
+    url_expires_at: float
+    # key of the object behind the url, to sign the url again
+    object_key: Optional[str] = None
+    cloudfront: bool = False
+    original_response: Any = field(default_factory=dict)
+
+
+class TtsCache:
+    """
+    Args:
+        directory (str): folder storing the audio files and their metadata
+        max_size (int): maximum size of the audio files on disk, in bytes
+        min_url_validity (float): minimum validity, in seconds, of a returned url
+        enabled (bool): if False, nothing is cached
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        max_size: int = DEFAULT_MAX_SIZE,
+        min_url_validity: float = DEFAULT_MIN_URL_VALIDITY,
+        enabled: bool = TTS_CACHE_ENABLED,
+    ) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.min_url_validity = min_url_validity
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, CachedTts]" = OrderedDict()
+        self._size = 0
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return len(self._entries)
+
+    def _audio_path(self, entry: CachedTts) -> str:
+        return os.path.join(self.directory, f"{entry.key}.{entry.file_extension}")
+
+    def _metadata_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _check_directory(self) -> bool:
+        """
+        Whether the cache folder can be trusted: owned by the process user and private
+        to them, its permissions are restricted if needed
+        """
+        try:
+            stat = os.stat(self.directory)
+            if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+                raise PermissionError("owned by another user")
+            if stat.st_mode & 0o777 != CACHE_DIR_MODE:
+                os.chmod(self.directory, CACHE_DIR_MODE)
+        except OSError as exc:
+            logger.warning(
+                "TTS cache disabled, %s can't be used: %s", self.directory, exc
+            )
+            self.enabled = False
+            return False
+        return True
+
+    def _make_directory(self) -> None:
+        os.makedirs(self.directory, mode=CACHE_DIR_MODE, exist_ok=True)
+        if not self._check_directory():
+            raise PermissionError(f"TTS cache folder {self.directory} can't be used")
+
+    def _load(self) -> None:
+        """Entries left on disk by previous processes, least recently used first"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.isdir(self.directory) or not self._check_directory():
+            return
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    entry = CachedTts(**json.load(f))
+                entries.append((os.stat(self._audio_path(entry)).st_atime, entry))
+            except (OSError, ValueError, TypeError):
+                self._remove_files(name[: -len(".json")])
+        for _, entry in sorted(entries, key=lambda item: item[0]):
+            self._entries[entry.key] = entry
+            self._size += entry.size
+        self._evict()
+
+    def _remove_files(self, key: str, file_extension: Optional[str] = None) -> None:
+        paths = [self._metadata_path(key)]
+        if file_extension:
+            paths.append(os.path.join(self.directory, f"{key}.{file_extension}"))
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _write_metadata(self, entry: CachedTts) -> None:
+        path = self._metadata_path(entry.key)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(asdict(entry), f, default=str)
+        os.replace(f.name, path)
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self._remove_files(entry.key, entry.file_extension)
+
+    def get(self, key: str) -> Optional[CachedTts]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if not os.path.exists(self._audio_path(entry)):
+                self._entries.pop(key)
+                self._size -= entry.size
+                self._remove_files(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: str,
+        audio: bytes,
+        file_extension: str,
+        resource_url: str,
+        object_key: Optional[str] = None,
+        cloudfront: bool = False,
+        url_validity: float = upload_s3.URL_LONG_PERIOD,
+        original_response: Any = None,
+    ) -> Optional[CachedTts]:
+        if not self.enabled or len(audio) > self.max_size:
+            return None
+        entry = CachedTts(
+            key=key,
+            file_extension=file_extension.lstrip("."),
+            size=len(audio),
+            resource_url=resource_url,
+            url_expires_at=_url_expiration(resource_url, url_validity),
+            object_key=object_key,
+            cloudfront=cloudfront,
+            original_response=original_response if original_response is not None else {},
+        )
+        with self._lock:
+            self._load()
+            self._make_directory()
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                f.write(audio)
+            os.replace(f.name, self._audio_path(entry))
+            try:
+                self._write_metadata(entry)
+            except TypeError:
+                # original response not serializable
+                entry.original_response = {}
+                self._write_metadata(entry)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            self._evict()
+        return entry
+
+    def read(self, entry: CachedTts) -> bytes:
+        with open(self._audio_path(entry), "rb") as f:
+            return f.read()
+
+    def update_url(self, entry: CachedTts, resource_url: str, **fields) -> None:
+        """Replace the url of an entry (signed again or uploaded again)"""
+        with self._lock:
+            entry.resource_url = resource_url
+            entry.url_expires_at = _url_expiration(
+                resource_url, upload_s3.URL_LONG_PERIOD
+            )
+            for name, value in fields.items():
+                setattr(entry, name, value)
+            if entry.key in self._entries:
+                self._write_metadata(entry)
+
+    def resource_url(self, entry: CachedTts) -> str:
+        """Url of the cached audio, valid for at least `min_url_validity` seconds"""
+        if entry.url_expires_at - time.time() >= self.min_url_validity:
+            return entry.resource_url
+        if entry.cloudfront and entry.object_key:
+            if not upload_s3.CLOUDFRONT_KEY_ID:
+                upload_s3.s3_client_load()
+            url = upload_s3.get_cloud_front_file_url(
+                entry.object_key, upload_s3.URL_LONG_PERIOD
+            )
+            self.update_url(entry, url)
+            return url
+        # the url cannot be signed again, upload the cached audio instead
+        with upload_s3.record_uploads() as uploads:
+            url = upload_s3.upload_file_bytes_to_s3(
+                BytesIO(self.read(entry)), f".{entry.file_extension}", upload_s3.USER_PROCESS
+            )
+        object_key = uploads[-1].filename if uploads else None
+        self.update_url(entry, url, object_key=object_key, cloudfront=bool(object_key))
+        return url
+
+    def clear(self) -> None:
+        with self._lock:
+            self._load()
+            for entry in self._entries.values():
+                self._remove_files(entry.key, entry.file_extension)
+            self._entries.clear()
+            self._size = 0
+
+
+tts_cache = TtsCache()
+
+
+def _request_key(
+    provider_name: str, signature: inspect.Signature, args, kwargs
+) -> Optional[str]:
+    try:
+        bound = signature.bind(None, *args, **kwargs)
+    except TypeError:
+        return None
+    bound.apply_defaults()
+    arguments = bound.arguments
+    if arguments.get("stream") or not isinstance(arguments.get("text"), str):
+        return None
+    extra_params = {
+        name: value
+        for parameter in signature.parameters.values()
+        if parameter.kind == inspect.Parameter.VAR_KEYWORD
+        for name, value in arguments.get(parameter.name, {}).items()
+    }
+    return tts_cache_key(
+        provider_name,
+        arguments["text"],
+        model=arguments.get("model"),
+        voice=arguments.get("voice"),
+        audio_format=arguments.get("audio_format"),
+        speed=arguments.get("speed"),
+        speaking_pitch=arguments.get("speaking_pitch"),
+        speaking_volume=arguments.get("speaking_volume"),
+        provider_params=arguments.get("provider_params"),
+        extra_params=extra_params,
+    )
+
+
+def _cached_response(cache: TtsCache, entry: CachedTts) -> ResponseType[TtsDataClass]:
+    return ResponseType[TtsDataClass](
+        original_response=entry.original_response,
+        standardized_response=TtsDataClass(audio_resource_url=cache.resource_url(entry)),
+    )
+
+
+def _store(
+    cache: TtsCache, key: str, result: Any, uploads: List[upload_s3.RecordedUpload]
+) -> None:
+    if not isinstance(result, ResponseType):
+        return
+    resource_url = getattr(result.standardized_response, "audio_resource_url", None)
+    upload = next((upload for upload in uploads if upload.url == resource_url), None)
+    if upload is None or upload_s3.is_recorded_url(resource_url):
+        # the audio was not uploaded by us (eg: provider hosted url), or only recorded
+        return
+    try:
+        cache.put(
+            key,
+            upload.content,
+            os.path.splitext(upload.filename)[1] or "mp3",
+            resource_url,
+            object_key=upload.filename,
+            cloudfront=upload.process_type == upload_s3.USER_PROCESS,
+            original_response=result.original_response,
+        )
+    except OSError as exc:
+        logger.warning("Could not cache tts result: %s", exc)
+
+
+def cached_tts(func: Callable) -> Callable:
+    """
+    Cache the results of a provider `audio__tts` / `audio__atts` method in `tts_cache`.
+    Streamed syntheses are not cached.
+    """
+    signature = inspect.signature(func)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            cache = tts_cache
+            key = _request_key(self.provider_name, signature, args, kwargs)
+            if key is None or not cache.enabled:
+                return await func(self, *args, **kwargs)
+            entry = await asyncio.to_thread(cache.get, key)
+            if entry is not None:
+                return await asyncio.to_thread(_cached_response, cache, entry)
+            with upload_s3.record_uploads() as uploads:
+                result = await func(self, *args, **kwargs)
+            await asyncio.to_thread(_store, cache, key, result, uploads)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = tts_cache
+        key = _request_key(self.provider_name, signature, args, kwargs)
+        if key is None or not cache.enabled:
+            return func(self, *args, **kwargs)
+        entry = cache.get(key)
+        if entry is not None:
+            return _cached_response(cache, entry)
+        with upload_s3.record_uploads() as uploads:
+            result = func(self, *args, **kwargs)
+        _store(cache, key, result, uploads)
+        return result
+
+    return wrapper
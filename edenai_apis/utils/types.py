@@ -1,4 +1,4 @@
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, Literal, Optional, TypeVar
 
 from pydantic import StrictStr, BaseModel
 
@@ -36,3 +36,12 @@ class AsyncErrorResponseType(AsyncBaseResponseType, Generic[T]):
 
 class AsyncResponseType(ResponseType, AsyncBaseResponseType, Generic[T]):
     status: StrictStr = "succeeded"
+
+
+class BatchDocumentItem(BaseModel, Generic[T]):
+    """Result of one document of a batch, `index` is its position in the request"""
+
+    index: int
+    status: Literal["success", "fail"]
+    result: Optional[T] = None
+    error: Optional[StrictStr] = None
@@ -2,12 +2,24 @@ import asyncio
 import datetime
 import json
 import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from io import BytesIO
-from typing import Callable, Tuple
+from pathlib import Path
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 from uuid import uuid4
 
 import aioboto3
-import aiofiles
 import boto3
 from botocore.signers import CloudFrontSigner
 from cryptography.hazmat.backends import default_backend
@@ -17,6 +29,12 @@ from cryptography.hazmat.primitives.asymmetric import padding
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.settings import keys_path
+from edenai_apis.utils.staging_registry import staging_registry
+from edenai_apis.utils.staging_upload import (
+    aupload_file_to_s3_bucket,
+    aupload_stream_to_s3_bucket,
+    upload_file_to_s3_bucket,
+)
 
 BUCKET = ""
 BUCKET_RESSOURCE = ""
@@ -31,6 +49,67 @@ URL_SHORT_PERIOD = 3600
 URL_LONG_PERIOD = 3600 * 24 * 7
 
 
+@dataclass
+class RecordedUpload:
+    """File bytes uploaded while `record_uploads` is active"""
+
+    content: bytes
+    filename: str
+    url: str
+    process_type: str
+
+
+# lists of the active `record_uploads` contexts, innermost last
+_recorded_uploads: ContextVar[Tuple[List[RecordedUpload], ...]] = ContextVar(
+    "recorded_uploads", default=()
+)
+_uploads_skipped: ContextVar[bool] = ContextVar("uploads_skipped", default=False)
+
+# scheme of the urls returned for files kept in memory by `record_uploads(upload=False)`
+RECORDED_URL_SCHEME = "recorded://"
+
+
+@contextmanager
+def record_uploads(upload: bool = True) -> Iterator[List[RecordedUpload]]:
+    """
+    Record the files bytes uploaded in this context (eg: to cache a result with its audio).
+
+    With `upload=False`, files bytes are only recorded, not sent to s3: the returned urls
+    are placeholders (`recorded://<filename>`), eg: to join audio chunks before uploading
+    the result once. Nested contexts all record the files.
+    """
+    uploads: List[RecordedUpload] = []
+    token = _recorded_uploads.set(_recorded_uploads.get() + (uploads,))
+    skip_token = _uploads_skipped.set(_uploads_skipped.get() or not upload)
+    try:
+        yield uploads
+    finally:
+        _uploads_skipped.reset(skip_token)
+        _recorded_uploads.reset(token)
+
+
+def is_recorded_url(url: str) -> bool:
+    """Whether an url is a placeholder of a file recorded without being uploaded"""
+    return url.startswith(RECORDED_URL_SCHEME)
+
+
+def _record_upload(file: BytesIO, filename: str, url: str, process_type: str) -> None:
+    recorders = _recorded_uploads.get()
+    if recorders and hasattr(file, "getvalue"):
+        upload = RecordedUpload(file.getvalue(), filename, url, process_type)
+        for uploads in recorders:
+            uploads.append(upload)
+
+
+def _skip_upload(file: BytesIO, filename: str, process_type: str) -> Optional[str]:
+    """Placeholder url of a file recorded instead of being uploaded, if uploads are skipped"""
+    if not _uploads_skipped.get() or not hasattr(file, "getvalue"):
+        return None
+    url = f"{RECORDED_URL_SCHEME}{filename}"
+    _record_upload(file, filename, url, process_type)
+    return url
+
+
 def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int, str]:
     """Returns A tuple with the adequat function to call, the url expiration time and the bucket to which
                 the file will be uploaded, depending of the process type
@@ -56,16 +135,22 @@ def rsa_signer(message):
     return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
 
 
-def s3_client_load():
+def s3_settings_load() -> Dict[str, str]:
+    """Load the amazon settings and set the buckets, region and cloudfront key"""
     api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
-    aws_access_key_id = api_settings["aws_access_key_id"]
-    aws_secret_access_key = api_settings["aws_secret_access_key"]
 
     global BUCKET, BUCKET_RESSOURCE, CLOUDFRONT_KEY_ID, REGION
     BUCKET = api_settings["providers_resource_bucket"]
     BUCKET_RESSOURCE = api_settings["users_resource_bucket"]
     CLOUDFRONT_KEY_ID = api_settings["cloudfront_key_id"]
     REGION = api_settings["ressource_region"]
+    return api_settings
+
+
+def s3_client_load():
+    api_settings = s3_settings_load()
+    aws_access_key_id = api_settings["aws_access_key_id"]
+    aws_secret_access_key = api_settings["aws_secret_access_key"]
     return boto3.client(
         "s3",
         region_name=REGION,
@@ -74,13 +159,26 @@ def s3_client_load():
     )
 
 
+def _staging_destination(bucket: str, file_name: str) -> str:
+    # the extension is part of the url, some providers rely on it to detect the format
+    return f"s3:{bucket}:{Path(str(file_name)).suffix}"
+
+
 def upload_file_to_s3(file_path: str, file_name: str, process_type=PROVIDER_PROCESS):
-    """Upload file to s3"""
-    filename = str(uuid4()) + "_" + str(file_name)
-    s3_client = s3_client_load()
+    """Upload file to s3, reusing the url of a previous upload of the same content"""
+    s3_settings_load()
     func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
-    s3_client.upload_file(file_path, bucket, filename)
-    return func_call(filename, process_time)
+
+    def upload() -> str:
+        # the client is only created if the content isn't already staged
+        s3_client = s3_client_load()
+        filename = str(uuid4()) + "_" + str(file_name)
+        upload_file_to_s3_bucket(s3_client, file_path, bucket, filename)
+        return func_call(filename, process_time)
+
+    return staging_registry.stage(
+        _staging_destination(bucket, file_name), file_path, upload, ttl=process_time
+    )
 
 
 def upload_file_bytes_to_s3(
@@ -88,10 +186,14 @@ def upload_file_bytes_to_s3(
 ) -> str:
     """Upload file byte to s3"""
     filename = str(uuid4()) + "_" + str(file_name)
+    if (url := _skip_upload(file, filename, process_type)) is not None:
+        return url
     s3_client = s3_client_load()
     func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
     s3_client.upload_fileobj(file, bucket, filename)
-    return func_call(filename, process_time)
+    url = func_call(filename, process_time)
+    _record_upload(file, filename, url, process_type)
+    return url
 
 
 def get_cloud_front_file_url(filename: str, process_time: int) -> str:
@@ -131,16 +233,10 @@ def get_providers_json_from_s3():
 # Async S3 utilities
 async def as3_client_load():
     """Create async S3 client using aioboto3"""
-    api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
+    api_settings = s3_settings_load()
     aws_access_key_id = api_settings["aws_access_key_id"]
     aws_secret_access_key = api_settings["aws_secret_access_key"]
 
-    global BUCKET, BUCKET_RESSOURCE, CLOUDFRONT_KEY_ID, REGION
-    BUCKET = api_settings["providers_resource_bucket"]
-    BUCKET_RESSOURCE = api_settings["users_resource_bucket"]
-    CLOUDFRONT_KEY_ID = api_settings["cloudfront_key_id"]
-    REGION = api_settings["ressource_region"]
-
     session = aioboto3.Session()
     return session.client(
         "s3",
@@ -183,20 +279,23 @@ async def aget_cloud_front_file_url(filename: str, process_time: int) -> str:
 async def aupload_file_to_s3(
     file_path: str, file_name: str, process_type=PROVIDER_PROCESS
 ):
-    """Upload file to s3"""
-    filename = str(uuid4()) + "_" + str(file_name)
-    if isinstance(file_path, str):
-        async with aiofiles.open(file_path, "rb") as file_:
-            file = await file_.read()
-    else:
-        file = file_path
-    file = BytesIO(file)
-    return await aupload_file_bytes_to_s3(file, filename, process_type)
-
-    # s3_client = s3_client_load()
-    # func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
-    # s3_client.upload_file(file_path, bucket, filename)
-    # return func_call(filename, process_time)
+    """Async version: Upload file to s3, streamed from disk with concurrent multipart"""
+    s3_settings_load()
+    _, process_time, bucket = set_time_and_presigned_url_process(process_type)
+
+    async def upload() -> str:
+        # the client is only created if the content isn't already staged
+        s3_client = await as3_client_load()
+        filename = str(uuid4()) + "_" + str(file_name)
+        async with s3_client:
+            await aupload_file_to_s3_bucket(s3_client, file_path, bucket, filename)
+        if process_type == USER_PROCESS:
+            return await aget_cloud_front_file_url(filename, process_time)
+        return await aget_s3_file_url(filename, process_time)
+
+    return await staging_registry.astage(
+        _staging_destination(bucket, file_name), file_path, upload, ttl=process_time
+    )
 
 
 async def aupload_file_bytes_to_s3(
@@ -204,6 +303,8 @@ async def aupload_file_bytes_to_s3(
 ) -> str:
     """Async version: Upload file bytes to s3"""
     filename = str(uuid4()) + "_" + str(file_name)
+    if (url := _skip_upload(file, filename, process_type)) is not None:
+        return url
 
     # Load API settings first to populate global variables
     api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
@@ -229,4 +330,34 @@ async def aupload_file_bytes_to_s3(
         await s3_client.upload_fileobj(file, bucket, filename)
 
     # Generate and return the URL
-    return await async_func_call(filename, process_time)
+    url = await async_func_call(filename, process_time)
+    _record_upload(file, filename, url, process_type)
+    return url
+
+
+async def aupload_stream_to_s3(
+    chunks: AsyncIterable[bytes], file_name: str, process_type: str = PROVIDER_PROCESS
+) -> str:
+    """Upload content produced chunk by chunk to s3, each part is sent as it is filled"""
+    s3_settings_load()
+    _, process_time, bucket = set_time_and_presigned_url_process(process_type)
+    filename = str(uuid4()) + "_" + str(file_name)
+    # the content is only kept if uploads are recorded
+    recorded: Optional[List[bytes]] = [] if _recorded_uploads.get() else None
+
+    async def tee() -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            if recorded is not None:
+                recorded.append(chunk)
+            yield chunk
+
+    async with await as3_client_load() as s3_client:
+        await aupload_stream_to_s3_bucket(s3_client, tee(), bucket, filename)
+
+    if process_type == USER_PROCESS:
+        url = await aget_cloud_front_file_url(filename, process_time)
+    else:
+        url = await aget_s3_file_url(filename, process_time)
+    if recorded is not None:
+        _record_upload(BytesIO(b"".join(recorded)), filename, url, process_type)
+    return url
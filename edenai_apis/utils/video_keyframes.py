@@ -0,0 +1,340 @@
+"""
+Local sampling of videos with ffmpeg, to avoid sending whole videos to providers.
+
+Two reductions of a video are available:
+    - keyframes: jpeg frames picked on scene changes (at most one every `min_interval`
+      seconds, at least one every `max_interval` seconds), downscaled and capped to
+      `max_frames` evenly spread over the video. Meant for providers taking images,
+    - proxy: a low resolution, low frame rate copy of the video with the same timeline,
+      so that timestamps of the results still apply to the original video.
+
+ffmpeg runs in its own process, `MAX_VIDEO_SAMPLERS` (`EDENAI_VIDEO_SAMPLER_WORKERS`)
+bounds the number running at once, for the sync and async front-ends together.
+Cancelling an async call kills ffmpeg.
+
+Usage:
+    keyframes = await aextract_keyframes(video_path, max_frames=32)
+    keyframes[0].timestamp, keyframes[0].content
+"""
+
+import asyncio
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from edenai_apis.utils.exception import ProviderException
+
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+MAX_VIDEO_SAMPLERS = int(
+    os.environ.get("EDENAI_VIDEO_SAMPLER_WORKERS", os.cpu_count() or 2)
+)
+
+# scene change score (0-1) above which a frame starts a new scene
+SCENE_THRESHOLD = 0.3
+MAX_FRAMES = 32
+MIN_INTERVAL = 1.0
+MAX_INTERVAL = 10.0
+KEYFRAME_MAX_DIMENSION = 768
+JPEG_QUALITY = 5  # mjpeg qscale, 2 (best) to 31
+PROXY_HEIGHT = 360
+PROXY_FRAME_RATE = 10
+
+_PTS_TIME = re.compile(rb"\bn:\s*\d+\s+pts:\s*-?\d+\s+pts_time:\s*(-?[\d.]+)")
+_JPEG_END = b"\xff\xd9"
+_JPEG_START = b"\xff\xd8"
+
+_pool = ThreadPoolExecutor(
+    max_workers=MAX_VIDEO_SAMPLERS, thread_name_prefix="video_sampler"
+)
+
+
+@dataclass
+class Keyframe:
+    """Jpeg frame of a video, `timestamp` in seconds from its start"""
+
+    timestamp: float
+    content: bytes
+
+
+def _keyframes_command(
+    video_path: str,
+    scene_threshold: float,
+    min_interval: float,
+    max_interval: float,
+    max_dimension: int,
+) -> List[str]:
+    # first frame, scene changes at least `min_interval` apart and a frame every
+    # `max_interval` seconds without scene change
+    select = (
+        f"isnan(prev_selected_t)"
+        f"+gt(scene,{scene_threshold})*gte(t-prev_selected_t,{min_interval})"
+        f"+gte(t-prev_selected_t,{max_interval})"
+    )
+    # longest side fitted to `max_dimension`, never upscaled
+    scale = (
+        f"if(gte(iw,ih),min(iw,{max_dimension}),-2)"
+        f":if(gte(iw,ih),-2,min(ih,{max_dimension}))"
+    )
+    return [
+        FFMPEG,
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "info",
+        "-i",
+        video_path,
+        "-an",
+        "-vf",
+        f"select='{select}',scale='{scale}',showinfo",
+        "-vsync",
+        "vfr",
+        "-f",
+        "image2pipe",
+        "-c:v",
+        "mjpeg",
+        "-q:v",
+        str(JPEG_QUALITY),
+        "pipe:1",
+    ]
+
+
+def _proxy_command(
+    video_path: str, output_path: str, height: int, frame_rate: int, audio: bool
+) -> List[str]:
+    command = [
+        FFMPEG,
+        "-hide_banner",
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-y",
+        "-i",
+        video_path,
+        "-vf",
+        f"scale=-2:'min(ih,{height})',fps={frame_rate}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-crf",
+        "30",
+        "-pix_fmt",
+        "yuv420p",
+    ]
+    command += ["-c:a", "aac", "-b:a", "48k", "-ac", "1"] if audio else ["-an"]
+    return command + ["-movflags", "+faststart", "-fflags", "+bitexact", output_path]
+
+
+def _split_jpegs(data: bytes) -> List[bytes]:
+    """Frames of an mjpeg stream (ffmpeg frames hold no embedded thumbnail)"""
+    frames = []
+    start = 0
+    while start < len(data):
+        end = data.find(_JPEG_END + _JPEG_START, start)
+        end = len(data) if end < 0 else end + len(_JPEG_END)
+        frames.append(data[start:end])
+        start = end
+    return frames
+
+
+def _spread(keyframes: List[Keyframe], max_frames: int) -> List[Keyframe]:
+    """At most `max_frames` keyframes, evenly picked, first and last ones included"""
+    if len(keyframes) <= max_frames:
+        return keyframes
+    if max_frames == 1:
+        return keyframes[:1]
+    step = (len(keyframes) - 1) / (max_frames - 1)
+    return [keyframes[round(index * step)] for index in range(max_frames)]
+
+
+def _error(returncode: int, stderr: bytes) -> ProviderException:
+    lines = [
+        line
+        for line in stderr.decode("utf-8", errors="replace").strip().splitlines()
+        if "showinfo" not in line
+    ]
+    return ProviderException(
+        f"Video sampling failed (ffmpeg returned {returncode}): "
+        f"{lines[-1] if lines else 'no output'}",
+        code=400,
+    )
+
+
+class _FfmpegJob:
+    """ffmpeg process of a sampling, killed if the job is cancelled"""
+
+    def __init__(self) -> None:
+        self.process: Optional[subprocess.Popen] = None
+        self.stderr = b""
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def run(self, command: List[str]) -> bytes:
+        with self._lock:
+            if self.cancelled:
+                raise ProviderException("Video sampling cancelled")
+            self.process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        stdout, stderr = self.process.communicate()
+        if self.cancelled:
+            raise ProviderException("Video sampling cancelled")
+        if self.process.returncode != 0:
+            raise _error(self.process.returncode, stderr)
+        self.stderr = stderr
+        return stdout
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
+
+
+def _run_keyframes(
+    job: _FfmpegJob,
+    video_path: str,
+    max_frames: int,
+    scene_threshold: float,
+    min_interval: float,
+    max_interval: float,
+    max_dimension: int,
+) -> List[Keyframe]:
+    command = _keyframes_command(
+        video_path, scene_threshold, min_interval, max_interval, max_dimension
+    )
+    frames = _split_jpegs(job.run(command))
+    timestamps = [float(match) for match in _PTS_TIME.findall(job.stderr)]
+    if len(timestamps) != len(frames):
+        raise ProviderException("Video sampling failed: unexpected ffmpeg output")
+    keyframes = [Keyframe(t, frame) for t, frame in zip(timestamps, frames)]
+    return _spread(keyframes, max_frames)
+
+
+def _run_proxy(
+    job: _FfmpegJob, video_path: str, height: int, frame_rate: int, audio: bool
+) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as output:
+        output_path = output.name
+    try:
+        job.run(_proxy_command(video_path, output_path, height, frame_rate, audio))
+    except BaseException:
+        os.remove(output_path)
+        raise
+    return output_path
+
+
+def _wait(job: _FfmpegJob, future):
+    try:
+        return future.result()
+    except BaseException:
+        # eg: KeyboardInterrupt while waiting
+        job.cancel()
+        raise
+
+
+async def _await(job: _FfmpegJob, future):
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # a queued job is dropped by the pool, a running one is killed
+        job.cancel()
+        raise
+
+
+def extract_keyframes(
+    video_path: str,
+    max_frames: int = MAX_FRAMES,
+    scene_threshold: float = SCENE_THRESHOLD,
+    min_interval: float = MIN_INTERVAL,
+    max_interval: float = MAX_INTERVAL,
+    max_dimension: int = KEYFRAME_MAX_DIMENSION,
+) -> List[Keyframe]:
+    """Keyframes of a video, sampled on scene changes.
+
+    Args:
+        video_path: Path of the video
+        max_frames: Maximum number of keyframes, evenly picked among the sampled ones
+        scene_threshold: Scene change score (0-1) from which a frame is sampled
+        min_interval: Minimum time between two sampled frames, in seconds
+        max_interval: Maximum time without sampled frame, in seconds
+        max_dimension: Maximum width and height of the keyframes, in pixels
+
+    Returns:
+        List[Keyframe]: keyframes in the order of the video
+    """
+    job = _FfmpegJob()
+    future = _pool.submit(
+        _run_keyframes,
+        job,
+        video_path,
+        max_frames,
+        scene_threshold,
+        min_interval,
+        max_interval,
+        max_dimension,
+    )
+    return _wait(job, future)
+
+
+async def aextract_keyframes(
+    video_path: str,
+    max_frames: int = MAX_FRAMES,
+    scene_threshold: float = SCENE_THRESHOLD,
+    min_interval: float = MIN_INTERVAL,
+    max_interval: float = MAX_INTERVAL,
+    max_dimension: int = KEYFRAME_MAX_DIMENSION,
+) -> List[Keyframe]:
+    """Async version of `extract_keyframes`, ffmpeg is killed if the call is cancelled"""
+    job = _FfmpegJob()
+    future = _pool.submit(
+        _run_keyframes,
+        job,
+        video_path,
+        max_frames,
+        scene_threshold,
+        min_interval,
+        max_interval,
+        max_dimension,
+    )
+    return await _await(job, future)
+
+
+def video_proxy(
+    video_path: str,
+    height: int = PROXY_HEIGHT,
+    frame_rate: int = PROXY_FRAME_RATE,
+    audio: bool = True,
+) -> str:
+    """Path of a low resolution mp4 copy of a video, to remove once used.
+
+    Args:
+        video_path: Path of the video
+        height: Maximum height of the copy, in pixels
+        frame_rate: Frame rate of the copy
+        audio: Keep a mono, low bitrate audio track
+    """
+    job = _FfmpegJob()
+    return _wait(job, _pool.submit(_run_proxy, job, video_path, height, frame_rate, audio))
+
+
+async def avideo_proxy(
+    video_path: str,
+    height: int = PROXY_HEIGHT,
+    frame_rate: int = PROXY_FRAME_RATE,
+    audio: bool = True,
+) -> str:
+    """Async version of `video_proxy`, ffmpeg is killed if the call is cancelled"""
+    job = _FfmpegJob()
+    return await _await(
+        job, _pool.submit(_run_proxy, job, video_path, height, frame_rate, audio)
+    )
@@ -0,0 +1,460 @@
+"""
+Push-based completion of asynchronous provider jobs.
+
+Providers that support callbacks post their results to a ``WebhookReceiver``
+(an embeddable asyncio HTTP server). Each callback is routed to the future
+waiting on its ``provider_job_id``; polling is only used as a fallback when no
+callback arrives in time.
+
+Callback urls carry a token signed with a secret of the receiver: callbacks without a
+valid token, or for a job the receiver did not hand out a url for, are rejected.
+Results received before anyone waits on them are kept for `result_ttl` seconds, at
+most `max_pending` of them. With a `job_store`, every callback is also written to it,
+for the `get_job_result` requests served by other processes.
+
+A provider sends its jobs' callbacks to the receiver installed for it with
+`set_webhook_receiver`, and falls back to polling without one.
+
+Usage:
+    async with WebhookReceiver(port=8080, public_url="https://hooks.example.com") as receiver:
+        callback_url = receiver.callback_url(job_id)
+        ...  # launch the provider job with `callback_url`
+        result = await receiver.wait_for_result(
+            job_id, callback_timeout=30, poll=get_job_result, max_time=600
+        )
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from edenai_apis.utils.job_store import JobStatus, JobStore
+
+logger = logging.getLogger(__name__)
+
+# Keys searched (in order) in a JSON callback body to find the provider job id
+JOB_ID_KEYS = ("provider_job_id", "job_id", "jobId", "media_id", "request_id", "id")
+
+MAX_BODY_SIZE = 50 * 1024 * 1024  # 50 Mb
+DEFAULT_RESULT_TTL = 3600  # seconds a callback url, or an unclaimed result, stays valid
+DEFAULT_MAX_PENDING = 10_000
+
+PollCallable = Callable[[], Awaitable[Optional[Any]]]
+
+
+def default_job_id_extractor(payload: Any) -> Optional[str]:
+    """Find the provider job id in a decoded callback body"""
+    if not isinstance(payload, dict):
+        return None
+    for key in JOB_ID_KEYS:
+        value = payload.get(key)
+        if isinstance(value, (str, int)) and str(value):
+            return str(value)
+        if isinstance(value, dict):
+            nested = default_job_id_extractor(value)
+            if nested:
+                return nested
+    # some providers nest the job under a top level object (eg: {"media": {"id": ..}})
+    for value in payload.values():
+        if isinstance(value, dict) and "id" in value:
+            return str(value["id"])
+    return None
+
+
+class CompletionChannel(ABC):
+    """Way of getting notified that an asynchronous provider job is finished"""
+
+    @abstractmethod
+    def callback_url(self, provider_job_id: Optional[str] = None) -> Optional[str]:
+        """Url to give to the provider so that it notifies the channel, if any"""
+
+    @abstractmethod
+    async def wait_for_result(
+        self,
+        provider_job_id: str,
+        callback_timeout: float = 0,
+        poll: Optional[PollCallable] = None,
+        poll_interval: float = 5,
+        max_time: float = 600,
+    ) -> Any:
+        """Wait for the result of a job"""
+
+
+async def _poll_until_done(
+    poll: PollCallable,
+    poll_interval: float,
+    deadline: float,
+    done: Optional[asyncio.Future] = None,
+) -> Any:
+    """
+    Call `poll` until it returns something other than None or the deadline is reached.
+    If `done` is given, it is awaited between two polls so that a late callback
+    still completes the job without waiting for the next poll.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        result = await poll()
+        if result is not None:
+            return result
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError("Job did not complete before max_time")
+        wait_time = min(poll_interval, remaining)
+        if done is None:
+            await asyncio.sleep(wait_time)
+            continue
+        try:
+            return await asyncio.wait_for(asyncio.shield(done), wait_time)
+        except asyncio.TimeoutError:
+            pass
+
+
+class PollingChannel(CompletionChannel):
+    """Completion channel without callbacks: only polls the provider"""
+
+    def callback_url(self, provider_job_id: Optional[str] = None) -> Optional[str]:
+        return None
+
+    async def wait_for_result(
+        self,
+        provider_job_id: str,
+        callback_timeout: float = 0,
+        poll: Optional[PollCallable] = None,
+        poll_interval: float = 5,
+        max_time: float = 600,
+    ) -> Any:
+        if poll is None:
+            raise ValueError("PollingChannel requires a `poll` callable")
+        deadline = asyncio.get_running_loop().time() + max_time
+        return await _poll_until_done(poll, poll_interval, deadline)
+
+
+class WebhookReceiver(CompletionChannel):
+    """
+    Minimal asyncio HTTP server receiving provider callbacks.
+
+    A callback is accepted as a ``POST``/``PUT`` on ``{path_prefix}/{provider_job_id}``,
+    or on ``{path_prefix}`` with the job id found in the JSON body by `job_id_extractor`
+    (for providers that only give the job id once the job is launched). In both cases
+    the ``token`` query parameter of the url returned by `callback_url` is required.
+
+    Args:
+        host (str): interface to bind
+        port (int): port to bind, 0 picks a free one
+        public_url (str): externally reachable base url (eg: behind a reverse proxy).
+            Defaults to the local address of the server.
+        path_prefix (str): path under which callbacks are received
+        job_id_extractor (Callable): returns the job id from a decoded callback body
+        secret (bytes): key signing the callback urls, random by default. Give the same
+            one to every receiver behind a load balancer
+        result_ttl (float): seconds during which a callback url is accepted and an
+            unclaimed result is kept
+        max_pending (int): maximum number of callback urls handed out and of unclaimed
+            results kept, the oldest ones are dropped first
+        job_store (JobStore): store the callbacks are written to, as succeeded jobs of
+            `provider_name`
+        provider_name (str): provider whose jobs are completed by the callbacks
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        public_url: Optional[str] = None,
+        path_prefix: str = "/callbacks",
+        job_id_extractor: Callable[[Any], Optional[str]] = default_job_id_extractor,
+        secret: Optional[bytes] = None,
+        result_ttl: float = DEFAULT_RESULT_TTL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        job_store: Optional[JobStore] = None,
+        provider_name: Optional[str] = None,
+    ) -> None:
+        if job_store is not None and not provider_name:
+            raise ValueError("A provider_name is required to write to a job store")
+        self.host = host
+        self.port = port
+        self.public_url = public_url.rstrip("/") if public_url else None
+        self.path_prefix = "/" + path_prefix.strip("/")
+        self.job_id_extractor = job_id_extractor
+        self.result_ttl = result_ttl
+        self.max_pending = max_pending
+        self.job_store = job_store
+        self.provider_name = provider_name
+        self._secret = secret or secrets.token_bytes(32)
+        # callback urls are handed out by the launch of jobs, from any thread
+        self._lock = threading.Lock()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._waiters: Dict[str, asyncio.Future] = {}
+        # job ids and launch nonces a callback url was handed out for -> expiration time
+        self._expected: "OrderedDict[str, float]" = OrderedDict()
+        # callbacks received before anyone waits on them -> (payload, expiration time)
+        self._received: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    async def __aenter__(self) -> "WebhookReceiver":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Webhook receiver listening on %s", self.base_url)
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        for future in self._waiters.values():
+            if not future.done():
+                future.cancel()
+        self._waiters.clear()
+        self._expected.clear()
+        self._received.clear()
+
+    @property
+    def base_url(self) -> str:
+        return self.public_url or f"http://{self.host}:{self.port}"
+
+    def callback_url(self, provider_job_id: Optional[str] = None) -> str:
+        """
+        Signed url to give to the provider.
+
+        Without `provider_job_id` (not known before launching the job), the url is
+        only valid for one callback whose body holds the job id.
+        """
+        url = f"{self.base_url}{self.path_prefix}"
+        if provider_job_id:
+            provider_job_id = str(provider_job_id)
+            self._expect(provider_job_id)
+            token = self._sign(provider_job_id)
+            return f"{url}/{quote(provider_job_id, safe='')}?token={token}"
+        nonce = secrets.token_urlsafe(16)
+        self._expect(f"launch:{nonce}")
+        return f"{url}?launch={nonce}&token={self._sign(f'launch:{nonce}')}"
+
+    def _sign(self, value: str) -> str:
+        return hmac.new(self._secret, value.encode(), hashlib.sha256).hexdigest()
+
+    def _verify(self, value: str, token: Optional[str]) -> bool:
+        return token is not None and hmac.compare_digest(self._sign(value), token)
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for entries in (self._expected, self._received):
+                while entries and (
+                    len(entries) > self.max_pending
+                    or self._expiration(entries) <= now
+                ):
+                    entries.popitem(last=False)
+
+    @staticmethod
+    def _expiration(entries: OrderedDict) -> float:
+        value = next(iter(entries.values()))
+        return value[1] if isinstance(value, tuple) else value
+
+    def _expect(self, key: str) -> None:
+        with self._lock:
+            self._expected[key] = time.monotonic() + self.result_ttl
+            self._expected.move_to_end(key)
+        self._purge()
+
+    def register(self, provider_job_id: str) -> asyncio.Future:
+        """Get the future completed by the callback of `provider_job_id`"""
+        provider_job_id = str(provider_job_id)
+        future = self._waiters.get(provider_job_id)
+        if future is None or future.cancelled():
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[provider_job_id] = future
+        self._purge()
+        if provider_job_id in self._received and not future.done():
+            future.set_result(self._received.pop(provider_job_id)[0])
+        return future
+
+    def complete(self, provider_job_id: str, payload: Any) -> None:
+        """Route a callback payload to the job waiting for it"""
+        provider_job_id = str(provider_job_id)
+        if self.job_store is not None:
+            # a single row upsert, short enough to run on the event loop
+            self.job_store.put(
+                self.provider_name, provider_job_id, JobStatus.SUCCEEDED, payload
+            )
+        future = self._waiters.get(provider_job_id)
+        if future is not None and not future.done():
+            future.set_result(payload)
+        else:
+            self._received[provider_job_id] = (
+                payload,
+                time.monotonic() + self.result_ttl,
+            )
+            self._received.move_to_end(provider_job_id)
+            self._purge()
+
+    async def wait_for_result(
+        self,
+        provider_job_id: str,
+        callback_timeout: float = 0,
+        poll: Optional[PollCallable] = None,
+        poll_interval: float = 5,
+        max_time: float = 600,
+    ) -> Any:
+        """
+        Wait for the callback of `provider_job_id`.
+
+        If no callback arrives within `callback_timeout` seconds, `poll` is called every
+        `poll_interval` seconds until it returns something other than None. A callback
+        arriving while polling still completes the job immediately.
+
+        Raises:
+            asyncio.TimeoutError: if nothing completed the job within `max_time` seconds
+        """
+        provider_job_id = str(provider_job_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_time
+        future = self.register(provider_job_id)
+        try:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(future),
+                    max_time if poll is None else min(callback_timeout, max_time),
+                )
+            except asyncio.TimeoutError:
+                if poll is None:
+                    raise
+            logger.debug("No callback for job %s, falling back to polling", provider_job_id)
+            return await _poll_until_done(poll, poll_interval, deadline, done=future)
+        finally:
+            if self._waiters.get(provider_job_id) is future:
+                del self._waiters[provider_job_id]
+            if not future.done():
+                future.cancel()
+
+    def _route(self, target: str, body: bytes) -> Tuple[int, str]:
+        url = urlsplit(target)
+        path = url.path
+        if not (path == self.path_prefix or path.startswith(self.path_prefix + "/")):
+            return 404, "Not Found"
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        self._purge()
+        provider_job_id = unquote(path[len(self.path_prefix) :].strip("/"))
+        # the job id of the path, or the one-shot launch nonce, must have been signed
+        # by this receiver and still be expected
+        key = provider_job_id or f"launch:{query.get('launch', '')}"
+        if not self._verify(key, query.get("token")):
+            return 403, "Forbidden"
+        with self._lock:
+            if key not in self._expected:
+                return 404, "Unknown job"
+
+        try:
+            payload = json.loads(body) if body else None
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            payload = body.decode("utf-8", errors="replace")
+
+        if not provider_job_id:
+            provider_job_id = self.job_id_extractor(payload)
+            if not provider_job_id:
+                return 400, "Could not find the job id"
+
+        # a callback url is only accepted once, it can't be replayed
+        with self._lock:
+            if self._expected.pop(key, None) is None:
+                return 404, "Unknown job"
+        self.complete(provider_job_id, payload)
+        return 200, "OK"
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            status, message = await self._handle_request(reader)
+        except (asyncio.IncompleteReadError, ValueError, ConnectionError):
+            status, message = 400, "Bad Request"
+        except Exception as exc:  # never let a bad callback kill the server
+            logger.exception("Error while handling webhook callback: %s", exc)
+            status, message = 500, "Internal Server Error"
+        body = message.encode()
+        try:
+            writer.write(
+                f"HTTP/1.1 {status} {message}\r\n"
+                f"Content-Type: text/plain\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader) -> Tuple[int, str]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        method, target, _ = request_line.split(" ", 2)
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        content_length = int(headers.get("content-length", 0))
+        if content_length > MAX_BODY_SIZE:
+            return 413, "Payload Too Large"
+        body = await reader.readexactly(content_length) if content_length else b""
+
+        if method.upper() not in ("POST", "PUT"):
+            return 405, "Method Not Allowed"
+        return self._route(target, body)
+
+
+_receivers: Dict[str, WebhookReceiver] = {}
+
+
+def set_webhook_receiver(
+    provider_name: str, receiver: Optional[WebhookReceiver]
+) -> None:
+    """
+    Send the callbacks of the async jobs of `provider_name` to `receiver`, None goes
+    back to polling. The receiver writes the callbacks to its job store, where
+    `get_job_result` reads them: give it the store of the process (`job_store()`).
+    """
+    if receiver is None:
+        _receivers.pop(provider_name, None)
+        return
+    if receiver.job_store is None or receiver.provider_name != provider_name:
+        raise ValueError(
+            f"The webhook receiver of {provider_name} must write to a job store "
+            f"as {provider_name}"
+        )
+    _receivers[provider_name] = receiver
+
+
+def webhook_receiver(provider_name: str) -> Optional[WebhookReceiver]:
+    """Running receiver of the callbacks of `provider_name`, if any"""
+    receiver = _receivers.get(provider_name)
+    return receiver if receiver is not None and receiver.is_running else None